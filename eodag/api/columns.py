@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024, CS GROUP - France, https://www.csgroup.eu/
+#
+# This file is part of EODAG project
+#     https://www.github.com/CS-SI/EODAG
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Columnar view of products, for vectorized filtering, sorting and export"""
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence
+
+import dateutil.parser
+import numpy as np
+import orjson
+import shapely
+
+if TYPE_CHECKING:
+    import pyarrow
+
+    from eodag.api.product import EOProduct
+
+#: Properties exported as dates
+DATE_PROPERTIES = ("startTimeFromAscendingNode", "completionTimeFromAscendingNode")
+
+#: GeoJSON types of geometries, by shapely type id
+_GEOMETRY_TYPES = (
+    "Point",
+    "LineString",
+    "LinearRing",
+    "Polygon",
+    "MultiPoint",
+    "MultiLineString",
+    "MultiPolygon",
+    "GeometryCollection",
+)
+
+
+def parse_date(value: Any) -> np.datetime64:
+    """Parse a date as a UTC :class:`numpy.datetime64`, naive dates being UTC
+
+    :param value: An ISO 8601 formatted date, or a :class:`datetime.datetime`
+    :returns: The parsed date, ``NaT`` if ``value`` is empty
+    """
+    if not value:
+        return np.datetime64("NaT", "us")
+    if isinstance(value, datetime.datetime):
+        date = value
+    else:
+        try:
+            # fast path for ISO 8601 dates
+            date = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            date = dateutil.parser.parse(value)
+    if date.tzinfo:
+        date = date.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return np.datetime64(date, "us")
+
+
+class SearchResultColumns:
+    """Columnar view of products: their properties as arrays, built lazily once.
+
+    Dates are UTC :class:`numpy.datetime64` arrays, where missing dates are ``NaT``, and
+    geometries are arrays of shapely geometries indexed by a :class:`shapely.STRtree`.
+
+    :param products: The products
+    """
+
+    def __init__(self, products: Sequence[EOProduct]) -> None:
+        self.products = list(products)
+        self._columns: Dict[str, np.ndarray] = {}
+        self._dates: Dict[str, np.ndarray] = {}
+        self._geometries: Optional[np.ndarray] = None
+        self._strtree: Optional[shapely.STRtree] = None
+
+    def __len__(self) -> int:
+        return len(self.products)
+
+    @property
+    def geometries(self) -> np.ndarray:
+        """Geometries of the products"""
+        if self._geometries is None:
+            self._geometries = np.array(
+                [product.geometry for product in self.products], dtype=object
+            )
+        return self._geometries
+
+    @property
+    def strtree(self) -> shapely.STRtree:
+        """Spatial index of the products geometries, whose indices are products indices"""
+        if self._strtree is None:
+            self._strtree = shapely.STRtree(self.geometries)
+        return self._strtree
+
+    @property
+    def search_intersections(self) -> np.ndarray:
+        """Intersections of the products geometries with the searched extent"""
+        return np.array(
+            [product.search_intersection for product in self.products], dtype=object
+        )
+
+    @property
+    def ids(self) -> np.ndarray:
+        """Ids of the products"""
+        return self.column("id")
+
+    @property
+    def start_dates(self) -> np.ndarray:
+        """Start dates of the products"""
+        return self.dates("startTimeFromAscendingNode")
+
+    @property
+    def end_dates(self) -> np.ndarray:
+        """End dates of the products"""
+        return self.dates("completionTimeFromAscendingNode")
+
+    @property
+    def cloud_cover(self) -> np.ndarray:
+        """Cloud cover of the products, ``nan`` where it is missing"""
+        return self.floats("cloudCover")
+
+    def has_property(self, name: str) -> bool:
+        """Whether all the products have a property
+
+        :param name: Name of the property
+        :returns: ``True`` if no product misses the property
+        """
+        return all(name in product.properties for product in self.products)
+
+    def column(self, name: str) -> np.ndarray:
+        """Values of a property of the products
+
+        :param name: Name of the property
+        :returns: The property values, ``None`` for products not having it
+        """
+        if name not in self._columns:
+            values = np.empty(len(self.products), dtype=object)
+            # assigned one by one, not to broadcast sequence values
+            for i, product in enumerate(self.products):
+                values[i] = product.properties.get(name)
+            self._columns[name] = values
+        return self._columns[name]
+
+    def dates(self, name: str) -> np.ndarray:
+        """Dates of the products, from a date property
+
+        :param name: Name of the property
+        :returns: The dates as UTC ``datetime64[us]``, ``NaT`` where they are missing
+        :raises: :class:`ValueError` if a date cannot be parsed
+        """
+        if name not in self._dates:
+            parsed: Dict[Any, np.datetime64] = {}
+            dates = np.empty(len(self.products), dtype="datetime64[us]")
+            for i, value in enumerate(self.column(name)):
+                try:
+                    dates[i] = parsed[value]
+                except KeyError:
+                    dates[i] = parsed[value] = parse_date(value)
+                except TypeError:
+                    # unhashable value
+                    dates[i] = parse_date(value)
+            self._dates[name] = dates
+        return self._dates[name]
+
+    def floats(self, name: str) -> np.ndarray:
+        """Numeric values of the products, from a numeric property
+
+        :param name: Name of the property
+        :returns: The values as floats, ``nan`` where they are missing
+        :raises: :class:`ValueError` if a value is not numeric
+        """
+        return np.array(
+            [np.nan if value is None else value for value in self.column(name)],
+            dtype=float,
+        )
+
+    def argsort_dates(self, name: str, reverse: bool = False) -> np.ndarray:
+        """Indices sorting the products by a date property, products with equal dates
+        keeping their order
+
+        :param name: Name of the property
+        :param reverse: (optional) Sort from the latest date
+        :returns: The sorting indices, missing dates being sorted as the UNIX epoch
+        """
+        dates = self.dates(name).view("int64").copy()
+        dates[np.isnat(self.dates(name))] = 0
+        return np.argsort(-dates if reverse else dates, kind="stable")
+
+    def to_arrow(self) -> pyarrow.Table:
+        """Products as an Arrow table, with a GeoParquet ``geometry`` WKB column
+
+        Properties are columns, whose values are JSON strings if they do not share a
+        type. The table metadata describes its geometry column as GeoParquet does.
+
+        :returns: The products table
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError(
+                "Feature not available, please install eodag[parquet] or eodag[all]"
+            )
+
+        names: Dict[str, None] = {}
+        for product in self.products:
+            names.update(dict.fromkeys(product.properties))
+        names.pop("geometry", None)
+
+        columns: Dict[str, pyarrow.Array] = {
+            "eodag_provider": pa.array(
+                [product.provider for product in self.products], pa.string()
+            ),
+            "eodag_product_type": pa.array(
+                [product.product_type for product in self.products], pa.string()
+            ),
+        }
+        for name in names:
+            if name in DATE_PROPERTIES:
+                try:
+                    columns[name] = pa.array(
+                        self.dates(name), pa.timestamp("us", tz="UTC")
+                    )
+                    continue
+                except ValueError:
+                    pass
+            values = self.column(name)
+            try:
+                columns[name] = pa.array(values)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                columns[name] = pa.array(
+                    [
+                        None
+                        if value is None
+                        else orjson.dumps(value, default=str).decode()
+                        for value in values
+                    ],
+                    pa.string(),
+                )
+
+        geometries = self.geometries
+        columns["geometry"] = pa.array(shapely.to_wkb(geometries), pa.binary())
+        present = geometries[~shapely.is_missing(geometries)]
+        geo_metadata = {
+            "version": "1.0.0",
+            "primary_column": "geometry",
+            "columns": {
+                "geometry": {
+                    "encoding": "WKB",
+                    "geometry_types": sorted(
+                        _GEOMETRY_TYPES[type_id]
+                        for type_id in np.unique(shapely.get_type_id(present))
+                    ),
+                    "bbox": shapely.total_bounds(present).tolist(),
+                }
+            },
+        }
+        table = pa.table(columns)
+        return table.replace_schema_metadata({"geo": orjson.dumps(geo_metadata)})
+
+    def to_parquet(self, path: str, **kwargs: Any) -> None:
+        """Write the products to a GeoParquet file
+
+        :param path: Path of the file to write
+        :param kwargs: Options of :func:`pyarrow.parquet.write_table`
+        """
+        table = self.to_arrow()
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, path, **kwargs)
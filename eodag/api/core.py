@@ -17,29 +17,50 @@
 # limitations under the License.
 from __future__ import annotations
 
+import asyncio
+import copy
 import datetime
+import functools
 import logging
 import os
+import pickle
 import re
 import shutil
 import tempfile
+import threading
+import time
+from contextlib import nullcontext
+from functools import partial
+from importlib.metadata import version
 from operator import itemgetter
-from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Union
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import geojson
-import pkg_resources
+import orjson
 import yaml.parser
-from pkg_resources import resource_filename
-from whoosh import analysis, fields
-from whoosh.fields import Schema
-from whoosh.index import create_in, exists_in, open_dir
-from whoosh.qparser import QueryParser
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
+from eodag.api.product import EOProduct
 from eodag.api.product.metadata_mapping import (
     ONLINE_STATUS,
     mtd_cfg_as_conversion_and_querypath,
 )
-from eodag.api.search_result import SearchResult
+from eodag.api.product_types_index import ProductTypesIndex
+from eodag.api.search_result import RawSearchResult, SearchResult
 from eodag.config import (
     PLUGINS_TOPICS_KEYS,
     PluginConfig,
@@ -61,7 +82,6 @@ from eodag.plugins.search.build_search_result import MeteoblueSearch
 from eodag.plugins.search.qssearch import PostJsonSearch
 from eodag.types import model_fields_to_annotated
 from eodag.types.queryables import CommonQueryables, QueryablesDict
-from eodag.types.whoosh import EODAGQueryParser
 from eodag.utils import (
     DEFAULT_DOWNLOAD_TIMEOUT,
     DEFAULT_DOWNLOAD_WAIT,
@@ -74,7 +94,8 @@ from eodag.utils import (
     _deprecated,
     get_geometry_from_various,
     makedirs,
-    obj_md5sum,
+    prefetch_iter,
+    resource_filename,
     sort_dict,
     string_to_jsonpath,
     uri_to_path,
@@ -85,17 +106,19 @@ from eodag.utils.exceptions import (
     NoMatchingProductType,
     PluginImplementationError,
     RequestError,
+    TimeOutError,
     UnsupportedProductType,
     UnsupportedProvider,
+    ValidationError,
 )
+from eodag.utils.requests import get_async_executor
 from eodag.utils.rest import rfc3339_str_to_datetime
+from eodag.utils.snapshot import load_content_snapshot
 from eodag.utils.stac_reader import fetch_stac_items
 
 if TYPE_CHECKING:
     from shapely.geometry.base import BaseGeometry
-    from whoosh.index import Index
 
-    from eodag.api.product import EOProduct
     from eodag.plugins.apis.base import Api
     from eodag.plugins.crunch.base import Crunch
     from eodag.plugins.search.base import Search
@@ -105,6 +128,14 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("eodag.core")
 
+#: Strategies used to combine the results of a fan-out search
+FAN_OUT_STRATEGIES = ("first", "merge", "dedup")
+
+#: Formats used to write and read products one by one (newline-delimited GeoJSON features,
+#: or RFC 8142 GeoJSON text sequences)
+STREAM_FORMATS = ("ndjson", "geojson-seq")
+GEOJSON_SEQ_RS = "\x1e"
+
 
 class EODataAccessGateway:
     """An API for downloading a wide variety of geospatial products originating
@@ -123,7 +154,6 @@ class EODataAccessGateway:
             "eodag", os.path.join("resources/", "product_types.yml")
         )
         self.product_types_config = SimpleYamlProxyConfig(product_types_config_path)
-        self.product_types_config_md5 = obj_md5sum(self.product_types_config.source)
         self.providers_config = load_default_config()
 
         env_var_cfg_dir = "EODAG_CFG_DIR"
@@ -175,11 +205,9 @@ class EODataAccessGateway:
         share_credentials(self.providers_config)
 
         # init updated providers conf
+        stac_provider_config = load_stac_provider_config()
         for provider in self.providers_config.keys():
-            provider_config_init(
-                self.providers_config[provider],
-                load_stac_provider_config(),
-            )
+            provider_config_init(self.providers_config[provider], stac_provider_config)
 
         # re-build _plugins_manager using up-to-date providers_config
         self._plugins_manager.rebuild(self.providers_config)
@@ -193,7 +221,7 @@ class EODataAccessGateway:
         self._plugins_manager.sort_providers()
 
         # Build a search index for product types
-        self._product_types_index: Optional[Index] = None
+        self._product_types_index: Optional[ProductTypesIndex] = None
         self.build_index()
 
         # set locations configuration
@@ -229,91 +257,19 @@ class EODataAccessGateway:
 
     def get_version(self) -> str:
         """Get eodag package version"""
-        return pkg_resources.get_distribution("eodag").version
+        return version("eodag")
 
     def build_index(self) -> None:
-        """Build a `Whoosh <https://whoosh.readthedocs.io/en/latest/index.html>`_
-        index for product types searches.
-        """
-        index_dir = os.path.join(self.conf_dir, ".index")
-
-        try:
-            create_index = not exists_in(index_dir)
-        except ValueError as ve:
-            # Whoosh uses pickle internally. New versions of Python sometimes introduce
-            # a new pickle protocol (e.g. 3.4 -> 4, 3.8 -> 5), the new version not
-            # being supported by previous versions of Python (e.g. Python 3.7 doesn't
-            # support Protocol 5). In that case, we need to recreate the .index.
-            if "unsupported pickle protocol" in str(ve):
-                logger.debug("Need to recreate whoosh .index: '%s'", ve)
-                create_index = True
-            # Unexpected error
-            else:
-                logger.error(
-                    "Error while opening .index using whoosh, "
-                    "please report this issue and try to delete '%s' manually",
-                    index_dir,
-                )
-                raise
-        # check index version
-        if not create_index:
-            if self._product_types_index is None:
-                logger.debug("Opening product types index in %s", index_dir)
-                self._product_types_index = open_dir(index_dir)
-
-            with self._product_types_index.searcher() as searcher:
-                p = QueryParser("md5", self._product_types_index.schema, plugins=[])
-                query = p.parse(self.product_types_config_md5)
-                results = searcher.search(query, limit=1)
-
-                if not results:
-                    create_index = True
-                    logger.debug(
-                        "Out-of-date product types index removed from %s", index_dir
-                    )
+        """Build the in-memory index of the product types, used to guess product types.
 
-        if create_index:
-            logger.debug("Creating product types index in %s", index_dir)
-            makedirs(index_dir)
-
-            kw_analyzer = (
-                analysis.CommaSeparatedTokenizer()
-                | analysis.LowercaseFilter()
-                | analysis.SubstitutionFilter("-", "")
-                | analysis.SubstitutionFilter("_", "")
-            )
-
-            product_types_schema = Schema(
-                ID=fields.ID(stored=True),
-                abstract=fields.TEXT,
-                instrument=fields.IDLIST,
-                platform=fields.ID,
-                platformSerialIdentifier=fields.IDLIST,
-                processingLevel=fields.ID,
-                sensorType=fields.ID,
-                md5=fields.ID,
-                license=fields.ID,
-                title=fields.TEXT,
-                missionStartDate=fields.STORED,
-                missionEndDate=fields.STORED,
-                keywords=fields.KEYWORD(analyzer=kw_analyzer),
-                stacCollection=fields.STORED,
-            )
-            self._product_types_index = create_in(index_dir, product_types_schema)
-            ix_writer = self._product_types_index.writer()
-            for product_type in self.list_product_types(fetch_providers=False):
-                versioned_product_type = dict(
-                    product_type, **{"md5": self.product_types_config_md5}
-                )
-                # add to index
-                ix_writer.add_document(
-                    **{
-                        k: v
-                        for k, v in versioned_product_type.items()
-                        if k in product_types_schema.names()
-                    }
-                )
-            ix_writer.commit()
+        The index is loaded from its snapshot if the product types did not change.
+        """
+        product_types = self.list_product_types(fetch_providers=False)
+        self._product_types_index = load_content_snapshot(
+            "product_types_index",
+            pickle.dumps(product_types, protocol=pickle.HIGHEST_PROTOCOL),
+            lambda _: ProductTypesIndex(product_types),
+        )
 
     def set_preferred_provider(self, provider: str) -> None:
         """Set max priority for the given provider.
@@ -685,6 +641,7 @@ class EODataAccessGateway:
 
         # get ext_product_types conf for user modified providers
         default_providers_config = load_default_config()
+        providers_to_discover: List[str] = []
         for (
             provider,
             user_discovery_conf,
@@ -752,21 +709,28 @@ class EODataAccessGateway:
                 # providers not skipped here should be user-modified
                 # or not in ext_product_types_conf (if eodag system conf != eodag conf used for ext_product_types_conf)
 
-            if not already_fetched:
-                # discover product types for user configured provider
-                provider_ext_product_types_conf = (
-                    self.discover_product_types(provider=provider) or {}
-                )
-                # update eodag product types list with new conf
-                self.update_product_types_list(provider_ext_product_types_conf)
+            providers_to_discover.append(provider)
+
+        if not already_fetched and providers_to_discover:
+            # discover product types for user configured providers, concurrently
+            provider_ext_product_types_conf = (
+                self._discover_product_types(providers_to_discover) or {}
+            )
+            # update eodag product types list with new conf
+            self.update_product_types_list(provider_ext_product_types_conf)
 
     def discover_product_types(
-        self, provider: Optional[str] = None
+        self, provider: Optional[str] = None, timeout: Optional[float] = None
     ) -> Optional[Dict[str, Any]]:
         """Fetch providers for product types
 
+        Providers are queried concurrently.
+
         :param provider: The name of a provider or provider-group to fetch. Defaults to
                          all providers (None value).
+        :param timeout: (optional) Time in seconds after which the providers that did not
+                        answer are skipped, and left to be fetched again later. Defaults to
+                        ``$EODAG_PRODUCT_TYPES_DISCOVERY_TIMEOUT`` if set, no limit otherwise
         :returns: external product types configuration
         """
         grouped_providers = [
@@ -782,7 +746,6 @@ class EODataAccessGateway:
             raise UnsupportedProvider(
                 f"The requested provider is not (yet) supported: {provider}"
             )
-        ext_product_types_conf: Dict[str, Any] = {}
         providers_to_fetch = [
             p
             for p in (
@@ -795,8 +758,30 @@ class EODataAccessGateway:
                 else self.available_providers()
             )
         ]
-        kwargs: Dict[str, Any] = {}
-        for provider in providers_to_fetch:
+        return self._discover_product_types(providers_to_fetch, timeout)
+
+    def _discover_product_types(
+        self, providers: List[str], timeout: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch providers for product types, in a single pool of threads
+
+        The plugins and authentications of the providers are built first, and only the
+        discovery requests are run concurrently.
+
+        :param providers: The names of the providers to fetch
+        :param timeout: (optional) Time in seconds after which the providers that did not
+                        answer are skipped and stopped. Defaults to
+                        ``$EODAG_PRODUCT_TYPES_DISCOVERY_TIMEOUT`` if set, no limit otherwise
+        :returns: external product types configuration
+        """
+        if timeout is None and os.getenv("EODAG_PRODUCT_TYPES_DISCOVERY_TIMEOUT"):
+            timeout = float(os.environ["EODAG_PRODUCT_TYPES_DISCOVERY_TIMEOUT"])
+        ext_product_types_conf: Dict[str, Any] = {}
+        # set once the timeout is reached, to stop the paginated discoveries
+        stop_event = threading.Event()
+        # plugins are prepared here, only discovery requests are run concurrently
+        discoveries: Dict[str, Callable[[], Optional[Dict[str, Any]]]] = {}
+        for provider in providers:
             if hasattr(self.providers_config[provider], "search"):
                 search_plugin_config = self.providers_config[provider].search
             elif hasattr(self.providers_config[provider], "api"):
@@ -814,6 +799,7 @@ class EODataAccessGateway:
                     "fetch_url"
                 ):
                     continue
+                kwargs: Dict[str, Any] = {}
                 # append auth to search plugin if needed
                 if getattr(search_plugin.config, "need_auth", False):
                     if auth := self._plugins_manager.get_auth(
@@ -829,10 +815,37 @@ class EODataAccessGateway:
                         ext_product_types_conf[provider] = None
                         continue
 
-                ext_product_types_conf[provider] = search_plugin.discover_product_types(
-                    **kwargs
+                discoveries[provider] = functools.partial(
+                    search_plugin.discover_product_types,
+                    stop_event=stop_event,
+                    **kwargs,
                 )
 
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, len(discoveries)), thread_name_prefix="eodag-discovery"
+        )
+        future_to_provider = {
+            executor.submit(discover): provider
+            for provider, discover in discoveries.items()
+        }
+        done, pending = wait(future_to_provider, timeout=timeout)
+        try:
+            for future in done:
+                ext_product_types_conf[future_to_provider[future]] = future.result()
+            for future in pending:
+                # not added to the configuration, to be fetched again later
+                logger.warning(
+                    "No product types discovered for provider %s within %ss, skipped",
+                    future_to_provider[future],
+                    timeout,
+                )
+        finally:
+            # do not wait for late providers, and stop their paginated discovery
+            stop_event.set()
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
         return sort_dict(ext_product_types_conf)
 
     def update_product_types_list(
@@ -842,6 +855,7 @@ class EODataAccessGateway:
 
         :param ext_product_types_conf: external product types configuration
         """
+        added_product_types: Set[str] = set()
         for provider, new_product_types_conf in ext_product_types_conf.items():
             if new_product_types_conf and provider in self.providers_config:
                 try:
@@ -865,54 +879,80 @@ class EODataAccessGateway:
                     )
                     continue
                 new_product_types: List[str] = []
+                unparsable_keys = search_plugin_config.discover_product_types.get(
+                    "generic_product_type_unparsable_properties", {}
+                ).keys()
+                # existing product types indexed by their hashable conf items, to only
+                # compare new product types with the ones sharing all their items
+                items_product_types: Dict[Tuple[str, Any], Set[str]] = {}
+
+                def index_product_type(product_type: str) -> None:
+                    for item in provider_products_config[product_type].items():
+                        try:
+                            items_product_types.setdefault(item, set()).add(
+                                product_type
+                            )
+                        except TypeError:
+                            # unhashable value
+                            continue
+
+                for existing_product_type in provider_products_config:
+                    index_product_type(existing_product_type)
+
                 for (
                     new_product_type,
                     new_product_type_conf,
                 ) in new_product_types_conf["providers_config"].items():
-                    if new_product_type not in provider_products_config:
-                        for existing_product_type in provider_products_config.copy():
-                            # compare parsed extracted conf (without metadata_mapping entry)
-                            unparsable_keys = (
-                                search_plugin_config.discover_product_types.get(
-                                    "generic_product_type_unparsable_properties", {}
-                                ).keys()
-                            )
-                            new_parsed_product_types_conf = {
-                                k: v
-                                for k, v in new_product_type_conf.items()
-                                if k not in unparsable_keys
-                            }
-                            if (
-                                new_parsed_product_types_conf.items()
-                                <= provider_products_config[
-                                    existing_product_type
-                                ].items()
-                            ):
-                                # new_product_types_conf is a subset on an existing conf
-                                break
-                        else:
-                            # new_product_type_conf does not already exist, append it
-                            # to provider_products_config
-                            provider_products_config[
-                                new_product_type
-                            ] = new_product_type_conf
-                            # to self.product_types_config
-                            self.product_types_config.source.update(
-                                {
-                                    new_product_type: new_product_types_conf[
-                                        "product_types_config"
-                                    ][new_product_type]
-                                }
-                            )
-                            self.product_types_config_md5 = obj_md5sum(
-                                self.product_types_config.source
-                            )
-                            ext_product_types_conf[provider] = new_product_types_conf
-                            new_product_types.append(new_product_type)
+                    if new_product_type in provider_products_config:
+                        continue
+                    # compare parsed extracted conf (without metadata_mapping entry)
+                    new_parsed_product_types_conf = {
+                        k: v
+                        for k, v in new_product_type_conf.items()
+                        if k not in unparsable_keys
+                    }
+                    candidates: Optional[Set[str]] = None
+                    for item in new_parsed_product_types_conf.items():
+                        try:
+                            matching = items_product_types.get(item, set())
+                        except TypeError:
+                            # unhashable value, checked on candidates
+                            continue
+                        candidates = (
+                            matching if candidates is None else candidates & matching
+                        )
+                        if not candidates:
+                            break
+                    if any(
+                        new_parsed_product_types_conf.items()
+                        <= provider_products_config[existing_product_type].items()
+                        for existing_product_type in (
+                            provider_products_config
+                            if candidates is None
+                            else candidates
+                        )
+                    ):
+                        # new_product_types_conf is a subset on an existing conf
+                        continue
+                    # new_product_type_conf does not already exist, append it
+                    # to provider_products_config
+                    provider_products_config[new_product_type] = new_product_type_conf
+                    index_product_type(new_product_type)
+                    # to self.product_types_config
+                    self.product_types_config.source.update(
+                        {
+                            new_product_type: new_product_types_conf[
+                                "product_types_config"
+                            ][new_product_type]
+                        }
+                    )
+                    ext_product_types_conf[provider] = new_product_types_conf
+                    new_product_types.append(new_product_type)
                 if new_product_types:
                     logger.debug(
                         f"Added {len(new_product_types)} product types for {provider}"
                     )
+                    added_product_types.update(new_product_types)
 
             elif provider not in self.providers_config:
                 # unknown provider
@@ -922,8 +962,13 @@ class EODataAccessGateway:
         # re-create _plugins_manager using up-to-date providers_config
         self._plugins_manager.build_product_type_to_provider_config_map()
 
-        # rebuild index after product types list update
-        self.build_index()
+        # index the added product types
+        if self._product_types_index is None:
+            self.build_index()
+        elif added_product_types:
+            for product_type in self.list_product_types(fetch_providers=False):
+                if product_type["_id"] in added_product_types:
+                    self._product_types_index.add(product_type)
 
     def available_providers(
         self, product_type: Optional[str] = None, by_group: bool = False
@@ -1025,11 +1070,10 @@ class EODataAccessGateway:
         """
         Find EODAG product type IDs that best match a set of search parameters.
 
-        See https://whoosh.readthedocs.io/en/latest/querylang.html#the-default-query-language
-          for syntax.
+        See :class:`~eodag.api.product_types_index.ProductTypesIndex` for the syntax.
 
-        :param free_text: Whoosh-compatible free text search filter used to search
-                        accross all the following parameters
+        :param free_text: Free text search filter used to search accross all the
+                          following parameters
         :param intersect: Join results for each parameter using INTERSECT instead of UNION.
         :param instrument: Instrument parameter.
         :param platform: Platform parameter.
@@ -1047,7 +1091,7 @@ class EODataAccessGateway:
         if productType := kwargs.get("productType"):
             return [productType]
 
-        if not self._product_types_index:
+        if self._product_types_index is None:
             raise EodagError("Missing product types index")
 
         filters = {
@@ -1074,12 +1118,7 @@ class EODataAccessGateway:
         if not text and (missionStartDate or missionEndDate):
             text = "*"
 
-        with self._product_types_index.searcher() as searcher:
-            p = EODAGQueryParser(list(filters.keys()), self._product_types_index.schema)
-            query = p.parse(text)
-            results = searcher.search(query, limit=None)
-
-            guesses: List[Dict[str, str]] = [dict(r) for r in results or []]
+        guesses = self._product_types_index.search(text, list(filters.keys()))
 
         # datetime filtering
         if missionStartDate or missionEndDate:
@@ -1124,6 +1163,8 @@ class EODataAccessGateway:
         locations: Optional[Dict[str, str]] = None,
         provider: Optional[str] = None,
         count: bool = False,
+        fan_out: Optional[str] = None,
+        fan_out_timeout: Optional[float] = None,
         **kwargs: Any,
     ) -> SearchResult:
         """Look for products matching criteria on known providers.
@@ -1164,6 +1205,19 @@ class EODataAccessGateway:
                          If not set, the configured preferred provider will be used at first
                          before trying others until finding results.
         :param count: (optional) Whether to run a query with a count request or not
+        :param fan_out: (optional) Query all the available providers concurrently instead of one
+                        after another, using one of the following strategies:
+
+                        * ``first``: the first non-empty results win
+                        * ``merge``: results of all providers are merged
+                        * ``dedup``: results of all providers are merged, skipping products whose
+                          id or title was already returned by a provider with a higher priority
+
+                        Per-provider errors are available in the ``errors`` attribute of the returned
+                        :class:`~eodag.api.search_result.SearchResult`, and latencies in its
+                        ``latencies`` attribute.
+        :param fan_out_timeout: (optional) With ``fan_out``, time in seconds after which the
+                                providers that did not answer are skipped and reported as errors
         :param kwargs: Some other criteria that will be used to do the search,
                        using paramaters compatibles with the provider
         :returns: A collection of EO products matching the criteria
@@ -1200,6 +1254,20 @@ class EODataAccessGateway:
             items_per_page=items_per_page,
         )
 
+        if fan_out:
+            return self._fan_out_search(
+                search_plugins,
+                lambda search_plugin: self._do_search(
+                    search_plugin,
+                    count=count,
+                    raise_errors=raise_errors,
+                    **search_kwargs,
+                ),
+                strategy=fan_out,
+                timeout=fan_out_timeout,
+                raise_errors=raise_errors,
+            )
+
         errors: List[Tuple[str, Exception]] = []
         # Loop over available providers and return the first non-empty results
         for i, search_plugin in enumerate(search_plugins):
@@ -1224,6 +1292,98 @@ class EODataAccessGateway:
             logger.error("No result could be obtained from any available provider")
         return SearchResult([], 0, errors) if count else SearchResult([], errors=errors)
 
+    async def async_search(
+        self,
+        page: int = DEFAULT_PAGE,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+        raise_errors: bool = False,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        geom: Optional[Union[str, Dict[str, float], BaseGeometry]] = None,
+        locations: Optional[Dict[str, str]] = None,
+        provider: Optional[str] = None,
+        count: bool = False,
+        **kwargs: Any,
+    ) -> SearchResult:
+        """Asynchronous version of :meth:`search`, used by the server mode.
+
+        Search requests of plugins supporting it (see
+        :meth:`~eodag.plugins.search.base.Search.async_query`) are sent asynchronously, the
+        other ones being sent from a worker thread. Searches by id are run in a worker
+        thread.
+
+        :param page: (optional) The page number to return
+        :param items_per_page: (optional) The number of results that must appear in one single
+                               page
+        :param raise_errors:  (optional) When an error occurs when searching, if this is set to
+                              True, the error is raised
+        :param start: (optional) Start sensing time in ISO 8601 format
+        :param end: (optional) End sensing time in ISO 8601 format
+        :param geom: (optional) Search area, see :meth:`search`
+        :param locations: (optional) Location filtering by name using locations configuration
+        :param provider: (optional) the provider to be used. If set, search fallback will be disabled.
+        :param count: (optional) Whether to run a query with a count request or not
+        :param kwargs: Some other criteria that will be used to do the search,
+                       using paramaters compatibles with the provider
+        :returns: A collection of EO products matching the criteria
+        """
+        loop = asyncio.get_running_loop()
+        # product types may have to be fetched from the providers
+        search_plugins, search_kwargs = await loop.run_in_executor(
+            get_async_executor(),
+            partial(
+                self._prepare_search,
+                start=start,
+                end=end,
+                geom=geom,
+                locations=locations,
+                provider=provider,
+                **kwargs,
+            ),
+        )
+        if search_kwargs.get("id"):
+            return await loop.run_in_executor(
+                get_async_executor(),
+                partial(
+                    self._search_by_id,
+                    search_kwargs.pop("id"),
+                    provider=provider,
+                    raise_errors=raise_errors,
+                    **search_kwargs,
+                ),
+            )
+        # remove datacube query string from kwargs which was only needed for search-by-id
+        search_kwargs.pop("_dc_qs", None)
+
+        search_kwargs.update(
+            page=page,
+            items_per_page=items_per_page,
+        )
+
+        errors: List[Tuple[str, Exception]] = []
+        # Loop over available providers and return the first non-empty results
+        for i, search_plugin in enumerate(search_plugins):
+            search_plugin.clear()
+            search_results = await self._async_do_search(
+                search_plugin,
+                count=count,
+                raise_errors=raise_errors,
+                **search_kwargs,
+            )
+            errors.extend(search_results.errors)
+            if len(search_results) == 0 and i < len(search_plugins) - 1:
+                logger.warning(
+                    f"No result could be obtained from provider {search_plugin.provider}, "
+                    "we will try to get the data from another provider",
+                )
+            elif len(search_results) > 0:
+                search_results.errors = errors
+                return search_results
+
+        if i > 1:
+            logger.error("No result could be obtained from any available provider")
+        return SearchResult([], 0, errors) if count else SearchResult([], errors=errors)
+
     def search_iter_page(
         self,
         items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
@@ -1231,6 +1391,7 @@ class EODataAccessGateway:
         end: Optional[str] = None,
         geom: Optional[Union[str, Dict[str, float], BaseGeometry]] = None,
         locations: Optional[Dict[str, str]] = None,
+        prefetch: int = 0,
         **kwargs: Any,
     ) -> Iterator[SearchResult]:
         """Iterate over the pages of a products search.
@@ -1256,6 +1417,8 @@ class EODataAccessGateway:
                           the geometry of the features having the property ISO3 starting with
                           'PA' such as Panama and Pakistan in the shapefile configured with
                           name=country and attr=ISO3
+        :param prefetch: (optional) Number of pages fetched in background, ahead of the
+                         page being consumed. Pages are fetched one after another when ``0``
         :param kwargs: Some other criteria that will be used to do the search,
                        using paramaters compatibles with the provider
         :returns: An iterator that yields page per page a collection of EO products
@@ -1269,6 +1432,7 @@ class EODataAccessGateway:
                 return self.search_iter_page_plugin(
                     items_per_page=items_per_page,
                     search_plugin=search_plugin,
+                    prefetch=prefetch,
                     **search_kwargs,
                 )
             except RequestError:
@@ -1289,18 +1453,81 @@ class EODataAccessGateway:
         self,
         search_plugin: Union[Search, Api],
         items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+        prefetch: int = 0,
         **kwargs: Any,
     ) -> Iterator[SearchResult]:
         """Iterate over the pages of a products search using a given search plugin.
 
         :param items_per_page: (optional) The number of results requested per page
+        :param prefetch: (optional) Number of pages fetched in background, ahead of the
+                         page being consumed. Pages are fetched one after another when ``0``
         :param kwargs: Some other criteria that will be used to do the search,
                        using parameters compatibles with the provider
         :param search_plugin: search plugin to be used
         :returns: An iterator that yields page per page a collection of EO products
                   matching the criteria
         """
+        pages: Generator[
+            Union[SearchResult, Tuple[Any, Dict[str, Any]]], None, None
+        ] = self._iter_pages_plugin(
+            search_plugin, items_per_page, normalize=prefetch <= 0, **kwargs
+        )
+        if prefetch > 0:
+            # the requests of the next pages are sent in background, the plugin
+            # pagination state being only updated by the background thread, while the
+            # current page is normalized here. Closing the pages waits for the request
+            # being sent, which restores the plugin pagination state once answered
+            pages = prefetch_iter(pages, depth=prefetch, wait_on_close=True)
+        prev_product = None
+        try:
+            for page in pages:
+                search_result = (
+                    page
+                    if isinstance(page, SearchResult)
+                    else self._normalize_search_results(search_plugin, *page)
+                )
+                if len(search_result) == 0:
+                    continue
+                # The first products between two iterations are compared. If they
+                # are actually the same product, it means the iteration failed at
+                # progressing for some reason. This is implemented as a workaround
+                # to some search plugins/providers not handling pagination.
+                product = search_result[0]
+                if (
+                    prev_product
+                    and product.properties["id"] == prev_product.properties["id"]
+                    and product.provider == prev_product.provider
+                ):
+                    logger.warning(
+                        "Iterate over pages: stop iterating since the next page "
+                        "appears to have the same products as in the previous one. "
+                        "This provider may not implement pagination.",
+                    )
+                    break
+                yield search_result
+                prev_product = product
+        finally:
+            # stop fetching pages, the plugin being ready for another search
+            pages.close()
 
+    def _iter_pages_plugin(
+        self,
+        search_plugin: Union[Search, Api],
+        items_per_page: int,
+        normalize: bool = True,
+        **kwargs: Any,
+    ) -> Generator[Union[SearchResult, Tuple[Any, Dict[str, Any]]], None, None]:
+        """Send the requests of the successive pages of a products search, until a page
+        is not full.
+
+        :param search_plugin: search plugin to be used
+        :param items_per_page: The number of results requested per page
+        :param normalize: (optional) If ``False``, the raw results of the provider are
+                          yielded, with the search criteria needed to normalize them
+        :param kwargs: Some other criteria that will be used to do the search
+        :returns: An iterator that yields page per page a collection of EO products, or
+                  the raw results of the provider and their search criteria
+        """
         iteration = 1
         # Store the search plugin config pagination.next_page_url_tpl to reset it later
         # since it might be modified if the next_page_url mechanism is used by the
@@ -1314,7 +1541,6 @@ class EODataAccessGateway:
             page=1,
             items_per_page=items_per_page,
         )
-        prev_product = None
         next_page_url = None
         next_page_query_obj = None
         while True:
@@ -1327,8 +1553,12 @@ class EODataAccessGateway:
                 # remove unwanted kwargs for _do_search
                 kwargs.pop("count", None)
                 kwargs.pop("raise_errors", None)
-                search_result = self._do_search(
-                    search_plugin, count=False, raise_errors=True, **kwargs
+                page: Union[SearchResult, Tuple[Any, Dict[str, Any]]] = (
+                    self._do_search(
+                        search_plugin, count=False, raise_errors=True, **kwargs
+                    )
+                    if normalize
+                    else self._do_search_raw(search_plugin, **kwargs)
                 )
             except Exception:
                 logger.warning(
@@ -1366,34 +1596,16 @@ class EODataAccessGateway:
                     else:
                         search_plugin.next_page_query_obj = next_page_query_obj
 
-            if len(search_result) > 0:
-                # The first products between two iterations are compared. If they
-                # are actually the same product, it means the iteration failed at
-                # progressing for some reason. This is implemented as a workaround
-                # to some search plugins/providers not handling pagination.
-                product = search_result[0]
-                if (
-                    prev_product
-                    and product.properties["id"] == prev_product.properties["id"]
-                    and product.provider == prev_product.provider
-                ):
-                    logger.warning(
-                        "Iterate over pages: stop iterating since the next page "
-                        "appears to have the same products as in the previous one. "
-                        "This provider may not implement pagination.",
-                    )
-                    last_page_with_products = iteration - 1
-                    break
-                yield search_result
-                prev_product = product
-                # Prevent a last search if the current one returned less than the
-                # maximum number of items asked for.
-                if len(search_result) < items_per_page:
-                    last_page_with_products = iteration
-                    break
-            else:
+            nb_results = len(page if isinstance(page, SearchResult) else page[0])
+            if nb_results == 0:
                 last_page_with_products = iteration - 1
                 break
+            yield page
+            # Prevent a last search if the current one returned less than the
+            # maximum number of items asked for.
+            if nb_results < items_per_page:
+                last_page_with_products = iteration
+                break
             iteration += 1
             kwargs["page"] = iteration
         logger.debug(
@@ -1408,6 +1620,9 @@ class EODataAccessGateway:
         end: Optional[str] = None,
         geom: Optional[Union[str, Dict[str, float], BaseGeometry]] = None,
         locations: Optional[Dict[str, str]] = None,
+        fan_out: Optional[str] = None,
+        fan_out_timeout: Optional[float] = None,
+        prefetch: int = 0,
         **kwargs: Any,
     ) -> SearchResult:
         """Search and return all the products matching the search criteria.
@@ -1447,83 +1662,381 @@ class EODataAccessGateway:
                           the geometry of the features having the property ISO3 starting with
                           'PA' such as Panama and Pakistan in the shapefile configured with
                           name=country and attr=ISO3
+        :param fan_out: (optional) Query all the available providers concurrently, using one of the
+                        ``first``, ``merge`` or ``dedup`` strategies (see
+                        :meth:`~eodag.api.core.EODataAccessGateway.search`)
+        :param fan_out_timeout: (optional) With ``fan_out``, time in seconds after which the
+                                providers that did not answer are skipped and reported as errors
+        :param prefetch: (optional) Number of pages fetched in background, ahead of the
+                         page being collected. Pages are fetched one after another when ``0``
         :param kwargs: Some other criteria that will be used to do the search,
                        using parameters compatible with the provider
         :returns: An iterator that yields page per page a collection of EO products
                   matching the criteria
         """
-        # Get the search plugin and the maximized value
-        # of items_per_page if defined for the provider used.
-        try:
-            product_type = self.get_product_type_from_alias(
-                self.guess_product_type(**kwargs)[0]
-            )
-        except NoMatchingProductType:
-            product_type = GENERIC_PRODUCT_TYPE
-        else:
-            # fetch product types list if product_type is unknown
-            if (
-                product_type
-                not in self._plugins_manager.product_type_to_provider_config_map.keys()
-            ):
-                logger.debug(
-                    f"Fetching external product types sources to find {product_type} product type"
-                )
-                self.fetch_product_types_list()
-
-        search_plugins, search_kwargs = self._prepare_search(
+        search_plugins, search_kwargs = self._prepare_search_all(
             start=start, end=end, geom=geom, locations=locations, **kwargs
         )
-        for i, search_plugin in enumerate(search_plugins):
-            itp = (
-                items_per_page
-                or getattr(search_plugin.config, "pagination", {}).get(
-                    "max_items_per_page"
-                )
-                or DEFAULT_MAX_ITEMS_PER_PAGE
-            )
+
+        def search_all_plugin(
+            search_plugin: Union[Search, Api], all_results: SearchResult
+        ) -> SearchResult:
+            itp = self._get_all_items_per_page(search_plugin, items_per_page)
+            for page_results in self.search_iter_page_plugin(
+                items_per_page=itp,
+                search_plugin=search_plugin,
+                prefetch=prefetch,
+                **search_kwargs,
+            ):
+                all_results.data.extend(page_results.data)
             logger.info(
-                "Searching for all the products with provider %s and a maximum of %s "
-                "items per page.",
+                "Found %s result(s) on provider '%s'",
+                len(all_results),
                 search_plugin.provider,
-                itp,
             )
+            return all_results
+
+        if fan_out:
+
+            def search_all_plugin_or_partial(
+                search_plugin: Union[Search, Api]
+            ) -> SearchResult:
+                all_results = SearchResult([], errors=[])
+                try:
+                    return search_all_plugin(search_plugin, all_results)
+                except RequestError as e:
+                    if len(all_results) == 0:
+                        raise
+                    # keep incomplete results
+                    all_results.errors.append((search_plugin.provider, e))
+                    return all_results
+
+            return self._fan_out_search(
+                search_plugins,
+                search_all_plugin_or_partial,
+                strategy=fan_out,
+                timeout=fan_out_timeout,
+            )
+
+        for i, search_plugin in enumerate(search_plugins):
             all_results = SearchResult([])
+            try:
+                return search_all_plugin(search_plugin, all_results)
+            except RequestError:
+                if len(all_results) == 0 and i < len(search_plugins) - 1:
+                    logger.warning(
+                        "No result could be obtained from provider %s, "
+                        "we will try to get the data from another provider",
+                        search_plugin.provider,
+                    )
+                elif len(all_results) == 0:
+                    logger.error(
+                        "No result could be obtained from any available provider"
+                    )
+                    raise
+                elif len(all_results) > 0:
+                    logger.warning(
+                        "Found %s result(s) on provider '%s', but it may be incomplete "
+                        "as it ended with an error",
+                        len(all_results),
+                        search_plugin.provider,
+                    )
+                    return all_results
+        raise RequestError("No result could be obtained from any available provider")
+
+    def search_stream(
+        self,
+        items_per_page: Optional[int] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        geom: Optional[Union[str, Dict[str, float], BaseGeometry]] = None,
+        locations: Optional[Dict[str, str]] = None,
+        prefetch: int = 0,
+        **kwargs: Any,
+    ) -> Iterator[EOProduct]:
+        """Iterate over all the products matching the search criteria.
+
+        Like :meth:`~eodag.api.core.EODataAccessGateway.search_all`, it iterates over the
+        pages of a search query, but products are yielded page per page instead of being
+        collected into a single :class:`~eodag.api.search_result.SearchResult`, so that very
+        large result sets can be processed (e.g. written with
+        :meth:`~eodag.api.core.EODataAccessGateway.serialize_stream`) with a constant memory usage.
+
+        Requests are attempted to all providers of the product ordered by descending piority,
+        until one of them returns products.
+
+        :param items_per_page: (optional) The number of results requested internally per
+                               page (see :meth:`~eodag.api.core.EODataAccessGateway.search_all`)
+        :param start: (optional) Start sensing time in ISO 8601 format (e.g. "1990-11-26",
+                      "1990-11-26T14:30:10.153Z", "1990-11-26T14:30:10+02:00", ...).
+                      If no time offset is given, the time is assumed to be given in UTC.
+        :param end: (optional) End sensing time in ISO 8601 format (e.g. "1990-11-26",
+                    "1990-11-26T14:30:10.153Z", "1990-11-26T14:30:10+02:00", ...).
+                    If no time offset is given, the time is assumed to be given in UTC.
+        :param geom: (optional) Search area that can be defined in different ways:
+
+                     * with a Shapely geometry object:
+                       :class:`shapely.geometry.base.BaseGeometry`
+                     * with a bounding box (dict with keys: "lonmin", "latmin", "lonmax", "latmax"):
+                       ``dict.fromkeys(["lonmin", "latmin", "lonmax", "latmax"])``
+                     * with a bounding box as list of float:
+                       ``[lonmin, latmin, lonmax, latmax]``
+                     * with a WKT str
+        :param locations: (optional) Location filtering by name using locations configuration
+                          ``{"<location_name>"="<attr_regex>"}``. For example, ``{"country"="PA."}`` will use
+                          the geometry of the features having the property ISO3 starting with
+                          'PA' such as Panama and Pakistan in the shapefile configured with
+                          name=country and attr=ISO3
+        :param prefetch: (optional) Number of pages fetched in background, ahead of the
+                         page being consumed. Pages are fetched one after another when ``0``
+        :param kwargs: Some other criteria that will be used to do the search,
+                       using parameters compatible with the provider
+        :returns: An iterator that yields one by one the EO products matching the criteria
+        """
+        search_plugins, search_kwargs = self._prepare_search_all(
+            start=start, end=end, geom=geom, locations=locations, **kwargs
+        )
+        for i, search_plugin in enumerate(search_plugins):
+            itp = self._get_all_items_per_page(search_plugin, items_per_page)
+            products_count = 0
             try:
                 for page_results in self.search_iter_page_plugin(
                     items_per_page=itp,
                     search_plugin=search_plugin,
+                    prefetch=prefetch,
                     **search_kwargs,
                 ):
-                    all_results.data.extend(page_results.data)
+                    products_count += len(page_results)
+                    yield from page_results
                 logger.info(
                     "Found %s result(s) on provider '%s'",
-                    len(all_results),
+                    products_count,
                     search_plugin.provider,
                 )
-                return all_results
+                return
             except RequestError:
-                if len(all_results) == 0 and i < len(search_plugins) - 1:
+                if products_count == 0 and i < len(search_plugins) - 1:
                     logger.warning(
                         "No result could be obtained from provider %s, "
                         "we will try to get the data from another provider",
                         search_plugin.provider,
                     )
-                elif len(all_results) == 0:
+                elif products_count == 0:
                     logger.error(
                         "No result could be obtained from any available provider"
                     )
                     raise
-                elif len(all_results) > 0:
+                else:
                     logger.warning(
                         "Found %s result(s) on provider '%s', but it may be incomplete "
                         "as it ended with an error",
-                        len(all_results),
+                        products_count,
                         search_plugin.provider,
                     )
-                    return all_results
+                    return
         raise RequestError("No result could be obtained from any available provider")
 
+    def _prepare_search_all(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        geom: Optional[Union[str, Dict[str, float], BaseGeometry]] = None,
+        locations: Optional[Dict[str, str]] = None,
+        **kwargs: Any,
+    ) -> Tuple[List[Union[Search, Api]], Dict[str, Any]]:
+        """Internal method to prepare the search of all the products matching the criteria,
+        fetching external product types if the searched one is unknown.
+
+        See :meth:`~eodag.api.core.EODataAccessGateway._prepare_search`
+        """
+        try:
+            product_type = self.get_product_type_from_alias(
+                self.guess_product_type(**kwargs)[0]
+            )
+        except NoMatchingProductType:
+            product_type = GENERIC_PRODUCT_TYPE
+        else:
+            # fetch product types list if product_type is unknown
+            if (
+                product_type
+                not in self._plugins_manager.product_type_to_provider_config_map.keys()
+            ):
+                logger.debug(
+                    f"Fetching external product types sources to find {product_type} product type"
+                )
+                self.fetch_product_types_list()
+
+        return self._prepare_search(
+            start=start, end=end, geom=geom, locations=locations, **kwargs
+        )
+
+    @staticmethod
+    def _get_all_items_per_page(
+        search_plugin: Union[Search, Api], items_per_page: Optional[int] = None
+    ) -> int:
+        """Internal method that gets the number of items per page used to search all the products
+        of a provider, using its maximum value if configured"""
+        itp = (
+            items_per_page
+            or getattr(search_plugin.config, "pagination", {}).get("max_items_per_page")
+            or DEFAULT_MAX_ITEMS_PER_PAGE
+        )
+        logger.info(
+            "Searching for all the products with provider %s and a maximum of %s "
+            "items per page.",
+            search_plugin.provider,
+            itp,
+        )
+        return itp
+
+    def _fan_out_search(
+        self,
+        search_plugins: List[Union[Search, Api]],
+        search_func: Callable[[Union[Search, Api]], SearchResult],
+        strategy: str = "merge",
+        timeout: Optional[float] = None,
+        raise_errors: bool = False,
+    ) -> SearchResult:
+        """Internal method that runs a search on several providers concurrently.
+
+        :param search_plugins: The search plugins of the providers to query
+        :param search_func: The search to run, for a given search plugin
+        :param strategy: (optional) How results are combined: ``first`` returns the first
+                         non-empty results, ``merge`` merges all results and ``dedup`` merges
+                         all results skipping already returned products ids and titles
+        :param timeout: (optional) Time in seconds after which the providers that did not
+                        answer are skipped and reported as errors
+        :param raise_errors: (optional) When an error occurs when searching, if this is set to
+                             True, the error is raised
+        :returns: A collection of EO products matching the criteria
+        """
+        if strategy not in FAN_OUT_STRATEGIES:
+            raise ValidationError(
+                f"Unknown fan-out strategy {strategy}, should be one of {FAN_OUT_STRATEGIES}"
+            )
+        errors: List[Tuple[str, Exception]] = []
+        # latencies of the providers that answered in time, late providers only write in
+        # elapsed_times and never update the returned latencies
+        latencies: Dict[str, float] = {}
+        elapsed_times: Dict[str, float] = {}
+        results: Dict[str, SearchResult] = {}
+
+        def timed_search(search_plugin: Union[Search, Api]) -> SearchResult:
+            # search on a copy of the plugin: late providers keep running after the
+            # results are returned, and must not change the search context of the
+            # shared plugin while it is used by other searches
+            search_plugin = copy.copy(search_plugin)
+            search_plugin.clear()
+            start_time = time.monotonic()
+            try:
+                return search_func(search_plugin)
+            finally:
+                elapsed_times[search_plugin.provider] = time.monotonic() - start_time
+
+        logger.info(
+            "Searching concurrently on providers %s",
+            ", ".join(p.provider for p in search_plugins),
+        )
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, len(search_plugins)), thread_name_prefix="eodag-search"
+        )
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        future_to_plugin = {
+            executor.submit(timed_search, search_plugin): search_plugin
+            for search_plugin in search_plugins
+        }
+        pending = set(future_to_plugin)
+        provider_results: Optional[SearchResult]
+        try:
+            while pending:
+                done, pending = wait(
+                    pending,
+                    timeout=(
+                        max(0.0, deadline - time.monotonic())
+                        if deadline is not None
+                        else None
+                    ),
+                    return_when=FIRST_COMPLETED,
+                )
+                if not done:
+                    break
+                for future in done:
+                    provider = future_to_plugin[future].provider
+                    latencies[provider] = elapsed_times[provider]
+                    try:
+                        provider_results = future.result()
+                    except Exception as e:
+                        if raise_errors:
+                            raise
+                        logger.warning(
+                            "Error while searching on provider %s (ignored): %s",
+                            provider,
+                            e,
+                        )
+                        errors.append((provider, e))
+                        continue
+                    logger.info(
+                        "Found %s result(s) on provider '%s' in %.2fs",
+                        len(provider_results),
+                        provider,
+                        latencies[provider],
+                    )
+                    errors.extend(provider_results.errors)
+                    results[provider] = provider_results
+                    if strategy == "first" and len(provider_results) > 0:
+                        provider_results.errors = errors
+                        provider_results.latencies = latencies
+                        return provider_results
+            for future in pending:
+                provider = future_to_plugin[future].provider
+                logger.warning(
+                    "No answer from provider %s within %ss, skipped", provider, timeout
+                )
+                errors.append(
+                    (
+                        provider,
+                        TimeOutError(
+                            RequestError(
+                                f"No answer from provider {provider} within {timeout}s"
+                            ),
+                            timeout,
+                        ),
+                    )
+                )
+        finally:
+            # do not wait for late providers
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+        # merge results following providers priorities
+        merged = SearchResult([], 0, errors)
+        seen: set = set()
+        for search_plugin in search_plugins:
+            provider_results = results.get(search_plugin.provider)
+            if provider_results is None:
+                continue
+            for product in provider_results:
+                if strategy == "dedup":
+                    keys = {
+                        product.properties.get("id"),
+                        product.properties.get("title"),
+                    } - {None}
+                    if keys & seen:
+                        continue
+                    seen |= keys
+                merged.data.append(product)
+            if merged.number_matched is not None:
+                merged.number_matched = (
+                    None
+                    if provider_results.number_matched is None
+                    else merged.number_matched + provider_results.number_matched
+                )
+        if not results:
+            merged.number_matched = None
+        merged.latencies = latencies
+        return merged
+
     def _search_by_id(
         self, uid: str, provider: Optional[str] = None, **kwargs: Any
     ) -> SearchResult:
@@ -1810,6 +2323,95 @@ class EODataAccessGateway:
         :param kwargs: Some other criteria that will be used to do the search
         :returns: A collection of EO products matching the criteria
         """
+        try:
+            prep = self._prepare_do_search(search_plugin, count, kwargs)
+            res, nb_res = search_plugin.query(prep, **kwargs)
+            return self._process_search_results(search_plugin, count, res, nb_res)
+        except Exception as e:
+            return self._search_error(search_plugin, e, count, raise_errors)
+
+    def _do_search_raw(
+        self, search_plugin: Union[Search, Api], **kwargs: Any
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """Internal method that sends the requests of a search on a given provider,
+        without normalizing its results if the search plugin supports it.
+
+        :param search_plugin: A search plugin
+        :param kwargs: Some other criteria that will be used to do the search
+        :returns: The raw results of the provider, or products if the plugin normalized
+                  them, and the search criteria needed to normalize them
+        """
+        prep = self._prepare_do_search(search_plugin, False, kwargs)
+        prep.normalize = False
+        res, _ = search_plugin.query(prep, **kwargs)
+        return res, kwargs
+
+    def _normalize_search_results(
+        self,
+        search_plugin: Union[Search, Api],
+        res: Any,
+        kwargs: Dict[str, Any],
+    ) -> SearchResult:
+        """Build the collection of EO products of the results returned by
+        :meth:`_do_search_raw`
+
+        :param search_plugin: The search plugin that returned the results
+        :param res: The raw results of the provider, or products
+        :param kwargs: The search criteria of the results
+        :returns: A collection of EO products
+        """
+        try:
+            if isinstance(res, RawSearchResult):
+                res = getattr(search_plugin, "normalize_results")(res, **kwargs)
+            return self._process_search_results(search_plugin, False, res, None)
+        except Exception as e:
+            return self._search_error(search_plugin, e, False, True)
+
+    async def _async_do_search(
+        self,
+        search_plugin: Union[Search, Api],
+        count: bool = False,
+        raise_errors: bool = False,
+        **kwargs: Any,
+    ) -> SearchResult:
+        """Internal method that performs a search on a given provider, sending the search
+        requests asynchronously if the search plugin supports it.
+
+        :param search_plugin: A search plugin
+        :param count: (optional) Whether to run a query with a count request or not
+        :param raise_errors: (optional) When an error occurs when searching, if this is set to
+                             True, the error is raised
+        :param kwargs: Some other criteria that will be used to do the search
+        :returns: A collection of EO products matching the criteria
+        """
+        try:
+            # authentication may need blocking requests
+            prep = await asyncio.get_running_loop().run_in_executor(
+                get_async_executor(),
+                self._prepare_do_search,
+                search_plugin,
+                count,
+                kwargs,
+            )
+            res, nb_res = await search_plugin.async_query(prep, **kwargs)
+            return self._process_search_results(search_plugin, count, res, nb_res)
+        except Exception as e:
+            return self._search_error(search_plugin, e, count, raise_errors)
+
+    def _prepare_do_search(
+        self,
+        search_plugin: Union[Search, Api],
+        count: bool,
+        kwargs: Dict[str, Any],
+    ) -> PreparedSearch:
+        """Build the :class:`~eodag.plugins.search.PreparedSearch` of a search on a given
+        provider, popping the pagination from the search criteria
+
+        :param search_plugin: A search plugin
+        :param count: Whether to run a query with a count request or not
+        :param kwargs: Search criteria, updated in place
+        :returns: The prepared search
+        """
         logger.info("Searching on provider %s", search_plugin.provider)
         max_items_per_page = getattr(search_plugin.config, "pagination", {}).get(
             "max_items_per_page", DEFAULT_MAX_ITEMS_PER_PAGE
@@ -1828,141 +2430,158 @@ class EODataAccessGateway:
                 max_items_per_page,
             )
 
-        results: List[EOProduct] = []
-        total_results: Optional[int] = 0 if count else None
-
-        errors: List[Tuple[str, Exception]] = []
-
-        try:
-            prep = PreparedSearch(count=count)
-
-            # append auth if needed
-            if getattr(search_plugin.config, "need_auth", False):
-                if auth := self._plugins_manager.get_auth(
-                    search_plugin.provider,
-                    getattr(search_plugin.config, "api_endpoint", None),
-                    search_plugin.config,
-                ):
-                    prep.auth = auth
+        prep = PreparedSearch(count=count)
 
-            prep.page = kwargs.pop("page", None)
-            prep.items_per_page = kwargs.pop("items_per_page", None)
+        # append auth if needed
+        if getattr(search_plugin.config, "need_auth", False):
+            if auth := self._plugins_manager.get_auth(
+                search_plugin.provider,
+                getattr(search_plugin.config, "api_endpoint", None),
+                search_plugin.config,
+            ):
+                prep.auth = auth
 
-            res, nb_res = search_plugin.query(prep, **kwargs)
+        prep.page = kwargs.pop("page", None)
+        prep.items_per_page = kwargs.pop("items_per_page", None)
+        return prep
 
-            if not isinstance(res, list):
-                raise PluginImplementationError(
-                    "The query function of a Search plugin must return a list of "
-                    "results, got {} instead".format(type(res))
-                )
+    def _process_search_results(
+        self,
+        search_plugin: Union[Search, Api],
+        count: bool,
+        res: List[EOProduct],
+        nb_res: Optional[int],
+    ) -> SearchResult:
+        """Check the results of a search plugin query and attach them their download
+        plugins
 
-            # Filter and attach to each eoproduct in the result the plugin capable of
-            # downloading it (this is done to enable the eo_product to download itself
-            # doing: eo_product.download()). The filtering is done by keeping only
-            # those eo_products that intersects the search extent (if there was no
-            # search extent, search_intersection contains the geometry of the
-            # eo_product)
-            # WARNING: this means an eo_product that has an invalid geometry can still
-            # be returned as a search result if there was no search extent (because we
-            # will not try to do an intersection)
-            for eo_product in res:
-                # if product_type is not defined, try to guess using properties
-                if eo_product.product_type is None:
-                    pattern = re.compile(r"[^\w,]+")
-                    try:
-                        guesses = self.guess_product_type(
-                            intersect=False,
-                            **{
-                                k: pattern.sub("", str(v).upper())
-                                for k, v in eo_product.properties.items()
-                                if k
-                                in [
-                                    "instrument",
-                                    "platform",
-                                    "platformSerialIdentifier",
-                                    "processingLevel",
-                                    "sensorType",
-                                    "keywords",
-                                ]
-                                and v is not None
-                            },
-                        )
-                    except NoMatchingProductType:
-                        pass
-                    else:
-                        eo_product.product_type = guesses[0]
+        :param search_plugin: The search plugin that returned the results
+        :param count: Whether the query was run with a count request or not
+        :param res: Products returned by the query
+        :param nb_res: Number of matching products returned by the query
+        :returns: A collection of EO products matching the criteria
+        """
+        if not isinstance(res, list):
+            raise PluginImplementationError(
+                "The query function of a Search plugin must return a list of "
+                "results, got {} instead".format(type(res))
+            )
 
+        # Filter and attach to each eoproduct in the result the plugin capable of
+        # downloading it (this is done to enable the eo_product to download itself
+        # doing: eo_product.download()). The filtering is done by keeping only
+        # those eo_products that intersects the search extent (if there was no
+        # search extent, search_intersection contains the geometry of the
+        # eo_product)
+        # WARNING: this means an eo_product that has an invalid geometry can still
+        # be returned as a search result if there was no search extent (because we
+        # will not try to do an intersection)
+        for eo_product in res:
+            # if product_type is not defined, try to guess using properties
+            if eo_product.product_type is None:
+                pattern = re.compile(r"[^\w,]+")
                 try:
-                    if eo_product.product_type is not None:
-                        eo_product.product_type = self.get_product_type_from_alias(
-                            eo_product.product_type
-                        )
+                    guesses = self.guess_product_type(
+                        intersect=False,
+                        **{
+                            k: pattern.sub("", str(v).upper())
+                            for k, v in eo_product.properties.items()
+                            if k
+                            in [
+                                "instrument",
+                                "platform",
+                                "platformSerialIdentifier",
+                                "processingLevel",
+                                "sensorType",
+                                "keywords",
+                            ]
+                            and v is not None
+                        },
+                    )
                 except NoMatchingProductType:
-                    logger.debug("product type %s not found", eo_product.product_type)
+                    pass
+                else:
+                    eo_product.product_type = guesses[0]
 
-                if eo_product.search_intersection is not None:
-                    download_plugin = self._plugins_manager.get_download_plugin(
-                        eo_product
+            try:
+                if eo_product.product_type is not None:
+                    eo_product.product_type = self.get_product_type_from_alias(
+                        eo_product.product_type
                     )
-                    if len(eo_product.assets) > 0:
-                        matching_url = next(iter(eo_product.assets.values()))["href"]
-                    elif eo_product.properties.get("storageStatus") != ONLINE_STATUS:
-                        matching_url = eo_product.properties.get(
-                            "orderLink"
-                        ) or eo_product.properties.get("downloadLink")
-                    else:
-                        matching_url = eo_product.properties.get("downloadLink")
+            except NoMatchingProductType:
+                logger.debug("product type %s not found", eo_product.product_type)
+
+            if eo_product.search_intersection is not None:
+                download_plugin = self._plugins_manager.get_download_plugin(eo_product)
+                if len(eo_product.assets) > 0:
+                    matching_url = next(iter(eo_product.assets.values()))["href"]
+                elif eo_product.properties.get("storageStatus") != ONLINE_STATUS:
+                    matching_url = eo_product.properties.get(
+                        "orderLink"
+                    ) or eo_product.properties.get("downloadLink")
+                else:
+                    matching_url = eo_product.properties.get("downloadLink")
 
-                    try:
-                        auth_plugin = next(
-                            self._plugins_manager.get_auth_plugins(
-                                search_plugin.provider,
-                                matching_url=matching_url,
-                                matching_conf=download_plugin.config,
-                            )
+                try:
+                    auth_plugin = next(
+                        self._plugins_manager.get_auth_plugins(
+                            search_plugin.provider,
+                            matching_url=matching_url,
+                            matching_conf=download_plugin.config,
                         )
-                    except StopIteration:
-                        auth_plugin = None
-                    eo_product.register_downloader(download_plugin, auth_plugin)
-
-            results.extend(res)
-            total_results = (
-                None
-                if (nb_res is None or total_results is None)
-                else total_results + nb_res
-            )
-            if count and nb_res is not None:
-                logger.info(
-                    "Found %s result(s) on provider '%s'",
-                    nb_res,
-                    search_plugin.provider,
-                )
-                # Hitting for instance
-                # https://theia.cnes.fr/atdistrib/resto2/api/collections/SENTINEL2/
-                #   search.json?startDate=2019-03-01&completionDate=2019-06-15
-                #   &processingLevel=LEVEL2A&maxRecords=1&page=1
-                # returns a number (properties.totalResults) that is the number of
-                # products in the collection (here SENTINEL2) instead of the estimated
-                # total number of products matching the search criteria (start/end date).
-                # Remove this warning when this is fixed upstream by THEIA.
-                if search_plugin.provider == "theia":
-                    logger.warning(
-                        "Results found on provider 'theia' is the total number of products "
-                        "available in the searched collection (e.g. SENTINEL2) instead of "
-                        "the total number of products matching the search criteria"
                     )
-        except Exception as e:
-            if raise_errors:
-                # Raise the error, letting the application wrapping eodag know that
-                # something went bad. This way it will be able to decide what to do next
-                raise
-            else:
-                logger.exception(
-                    "Error while searching on provider %s (ignored):",
-                    search_plugin.provider,
+                except StopIteration:
+                    auth_plugin = None
+                eo_product.register_downloader(download_plugin, auth_plugin)
+
+        if count and nb_res is not None:
+            logger.info(
+                "Found %s result(s) on provider '%s'",
+                nb_res,
+                search_plugin.provider,
+            )
+            # Hitting for instance
+            # https://theia.cnes.fr/atdistrib/resto2/api/collections/SENTINEL2/
+            #   search.json?startDate=2019-03-01&completionDate=2019-06-15
+            #   &processingLevel=LEVEL2A&maxRecords=1&page=1
+            # returns a number (properties.totalResults) that is the number of
+            # products in the collection (here SENTINEL2) instead of the estimated
+            # total number of products matching the search criteria (start/end date).
+            # Remove this warning when this is fixed upstream by THEIA.
+            if search_plugin.provider == "theia":
+                logger.warning(
+                    "Results found on provider 'theia' is the total number of products "
+                    "available in the searched collection (e.g. SENTINEL2) instead of "
+                    "the total number of products matching the search criteria"
                 )
-                errors.append((search_plugin.provider, e))
-        return SearchResult(results, total_results, errors)
+        return SearchResult(res, nb_res if count else None)
+
+    @staticmethod
+    def _search_error(
+        search_plugin: Union[Search, Api],
+        error: Exception,
+        count: bool,
+        raise_errors: bool,
+    ) -> SearchResult:
+        """Handle an error raised while searching on a given provider
+
+        :param search_plugin: The search plugin that failed
+        :param error: The raised error
+        :param count: Whether the query was run with a count request or not
+        :param raise_errors: Whether the error must be raised or only reported in the
+                             returned search result
+        :returns: An empty search result holding the error
+        """
+        if raise_errors:
+            # Raise the error, letting the application wrapping eodag know that
+            # something went bad. This way it will be able to decide what to do next
+            raise error
+        logger.error(
+            "Error while searching on provider %s (ignored):",
+            search_plugin.provider,
+            exc_info=error,
+        )
+        return SearchResult([], 0 if count else None, [(search_plugin.provider, error)])
 
     def crunch(self, results: SearchResult, **kwargs: Any) -> SearchResult:
         """Apply the filters given through the keyword arguments to the results
@@ -2009,6 +2628,7 @@ class EODataAccessGateway:
         progress_callback: Optional[ProgressCallback] = None,
         wait: float = DEFAULT_DOWNLOAD_WAIT,
         timeout: float = DEFAULT_DOWNLOAD_TIMEOUT,
+        max_workers: int = 1,
         **kwargs: Unpack[DownloadConf],
     ) -> List[str]:
         """Download all products resulting from a search.
@@ -2028,6 +2648,9 @@ class EODataAccessGateway:
                      two download tries of the same product
         :param timeout: (optional) If download fails, maximum time in minutes
                         before stop retrying to download
+        :param max_workers: (optional) Maximum number of products downloaded concurrently, also limited
+                            per provider by the ``max_workers`` download plugin parameter; default: ``1``
+                            (sequential download)
         :param kwargs: Additional keyword arguments from the download plugin configuration class that can
                        be provided to override any other values defined in a configuration file
                        or with environment variables:
@@ -2055,6 +2678,7 @@ class EODataAccessGateway:
                 progress_callback=progress_callback,
                 wait=wait,
                 timeout=timeout,
+                max_workers=max_workers,
                 **kwargs,
             )
         else:
@@ -2085,6 +2709,85 @@ class EODataAccessGateway:
         with open(filename, "r") as fh:
             return SearchResult.from_geojson(geojson.load(fh))
 
+    @staticmethod
+    def serialize_stream(
+        products: Iterable[EOProduct],
+        filename: Union[str, IO[str]] = "search_results.ndjson",
+        output_format: str = "ndjson",
+    ) -> int:
+        """Registers products into a file, one GeoJSON feature at a time.
+
+        Products are written as soon as they are received, which allows storing the products
+        yielded by :meth:`~eodag.api.core.EODataAccessGateway.search_stream` with a constant
+        memory usage.
+
+        :param products: EO products to register, e.g. from
+                         :meth:`~eodag.api.core.EODataAccessGateway.search_stream`
+        :param filename: (optional) The name of the file to generate, or a text stream to write to
+        :param output_format: (optional) ``ndjson`` (one feature per line) or ``geojson-seq``
+                              (`RFC 8142 <https://www.rfc-editor.org/rfc/rfc8142>`_ GeoJSON text
+                              sequence, each feature being preceded by a record separator)
+        :returns: The number of registered products
+        :raises: :class:`~eodag.utils.exceptions.ValidationError`
+        """
+        if output_format not in STREAM_FORMATS:
+            raise ValidationError(
+                f"Unknown output format {output_format}, must be one of {STREAM_FORMATS}"
+            )
+        prefix = GEOJSON_SEQ_RS if output_format == "geojson-seq" else ""
+        products_count = 0
+        with (
+            open(filename, "w") if isinstance(filename, str) else nullcontext(filename)
+        ) as fh:
+            for product in products:
+                fh.write(prefix + geojson.dumps(product) + "\n")
+                products_count += 1
+        return products_count
+
+    @staticmethod
+    def deserialize_stream(filename: Union[str, IO[str]]) -> Iterator[EOProduct]:
+        """Lazily loads products from a file, one GeoJSON feature at a time.
+
+        Files written by :meth:`~eodag.api.core.EODataAccessGateway.serialize_stream`
+        (``ndjson`` or ``geojson-seq``) are read feature by feature, without loading the
+        whole file in memory. GeoJSON feature collections written by
+        :meth:`~eodag.api.core.EODataAccessGateway.serialize` are also accepted, but are
+        entirely loaded before iterating over their features.
+
+        :param filename: A filename containing the products, or a text stream to read from
+        :returns: An iterator that yields one by one the EO products encoded in `filename`
+        :raises: :class:`~eodag.utils.exceptions.ValidationError` if a line is not a
+                 GeoJSON feature
+        """
+        with (
+            open(filename, "r") if isinstance(filename, str) else nullcontext(filename)
+        ) as fh:
+            first_record = True
+            for line_number, line in enumerate(fh, start=1):
+                record = line.strip().lstrip(GEOJSON_SEQ_RS).strip()
+                if not record:
+                    continue
+                try:
+                    try:
+                        feature = orjson.loads(record)
+                    except orjson.JSONDecodeError:
+                        if not first_record:
+                            raise
+                        # not a one-line record, the whole file is a GeoJSON document,
+                        # e.g. an indented feature collection
+                        feature = orjson.loads(line + fh.read())
+                except orjson.JSONDecodeError as e:
+                    raise ValidationError(
+                        f"Invalid GeoJSON feature at line {line_number} of "
+                        f"{getattr(fh, 'name', filename)}: {e}"
+                    ) from e
+                first_record = False
+                if feature.get("type") == "FeatureCollection":
+                    for collection_feature in feature["features"]:
+                        yield EOProduct.from_geojson(collection_feature)
+                    continue
+                yield EOProduct.from_geojson(feature)
+
     def deserialize_and_register(self, filename: str) -> SearchResult:
         """Loads results of a search from a geojson file and register
         products with the information needed to download itself
@@ -181,13 +181,17 @@ class EOProduct:
         :returns: The representation of a :class:`~eodag.api.product._product.EOProduct` as a
                   Python dict
         """
+        geometry_mapping = geometry.mapping(self.geometry)
         search_intersection = None
-        if self.search_intersection is not None:
+        if self.search_intersection is self.geometry:
+            # no extent was searched, do not serialize the geometry twice
+            search_intersection = dict(geometry_mapping)
+        elif self.search_intersection is not None:
             search_intersection = geometry.mapping(self.search_intersection)
 
         geojson_repr: Dict[str, Any] = {
             "type": "Feature",
-            "geometry": geometry.mapping(self.geometry),
+            "geometry": geometry_mapping,
             "id": self.properties["id"],
             "assets": self.assets.as_dict(),
             "properties": {
@@ -324,6 +328,8 @@ class EOProduct:
         progress_callback, close_progress_callback = self._init_progress_bar(
             progress_callback
         )
+        # products already on this platform are not stored
+        is_remote = self.location == self.remote_location
 
         fs_path = self.downloader.download(
             self,
@@ -340,6 +346,8 @@ class EOProduct:
 
         if fs_path is None:
             raise DownloadError("Missing file location returned by download process")
+        if is_remote:
+            self.downloader.store_product(self, fs_path, **kwargs)
         logger.debug(
             "Product location updated from '%s' to '%s'",
             self.remote_location,
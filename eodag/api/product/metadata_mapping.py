@@ -21,6 +21,7 @@ import ast
 import json
 import logging
 import re
+from collections import defaultdict
 from datetime import datetime, timedelta
 from string import Formatter
 from typing import (
@@ -56,7 +57,6 @@ from eodag.utils import (
     DEFAULT_PROJ,
     deepcopy,
     dict_items_recursive_apply,
-    format_string,
     get_geometry_from_various,
     get_timestamp,
     items_recursive_apply,
@@ -64,6 +64,7 @@ from eodag.utils import (
     string_to_jsonpath,
     update_nested_dict,
 )
+from eodag.utils.exceptions import MisconfiguredError
 
 if TYPE_CHECKING:
     from shapely.geometry.base import BaseGeometry
@@ -194,744 +195,786 @@ def format_metadata(search_param: str, *args: Any, **kwargs: Any) -> str:
     :param kwargs: (optional) Additional named-arguments to use when formatting
     :returns: The formatted string
     """
+    # if stac extension colon separator `:` is in search params, parse it to prevent issues with vformat
+    if re.search(r"{[\w-]*:[\w#-]*}", search_param):
+        search_param = re.sub(r"{([\w-]*):([\w#-]*)}", r"{\1_COLON_\2}", search_param)
+        kwargs = {k.replace(":", "_COLON_"): v for k, v in kwargs.items()}
 
-    class MetadataFormatter(Formatter):
-        CONVERSION_REGEX = re.compile(
-            r"^(?P<field_name>.+)"
-            + SEP
-            + r"(?P<converter>[^\d\W]\w*)(\((?P<args>.*)\))*$"
-        )
+    return MetadataFormatter().vformat(search_param, args, kwargs)
 
-        def __init__(self) -> None:
-            self.custom_converter: Optional[Callable] = None
-            self.custom_args: Optional[str] = None
-
-        def get_field(self, field_name: str, args: Any, kwargs: Any) -> Any:
-            conversion_func_spec = self.CONVERSION_REGEX.match(field_name)
-            # Register a custom converter if any for later use (see convert_field)
-            # This is done because we don't have the value associated to field_name at
-            # this stage
-            if conversion_func_spec:
-                field_name = conversion_func_spec.groupdict()["field_name"]
-                converter = conversion_func_spec.groupdict()["converter"]
-                self.custom_args = conversion_func_spec.groupdict()["args"]
-                self.custom_converter = getattr(self, "convert_{}".format(converter))
-
-            return super(MetadataFormatter, self).get_field(field_name, args, kwargs)
-
-        def convert_field(self, value: Any, conversion: Any) -> Any:
-            # Do custom conversion if any (see get_field)
-            if self.custom_converter is not None:
-                if self.custom_args is not None and value is not None:
-                    converted = self.custom_converter(value, self.custom_args)
-                elif value is not None:
-                    converted = self.custom_converter(value)
-                else:
-                    converted = ""
-                # Clear this state variable in case the same converter is used to
-                # resolve other named arguments
-                self.custom_converter = None
-                self.custom_args = None
-                return converted
-            return super(MetadataFormatter, self).convert_field(value, conversion)
-
-        @staticmethod
-        def convert_datetime_to_timestamp_milliseconds(date_time: str) -> int:
-            """Convert a date_time (str) to a Unix timestamp in milliseconds
-
-            "2021-04-21T18:27:19.123Z" => "1619029639123"
-            "2021-04-21" => "1618963200000"
-            "2021-04-21T00:00:00+02:00" => "1618956000000"
-            """
-            return int(1e3 * get_timestamp(date_time))
-
-        @staticmethod
-        def convert_to_iso_utc_datetime_from_milliseconds(
-            timestamp: int,
-        ) -> Union[str, int]:
-            """Convert a timestamp in milliseconds (int) to its ISO8601 UTC format
-
-            1619029639123 => "2021-04-21T18:27:19.123Z"
-            """
-            try:
-                return (
-                    datetime.fromtimestamp(timestamp / 1e3, tzutc())
-                    .isoformat(timespec="milliseconds")
-                    .replace("+00:00", "Z")
-                )
-            except TypeError:
-                return timestamp
-
-        @staticmethod
-        def convert_to_iso_utc_datetime(
-            date_time: str, timespec: str = "milliseconds"
-        ) -> str:
-            """Convert a date_time (str) to its ISO 8601 representation in UTC
-
-            "2021-04-21" => "2021-04-21T00:00:00.000Z"
-            "2021-04-21T00:00:00.000+02:00" => "2021-04-20T22:00:00.000Z"
-
-            The optional argument timespec specifies the number of additional
-            terms of the time to include. Valid options are 'auto', 'hours',
-            'minutes', 'seconds', 'milliseconds' and 'microseconds'.
-            """
-            try:
-                dt = isoparse(date_time)
-            except ValueError:
-                return date_time
-            if not dt.tzinfo:
-                dt = dt.replace(tzinfo=UTC)
-            elif dt.tzinfo is not UTC:
-                dt = dt.astimezone(UTC)
-            return dt.isoformat(timespec=timespec).replace("+00:00", "Z")
-
-        @staticmethod
-        def convert_to_iso_date(
-            datetime_string: str, time_delta_args_str: str = "0,0,0,0,0,0,0"
-        ) -> str:
-            """Convert an ISO8601 datetime (str) to its ISO8601 date format
-
-            "2021-04-21T18:27:19.123Z" => "2021-04-21"
-            "2021-04-21" => "2021-04-21"
-            "2021-04-21T00:00:00+06:00" => "2021-04-20" !
-            """
-            dt = isoparse(datetime_string)
-            if not dt.tzinfo:
-                dt = dt.replace(tzinfo=UTC)
-            elif dt.tzinfo is not UTC:
-                dt = dt.astimezone(UTC)
-            time_delta_args = ast.literal_eval(time_delta_args_str)
-            dt += timedelta(*time_delta_args)
-            return dt.isoformat()[:10]
-
-        @staticmethod
-        def convert_to_non_separated_date(datetime_string):
-            iso_date = MetadataFormatter.convert_to_iso_date(datetime_string)
-            return iso_date.replace("-", "")
-
-        @staticmethod
-        def convert_to_rounded_wkt(value: BaseGeometry) -> str:
-            wkt_value = cast(
-                str, wkt.dumps(value, rounding_precision=COORDS_ROUNDING_PRECISION)
-            )
-            # If needed, simplify WKT to prevent too long request failure
-            tolerance = 0.1
-            while len(wkt_value) > WKT_MAX_LEN and tolerance <= 1:
-                logger.debug(
-                    "Geometry WKT is too long (%s), trying to simplify it with tolerance %s",
-                    len(wkt_value),
-                    tolerance,
-                )
-                wkt_value = cast(
-                    str,
-                    wkt.dumps(
-                        value.simplify(tolerance),
-                        rounding_precision=COORDS_ROUNDING_PRECISION,
-                    ),
-                )
-                tolerance += 0.1
-            if len(wkt_value) > WKT_MAX_LEN and tolerance > 1:
-                logger.warning("Failed to reduce WKT length lower than %s", WKT_MAX_LEN)
-            return wkt_value
-
-        @staticmethod
-        def convert_to_bounds_lists(input_geom: BaseGeometry) -> List[List[float]]:
-            if isinstance(input_geom, MultiPolygon):
-                geoms = [geom for geom in input_geom.geoms]
-                # sort with larger one at first (stac-browser only plots first one)
-                geoms.sort(key=lambda x: x.area, reverse=True)
-                return [list(x.bounds[0:4]) for x in geoms]
-            else:
-                return [list(input_geom.bounds[0:4])]
-
-        @staticmethod
-        def convert_to_bounds(input_geom_unformatted: Any) -> List[float]:
-            input_geom = get_geometry_from_various(geometry=input_geom_unformatted)
-            if isinstance(input_geom, MultiPolygon):
-                geoms = [geom for geom in input_geom.geoms]
-                # sort with larger one at first (stac-browser only plots first one)
-                geoms.sort(key=lambda x: x.area, reverse=True)
-                min_lon = 180
-                min_lat = 90
-                max_lon = -180
-                max_lat = -90
-                for geom in geoms:
-                    min_lon = min(min_lon, geom.bound[0])
-                    min_lat = min(min_lat, geom.bound[1])
-                    max_lon = max(max_lon, geom.bound[2])
-                    max_lat = max(max_lat, geom.bound[3])
-                return [min_lon, min_lat, max_lon, max_lat]
-            else:
-                return list(input_geom.bounds[0:4])
-
-        @staticmethod
-        def convert_to_nwse_bounds(input_geom: BaseGeometry) -> List[float]:
-            if isinstance(input_geom, str):
-                input_geom = shapely.wkt.loads(input_geom)
-            return list(input_geom.bounds[-1:] + input_geom.bounds[:-1])
-
-        @staticmethod
-        def convert_to_nwse_bounds_str(
-            input_geom: BaseGeometry, separator: str = ","
-        ) -> str:
-            return separator.join(
-                str(x) for x in MetadataFormatter.convert_to_nwse_bounds(input_geom)
-            )
 
-        @staticmethod
-        def convert_to_geojson(string: str) -> str:
-            return geojson.dumps(string)
+class MetadataFormatter(Formatter):
+    """:class:`string.Formatter` used by :func:`format_metadata`, resolving
+    ``{<field_name>#<conversion_function>}`` fields"""
 
-        @staticmethod
-        def convert_from_ewkt(ewkt_string: str) -> Union[BaseGeometry, str]:
-            """Convert EWKT (Extended Well-Known text) to shapely geometry"""
+    CONVERSION_REGEX = re.compile(
+        r"^(?P<field_name>.+)" + SEP + r"(?P<converter>[^\d\W]\w*)(\((?P<args>.*)\))*$"
+    )
 
-            ewkt_regex = re.compile(
-                r"^.*(?P<proj>SRID=[0-9]+);(?P<wkt>[A-Z0-9 \(\),\.-]+).*$"
+    def __init__(self) -> None:
+        self.custom_converter: Optional[Callable] = None
+        self.custom_args: Optional[str] = None
+
+    def get_field(self, field_name: str, args: Any, kwargs: Any) -> Any:
+        conversion_func_spec = self.CONVERSION_REGEX.match(field_name)
+        # Register a custom converter if any for later use (see convert_field)
+        # This is done because we don't have the value associated to field_name at
+        # this stage
+        if conversion_func_spec:
+            field_name = conversion_func_spec.groupdict()["field_name"]
+            converter = conversion_func_spec.groupdict()["converter"]
+            self.custom_args = conversion_func_spec.groupdict()["args"]
+            self.custom_converter = getattr(self, "convert_{}".format(converter))
+
+        return super(MetadataFormatter, self).get_field(field_name, args, kwargs)
+
+    def convert_field(self, value: Any, conversion: Any) -> Any:
+        # Do custom conversion if any (see get_field)
+        if self.custom_converter is not None:
+            if self.custom_args is not None and value is not None:
+                converted = self.custom_converter(value, self.custom_args)
+            elif value is not None:
+                converted = self.custom_converter(value)
+            else:
+                converted = ""
+            # Clear this state variable in case the same converter is used to
+            # resolve other named arguments
+            self.custom_converter = None
+            self.custom_args = None
+            return converted
+        return super(MetadataFormatter, self).convert_field(value, conversion)
+
+    @staticmethod
+    def convert_datetime_to_timestamp_milliseconds(date_time: str) -> int:
+        """Convert a date_time (str) to a Unix timestamp in milliseconds
+
+        "2021-04-21T18:27:19.123Z" => "1619029639123"
+        "2021-04-21" => "1618963200000"
+        "2021-04-21T00:00:00+02:00" => "1618956000000"
+        """
+        return int(1e3 * get_timestamp(date_time))
+
+    @staticmethod
+    def convert_to_iso_utc_datetime_from_milliseconds(
+        timestamp: int,
+    ) -> Union[str, int]:
+        """Convert a timestamp in milliseconds (int) to its ISO8601 UTC format
+
+        1619029639123 => "2021-04-21T18:27:19.123Z"
+        """
+        try:
+            return (
+                datetime.fromtimestamp(timestamp / 1e3, tzutc())
+                .isoformat(timespec="milliseconds")
+                .replace("+00:00", "Z")
+            )
+        except TypeError:
+            return timestamp
+
+    @staticmethod
+    def convert_to_iso_utc_datetime(
+        date_time: str, timespec: str = "milliseconds"
+    ) -> str:
+        """Convert a date_time (str) to its ISO 8601 representation in UTC
+
+        "2021-04-21" => "2021-04-21T00:00:00.000Z"
+        "2021-04-21T00:00:00.000+02:00" => "2021-04-20T22:00:00.000Z"
+
+        The optional argument timespec specifies the number of additional
+        terms of the time to include. Valid options are 'auto', 'hours',
+        'minutes', 'seconds', 'milliseconds' and 'microseconds'.
+        """
+        try:
+            dt = isoparse(date_time)
+        except ValueError:
+            return date_time
+        if not dt.tzinfo:
+            dt = dt.replace(tzinfo=UTC)
+        elif dt.tzinfo is not UTC:
+            dt = dt.astimezone(UTC)
+        return dt.isoformat(timespec=timespec).replace("+00:00", "Z")
+
+    @staticmethod
+    def convert_to_iso_date(
+        datetime_string: str, time_delta_args_str: str = "0,0,0,0,0,0,0"
+    ) -> str:
+        """Convert an ISO8601 datetime (str) to its ISO8601 date format
+
+        "2021-04-21T18:27:19.123Z" => "2021-04-21"
+        "2021-04-21" => "2021-04-21"
+        "2021-04-21T00:00:00+06:00" => "2021-04-20" !
+        """
+        dt = isoparse(datetime_string)
+        if not dt.tzinfo:
+            dt = dt.replace(tzinfo=UTC)
+        elif dt.tzinfo is not UTC:
+            dt = dt.astimezone(UTC)
+        time_delta_args = ast.literal_eval(time_delta_args_str)
+        dt += timedelta(*time_delta_args)
+        return dt.isoformat()[:10]
+
+    @staticmethod
+    def convert_to_non_separated_date(datetime_string):
+        iso_date = MetadataFormatter.convert_to_iso_date(datetime_string)
+        return iso_date.replace("-", "")
+
+    @staticmethod
+    def convert_to_rounded_wkt(value: BaseGeometry) -> str:
+        wkt_value = cast(
+            str, wkt.dumps(value, rounding_precision=COORDS_ROUNDING_PRECISION)
+        )
+        # If needed, simplify WKT to prevent too long request failure
+        tolerance = 0.1
+        while len(wkt_value) > WKT_MAX_LEN and tolerance <= 1:
+            logger.debug(
+                "Geometry WKT is too long (%s), trying to simplify it with tolerance %s",
+                len(wkt_value),
+                tolerance,
+            )
+            wkt_value = cast(
+                str,
+                wkt.dumps(
+                    value.simplify(tolerance),
+                    rounding_precision=COORDS_ROUNDING_PRECISION,
+                ),
             )
-            ewkt_match = ewkt_regex.match(ewkt_string)
-            if ewkt_match:
-                g = ewkt_match.groupdict()
-                from_proj = g["proj"].replace("SRID", "EPSG").replace("=", ":")
-                input_geom = wkt.loads(g["wkt"])
+            tolerance += 0.1
+        if len(wkt_value) > WKT_MAX_LEN and tolerance > 1:
+            logger.warning("Failed to reduce WKT length lower than %s", WKT_MAX_LEN)
+        return wkt_value
+
+    @staticmethod
+    def convert_to_bounds_lists(input_geom: BaseGeometry) -> List[List[float]]:
+        if isinstance(input_geom, MultiPolygon):
+            geoms = [geom for geom in input_geom.geoms]
+            # sort with larger one at first (stac-browser only plots first one)
+            geoms.sort(key=lambda x: x.area, reverse=True)
+            return [list(x.bounds[0:4]) for x in geoms]
+        else:
+            return [list(input_geom.bounds[0:4])]
+
+    @staticmethod
+    def convert_to_bounds(input_geom_unformatted: Any) -> List[float]:
+        input_geom = get_geometry_from_various(geometry=input_geom_unformatted)
+        if isinstance(input_geom, MultiPolygon):
+            geoms = [geom for geom in input_geom.geoms]
+            # sort with larger one at first (stac-browser only plots first one)
+            geoms.sort(key=lambda x: x.area, reverse=True)
+            min_lon = 180
+            min_lat = 90
+            max_lon = -180
+            max_lat = -90
+            for geom in geoms:
+                min_lon = min(min_lon, geom.bound[0])
+                min_lat = min(min_lat, geom.bound[1])
+                max_lon = max(max_lon, geom.bound[2])
+                max_lat = max(max_lat, geom.bound[3])
+            return [min_lon, min_lat, max_lon, max_lat]
+        else:
+            return list(input_geom.bounds[0:4])
+
+    @staticmethod
+    def convert_to_nwse_bounds(input_geom: BaseGeometry) -> List[float]:
+        if isinstance(input_geom, str):
+            input_geom = shapely.wkt.loads(input_geom)
+        return list(input_geom.bounds[-1:] + input_geom.bounds[:-1])
+
+    @staticmethod
+    def convert_to_nwse_bounds_str(
+        input_geom: BaseGeometry, separator: str = ","
+    ) -> str:
+        return separator.join(
+            str(x) for x in MetadataFormatter.convert_to_nwse_bounds(input_geom)
+        )
 
-                from_proj = pyproj.CRS(from_proj)
-                to_proj = pyproj.CRS(DEFAULT_PROJ)
+    @staticmethod
+    def convert_to_geojson(string: str) -> str:
+        return geojson.dumps(string)
 
-                if from_proj != to_proj:
-                    # reproject
-                    project = pyproj.Transformer.from_crs(
-                        from_proj, to_proj, always_xy=True
-                    ).transform
-                    return transform(project, input_geom)
-                else:
-                    return input_geom
+    @staticmethod
+    def convert_from_ewkt(ewkt_string: str) -> Union[BaseGeometry, str]:
+        """Convert EWKT (Extended Well-Known text) to shapely geometry"""
+
+        ewkt_regex = re.compile(
+            r"^.*(?P<proj>SRID=[0-9]+);(?P<wkt>[A-Z0-9 \(\),\.-]+).*$"
+        )
+        ewkt_match = ewkt_regex.match(ewkt_string)
+        if ewkt_match:
+            g = ewkt_match.groupdict()
+            from_proj = g["proj"].replace("SRID", "EPSG").replace("=", ":")
+            input_geom = wkt.loads(g["wkt"])
+
+            from_proj = pyproj.CRS(from_proj)
+            to_proj = pyproj.CRS(DEFAULT_PROJ)
+
+            if from_proj != to_proj:
+                # reproject
+                project = pyproj.Transformer.from_crs(
+                    from_proj, to_proj, always_xy=True
+                ).transform
+                return transform(project, input_geom)
             else:
-                logger.warning(f"Could not read {ewkt_string} as EWKT")
-                return ewkt_string
+                return input_geom
+        else:
+            logger.warning(f"Could not read {ewkt_string} as EWKT")
+            return ewkt_string
 
-        @staticmethod
-        def convert_to_ewkt(input_geom: BaseGeometry) -> str:
-            """Convert shapely geometry to EWKT (Extended Well-Known text)"""
+    @staticmethod
+    def convert_to_ewkt(input_geom: BaseGeometry) -> str:
+        """Convert shapely geometry to EWKT (Extended Well-Known text)"""
 
-            proj = DEFAULT_PROJ.upper().replace("EPSG", "SRID").replace(":", "=")
-            wkt_geom = MetadataFormatter.convert_to_rounded_wkt(input_geom)
+        proj = DEFAULT_PROJ.upper().replace("EPSG", "SRID").replace(":", "=")
+        wkt_geom = MetadataFormatter.convert_to_rounded_wkt(input_geom)
 
-            return f"{proj};{wkt_geom}"
+        return f"{proj};{wkt_geom}"
 
-        @staticmethod
-        def convert_from_georss(georss: Any) -> Union[BaseGeometry, Any]:
-            """Convert GeoRSS to shapely geometry"""
+    @staticmethod
+    def convert_from_georss(georss: Any) -> Union[BaseGeometry, Any]:
+        """Convert GeoRSS to shapely geometry"""
 
-            if "polygon" in georss.tag:
-                # Polygon
-                coords_list = georss.text.split()
+        if "polygon" in georss.tag:
+            # Polygon
+            coords_list = georss.text.split()
+            polygon_args = [
+                (float(coords_list[2 * i]), float(coords_list[2 * i + 1]))
+                for i in range(int(len(coords_list) / 2))
+            ]
+            return Polygon(polygon_args)
+        elif len(georss) == 1 and "multisurface" in georss[0].tag.lower():
+            # Multipolygon
+            from_proj = getattr(georss[0], "attrib", {}).get("srsName", None)
+            if from_proj:
+                from_proj = pyproj.CRS(from_proj)
+                to_proj = pyproj.CRS(DEFAULT_PROJ)
+                project = pyproj.Transformer.from_crs(
+                    from_proj, to_proj, always_xy=True
+                ).transform
+
+            # function to get deepest elements
+            def flatten_elements(nested) -> Iterator[Any]:
+                for e in nested:
+                    if len(e) > 0:
+                        yield from flatten_elements(e)
+                    else:
+                        yield e
+
+            polygons_list: List[Polygon] = []
+            for elem in flatten_elements(georss[0]):
+                coords_list = elem.text.split()
                 polygon_args = [
                     (float(coords_list[2 * i]), float(coords_list[2 * i + 1]))
                     for i in range(int(len(coords_list) / 2))
                 ]
-                return Polygon(polygon_args)
-            elif len(georss) == 1 and "multisurface" in georss[0].tag.lower():
-                # Multipolygon
-                from_proj = getattr(georss[0], "attrib", {}).get("srsName", None)
-                if from_proj:
-                    from_proj = pyproj.CRS(from_proj)
-                    to_proj = pyproj.CRS(DEFAULT_PROJ)
-                    project = pyproj.Transformer.from_crs(
-                        from_proj, to_proj, always_xy=True
-                    ).transform
-
-                # function to get deepest elements
-                def flatten_elements(nested) -> Iterator[Any]:
-                    for e in nested:
-                        if len(e) > 0:
-                            yield from flatten_elements(e)
-                        else:
-                            yield e
-
-                polygons_list: List[Polygon] = []
-                for elem in flatten_elements(georss[0]):
-                    coords_list = elem.text.split()
-                    polygon_args = [
-                        (float(coords_list[2 * i]), float(coords_list[2 * i + 1]))
-                        for i in range(int(len(coords_list) / 2))
-                    ]
-                    polygon = Polygon(polygon_args)
-                    # reproject if needed
-                    if from_proj and from_proj != to_proj:
-                        polygons_list.append(transform(project, polygon))
-                    else:
-                        polygons_list.append(polygon)
+                polygon = Polygon(polygon_args)
+                # reproject if needed
+                if from_proj and from_proj != to_proj:
+                    polygons_list.append(transform(project, polygon))
+                else:
+                    polygons_list.append(polygon)
 
-                return MultiPolygon(polygons_list)
+            return MultiPolygon(polygons_list)
 
-            else:
-                logger.warning(
-                    f"Incoming GeoRSS format not supported yet: {str(georss)}"
-                )
-                return georss
-
-        @staticmethod
-        def convert_to_longitude_latitude(
-            input_geom_unformatted: Any,
-        ) -> Dict[str, float]:
-            bounds = MetadataFormatter.convert_to_bounds(input_geom_unformatted)
-            lon = (bounds[0] + bounds[2]) / 2
-            lat = (bounds[1] + bounds[3]) / 2
-            return {"lon": lon, "lat": lat}
-
-        @staticmethod
-        def convert_csv_list(values_list: Any) -> Any:
-            if isinstance(values_list, list):
-                return ",".join([str(x) for x in values_list])
-            else:
-                return values_list
+        else:
+            logger.warning(f"Incoming GeoRSS format not supported yet: {str(georss)}")
+            return georss
+
+    @staticmethod
+    def convert_to_longitude_latitude(
+        input_geom_unformatted: Any,
+    ) -> Dict[str, float]:
+        bounds = MetadataFormatter.convert_to_bounds(input_geom_unformatted)
+        lon = (bounds[0] + bounds[2]) / 2
+        lat = (bounds[1] + bounds[3]) / 2
+        return {"lon": lon, "lat": lat}
+
+    @staticmethod
+    def convert_csv_list(values_list: Any) -> Any:
+        if isinstance(values_list, list):
+            return ",".join([str(x) for x in values_list])
+        else:
+            return values_list
 
-        @staticmethod
-        def convert_remove_extension(string: str) -> str:
-            parts = string.split(".")
-            if parts:
-                return parts[0]
-            return ""
+    @staticmethod
+    def convert_remove_extension(string: str) -> str:
+        parts = string.split(".")
+        if parts:
+            return parts[0]
+        return ""
 
-        @staticmethod
-        def convert_get_group_name(string: str, pattern: str) -> str:
-            try:
-                match = re.search(pattern, str(string))
-                if match:
-                    return match.lastgroup or NOT_AVAILABLE
-            except AttributeError:
-                pass
-            logger.warning(
-                "Could not extract property from %s using %s", string, pattern
-            )
-            return NOT_AVAILABLE
+    @staticmethod
+    def convert_get_group_name(string: str, pattern: str) -> str:
+        try:
+            match = re.search(pattern, str(string))
+            if match:
+                return match.lastgroup or NOT_AVAILABLE
+        except AttributeError:
+            pass
+        logger.warning("Could not extract property from %s using %s", string, pattern)
+        return NOT_AVAILABLE
+
+    @staticmethod
+    def convert_replace_str(string: str, args: str) -> str:
+        old, new = ast.literal_eval(args)
+        return re.sub(old, new, string)
+
+    @staticmethod
+    def convert_recursive_sub_str(
+        input_obj: Union[Dict[Any, Any], List[Any]], args: str
+    ) -> Union[Dict[Any, Any], List[Any]]:
+        old, new = ast.literal_eval(args)
+        return items_recursive_apply(
+            input_obj,
+            lambda k, v, x, y: re.sub(x, y, v) if isinstance(v, str) else v,
+            **{"x": old, "y": new},
+        )
 
-        @staticmethod
-        def convert_replace_str(string: str, args: str) -> str:
-            old, new = ast.literal_eval(args)
-            return re.sub(old, new, string)
-
-        @staticmethod
-        def convert_recursive_sub_str(
-            input_obj: Union[Dict[Any, Any], List[Any]], args: str
-        ) -> Union[Dict[Any, Any], List[Any]]:
-            old, new = ast.literal_eval(args)
-            return items_recursive_apply(
-                input_obj,
-                lambda k, v, x, y: re.sub(x, y, v) if isinstance(v, str) else v,
-                **{"x": old, "y": new},
+    @staticmethod
+    def convert_dict_update(input_dict: Dict[Any, Any], args: str) -> Dict[Any, Any]:
+        """Converts"""
+        new_items_list = ast.literal_eval(args)
+
+        new_items_dict = nested_pairs2dict(new_items_list)
+
+        return dict(input_dict, **new_items_dict)
+
+    @staticmethod
+    def convert_dict_filter(
+        input_dict: Dict[Any, Any], jsonpath_filter_str: str
+    ) -> Dict[Any, Any]:
+        """Fitlers dict items using jsonpath"""
+
+        jsonpath_filter = string_to_jsonpath(jsonpath_filter_str, force=True)
+        if isinstance(jsonpath_filter, str) or not isinstance(input_dict, dict):
+            return {}
+
+        keys_list = list(input_dict.keys())
+        matches = jsonpath_filter.find(input_dict)
+        result = {}
+        for match in matches:
+            # extract key index from matched jsonpath
+            matched_jsonpath_str = str(match.full_path)
+            matched_index = int(matched_jsonpath_str.split(".")[-1][1:-1])
+            key = keys_list[matched_index]
+            result[key] = match.value
+        return result
+
+    @staticmethod
+    def convert_slice_str(string: str, args: str) -> str:
+        cmin, cmax, cstep = [
+            int(x.strip()) if x.strip().lstrip("-").isdigit() else None
+            for x in args.split(",")
+        ]
+        return string[cmin:cmax:cstep]
+
+    @staticmethod
+    def convert_to_lower(string: str) -> str:
+        """Convert a string to lowercase."""
+        return string.lower()
+
+    @staticmethod
+    def convert_to_upper(string: str) -> str:
+        """Convert a string to uppercase."""
+        return string.upper()
+
+    @staticmethod
+    def convert_fake_l2a_title_from_l1c(string: str) -> str:
+        id_regex = re.compile(
+            r"^(?P<id1>\w+)_(?P<id2>\w+)_(?P<id3>\w+)_(?P<id4>\w+)_(?P<id5>\w+)_(?P<id6>\w+)_(?P<id7>\w+)$"
+        )
+        id_match = id_regex.match(string)
+        if id_match:
+            id_dict = id_match.groupdict()
+            return "%s_MSIL2A_%s____________%s________________" % (
+                id_dict["id1"],
+                id_dict["id3"],
+                id_dict["id6"],
             )
+        else:
+            logger.error("Could not extract fake title from %s" % string)
+            return NOT_AVAILABLE
 
-        @staticmethod
-        def convert_dict_update(
-            input_dict: Dict[Any, Any], args: str
-        ) -> Dict[Any, Any]:
-            """Converts"""
-            new_items_list = ast.literal_eval(args)
-
-            new_items_dict = nested_pairs2dict(new_items_list)
-
-            return dict(input_dict, **new_items_dict)
-
-        @staticmethod
-        def convert_dict_filter(
-            input_dict: Dict[Any, Any], jsonpath_filter_str: str
-        ) -> Dict[Any, Any]:
-            """Fitlers dict items using jsonpath"""
-
-            jsonpath_filter = string_to_jsonpath(jsonpath_filter_str, force=True)
-            if isinstance(jsonpath_filter, str) or not isinstance(input_dict, dict):
-                return {}
-
-            keys_list = list(input_dict.keys())
-            matches = jsonpath_filter.find(input_dict)
-            result = {}
-            for match in matches:
-                # extract key index from matched jsonpath
-                matched_jsonpath_str = str(match.full_path)
-                matched_index = int(matched_jsonpath_str.split(".")[-1][1:-1])
-                key = keys_list[matched_index]
-                result[key] = match.value
-            return result
-
-        @staticmethod
-        def convert_slice_str(string: str, args: str) -> str:
-            cmin, cmax, cstep = [
-                int(x.strip()) if x.strip().lstrip("-").isdigit() else None
-                for x in args.split(",")
-            ]
-            return string[cmin:cmax:cstep]
-
-        @staticmethod
-        def convert_to_lower(string: str) -> str:
-            """Convert a string to lowercase."""
-            return string.lower()
-
-        @staticmethod
-        def convert_to_upper(string: str) -> str:
-            """Convert a string to uppercase."""
-            return string.upper()
-
-        @staticmethod
-        def convert_fake_l2a_title_from_l1c(string: str) -> str:
-            id_regex = re.compile(
-                r"^(?P<id1>\w+)_(?P<id2>\w+)_(?P<id3>\w+)_(?P<id4>\w+)_(?P<id5>\w+)_(?P<id6>\w+)_(?P<id7>\w+)$"
-            )
-            id_match = id_regex.match(string)
-            if id_match:
-                id_dict = id_match.groupdict()
-                return "%s_MSIL2A_%s____________%s________________" % (
-                    id_dict["id1"],
-                    id_dict["id3"],
-                    id_dict["id6"],
-                )
-            else:
-                logger.error("Could not extract fake title from %s" % string)
-                return NOT_AVAILABLE
-
-        @staticmethod
-        def convert_s2msil2a_title_to_aws_productinfo(string: str) -> str:
-            id_regex = re.compile(
-                r"^(?P<id1>\w+)_(?P<id2>\w+)_(?P<year>[0-9]{4})(?P<month>[0-9]{2})(?P<day>[0-9]{2})T[0-9]+_"
-                + r"(?P<id4>[A-Z0-9_]+)_(?P<id5>[A-Z0-9_]+)_T(?P<tile1>[0-9]{2})(?P<tile2>[A-Z])(?P<tile3>[A-Z]{2})_"
-                + r"(?P<id7>[A-Z0-9_]+)$"
-            )
-            id_match = id_regex.match(string)
-            if id_match:
-                id_dict = id_match.groupdict()
-                return (
-                    "https://roda.sentinel-hub.com/sentinel-s2-l2a/tiles/%s/%s/%s/%s/%s/%s/0/{collection}.json"
-                    % (
-                        id_dict["tile1"],
-                        id_dict["tile2"],
-                        id_dict["tile3"],
-                        id_dict["year"],
-                        int(id_dict["month"]),
-                        int(id_dict["day"]),
-                    )
-                )
-            else:
-                logger.error("Could not extract title infos from %s" % string)
-                return NOT_AVAILABLE
-
-        @staticmethod
-        def convert_split_id_into_s1_params(product_id: str) -> Dict[str, str]:
-            parts: List[str] = re.split(r"_(?!_)", product_id)
-            if len(parts) < 9:
-                logger.error(
-                    "id %s does not match expected Sentinel-1 id format", product_id
+    @staticmethod
+    def convert_s2msil2a_title_to_aws_productinfo(string: str) -> str:
+        id_regex = re.compile(
+            r"^(?P<id1>\w+)_(?P<id2>\w+)_(?P<year>[0-9]{4})(?P<month>[0-9]{2})(?P<day>[0-9]{2})T[0-9]+_"
+            + r"(?P<id4>[A-Z0-9_]+)_(?P<id5>[A-Z0-9_]+)_T(?P<tile1>[0-9]{2})(?P<tile2>[A-Z])(?P<tile3>[A-Z]{2})_"
+            + r"(?P<id7>[A-Z0-9_]+)$"
+        )
+        id_match = id_regex.match(string)
+        if id_match:
+            id_dict = id_match.groupdict()
+            return (
+                "https://roda.sentinel-hub.com/sentinel-s2-l2a/tiles/%s/%s/%s/%s/%s/%s/0/{collection}.json"
+                % (
+                    id_dict["tile1"],
+                    id_dict["tile2"],
+                    id_dict["tile3"],
+                    id_dict["year"],
+                    int(id_dict["month"]),
+                    int(id_dict["day"]),
                 )
-                raise ValueError
-            params = {"sensorMode": parts[1]}
-            level = "LEVEL" + parts[3][0]
-            params["processingLevel"] = level
-            start_date = datetime.strptime(parts[4], "%Y%m%dT%H%M%S") - timedelta(
-                seconds=1
-            )
-            params["startDate"] = start_date.strftime("%Y-%m-%dT%H:%M:%SZ")
-            end_date = datetime.strptime(parts[5], "%Y%m%dT%H%M%S") + timedelta(
-                seconds=1
             )
-            params["endDate"] = end_date.strftime("%Y-%m-%dT%H:%M:%SZ")
-            product_type = parts[2][:3]
-            if product_type == "GRD" and parts[-1] == "COG":
-                product_type = "GRD-COG"
-            elif product_type == "GRD" and parts[-2] == "CARD" and parts[-1] == "BS":
-                product_type = "CARD-BS"
-            params["productType"] = product_type
-            polarisation_mapping = {
-                "SV": "VV",
-                "SH": "HH",
-                "DH": "HH+HV",
-                "DV": "VV+VH",
-            }
-            polarisation = polarisation_mapping[parts[3][2:]]
-            params["polarisation"] = polarisation
-            return params
-
-        @staticmethod
-        def convert_split_id_into_s3_params(product_id: str) -> Dict[str, str]:
-            parts: List[str] = re.split(r"_(?!_)", product_id)
-            params = {"productType": product_id[4:15]}
-            dates = re.findall("[0-9]{8}T[0-9]{6}", product_id)
-            start_date = datetime.strptime(dates[0], "%Y%m%dT%H%M%S") - timedelta(
-                seconds=1
-            )
-            params["startDate"] = start_date.strftime("%Y-%m-%dT%H:%M:%SZ")
-            end_date = datetime.strptime(dates[1], "%Y%m%dT%H%M%S") + timedelta(
-                seconds=1
-            )
-            params["endDate"] = end_date.strftime("%Y-%m-%dT%H:%M:%SZ")
-            params["timeliness"] = parts[-2]
-            params["sat"] = "Sentinel-" + parts[0][1:]
-            return params
-
-        @staticmethod
-        def convert_split_id_into_s5p_params(product_id: str) -> Dict[str, str]:
-            parts: List[str] = re.split(r"_(?!_)", product_id)
-            params = {
-                "productType": product_id[9:19],
-                "processingMode": parts[1],
-                "processingLevel": parts[2].replace("_", ""),
-            }
-            start_date = datetime.strptime(parts[-6], "%Y%m%dT%H%M%S") - timedelta(
-                seconds=10
-            )
-            params["startDate"] = start_date.strftime("%Y-%m-%dT%H:%M:%SZ")
-            end_date = datetime.strptime(parts[-5], "%Y%m%dT%H%M%S") + timedelta(
-                seconds=10
-            )
-            params["endDate"] = end_date.strftime("%Y-%m-%dT%H:%M:%SZ")
-            return params
-
-        @staticmethod
-        def convert_split_cop_dem_id(product_id: str) -> List[int]:
-            parts = product_id.split("_")
-            lattitude = parts[3]
-            longitude = parts[5]
-            if lattitude[0] == "N":
-                lat_num = int(lattitude[1:])
-            else:
-                lat_num = -1 * int(lattitude[1:])
-            if longitude[0] == "E":
-                long_num = int(longitude[1:])
-            else:
-                long_num = -1 * int(longitude[1:])
-            bbox = [long_num - 1, lat_num - 1, long_num + 1, lat_num + 1]
-            return bbox
-
-        @staticmethod
-        def convert_dates_from_cmems_id(product_id: str):
-            date_format_1 = "[0-9]{10}"
-            date_format_2 = "[0-9]{8}"
-            dates = re.findall(date_format_1, product_id)
-            if dates:
-                date = dates[0]
-            else:
-                dates = re.findall(date_format_2, product_id)
-                date = dates[0]
-            if len(date) == 10:
-                date_time = datetime.strptime(dates[0], "%Y%m%d%H")
-            else:
-                date_time = datetime.strptime(dates[0], "%Y%m%d")
-            return {
-                "min_date": date_time.strftime("%Y-%m-%dT%H:%M:%SZ"),
-                "max_date": (date_time + timedelta(days=1)).strftime(
-                    "%Y-%m-%dT%H:%M:%SZ"
-                ),
-            }
+        else:
+            logger.error("Could not extract title infos from %s" % string)
+            return NOT_AVAILABLE
 
-        @staticmethod
-        def convert_to_datetime_dict(
-            date: str, format: str
-        ) -> Dict[str, Union[List[str], str]]:
-            """Convert a date (str) to a dictionary where values are in the format given in argument
-
-            date == "2021-04-21T18:27:19.123Z" and format == "list" => {
-                "year": ["2021"],
-                "month": ["04"],
-                "day": ["21"],
-                "hour": ["18"],
-                "minute": ["27"],
-                "second": ["19"],
-            }
-            date == "2021-04-21T18:27:19.123Z" and format == "string" => {
-                "year": "2021",
-                "month": "04",
-                "day": "21",
-                "hour": "18",
-                "minute": "27",
-                "second": "19",
-            }
-            date == "2021-04-21" and format == "list" => {
-                "year": ["2021"],
-                "month": ["04"],
-                "day": ["21"],
-                "hour": ["00"],
-                "minute": ["00"],
-                "second": ["00"],
-            }
-            """
-            utc_date = MetadataFormatter.convert_to_iso_utc_datetime(date)
-            date_object = datetime.strptime(utc_date, "%Y-%m-%dT%H:%M:%S.%fZ")
-            if format == "list":
-                return {
-                    "year": [date_object.strftime("%Y")],
-                    "month": [date_object.strftime("%m")],
-                    "day": [date_object.strftime("%d")],
-                    "hour": [date_object.strftime("%H")],
-                    "minute": [date_object.strftime("%M")],
-                    "second": [date_object.strftime("%S")],
-                }
-            else:
-                return {
-                    "year": date_object.strftime("%Y"),
-                    "month": date_object.strftime("%m"),
-                    "day": date_object.strftime("%d"),
-                    "hour": date_object.strftime("%H"),
-                    "minute": date_object.strftime("%M"),
-                    "second": date_object.strftime("%S"),
-                }
-
-        @staticmethod
-        def convert_interval_to_datetime_dict(
-            date: str, separator: str = "/"
-        ) -> Dict[str, List[str]]:
-            """Convert a date interval ('/' separated str) to a dictionary where values are lists
-
-            date == "2021-04-21/2021-04-22" => {
-                "year": ["2021"],
-                "month": ["04"],
-                "day": ["21", "22"],
-            }
-            """
-            if separator not in date:
-                raise ValueError(
-                    f"Could not format {date} using convert_interval_to_datetime_dict: {separator} separator missing"
-                )
-            start, end = date.split(separator)
-            start_utc_date = MetadataFormatter.convert_to_iso_utc_datetime(start)
-            end_utc_date = MetadataFormatter.convert_to_iso_utc_datetime(end)
-            start_date_object = datetime.strptime(
-                start_utc_date, "%Y-%m-%dT%H:%M:%S.%fZ"
+    @staticmethod
+    def convert_split_id_into_s1_params(product_id: str) -> Dict[str, str]:
+        parts: List[str] = re.split(r"_(?!_)", product_id)
+        if len(parts) < 9:
+            logger.error(
+                "id %s does not match expected Sentinel-1 id format", product_id
             )
-            end_date_object = datetime.strptime(end_utc_date, "%Y-%m-%dT%H:%M:%S.%fZ")
-
-            delta_utc_date = end_date_object - start_date_object
-
-            years = set()
-            months = set()
-            days = set()
-
-            for i in range(delta_utc_date.days + 1):
-                date_object = start_date_object + timedelta(days=i)
-                years.add(date_object.strftime("%Y"))
-                months.add(date_object.strftime("%m"))
-                days.add(date_object.strftime("%d"))
-
+            raise ValueError
+        params = {"sensorMode": parts[1]}
+        level = "LEVEL" + parts[3][0]
+        params["processingLevel"] = level
+        start_date = datetime.strptime(parts[4], "%Y%m%dT%H%M%S") - timedelta(seconds=1)
+        params["startDate"] = start_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+        end_date = datetime.strptime(parts[5], "%Y%m%dT%H%M%S") + timedelta(seconds=1)
+        params["endDate"] = end_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+        product_type = parts[2][:3]
+        if product_type == "GRD" and parts[-1] == "COG":
+            product_type = "GRD-COG"
+        elif product_type == "GRD" and parts[-2] == "CARD" and parts[-1] == "BS":
+            product_type = "CARD-BS"
+        params["productType"] = product_type
+        polarisation_mapping = {
+            "SV": "VV",
+            "SH": "HH",
+            "DH": "HH+HV",
+            "DV": "VV+VH",
+        }
+        polarisation = polarisation_mapping[parts[3][2:]]
+        params["polarisation"] = polarisation
+        return params
+
+    @staticmethod
+    def convert_split_id_into_s3_params(product_id: str) -> Dict[str, str]:
+        parts: List[str] = re.split(r"_(?!_)", product_id)
+        params = {"productType": product_id[4:15]}
+        dates = re.findall("[0-9]{8}T[0-9]{6}", product_id)
+        start_date = datetime.strptime(dates[0], "%Y%m%dT%H%M%S") - timedelta(seconds=1)
+        params["startDate"] = start_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+        end_date = datetime.strptime(dates[1], "%Y%m%dT%H%M%S") + timedelta(seconds=1)
+        params["endDate"] = end_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+        params["timeliness"] = parts[-2]
+        params["sat"] = "Sentinel-" + parts[0][1:]
+        return params
+
+    @staticmethod
+    def convert_split_id_into_s5p_params(product_id: str) -> Dict[str, str]:
+        parts: List[str] = re.split(r"_(?!_)", product_id)
+        params = {
+            "productType": product_id[9:19],
+            "processingMode": parts[1],
+            "processingLevel": parts[2].replace("_", ""),
+        }
+        start_date = datetime.strptime(parts[-6], "%Y%m%dT%H%M%S") - timedelta(
+            seconds=10
+        )
+        params["startDate"] = start_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+        end_date = datetime.strptime(parts[-5], "%Y%m%dT%H%M%S") + timedelta(seconds=10)
+        params["endDate"] = end_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+        return params
+
+    @staticmethod
+    def convert_split_cop_dem_id(product_id: str) -> List[int]:
+        parts = product_id.split("_")
+        lattitude = parts[3]
+        longitude = parts[5]
+        if lattitude[0] == "N":
+            lat_num = int(lattitude[1:])
+        else:
+            lat_num = -1 * int(lattitude[1:])
+        if longitude[0] == "E":
+            long_num = int(longitude[1:])
+        else:
+            long_num = -1 * int(longitude[1:])
+        bbox = [long_num - 1, lat_num - 1, long_num + 1, lat_num + 1]
+        return bbox
+
+    @staticmethod
+    def convert_dates_from_cmems_id(product_id: str):
+        date_format_1 = "[0-9]{10}"
+        date_format_2 = "[0-9]{8}"
+        dates = re.findall(date_format_1, product_id)
+        if dates:
+            date = dates[0]
+        else:
+            dates = re.findall(date_format_2, product_id)
+            date = dates[0]
+        if len(date) == 10:
+            date_time = datetime.strptime(dates[0], "%Y%m%d%H")
+        else:
+            date_time = datetime.strptime(dates[0], "%Y%m%d")
+        return {
+            "min_date": date_time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "max_date": (date_time + timedelta(days=1)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }
+
+    @staticmethod
+    def convert_to_datetime_dict(
+        date: str, format: str
+    ) -> Dict[str, Union[List[str], str]]:
+        """Convert a date (str) to a dictionary where values are in the format given in argument
+
+        date == "2021-04-21T18:27:19.123Z" and format == "list" => {
+            "year": ["2021"],
+            "month": ["04"],
+            "day": ["21"],
+            "hour": ["18"],
+            "minute": ["27"],
+            "second": ["19"],
+        }
+        date == "2021-04-21T18:27:19.123Z" and format == "string" => {
+            "year": "2021",
+            "month": "04",
+            "day": "21",
+            "hour": "18",
+            "minute": "27",
+            "second": "19",
+        }
+        date == "2021-04-21" and format == "list" => {
+            "year": ["2021"],
+            "month": ["04"],
+            "day": ["21"],
+            "hour": ["00"],
+            "minute": ["00"],
+            "second": ["00"],
+        }
+        """
+        utc_date = MetadataFormatter.convert_to_iso_utc_datetime(date)
+        date_object = datetime.strptime(utc_date, "%Y-%m-%dT%H:%M:%S.%fZ")
+        if format == "list":
             return {
-                "year": list(years),
-                "month": list(months),
-                "day": list(days),
+                "year": [date_object.strftime("%Y")],
+                "month": [date_object.strftime("%m")],
+                "day": [date_object.strftime("%d")],
+                "hour": [date_object.strftime("%H")],
+                "minute": [date_object.strftime("%M")],
+                "second": [date_object.strftime("%S")],
             }
-
-        @staticmethod
-        def convert_get_ecmwf_time(date: str) -> List[str]:
-            """Get the time of a date (str) in the ECMWF format (["HH:00"])
-
-            "2021-04-21T18:27:19.123Z" => ["18:00"]
-            "2021-04-21" => ["00:00"]
-            """
-            return [
-                str(MetadataFormatter.convert_to_datetime_dict(date, "str")["hour"])
-                + ":00"
-            ]
-
-        @staticmethod
-        def convert_get_dates_from_string(text: str, split_param="-"):
-            reg = "[0-9]{8}" + split_param + "[0-9]{8}"
-            match = re.search(reg, text)
-            if not match:
-                return NOT_AVAILABLE
-            dates_str = match.group()
-            dates = dates_str.split(split_param)
-            start_date = datetime.strptime(dates[0], "%Y%m%d")
-            end_date = datetime.strptime(dates[1], "%Y%m%d")
+        else:
             return {
-                "startDate": start_date.strftime("%Y-%m-%dT%H:%M:%SZ"),
-                "endDate": end_date.strftime("%Y-%m-%dT%H:%M:%SZ"),
-            }
-
-        @staticmethod
-        def convert_get_hydrological_year(date: str):
-            utc_date = MetadataFormatter.convert_to_iso_utc_datetime(date)
-            date_object = datetime.strptime(utc_date, "%Y-%m-%dT%H:%M:%S.%fZ")
-            date_object_second_year = date_object + relativedelta(years=1)
-            return [
-                f'{date_object.strftime("%Y")}_{date_object_second_year.strftime("%y")}'
-            ]
-
-        @staticmethod
-        def convert_get_variables_from_path(path: str):
-            if "?" not in path:
-                return []
-            variables = path.split("?")[1]
-            return variables.split(",")
-
-        @staticmethod
-        def convert_assets_list_to_dict(
-            assets_list: List[Dict[str, str]], asset_name_key: str = "title"
-        ) -> Dict[str, Dict[str, str]]:
-            """Convert a list of assets to a dictionary where keys represent
-            name of assets and are found among values of asset dictionaries.
-
-            assets_list == [
-                {"href": "foo", "title": "asset1", "name": "foo-name"},
-                {"href": "bar", "title": "path/to/asset1", "name": "bar-name"},
-                {"href": "baz", "title": "path/to/asset2", "name": "baz-name"},
-                {"href": "qux", "title": "asset3", "name": "qux-name"},
-            ] and asset_name_key == "title" => {
-                "asset1": {"href": "foo", "title": "asset1", "name": "foo-name"},
-                "path/to/asset1": {"href": "bar", "title": "path/to/asset1", "name": "bar-name"},
-                "asset2": {"href": "baz", "title": "path/to/asset2", "name": "baz-name"},
-                "asset3": {"href": "qux", "title": "asset3", "name": "qux-name"},
-            }
-            assets_list == [
-                {"href": "foo", "title": "foo-title", "name": "asset1"},
-                {"href": "bar", "title": "bar-title", "name": "path/to/asset1"},
-                {"href": "baz", "title": "baz-title", "name": "path/to/asset2"},
-                {"href": "qux", "title": "qux-title", "name": "asset3"},
-            ] and asset_name_key == "name" => {
-                "asset1": {"href": "foo", "title": "foo-title", "name": "asset1"},
-                "path/to/asset1": {"href": "bar", "title": "bar-title", "name": "path/to/asset1"},
-                "asset2": {"href": "baz", "title": "baz-title", "name": "path/to/asset2"},
-                "asset3": {"href": "qux", "title": "qux-title", "name": "asset3"},
+                "year": date_object.strftime("%Y"),
+                "month": date_object.strftime("%m"),
+                "day": date_object.strftime("%d"),
+                "hour": date_object.strftime("%H"),
+                "minute": date_object.strftime("%M"),
+                "second": date_object.strftime("%S"),
             }
-            """
-            asset_names: List[str] = []
-            assets_dict: Dict[str, Dict[str, str]] = {}
-
-            for asset in assets_list:
-                asset_name = asset[asset_name_key]
-                asset_names.append(asset_name)
-                assets_dict[asset_name] = asset
-
-            # we only keep the equivalent of the path basename in the case where the
-            # asset name has a path pattern and this basename is only found once
-            immutable_asset_indexes: List[int] = []
-            for i, asset_name in enumerate(asset_names):
-                if i in immutable_asset_indexes:
-                    continue
-                change_asset_name = True
-                asset_basename = asset_name.split("/")[-1]
-                j = i + 1
-                while change_asset_name and j < len(asset_names):
-                    asset_tmp_basename = asset_names[j].split("/")[-1]
-                    if asset_basename == asset_tmp_basename:
-                        change_asset_name = False
-                        immutable_asset_indexes.extend([i, j])
-                    j += 1
-                if change_asset_name:
-                    assets_dict[asset_basename] = assets_dict.pop(asset_name)
-            return assets_dict
 
-    # if stac extension colon separator `:` is in search params, parse it to prevent issues with vformat
-    if re.search(r"{[\w-]*:[\w#-]*}", search_param):
-        search_param = re.sub(r"{([\w-]*):([\w#-]*)}", r"{\1_COLON_\2}", search_param)
-        kwargs = {k.replace(":", "_COLON_"): v for k, v in kwargs.items()}
+    @staticmethod
+    def convert_interval_to_datetime_dict(
+        date: str, separator: str = "/"
+    ) -> Dict[str, List[str]]:
+        """Convert a date interval ('/' separated str) to a dictionary where values are lists
+
+        date == "2021-04-21/2021-04-22" => {
+            "year": ["2021"],
+            "month": ["04"],
+            "day": ["21", "22"],
+        }
+        """
+        if separator not in date:
+            raise ValueError(
+                f"Could not format {date} using convert_interval_to_datetime_dict: {separator} separator missing"
+            )
+        start, end = date.split(separator)
+        start_utc_date = MetadataFormatter.convert_to_iso_utc_datetime(start)
+        end_utc_date = MetadataFormatter.convert_to_iso_utc_datetime(end)
+        start_date_object = datetime.strptime(start_utc_date, "%Y-%m-%dT%H:%M:%S.%fZ")
+        end_date_object = datetime.strptime(end_utc_date, "%Y-%m-%dT%H:%M:%S.%fZ")
+
+        delta_utc_date = end_date_object - start_date_object
+
+        years = set()
+        months = set()
+        days = set()
+
+        for i in range(delta_utc_date.days + 1):
+            date_object = start_date_object + timedelta(days=i)
+            years.add(date_object.strftime("%Y"))
+            months.add(date_object.strftime("%m"))
+            days.add(date_object.strftime("%d"))
+
+        return {
+            "year": list(years),
+            "month": list(months),
+            "day": list(days),
+        }
+
+    @staticmethod
+    def convert_get_ecmwf_time(date: str) -> List[str]:
+        """Get the time of a date (str) in the ECMWF format (["HH:00"])
+
+        "2021-04-21T18:27:19.123Z" => ["18:00"]
+        "2021-04-21" => ["00:00"]
+        """
+        return [
+            str(MetadataFormatter.convert_to_datetime_dict(date, "str")["hour"]) + ":00"
+        ]
+
+    @staticmethod
+    def convert_get_dates_from_string(text: str, split_param="-"):
+        reg = "[0-9]{8}" + split_param + "[0-9]{8}"
+        match = re.search(reg, text)
+        if not match:
+            return NOT_AVAILABLE
+        dates_str = match.group()
+        dates = dates_str.split(split_param)
+        start_date = datetime.strptime(dates[0], "%Y%m%d")
+        end_date = datetime.strptime(dates[1], "%Y%m%d")
+        return {
+            "startDate": start_date.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "endDate": end_date.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }
+
+    @staticmethod
+    def convert_get_hydrological_year(date: str):
+        utc_date = MetadataFormatter.convert_to_iso_utc_datetime(date)
+        date_object = datetime.strptime(utc_date, "%Y-%m-%dT%H:%M:%S.%fZ")
+        date_object_second_year = date_object + relativedelta(years=1)
+        return [
+            f'{date_object.strftime("%Y")}_{date_object_second_year.strftime("%y")}'
+        ]
+
+    @staticmethod
+    def convert_get_variables_from_path(path: str):
+        if "?" not in path:
+            return []
+        variables = path.split("?")[1]
+        return variables.split(",")
+
+    @staticmethod
+    def convert_assets_list_to_dict(
+        assets_list: List[Dict[str, str]], asset_name_key: str = "title"
+    ) -> Dict[str, Dict[str, str]]:
+        """Convert a list of assets to a dictionary where keys represent
+        name of assets and are found among values of asset dictionaries.
+
+        assets_list == [
+            {"href": "foo", "title": "asset1", "name": "foo-name"},
+            {"href": "bar", "title": "path/to/asset1", "name": "bar-name"},
+            {"href": "baz", "title": "path/to/asset2", "name": "baz-name"},
+            {"href": "qux", "title": "asset3", "name": "qux-name"},
+        ] and asset_name_key == "title" => {
+            "asset1": {"href": "foo", "title": "asset1", "name": "foo-name"},
+            "path/to/asset1": {"href": "bar", "title": "path/to/asset1", "name": "bar-name"},
+            "asset2": {"href": "baz", "title": "path/to/asset2", "name": "baz-name"},
+            "asset3": {"href": "qux", "title": "asset3", "name": "qux-name"},
+        }
+        assets_list == [
+            {"href": "foo", "title": "foo-title", "name": "asset1"},
+            {"href": "bar", "title": "bar-title", "name": "path/to/asset1"},
+            {"href": "baz", "title": "baz-title", "name": "path/to/asset2"},
+            {"href": "qux", "title": "qux-title", "name": "asset3"},
+        ] and asset_name_key == "name" => {
+            "asset1": {"href": "foo", "title": "foo-title", "name": "asset1"},
+            "path/to/asset1": {"href": "bar", "title": "bar-title", "name": "path/to/asset1"},
+            "asset2": {"href": "baz", "title": "baz-title", "name": "path/to/asset2"},
+            "asset3": {"href": "qux", "title": "qux-title", "name": "asset3"},
+        }
+        """
+        asset_names: List[str] = []
+        assets_dict: Dict[str, Dict[str, str]] = {}
+
+        for asset in assets_list:
+            asset_name = asset[asset_name_key]
+            asset_names.append(asset_name)
+            assets_dict[asset_name] = asset
+
+        # we only keep the equivalent of the path basename in the case where the
+        # asset name has a path pattern and this basename is only found once
+        immutable_asset_indexes: List[int] = []
+        for i, asset_name in enumerate(asset_names):
+            if i in immutable_asset_indexes:
+                continue
+            change_asset_name = True
+            asset_basename = asset_name.split("/")[-1]
+            j = i + 1
+            while change_asset_name and j < len(asset_names):
+                asset_tmp_basename = asset_names[j].split("/")[-1]
+                if asset_basename == asset_tmp_basename:
+                    change_asset_name = False
+                    immutable_asset_indexes.extend([i, j])
+                j += 1
+            if change_asset_name:
+                assets_dict[asset_basename] = assets_dict.pop(asset_name)
+        return assets_dict
+
+
+TEMPLATE_REGEX = re.compile(r"({[^{}:]+})+")
+SIMPLE_FIELD_NAME_REGEX = re.compile(r"^\w+$")
+# first characters (after leading blanks) of a string that ast.literal_eval may parse
+LITERAL_FIRST_CHARS = frozenset("0123456789+-.([{\"'#\\\n\r\f\v")
+# literal strings starting with a letter: keywords or prefixed strings
+LITERAL_NAME_REGEX = re.compile(r"(True|False|None)(?!\w)|[bBrRuUfF]{1,2}['\"]")
+# a-b-c like strings (e.g. dates) are not literals
+NOT_LITERAL_REGEX = re.compile(r"\d+-\d+-")
+LITERAL_TYPES = (str, int, float, bool, type(None))
+
+#: Kinds of steps of a :class:`CompiledJsonMapping`
+_CONSTANT, _PATH, _CONVERTED_PATH = range(3)
+
+
+def literal_eval_or_self(value: Any) -> Any:
+    """Get value as python object when possible, as :func:`ast.literal_eval` would do,
+    skipping the costly parsing of strings that cannot be python literals"""
+    if isinstance(value, str):
+        stripped = value.lstrip(" \t")
+        if not stripped:
+            return value
+        if stripped[0] in LITERAL_FIRST_CHARS:
+            if NOT_LITERAL_REGEX.match(stripped):
+                return value
+        elif not LITERAL_NAME_REGEX.match(stripped):
+            return value
+    elif not isinstance(value, bytes):
+        return value
+    try:
+        return ast.literal_eval(value)
+    except Exception:
+        return value
+
+
+def _is_literal(value: Any) -> bool:
+    """Check if ``ast.literal_eval(str(value)) == value``, without formatting and parsing it"""
+    value_type = type(value)
+    if value_type is float:
+        return value == value and value not in (float("inf"), float("-inf"))
+    if value_type in LITERAL_TYPES:
+        return True
+    if value_type in (list, tuple):
+        return all(_is_literal(v) for v in value)
+    if value_type is dict:
+        return all(_is_literal(k) and _is_literal(v) for k, v in value.items())
+    return False
+
+
+def _format_conversion(conversion: Union[str, List[Any]]) -> str:
+    """Reformat a configured conversion as ``converter(args)`` or ``converter``"""
+    if (
+        len(conversion) > 1
+        and isinstance(conversion, list)
+        and conversion[1] is not None
+    ):
+        return "%s(%s)" % (conversion[0], conversion[1])
+    elif isinstance(conversion, list):
+        return conversion[0]
+    return conversion
 
-    return MetadataFormatter().vformat(search_param, args, kwargs)
 
+class CompiledJsonMapping:
+    """Metadata mapping compiled once into an execution plan, to be applied to many provider
+    json results.
 
-def properties_from_json(
-    json: Dict[str, Any],
-    mapping: Dict[str, Any],
-    discovery_config: Optional[Dict[str, Any]] = None,
-) -> Dict[str, Any]:
-    """Extract properties from a provider json result.
+    Mapping values are classified once (constants, templates, jsonpaths with or without
+    converter), constants are parsed once, converters are resolved to bound callables and
+    the discovery configuration is pre-parsed. Calling the plan on a json result gives the
+    same properties as :func:`properties_from_json`.
 
-    :param json: The representation of a provider result as a json object
     :param mapping: A mapping between :class:`~eodag.api.product._product.EOProduct`'s metadata
                     keys and the location of the values of these properties in the json
                     representation, expressed as a
@@ -939,130 +982,229 @@ def properties_from_json(
     :param discovery_config: (optional) metadata discovery configuration dict, accepting among other items
                              `discovery_pattern` (Regex pattern for metadata key discovery, e.g. "^[a-zA-Z]+$"),
                              `discovery_path` (String representation of jsonpath)
-    :returns: The metadata of the :class:`~eodag.api.product._product.EOProduct`
     """
-    properties: Dict[str, Any] = {}
-    templates = {}
-    used_jsonpaths = []
-    for metadata, value in mapping.items():
-        # Treat the case when the value is from a queryable metadata
-        if isinstance(value, list):
-            conversion_or_none, path_or_text = value[1]
-        else:
-            conversion_or_none, path_or_text = value
-        if isinstance(path_or_text, str):
-            if re.search(r"({[^{}:]+})+", path_or_text):
-                templates[metadata] = path_or_text
+
+    def __init__(
+        self,
+        mapping: Dict[str, Any],
+        discovery_config: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.steps: List[Tuple[Any, ...]] = []
+        templates: Dict[str, str] = {}
+        formatter = MetadataFormatter()
+        for metadata, value in mapping.items():
+            # Treat the case when the value is from a queryable metadata
+            if isinstance(value, list):
+                conversion_or_none, path_or_text = value[1]
             else:
-                properties[metadata] = path_or_text
-        else:
+                conversion_or_none, path_or_text = value
+            if isinstance(path_or_text, str):
+                if TEMPLATE_REGEX.search(path_or_text):
+                    templates[metadata] = path_or_text
+                else:
+                    self.steps.append(
+                        (_CONSTANT, metadata, literal_eval_or_self(path_or_text))
+                    )
+            elif conversion_or_none is None:
+                self.steps.append((_PATH, metadata, path_or_text))
+            else:
+                conversion = _format_conversion(conversion_or_none)
+                # check if conversion uses variables to format
+                dynamic = bool(TEMPLATE_REGEX.search(conversion))
+                converter = None
+                args = None
+                if (
+                    not dynamic
+                    and SIMPLE_FIELD_NAME_REGEX.match(metadata)
+                    and not any(c in conversion for c in ":!{}")
+                ):
+                    conversion_spec = MetadataFormatter.CONVERSION_REGEX.match(
+                        "%s%s%s" % (metadata, SEP, conversion)
+                    )
+                    if conversion_spec:
+                        converter = getattr(
+                            formatter,
+                            "convert_{}".format(conversion_spec.group("converter")),
+                            None,
+                        )
+                        args = conversion_spec.group("args")
+                self.steps.append(
+                    (
+                        _CONVERTED_PATH,
+                        metadata,
+                        path_or_text,
+                        conversion,
+                        dynamic,
+                        converter,
+                        args,
+                    )
+                )
+
+        # templates as (metadata, template, needs format_metadata), resolved in mapping
+        # order: a template using a template defined after it gets an empty value for it
+        self.templates: List[Tuple[str, str, bool]] = [
+            (
+                metadata,
+                template,
+                bool(COMPLEX_QS_REGEX.match(template)) and "#" in template,
+            )
+            for metadata, template in templates.items()
+        ]
+
+        discovery_config = discovery_config or {}
+        self.discovery_pattern: Optional[re.Pattern[str]] = None
+        self.discovery_jsonpath: Union[str, JSONPath] = ""
+        self.discovery_path_id: Optional[Union[str, JSONPath]] = None
+        self.discovery_path_value: Optional[Union[str, JSONPath]] = None
+        discovery_pattern = discovery_config.get("metadata_pattern", None)
+        discovery_path = discovery_config.get("metadata_path", None)
+        if discovery_pattern and discovery_path:
+            self.discovery_pattern = re.compile(discovery_pattern)
+            self.discovery_jsonpath = string_to_jsonpath(discovery_path)
+            self.discovery_path_id = (
+                string_to_jsonpath(discovery_config["metadata_path_id"], force=True)
+                if "metadata_path_id" in discovery_config
+                else None
+            )
+            self.discovery_path_value = (
+                string_to_jsonpath(discovery_config["metadata_path_value"], force=True)
+                if "metadata_path_value" in discovery_config
+                else None
+            )
+
+    def __call__(self, json: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract properties from a provider json result.
+
+        :param json: The representation of a provider result as a json object
+        :returns: The metadata of the :class:`~eodag.api.product._product.EOProduct`
+        """
+        properties: Dict[str, Any] = {}
+        # used jsonpaths, indexed by their string representation, are only needed to
+        # prevent metadata discovery duplicates
+        used_jsonpaths: Optional[Dict[str, List[Any]]] = (
+            {} if self.discovery_pattern is not None else None
+        )
+        for step in self.steps:
+            kind, metadata = step[0], step[1]
+            if kind == _CONSTANT:
+                value = step[2]
+                properties[metadata] = (
+                    deepcopy(value) if isinstance(value, (dict, list)) else value
+                )
+                continue
             try:
-                match = path_or_text.find(json)
+                match = step[2].find(json)
             except KeyError:
                 match = []
             if len(match) == 1:
                 extracted_value = match[0].value
-                used_jsonpaths.append(match[0].full_path)
+                if used_jsonpaths is not None:
+                    full_path = match[0].full_path
+                    used_jsonpaths.setdefault(str(full_path), []).append(full_path)
             else:
                 extracted_value = NOT_AVAILABLE
             if extracted_value is None:
                 properties[metadata] = None
-            else:
-                if conversion_or_none is None:
-                    properties[metadata] = extracted_value
+                continue
+            if kind == _PATH:
+                properties[metadata] = literal_eval_or_self(extracted_value)
+                continue
+
+            _, _, _, conversion, dynamic, converter, args = step
+            if dynamic:
+                conversion = conversion.format(**properties)
+            try:
+                if converter is not None:
+                    converted = (
+                        converter(extracted_value, args)
+                        if args is not None
+                        else converter(extracted_value)
+                    )
+                    if type(converted) is not str and _is_literal(converted):
+                        # skip the string formatting and parsing round trip
+                        properties[metadata] = converted
+                        continue
+                    # same output as format_metadata, which only returns strings
+                    formatted = format(converted, "")
                 else:
-                    # reformat conversion_or_none as metadata#converter(args) or metadata#converter
-                    if (
-                        len(conversion_or_none) > 1
-                        and isinstance(conversion_or_none, list)
-                        and conversion_or_none[1] is not None
-                    ):
-                        conversion_or_none = "%s(%s)" % (
-                            conversion_or_none[0],
-                            conversion_or_none[1],
-                        )
-                    elif isinstance(conversion_or_none, list):
-                        conversion_or_none = conversion_or_none[0]
-
-                    # check if conversion uses variables to format
-                    if re.search(r"({[^{}:]+})+", conversion_or_none):
-                        conversion_or_none = conversion_or_none.format(**properties)
+                    formatted = format_metadata(
+                        "{%s%s%s}" % (metadata, SEP, conversion),
+                        **{metadata: extracted_value},
+                    )
+            except ValueError:
+                if extracted_value != NOT_AVAILABLE:
+                    # formatting should work, otherwise something is wrong in the mapping
+                    raise
+                # value could not be formatted as it is not available
+                logger.debug(
+                    f"{metadata}: {extracted_value} could not be formatted with {conversion}"
+                )
+                continue
+            # properties as python objects when possible (format_metadata returns only strings)
+            properties[metadata] = literal_eval_or_self(formatted)
 
-                    if extracted_value == NOT_AVAILABLE:
-                        # try if value can be formatted even if it is not available
-                        try:
-                            properties[metadata] = format_metadata(
-                                "{%s%s%s}" % (metadata, SEP, conversion_or_none),
-                                **{metadata: extracted_value},
-                            )
-                        except ValueError:
-                            logger.debug(
-                                f"{metadata}: {extracted_value} could not be formatted with {conversion_or_none}"
-                            )
-                            continue
-                    else:
-                        # in this case formatting should work, otherwise something is wrong in the mapping
-                        properties[metadata] = format_metadata(
-                            "{%s%s%s}" % (metadata, SEP, conversion_or_none),
-                            **{metadata: extracted_value},
+        # Resolve templates
+        for metadata, template, is_complex in self.templates:
+            try:
+                if is_complex:
+                    result = format_metadata(template, **properties)
+                else:
+                    # defaultdict usage will return "" for missing keys in format_args
+                    try:
+                        result = template.format_map(defaultdict(str, **properties))
+                    except TypeError as e:
+                        raise MisconfiguredError(
+                            f"Unable to format str={template} using {str(properties)}: {str(e)}"
                         )
-        # properties as python objects when possible (format_metadata returns only strings)
-        try:
-            properties[metadata] = ast.literal_eval(properties[metadata])
-        except Exception:
-            pass
-
-    # Resolve templates
-    for metadata, template in templates.items():
-        try:
-            properties[metadata] = format_string(metadata, template, **properties)
-        except ValueError:
-            logger.warning(
-                f"Could not parse {metadata} ({template}) using product properties"
-            )
-            logger.debug(f"available properties: {properties}")
-            properties[metadata] = NOT_AVAILABLE
-
-    # adds missing discovered properties
-    if not discovery_config:
-        discovery_config = {}
-
-    discovery_pattern = discovery_config.get("metadata_pattern", None)
-    discovery_path = discovery_config.get("metadata_path", None)
-    if discovery_pattern and discovery_path:
-        discovery_jsonpath = string_to_jsonpath(discovery_path)
+                properties[metadata] = literal_eval_or_self(result)
+            except ValueError:
+                logger.warning(
+                    f"Could not parse {metadata} ({template}) using product properties"
+                )
+                logger.debug(f"available properties: {properties}")
+                properties[metadata] = NOT_AVAILABLE
+
+        if used_jsonpaths is not None:
+            self._discover_properties(json, properties, used_jsonpaths)
+
+        return properties
+
+    def _discover_properties(
+        self,
+        json: Dict[str, Any],
+        properties: Dict[str, Any],
+        used_jsonpaths: Dict[str, List[Any]],
+    ) -> None:
+        """Add missing discovered properties"""
+        if self.discovery_pattern is None:
+            return
         discovered_properties = (
-            discovery_jsonpath.find(json)
-            if isinstance(discovery_jsonpath, JSONPath)
+            self.discovery_jsonpath.find(json)
+            if isinstance(self.discovery_jsonpath, JSONPath)
             else []
         )
         for found_jsonpath in discovered_properties:
-            if "metadata_path_id" in discovery_config.keys():
-                found_key_paths = string_to_jsonpath(
-                    discovery_config["metadata_path_id"], force=True
-                ).find(found_jsonpath.value)
+            if self.discovery_path_id is not None:
+                found_key_paths = self.discovery_path_id.find(found_jsonpath.value)
                 if not found_key_paths or isinstance(found_key_paths, int):
                     continue
                 found_key = found_key_paths[0].value
                 used_jsonpath = Child(
-                    found_jsonpath.full_path,
-                    string_to_jsonpath(
-                        discovery_config["metadata_path_value"], force=True
-                    ),
+                    found_jsonpath.full_path, self.discovery_path_value
                 )
             else:
                 # default key got from metadata_path
                 found_key = found_jsonpath.path.fields[-1]
                 used_jsonpath = found_jsonpath.full_path
             if (
-                re.compile(discovery_pattern).match(found_key)
+                self.discovery_pattern.match(found_key)
                 and found_key not in properties.keys()
-                and used_jsonpath not in used_jsonpaths
+                and used_jsonpath not in used_jsonpaths.get(str(used_jsonpath), [])
             ):
-                if "metadata_path_value" in discovery_config.keys():
-                    found_value_path = string_to_jsonpath(
-                        discovery_config["metadata_path_value"], force=True
-                    ).find(found_jsonpath.value)
+                if self.discovery_path_value is not None:
+                    found_value_path = self.discovery_path_value.find(
+                        found_jsonpath.value
+                    )
                     properties[found_key] = (
                         found_value_path[0].value
                         if found_value_path and not isinstance(found_value_path, int)
@@ -1073,12 +1215,30 @@ def properties_from_json(
                     properties[found_key] = found_jsonpath.value
 
                 # properties as python objects when possible (format_metadata returns only strings)
-                try:
-                    properties[found_key] = ast.literal_eval(properties[found_key])
-                except Exception:
-                    pass
+                properties[found_key] = literal_eval_or_self(properties[found_key])
 
-    return properties
+
+def properties_from_json(
+    json: Dict[str, Any],
+    mapping: Dict[str, Any],
+    discovery_config: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Extract properties from a provider json result.
+
+    When the same mapping is applied to many results, compile it once using
+    :class:`CompiledJsonMapping` instead.
+
+    :param json: The representation of a provider result as a json object
+    :param mapping: A mapping between :class:`~eodag.api.product._product.EOProduct`'s metadata
+                    keys and the location of the values of these properties in the json
+                    representation, expressed as a
+                    `jsonpath <http://goessner.net/articles/JsonPath/>`_
+    :param discovery_config: (optional) metadata discovery configuration dict, accepting among other items
+                             `discovery_pattern` (Regex pattern for metadata key discovery, e.g. "^[a-zA-Z]+$"),
+                             `discovery_path` (String representation of jsonpath)
+    :returns: The metadata of the :class:`~eodag.api.product._product.EOProduct`
+    """
+    return CompiledJsonMapping(mapping, discovery_config)(json)
 
 
 def properties_from_xml(
@@ -0,0 +1,878 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024, CS GROUP - France, https://www.csgroup.eu/
+#
+# This file is part of EODAG project
+#     https://www.github.com/CS-SI/EODAG
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""In-memory full text index of the product types, used to guess product types"""
+from __future__ import annotations
+
+import functools
+import math
+import re
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+#: Words ignored in text fields
+STOP_WORDS = frozenset(
+    (
+        "a", "an", "and", "are", "as", "at", "be", "by", "can", "for", "from", "have",
+        "if", "in", "is", "it", "may", "not", "of", "on", "or", "tbd", "that", "the",
+        "this", "to", "us", "we", "when", "will", "with", "yet", "you", "your",
+    )
+)  # fmt: skip
+
+#: BM25 parameters used to score text fields matches
+BM25_B = 0.75
+BM25_K1 = 1.2
+
+_TEXT_TOKEN_RE = re.compile(r"\w+(\.?\w+)*")
+_IDLIST_TOKEN_RE = re.compile(r"[^\r\n\t ,;]+")
+
+
+def _analyze_id(value: str, tokenize: bool = True) -> List[str]:
+    """The whole value, as is"""
+    return [value]
+
+
+def _analyze_idlist(value: str, tokenize: bool = True) -> List[str]:
+    """Values separated by whitespaces, commas or semicolons"""
+    return _IDLIST_TOKEN_RE.findall(value) if tokenize else [value]
+
+
+def _analyze_text(value: str, tokenize: bool = True) -> List[str]:
+    """Lowercase words, without stop words"""
+    if not tokenize:
+        return [value.lower()]
+    words = (match.group(0).lower() for match in _TEXT_TOKEN_RE.finditer(value))
+    return [word for word in words if len(word) > 1 and word not in STOP_WORDS]
+
+
+def _analyze_keywords(value: str, tokenize: bool = True) -> List[str]:
+    """Lowercase comma separated values, without dashes and underscores"""
+    keywords = value.split(",") if tokenize else [value]
+    return [
+        keyword.strip().lower().replace("-", "").replace("_", "")
+        for keyword in keywords
+        if keyword.strip()
+    ]
+
+
+#: Analyzers of the indexed fields, splitting their values into terms
+FIELDS_ANALYZERS: Dict[str, Callable[..., List[str]]] = {
+    "ID": _analyze_id,
+    "abstract": _analyze_text,
+    "instrument": _analyze_idlist,
+    "platform": _analyze_id,
+    "platformSerialIdentifier": _analyze_idlist,
+    "processingLevel": _analyze_id,
+    "sensorType": _analyze_id,
+    "license": _analyze_id,
+    "title": _analyze_text,
+    "keywords": _analyze_keywords,
+}
+
+#: Fields whose terms positions are indexed, for phrase searches, and whose matches
+#: are scored with BM25
+TEXT_FIELDS = frozenset(("abstract", "title"))
+
+#: Fields returned with the search results
+STORED_FIELDS = ("ID", "missionStartDate", "missionEndDate")
+
+
+def _untokenized(
+    analyzer: Callable[..., List[str]], text: Optional[str]
+) -> Optional[str]:
+    """Text analyzed as a single term, for wildcards and ranges"""
+    terms = analyzer(text, tokenize=False) if text else None
+    return terms[0] if terms else None
+
+
+class ProductTypesIndex:
+    """In-memory inverted index of the product types.
+
+    Product types are indexed as they are added, and searched using a query language
+    where:
+
+    * terms are searched in the given fields, or in the field prefixing them
+      (``title:sentinel``), terms being separated by whitespaces;
+    * phrases are enclosed in double quotes (``"sea surface"``), and single terms
+      containing whitespaces in single quotes (``'sea surface'``);
+    * ``*`` and ``?`` are wildcards (``S2*``), ``[a TO b]`` and ``{a TO b}`` are
+      inclusive and exclusive ranges of terms;
+    * terms and groups of terms, in parentheses, are joined with ``AND``, ``OR``,
+      ``NOT``, ``ANDNOT``, ``ANDMAYBE`` or ``REQUIRE``, or made required with ``+`` and
+      excluded with ``-``, terms matching any of them by default;
+    * matches of a term or group are boosted with ``^`` (``title:sentinel^2``).
+
+    The index can be pickled.
+
+    :param product_types: (optional) Product types to index, as returned by
+                          :meth:`~eodag.api.core.EODataAccessGateway.list_product_types`
+    """
+
+    def __init__(self, product_types: Iterable[Dict[str, Any]] = ()) -> None:
+        self._lock = threading.Lock()
+        # stored fields of the product types, by document number
+        self._documents: List[Dict[str, Any]] = []
+        self._docnums: Dict[str, int] = {}
+        # document numbers and positions of the terms of each field
+        self._postings: Dict[str, Dict[str, Dict[int, Tuple[int, ...]]]] = {
+            field: {} for field in FIELDS_ANALYZERS
+        }
+        # documents having each field
+        self._field_docnums: Dict[str, Set[int]] = {
+            field: set() for field in FIELDS_ANALYZERS
+        }
+        # number of terms of the text fields of each document
+        self._lengths: Dict[str, Dict[int, int]] = {field: {} for field in TEXT_FIELDS}
+        self._total_lengths: Dict[str, int] = dict.fromkeys(TEXT_FIELDS, 0)
+        for product_type in product_types:
+            self.add(product_type)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def __contains__(self, product_type_id: str) -> bool:
+        return product_type_id in self._docnums
+
+    def add(self, product_type: Dict[str, Any]) -> None:
+        """Index a product type, replacing the one having the same ``ID`` if any
+
+        :param product_type: The product type, as returned by
+                             :meth:`~eodag.api.core.EODataAccessGateway.list_product_types`
+        """
+        product_type_id: str = product_type["ID"]
+        document = {k: product_type.get(k) for k in STORED_FIELDS}
+        with self._lock:
+            docnum = self._docnums.get(product_type_id)
+            if docnum is None:
+                docnum = self._docnums[product_type_id] = len(self._documents)
+                self._documents.append(document)
+            else:
+                self._remove(docnum)
+                self._documents[docnum] = document
+
+            for field, analyzer in FIELDS_ANALYZERS.items():
+                value = product_type.get(field)
+                if value is None:
+                    continue
+                terms = analyzer(str(value))
+                if not terms:
+                    continue
+                self._field_docnums[field].add(docnum)
+                positions: Dict[str, List[int]] = {}
+                for position, term in enumerate(terms):
+                    positions.setdefault(term, []).append(position)
+                field_postings = self._postings[field]
+                for term, term_positions in positions.items():
+                    field_postings.setdefault(term, {})[docnum] = (
+                        tuple(term_positions) if field in TEXT_FIELDS else ()
+                    )
+                if field in TEXT_FIELDS:
+                    self._lengths[field][docnum] = len(terms)
+                    self._total_lengths[field] += len(terms)
+
+    def _remove(self, docnum: int) -> None:
+        """Remove the terms of a document, must be called with the lock held"""
+        for field, field_postings in self._postings.items():
+            if docnum not in self._field_docnums[field]:
+                continue
+            self._field_docnums[field].discard(docnum)
+            for term in [t for t, docs in field_postings.items() if docnum in docs]:
+                del field_postings[term][docnum]
+                if not field_postings[term]:
+                    del field_postings[term]
+        for field, lengths in self._lengths.items():
+            self._total_lengths[field] -= lengths.pop(docnum, 0)
+
+    def search(self, text: str, fieldnames: List[str]) -> List[Dict[str, Any]]:
+        """Search product types
+
+        :param text: The query, see :class:`ProductTypesIndex` for its syntax
+        :param fieldnames: Fields where terms without field are searched
+        :returns: The stored fields of the matching product types, best matches first
+        """
+        query = parse_query(text, tuple(fieldnames))
+        if query is None:
+            return []
+        with self._lock:
+            scores = query.matches(self)
+            documents = [(score, self._documents[d]) for d, score in scores.items()]
+        documents.sort(key=lambda doc: (-doc[0], doc[1]["ID"]))
+        return [dict(document) for _, document in documents]
+
+    def term_scores(self, field: str, term: str) -> Dict[int, float]:
+        """Scores of the documents containing a term
+
+        Matches of text fields are scored with BM25, other matches score 1.
+
+        :param field: Field of the term
+        :param term: The analyzed term
+        :returns: The documents scores, by document number
+        """
+        postings = self._postings.get(field, {}).get(term)
+        if not postings:
+            return {}
+        if field not in TEXT_FIELDS:
+            return dict.fromkeys(postings, 1.0)
+        doc_count = len(self._documents)
+        idf = math.log(doc_count / (len(postings) + 1)) + 1
+        lengths = self._lengths[field]
+        avg_length = self._total_lengths[field] / doc_count
+        return {
+            docnum: idf
+            * (len(positions) * (BM25_K1 + 1))
+            / (
+                len(positions)
+                + BM25_K1 * (1 - BM25_B + BM25_B * lengths[docnum] / avg_length)
+            )
+            for docnum, positions in postings.items()
+        }
+
+    def phrase_scores(
+        self, field: str, words: List[str], slop: int
+    ) -> Dict[int, float]:
+        """Scores of the documents containing a phrase
+
+        :param field: Field of the phrase, which must be a text field to match
+        :param words: The analyzed words of the phrase
+        :param slop: Maximum distance between two consecutive words of the phrase
+        :returns: The documents scores, by document number
+        """
+        if field not in TEXT_FIELDS:
+            return {}
+        field_postings = self._postings[field]
+        if any(word not in field_postings for word in words):
+            return {}
+        words_scores = [self.term_scores(field, word) for word in words]
+        scores: Dict[int, float] = {}
+        for docnum in set.intersection(*(set(s) for s in words_scores)):
+            reachable = set(field_postings[words[0]][docnum])
+            for word in words[1:]:
+                reachable = {
+                    p
+                    for p in field_postings[word][docnum]
+                    if any(1 <= p - q <= slop for q in reachable)
+                }
+                if not reachable:
+                    break
+            else:
+                scores[docnum] = sum(s[docnum] for s in words_scores)
+        return scores
+
+    def matching_terms(self, field: str, predicate: Callable[[str], bool]) -> Set[int]:
+        """Documents containing terms of a field matching a predicate
+
+        :param field: Field of the terms
+        :param predicate: Function telling if a term matches
+        :returns: The documents numbers
+        """
+        docnums: Set[int] = set()
+        for term, postings in self._postings.get(field, {}).items():
+            if predicate(term):
+                docnums.update(postings)
+        return docnums
+
+    def field_docnums(self, field: Optional[str] = None) -> Set[int]:
+        """Documents having a field
+
+        :param field: (optional) The field, all the documents if not given
+        :returns: The documents numbers
+        """
+        if field is None:
+            return set(range(len(self._documents)))
+        return self._field_docnums.get(field, set())
+
+
+class Query:
+    """Query matching documents of a :class:`ProductTypesIndex`"""
+
+    boost = 1.0
+
+    def matches(self, index: ProductTypesIndex) -> Dict[int, float]:
+        """Matching documents
+
+        :param index: The searched index
+        :returns: The scores of the matching documents, by document number
+        """
+        scores = self._matches(index)
+        if self.boost != 1.0:
+            return {docnum: score * self.boost for docnum, score in scores.items()}
+        return scores
+
+    def _matches(self, index: ProductTypesIndex) -> Dict[int, float]:
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        attrs = ", ".join(f"{k}={v!r}" for k, v in self.__dict__.items())
+        return f"{self.__class__.__name__}({attrs})"
+
+
+class Term(Query):
+    """Documents containing a term"""
+
+    def __init__(self, field: str, text: str, boost: float = 1.0) -> None:
+        self.field = field
+        self.text = text
+        self.boost = boost
+
+    def _matches(self, index: ProductTypesIndex) -> Dict[int, float]:
+        return index.term_scores(self.field, self.text)
+
+
+class Phrase(Query):
+    """Documents containing words, in order and close to each other"""
+
+    def __init__(
+        self, field: str, words: List[str], slop: int = 1, boost: float = 1.0
+    ) -> None:
+        self.field = field
+        self.words = words
+        self.slop = slop
+        self.boost = boost
+
+    def _matches(self, index: ProductTypesIndex) -> Dict[int, float]:
+        return index.phrase_scores(self.field, self.words, self.slop)
+
+
+class TermsMatch(Query):
+    """Documents containing a term matching a prefix, a wildcard pattern or a range,
+    all scoring 1"""
+
+    def __init__(
+        self, field: str, predicate: Callable[[str], bool], boost: float = 1.0
+    ) -> None:
+        self.field = field
+        self.predicate = predicate
+        self.boost = boost
+
+    def _matches(self, index: ProductTypesIndex) -> Dict[int, float]:
+        return dict.fromkeys(index.matching_terms(self.field, self.predicate), 1.0)
+
+
+class Every(Query):
+    """Documents having a field, or all documents, all scoring 1"""
+
+    def __init__(self, field: Optional[str] = None, boost: float = 1.0) -> None:
+        self.field = field
+        self.boost = boost
+
+    def _matches(self, index: ProductTypesIndex) -> Dict[int, float]:
+        return dict.fromkeys(index.field_docnums(self.field), 1.0)
+
+
+class Or(Query):
+    """Documents matching any subquery, scored with the sum of their scores"""
+
+    def __init__(self, subqueries: List[Query], boost: float = 1.0) -> None:
+        self.subqueries = subqueries
+        self.boost = boost
+
+    def _matches(self, index: ProductTypesIndex) -> Dict[int, float]:
+        scores: Dict[int, float] = {}
+        for subquery in self.subqueries:
+            for docnum, score in subquery.matches(index).items():
+                scores[docnum] = scores.get(docnum, 0.0) + score
+        return scores
+
+
+class And(Query):
+    """Documents matching all subqueries, scored with the sum of their scores"""
+
+    def __init__(self, subqueries: List[Query], boost: float = 1.0) -> None:
+        self.subqueries = subqueries
+        self.boost = boost
+
+    def _matches(self, index: ProductTypesIndex) -> Dict[int, float]:
+        scores = self.subqueries[0].matches(index)
+        for subquery in self.subqueries[1:]:
+            if not scores:
+                break
+            sub_scores = subquery.matches(index)
+            scores = {
+                docnum: score + sub_scores[docnum]
+                for docnum, score in scores.items()
+                if docnum in sub_scores
+            }
+        return scores
+
+
+class Not(Query):
+    """Documents not matching a query, all scoring 1"""
+
+    def __init__(self, query: Query) -> None:
+        self.query = query
+
+    def _matches(self, index: ProductTypesIndex) -> Dict[int, float]:
+        excluded = self.query.matches(index)
+        return {d: 1.0 for d in index.field_docnums() if d not in excluded}
+
+
+class AndNot(Query):
+    """Documents matching a query but not another one"""
+
+    def __init__(self, positive: Query, negative: Query, boost: float = 1.0) -> None:
+        self.positive = positive
+        self.negative = negative
+        self.boost = boost
+
+    def _matches(self, index: ProductTypesIndex) -> Dict[int, float]:
+        scores = self.positive.matches(index)
+        excluded = self.negative.matches(index) if scores else {}
+        return {d: score for d, score in scores.items() if d not in excluded}
+
+
+class AndMaybe(Query):
+    """Documents matching a query, whose scores are increased if they match another
+    one"""
+
+    def __init__(self, required: Query, optional: Query, boost: float = 1.0) -> None:
+        self.required = required
+        self.optional = optional
+        self.boost = boost
+
+    def _matches(self, index: ProductTypesIndex) -> Dict[int, float]:
+        scores = self.required.matches(index)
+        optional_scores = self.optional.matches(index) if scores else {}
+        return {d: score + optional_scores.get(d, 0.0) for d, score in scores.items()}
+
+
+class Require(Query):
+    """Documents matching two queries, scored by the first one only"""
+
+    def __init__(self, scored: Query, required: Query, boost: float = 1.0) -> None:
+        self.scored = scored
+        self.required = required
+        self.boost = boost
+
+    def _matches(self, index: ProductTypesIndex) -> Dict[int, float]:
+        scores = self.scored.matches(index)
+        required = self.required.matches(index) if scores else {}
+        return {d: score for d, score in scores.items() if d in required}
+
+
+class _Node:
+    """Node of a parsed query"""
+
+    fieldname: Optional[str] = None
+    boost = 1.0
+
+    def set_fieldname(self, fieldname: str) -> None:
+        """Set the field of the node if it has none"""
+        if self.fieldname is None:
+            self.fieldname = fieldname
+
+
+class _Word(_Node):
+    def __init__(self, text: str, literal: bool = False) -> None:
+        self.text = text
+        # single quoted words do not contain wildcards
+        self.literal = literal
+
+
+class _Phrase(_Node):
+    def __init__(self, text: str, slop: int) -> None:
+        self.text = text
+        self.slop = slop
+
+
+class _Range(_Node):
+    def __init__(
+        self,
+        start: str,
+        end: str,
+        start_excl: bool,
+        end_excl: bool,
+    ) -> None:
+        self.start = start
+        self.end = end
+        self.start_excl = start_excl
+        self.end_excl = end_excl
+
+
+class _Every(_Node):
+    def set_fieldname(self, fieldname: str) -> None:
+        pass
+
+
+class _Group(_Node):
+    def __init__(
+        self,
+        kind: str = "or",
+        nodes: Optional[List[_Node]] = None,
+        operation: bool = False,
+    ) -> None:
+        self.kind = kind
+        self.nodes: List[_Node] = nodes if nodes is not None else []
+        # whether the group was created by an infix operator, or by parentheses
+        self.operation = operation
+
+    def set_fieldname(self, fieldname: str) -> None:
+        for node in self.nodes:
+            node.set_fieldname(fieldname)
+
+
+class _Token(_Node):
+    """Syntax token: whitespace, parenthesis, operator, field name, boost or +/-"""
+
+    def __init__(self, kind: str, original: str, value: Any = None) -> None:
+        self.kind = kind
+        self.original = original
+        self.value = value
+
+
+#: Infix operators, from the one binding the most to the one binding the least
+_INFIX_OPERATORS = ("and", "or", "andnot", "andmaybe", "require")
+
+#: Syntax tokens of the query language, tried in this order at each position of the
+#: query, the text between them being words
+_TAGGER_RE = re.compile(
+    r"""
+    (?P<andnot>(?<=\s)ANDNOT(?=\s))
+    |(?P<andmaybe>(?<=\s)ANDMAYBE(?=\s))
+    |(?P<every>[*]:[*])
+    |(?P<quoted>(^|(?<=\W))'(?P<quoted_text>.*?)'(?=\s|\]|[)}]|$))
+    |(?P<field>(?P<field_text>\w+):)
+    |(?P<phrase>"(?P<phrase_text>.*?)"(~(?P<phrase_slop>[1-9][0-9]*))?)
+    |(?P<open>[(])
+    |(?P<close>[)])
+    |(?P<not>(^|(?<=(\s|[()])))NOT(?=\s))
+    |(?P<and>(?<=\s)AND(?=\s))
+    |(?P<or>(?<=\s)OR(?=\s))
+    |(?P<require>(^|(?<=\s))REQUIRE(?=\s))
+    |(?P<boost>\^(?P<boost_value>[0-9]*(\.[0-9]+)?)($|(?=[ \t\r\n)])))
+    |(?P<plus>\+)
+    |(?P<minus>-)
+    |(?P<range>
+        (?P<range_open>\{|\[)
+        (?P<range_start>('[^']*?'\s+)|([^\]}]+?(?=[Tt][Oo])))?
+        [Tt][Oo]
+        (?P<range_end>(\s+'[^']*?')|([^\]}]+?))?
+        (?P<range_close>}|])
+    )
+    |(?P<space>\s+)
+    """,
+    re.VERBOSE,
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_query(text: str, fieldnames: Tuple[str, ...]) -> Optional[Query]:
+    """Parse a query of the :class:`ProductTypesIndex` query language, cached
+
+    :param text: The query
+    :param fieldnames: Fields where terms without field are searched
+    :returns: The parsed query, ``None`` if it cannot match anything
+    """
+    return QueryParser(list(fieldnames)).parse(text)
+
+
+class QueryParser:
+    """Parser of the :class:`ProductTypesIndex` query language
+
+    :param fieldnames: Fields where terms without field are searched
+    """
+
+    def __init__(self, fieldnames: List[str]) -> None:
+        self.fieldnames = fieldnames
+
+    def parse(self, text: str) -> Optional[Query]:
+        """Parse a query
+
+        :param text: The query
+        :returns: The parsed query, ``None`` if it cannot match anything
+        """
+        group = self._group(self._tag(text))
+        group = self._apply_syntax(group)
+        nodes = group.nodes
+        group.nodes = self._plus_minus(nodes) if nodes else nodes
+        return self._query(group)
+
+    def _tag(self, text: str) -> List[_Node]:
+        """Split the query into words and syntax tokens"""
+        nodes: List[_Node] = []
+        word = ""
+        pos = 0
+        for match in _TAGGER_RE.finditer(text):
+            kind = match.lastgroup
+            if kind is None:
+                # every syntax token is a named group
+                continue
+            word += text[pos : match.start()]
+            pos = match.end()
+            if kind == "field" and match.group("field_text") not in FIELDS_ANALYZERS:
+                # unknown fields are part of the text
+                word += match.group(0)
+                continue
+            if word:
+                nodes.append(_Word(word))
+                word = ""
+            if kind == "quoted":
+                nodes.append(_Word(match.group("quoted_text"), literal=True))
+            elif kind == "phrase":
+                slop = int(match.group("phrase_slop") or 1)
+                nodes.append(_Phrase(match.group("phrase_text"), slop))
+            elif kind == "every":
+                nodes.append(_Every())
+            elif kind == "range":
+                start = (match.group("range_start") or "").rstrip()
+                end = (match.group("range_end") or "").lstrip()
+                nodes.append(
+                    _Range(
+                        start[1:-1] if start[:1] == start[-1:] == "'" else start,
+                        end[1:-1] if end[:1] == end[-1:] == "'" else end,
+                        match.group("range_open") == "{",
+                        match.group("range_close") == "}",
+                    )
+                )
+            elif kind == "field":
+                nodes.append(_Token(kind, match.group(0), match.group("field_text")))
+            elif kind == "boost":
+                try:
+                    boost = float(match.group("boost_value"))
+                except ValueError:
+                    nodes.append(_Word(match.group(0)))
+                else:
+                    nodes.append(_Token(kind, match.group(0), boost))
+            else:
+                nodes.append(_Token(kind, match.group(0)))
+        word += text[pos:]
+        if word:
+            nodes.append(_Word(word))
+        return nodes
+
+    @staticmethod
+    def _group(nodes: List[_Node]) -> _Group:
+        """Nest the nodes enclosed in parentheses into groups"""
+        stack = [_Group()]
+        for node in nodes:
+            if isinstance(node, _Token) and node.kind == "open":
+                stack.append(_Group())
+            elif isinstance(node, _Token) and node.kind == "close":
+                if len(stack) > 1:
+                    last = stack.pop()
+                    stack[-1].nodes.append(last)
+            else:
+                stack[-1].nodes.append(node)
+        top = stack[0]
+        # unclosed parentheses are ignored
+        for unclosed in stack[1:]:
+            top.nodes.extend(unclosed.nodes)
+        if len(top.nodes) == 1 and isinstance(top.nodes[0], _Group):
+            top = top.nodes[0]
+        return top
+
+    def _apply_syntax(self, group: _Group) -> _Group:
+        """Apply field names and boosts to the nodes following or preceding them,
+        and remove whitespaces"""
+        nodes: List[_Node] = []
+        for node in group.nodes:
+            if isinstance(node, _Group):
+                node = self._apply_syntax(node)
+            previous = nodes[-1] if nodes else None
+            if isinstance(previous, _Token) and previous.kind == "field":
+                if isinstance(node, _Token):
+                    # field name not followed by a term
+                    nodes[-1] = _Word(previous.original)
+                else:
+                    node.set_fieldname(previous.value)
+                    nodes.pop()
+            if isinstance(node, _Token) and node.kind == "boost":
+                if previous is not None and not isinstance(previous, _Token):
+                    previous.boost = node.value
+                    continue
+                node = _Word(node.original)
+            nodes.append(node)
+        if nodes and isinstance(nodes[-1], _Token) and nodes[-1].kind == "field":
+            nodes[-1] = _Word(nodes[-1].original)
+        group.nodes = [
+            node
+            for node in nodes
+            if not (isinstance(node, _Token) and node.kind == "space")
+        ]
+        return group
+
+    def _plus_minus(self, nodes: List[_Node]) -> List[_Node]:
+        """Sort the top level nodes into required, optional and excluded ones"""
+        required: List[_Node] = []
+        optional: List[_Node] = []
+        excluded: List[_Node] = []
+        target = optional
+        for node in nodes:
+            if isinstance(node, _Token) and node.kind == "plus":
+                target = required
+            elif isinstance(node, _Token) and node.kind == "minus":
+                target = excluded
+            else:
+                target.append(node)
+                target = optional
+        result: _Node = _Group("or", optional)
+        if required:
+            result = _Group("andmaybe", [_Group("and", required), result])
+        if excluded:
+            result = _Group("andnot", [result, _Group("or", excluded)])
+        return [result]
+
+    def _operators(self, nodes: List[_Node]) -> List[_Node]:
+        """Group the nodes joined by operators"""
+        nodes = [
+            node
+            for node in nodes
+            if not (isinstance(node, _Token) and node.kind in ("plus", "minus"))
+        ]
+        # prefix operator
+        i = len(nodes) - 1
+        while i >= 0:
+            node = nodes[i]
+            if isinstance(node, _Token) and node.kind == "not":
+                if i < len(nodes) - 1:
+                    nodes[i : i + 2] = [_Group("not", [nodes[i + 1]])]
+                else:
+                    del nodes[i]
+            i -= 1
+        # infix operators
+        for kind in _INFIX_OPERATORS:
+            i = 0
+            while i < len(nodes):
+                node = nodes[i]
+                if not (isinstance(node, _Token) and node.kind == kind):
+                    i += 1
+                    continue
+                if 0 < i < len(nodes) - 1:
+                    left, right = nodes[i - 1], nodes[i + 1]
+                    if (
+                        kind in ("and", "or")
+                        and isinstance(left, _Group)
+                        and left.operation
+                        and left.kind == kind
+                    ):
+                        left.nodes.append(right)
+                        del nodes[i : i + 2]
+                    else:
+                        nodes[i - 1 : i + 2] = [_Group(kind, [left, right], True)]
+                else:
+                    # operator missing an operand
+                    del nodes[i]
+        # remaining operators tokens have no operand
+        return [node for node in nodes if not isinstance(node, _Token)]
+
+    def _query(self, node: _Node) -> Optional[Query]:
+        """Build the query of a node, ``None`` if it cannot match anything"""
+        if isinstance(node, _Group):
+            return self._group_query(node)
+        if isinstance(node, _Every):
+            return Every(boost=node.boost)
+        fieldnames = [node.fieldname] if node.fieldname else self.fieldnames
+        queries = [
+            query
+            for query in (self._field_query(node, field) for field in fieldnames)
+            if query is not None
+        ]
+        if len(queries) > 1:
+            return Or(queries)
+        return queries[0] if queries else None
+
+    def _group_query(self, group: _Group) -> Optional[Query]:
+        query: Optional[Query]
+        if group.kind in ("or", "and"):
+            subqueries = [
+                q
+                for q in (self._query(n) for n in self._operators(group.nodes))
+                if q is not None
+            ]
+            if len(subqueries) == 1:
+                query = subqueries[0]
+                query.boost *= group.boost
+                return query
+            if not subqueries:
+                return None
+            return (Or if group.kind == "or" else And)(subqueries, boost=group.boost)
+
+        subqueries_or_none = [self._query(n) for n in group.nodes]
+        if group.kind == "not":
+            return Not(subqueries_or_none[0]) if subqueries_or_none[0] else None
+        first, second = subqueries_or_none
+        if group.kind == "require":
+            query = Require(first, second) if first and second else None
+        elif first is None or second is None:
+            query = first
+        elif group.kind == "andnot":
+            query = AndNot(first, second)
+        else:
+            query = AndMaybe(first, second)
+        if query is not None:
+            query.boost *= group.boost
+        return query
+
+    def _field_query(self, node: _Node, field: str) -> Optional[Query]:
+        """Query of a word, phrase or range node in a field"""
+        analyzer = FIELDS_ANALYZERS.get(field)
+        if analyzer is None:
+            return None
+        boost = node.boost
+
+        if isinstance(node, _Phrase):
+            words = analyzer(node.text)
+            if not words:
+                return None
+            if len(words) == 1:
+                return Term(field, words[0], boost=boost)
+            return Phrase(field, words, slop=node.slop, boost=boost)
+
+        if isinstance(node, _Range):
+            start = _untokenized(analyzer, node.start)
+            end = _untokenized(analyzer, node.end)
+            if start is None and end is None:
+                return Every(field, boost=boost)
+
+            def in_range(term: str) -> bool:
+                if start is not None and (
+                    term < start or (node.start_excl and term == start)
+                ):
+                    return False
+                return end is None or not (
+                    term > end or (node.end_excl and term == end)
+                )
+
+            return TermsMatch(field, in_range, boost=boost)
+
+        assert isinstance(node, _Word)
+        if not node.literal and ("*" in node.text or "?" in node.text):
+            pattern = _untokenized(analyzer, node.text)
+            if pattern is None:
+                return None
+            if pattern == "*":
+                return Every(field, boost=boost)
+            if "?" not in pattern and pattern.find("*") == len(pattern) - 1:
+                prefix = pattern[:-1]
+                return TermsMatch(field, lambda t: t.startswith(prefix), boost=boost)
+            regex = re.compile(
+                re.escape(pattern).replace(r"\*", ".*").replace(r"\?", "."), re.DOTALL
+            )
+            return TermsMatch(field, lambda t: bool(regex.fullmatch(t)), boost=boost)
+
+        terms = analyzer(node.text)
+        if len(terms) > 1:
+            return Or([Term(field, term, boost=boost) for term in terms])
+        return Term(field, terms[0], boost=boost) if terms else None
@@ -28,11 +28,15 @@ from typing import (
     Optional,
     Tuple,
     Union,
+    cast,
 )
 
+import numpy as np
+import shapely
 from shapely.geometry import GeometryCollection, shape
 from typing_extensions import Doc
 
+from eodag.api.columns import SearchResultColumns
 from eodag.api.product import EOProduct
 from eodag.plugins.crunch.filter_date import FilterDate
 from eodag.plugins.crunch.filter_latest_intersect import FilterLatestIntersect
@@ -41,6 +45,7 @@ from eodag.plugins.crunch.filter_overlap import FilterOverlap
 from eodag.plugins.crunch.filter_property import FilterProperty
 
 if TYPE_CHECKING:
+    import pyarrow
     from shapely.geometry.base import BaseGeometry
 
     from eodag.plugins.crunch.base import Crunch
@@ -62,6 +67,10 @@ class SearchResult(UserList):
         List[Tuple[str, Exception]], Doc("Tuple of provider name, exception")
     ]
 
+    latencies: Annotated[
+        Dict[str, float], Doc("Search duration in seconds per provider name")
+    ]
+
     def __init__(
         self,
         products: List[EOProduct],
@@ -71,6 +80,38 @@ class SearchResult(UserList):
         super().__init__(products)
         self.number_matched = number_matched
         self.errors = errors
+        self.latencies = {}
+        # products whose columnar view is cached, and the cached view
+        self._columns_products: List[EOProduct] = []
+        self._columns: Optional[SearchResultColumns] = None
+
+    @property
+    def columns(self) -> SearchResultColumns:
+        """Columnar view of the products, for vectorized filtering, sorting and export.
+
+        It is built lazily, and again only if the products change.
+        """
+        if (
+            self._columns is None
+            or len(self._columns_products) != len(self.data)
+            or any(
+                cached is not product
+                for cached, product in zip(self._columns_products, self.data)
+            )
+        ):
+            self._columns_products = list(self.data)
+            self._columns = SearchResultColumns(self.data)
+        return self._columns
+
+    @property
+    def geometries(self) -> np.ndarray:
+        """Geometries of the products, as an array for shapely vectorized operations"""
+        return self.columns.geometries
+
+    @property
+    def strtree(self) -> shapely.STRtree:
+        """Spatial index of the products geometries, whose indices are products indices"""
+        return self.columns.strtree
 
     def crunch(self, cruncher: Crunch, **search_params: Any) -> SearchResult:
         """Do some crunching with the underlying EO products.
@@ -79,7 +120,10 @@ class SearchResult(UserList):
         :param search_params: The criteria that have been used to produce this result
         :returns: The result of the application of the crunching method to the EO products
         """
-        crunched_results = cruncher.proceed(self.data, **search_params)
+        # crunchers may use the cached columns of the search result
+        crunched_results = cruncher.proceed(
+            cast(List[EOProduct], self), **search_params
+        )
         return SearchResult(crunched_results)
 
     def filter_date(
@@ -168,6 +212,23 @@ class SearchResult(UserList):
             "features": [product.as_dict() for product in self],
         }
 
+    def to_arrow(self) -> pyarrow.Table:
+        """Arrow table of the products, see
+        :meth:`~eodag.api.columns.SearchResultColumns.to_arrow`
+
+        :returns: The products table
+        """
+        return self.columns.to_arrow()
+
+    def to_parquet(self, path: str, **kwargs: Any) -> None:
+        """Write the products to a GeoParquet file, without building their GeoJSON
+        representation. Needs ``pyarrow``.
+
+        :param path: Path of the file to write
+        :param kwargs: Options of :func:`pyarrow.parquet.write_table`
+        """
+        self.columns.to_parquet(path, **kwargs)
+
     def as_shapely_geometry_object(self) -> GeometryCollection:
         """:class:`shapely.GeometryCollection` representation of SearchResult"""
         return GeometryCollection(
@@ -232,7 +232,8 @@ def version() -> None:
     type=click.Path(dir_okay=False, writable=True, readable=False),
     default="search_results.geojson",
     help="Path to the file where to store search results (.geojson extension will be "
-    "automatically appended to the filename). DEFAULT: search_results.geojson",
+    "automatically appended to the filename, or .ndjson with --stream). "
+    "DEFAULT: search_results.geojson",
 )
 @click.option(
     "--items",
@@ -259,6 +260,15 @@ def version() -> None:
     "or a maximum value defined internally for the requested provider, or a default "
     "maximum value equals to 50.",
 )
+@click.option(
+    "--stream",
+    is_flag=True,
+    cls=MutuallyExclusiveOption,
+    mutually_exclusive=["cruncher", "cruncher_args", "page", "count"],
+    help="Retrieve ALL the products that match the search criteria, like --all, but "
+    "write them to the storage file one by one as they are received, as "
+    "newline-delimited GeoJSON features, with a constant memory usage.",
+)
 @click.option(
     "--count",
     is_flag=True,
@@ -375,6 +385,21 @@ def search_crunch(ctx: Context, **kwargs: Any) -> None:
 
     # Search
     get_all_products = kwargs.pop("all")
+    if kwargs.pop("stream"):
+        storage_filepath = kwargs.pop("storage")
+        storage_root, storage_ext = os.path.splitext(storage_filepath)
+        if storage_ext != ".ndjson":
+            storage_filepath = (
+                storage_root if storage_ext == ".geojson" else storage_filepath
+            ) + ".ndjson"
+        products_count = gateway.serialize_stream(
+            gateway.search_stream(items_per_page=items_per_page, **criteria),
+            filename=storage_filepath,
+        )
+        click.echo("Returned {} products".format(products_count))
+        click.echo("Results stored at '{}'".format(storage_filepath))
+        return
+
     if get_all_products:
         # search_all needs items_per_page to be None if the user lets eodag determines
         # what value it should take.
@@ -546,6 +571,13 @@ def discover_pt(ctx: Context, **kwargs: Any) -> None:
     show_default=False,
     help="Download only quicklooks of products instead full set of files",
 )
+@click.option(
+    "--max-workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Maximum number of products downloaded concurrently",
+)
 @click.pass_context
 def download(ctx: Context, **kwargs: Any) -> None:
     """Download a bunch of products from a serialized search result"""
@@ -600,7 +632,9 @@ def download(ctx: Context, **kwargs: Any) -> None:
                     )
                 search_results[idx].register_downloader(downloader, auth)
 
-        downloaded_files = satim_api.download_all(search_results)
+        downloaded_files = satim_api.download_all(
+            search_results, max_workers=kwargs.pop("max_workers")
+        )
         if downloaded_files and len(downloaded_files) > 0:
             for downloaded_file in downloaded_files:
                 if downloaded_file is None:
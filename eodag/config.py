@@ -44,7 +44,6 @@ import yaml.constructor
 import yaml.parser
 from annotated_types import Gt
 from jsonpath_ng import JSONPath
-from pkg_resources import resource_filename
 
 from eodag.api.product.metadata_mapping import mtd_cfg_as_conversion_and_querypath
 from eodag.utils import (
@@ -56,6 +55,7 @@ from eodag.utils import (
     deepcopy,
     dict_items_recursive_apply,
     merge_mappings,
+    resource_filename,
     slugify,
     sort_dict,
     string_to_jsonpath,
@@ -410,6 +410,14 @@ class PluginConfig(yaml.YAMLObject):
     #: :class:`~eodag.plugins.base.PluginTopic` :class:`urllib3.util.Retry` ``status_forcelist`` parameter,
     #: list of integer HTTP status codes that we should force a retry on
     retry_status_forcelist: List[int]
+    #: :class:`~eodag.plugins.base.PluginTopic` Number of hosts for which pooled connections are kept
+    pool_connections: int
+    #: :class:`~eodag.plugins.base.PluginTopic` Maximum number of pooled connections kept per host
+    pool_maxsize: int
+    #: :class:`~eodag.plugins.base.PluginTopic` Wait for a free pooled connection instead of opening a new one
+    pool_block: bool
+    #: :class:`~eodag.plugins.base.PluginTopic` Keep connections open between requests
+    keep_alive: bool
 
     # search & api -----------------------------------------------------------------------------------------------------
     # copied from ProviderConfig in PluginManager.get_search_plugins()
@@ -444,6 +452,9 @@ class PluginConfig(yaml.YAMLObject):
     literal_search_params: Dict[str, str]
     #: :class:`~eodag.plugins.search.qssearch.QueryStringSearch` Characters that should not be quoted in the url params
     dont_quote: List[str]
+    #: :class:`~eodag.plugins.search.qssearch.QueryStringSearch` Duration in seconds during which search responses
+    #: are served from the on-disk responses cache, ``0`` to disable it
+    response_cache_ttl: int
     #: :class:`~eodag.plugins.search.qssearch.ODataV4Search` Dict describing free text search request build
     free_text_search_operations: Dict[str, Any]
     #: :class:`~eodag.plugins.search.qssearch.ODataV4Search` Set to ``True`` if the metadata is not given in the search
@@ -467,9 +478,16 @@ class PluginConfig(yaml.YAMLObject):
     merge_responses: bool
     #: :class:`~eodag.plugins.search.qssearch.PostJsonSearch` Collections names (`aws_eos` specific)
     collection: List[str]
-    #: :class:`~eodag.plugins.search.static_stac_search.StaticStacSearch`
+    #: :class:`~eodag.plugins.search.static_stac_search.StaticStacSearch`,
+    #: :class:`~eodag.plugins.authentication.sas_auth.SASAuth`
     #: Maximum number of connections for concurrent HTTP requests
     max_connections: int
+    #: :class:`~eodag.plugins.search.static_stac_search.StaticStacSearch`
+    #: Directory where the catalog index is persisted
+    index_dir: str
+    #: :class:`~eodag.plugins.search.static_stac_search.StaticStacSearch`
+    #: Duration in seconds during which the catalog index is used without being refreshed
+    index_ttl: int
     #: :class:`~eodag.plugins.search.build_search_result.ECMWFSearch`
     #: Whether end date should be excluded from search request or not
     end_date_excluded: bool
@@ -490,6 +508,9 @@ class PluginConfig(yaml.YAMLObject):
     #: :class:`~eodag.plugins.download.base.Download`
     #: Whether the content of the downloaded file should be extracted or not
     extract: bool
+    #: :class:`~eodag.plugins.download.http.HTTPDownload`
+    #: Whether archives should be extracted while they are downloaded, without being written to disk
+    stream_extract: bool
     #: :class:`~eodag.plugins.download.base.Download` Which extension should be used for the downloaded file
     output_extension: str
     #: :class:`~eodag.plugins.download.base.Download` Whether the directory structure should be flattened or not
@@ -500,6 +521,11 @@ class PluginConfig(yaml.YAMLObject):
     ignore_assets: bool
     #: :class:`~eodag.plugins.download.base.Download` Product type specific configuration
     products: Dict[str, Dict[str, Any]]
+    #: :class:`~eodag.plugins.download.base.Download`
+    #: Maximum number of products of the provider downloaded concurrently by ``download_all``
+    max_workers: int
+    #: :class:`~eodag.plugins.download.http.HTTPDownload` Maximum number of assets of a product downloaded concurrently
+    assets_in_flight: int
     #: :class:`~eodag.plugins.download.http.HTTPDownload` Whether the product has to be ordered to download it or not
     order_enabled: bool
     #: :class:`~eodag.plugins.download.http.HTTPDownload` HTTP request method for the order request
@@ -524,6 +550,13 @@ class PluginConfig(yaml.YAMLObject):
     requester_pays: bool
     #: :class:`~eodag.plugins.download.aws.AwsDownload` S3 endpoint
     s3_endpoint: str
+    #: :class:`~eodag.plugins.download.aws.AwsDownload` Size in bytes of the ranged GETs used to download S3 objects
+    range_size: int
+    #: :class:`~eodag.plugins.download.aws.AwsDownload` Maximum number of ranges of a S3 object downloaded concurrently
+    ranges_in_flight: int
+    #: :class:`~eodag.plugins.download.aws.AwsDownload`
+    #: Maximum number of S3 objects of a product downloaded concurrently
+    objects_in_flight: int
 
     # auth -------------------------------------------------------------------------------------------------------------
     #: :class:`~eodag.plugins.authentication.base.Authentication` Authentication credentials dictionary
@@ -601,6 +634,8 @@ class PluginConfig(yaml.YAMLObject):
     token_uri: str
     #: :class:`~eodag.plugins.authentication.sas_auth.SASAuth` Key to get the signed url
     signed_url_key: str
+    #: :class:`~eodag.plugins.authentication.sas_auth.SASAuth` Maximum number of signed urls kept in cache
+    max_signed_urls: int
     #: :class:`~eodag.plugins.authentication.token.TokenAuth`
     #: Credentials json structure if they should be sent as POST data
     req_data: Dict[str, Any]
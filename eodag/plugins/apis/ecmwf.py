@@ -270,6 +270,7 @@ class EcmwfApi(Api, ECMWFSearch):
         progress_callback: Optional[ProgressCallback] = None,
         wait: float = DEFAULT_DOWNLOAD_WAIT,
         timeout: float = DEFAULT_DOWNLOAD_TIMEOUT,
+        max_workers: int = 1,
         **kwargs: Unpack[DownloadConf],
     ) -> List[str]:
         """
@@ -282,6 +283,7 @@ class EcmwfApi(Api, ECMWFSearch):
             progress_callback=progress_callback,
             wait=wait,
             timeout=timeout,
+            max_workers=max_workers,
             **kwargs,
         )
 
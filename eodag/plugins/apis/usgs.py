@@ -32,8 +32,8 @@ from usgs import USGSAuthExpiredError, USGSError, api
 from eodag.api.product import EOProduct
 from eodag.api.product.metadata_mapping import (
     DEFAULT_METADATA_MAPPING,
+    CompiledJsonMapping,
     mtd_cfg_as_conversion_and_querypath,
-    properties_from_json,
 )
 from eodag.plugins.apis.base import Api
 from eodag.plugins.search import PreparedSearch
@@ -259,12 +259,11 @@ class UsgsApi(Api):
                         )
             results["data"]["results"] = list(results_by_entity_id.values())
 
+            extract_properties = CompiledJsonMapping(self.config.metadata_mapping)
             for result in results["data"]["results"]:
                 result["productType"] = usgs_dataset
 
-                product_properties = properties_from_json(
-                    result, self.config.metadata_mapping
-                )
+                product_properties = extract_properties(result)
 
                 final.append(
                     EOProduct(
@@ -469,6 +468,7 @@ class UsgsApi(Api):
         progress_callback: Optional[ProgressCallback] = None,
         wait: float = DEFAULT_DOWNLOAD_WAIT,
         timeout: float = DEFAULT_DOWNLOAD_TIMEOUT,
+        max_workers: int = 1,
         **kwargs: Unpack[DownloadConf],
     ) -> List[str]:
         """
@@ -481,5 +481,6 @@ class UsgsApi(Api):
             progress_callback=progress_callback,
             wait=wait,
             timeout=timeout,
+            max_workers=max_workers,
             **kwargs,
         )
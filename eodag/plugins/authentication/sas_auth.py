@@ -18,15 +18,23 @@
 from __future__ import annotations
 
 import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import timezone
 from json import JSONDecodeError
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
 
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dateutil.parser import isoparse
 from requests.auth import AuthBase
 
 from eodag.plugins.authentication.base import Authentication
 from eodag.utils import HTTP_REQ_TIMEOUT, USER_AGENT, deepcopy, format_dict_items
 from eodag.utils.exceptions import AuthenticationError, TimeOutError
+from eodag.utils.requests import get_provider_session
 
 if TYPE_CHECKING:
     from requests import PreparedRequest
@@ -34,9 +42,38 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("eodag.auth.sas_auth")
 
+#: Default maximum number of signed urls kept by :class:`RequestsSASAuth`
+DEFAULT_MAX_SIGNED_URLS = 1000
+#: Default maximum number of concurrent requests used to sign several urls
+DEFAULT_SIGN_MAX_CONNECTIONS = 10
+#: Signed urls expiring within this number of seconds are signed again
+SIGNED_URL_EXPIRY_MARGIN = 60
+
+
+def get_signed_url_expiry(signed_url: str) -> Optional[float]:
+    """Expiry time of a signed url, read from its ``se`` (signed expiry) query parameter
+
+    :param signed_url: signed url
+    :returns: expiry as a POSIX timestamp, or ``None`` if the url does not have a valid expiry
+    """
+    signed_expiry = parse_qs(urlparse(signed_url).query).get("se")
+    if not signed_expiry:
+        return None
+    try:
+        expiry = isoparse(signed_expiry[0])
+    except ValueError:
+        return None
+    if expiry.tzinfo is None:
+        expiry = expiry.replace(tzinfo=timezone.utc)
+    return expiry.timestamp()
+
 
 class RequestsSASAuth(AuthBase):
-    """A custom authentication class to be used with requests module"""
+    """A custom authentication class to be used with requests module
+
+    Signed urls are cached until they expire (see :func:`get_signed_url_expiry`), and
+    least recently used ones are evicted when more than ``max_signed_urls`` are cached.
+    """
 
     def __init__(
         self,
@@ -44,12 +81,20 @@ class RequestsSASAuth(AuthBase):
         signed_url_key: str,
         headers: Optional[Dict[str, str]] = None,
         ssl_verify: bool = True,
+        session: Optional[requests.Session] = None,
+        max_signed_urls: int = DEFAULT_MAX_SIGNED_URLS,
+        max_connections: int = DEFAULT_SIGN_MAX_CONNECTIONS,
     ) -> None:
         self.auth_uri = auth_uri
         self.signed_url_key = signed_url_key
         self.headers = headers
-        self.signed_urls: Dict[str, str] = {}
+        # signed url and its expiry, per signing request url
+        self.signed_urls: OrderedDict[str, Tuple[str, Optional[float]]] = OrderedDict()
         self.ssl_verify = ssl_verify
+        self.session = session or requests.Session()
+        self.max_signed_urls = max_signed_urls
+        self.max_connections = max_connections
+        self._lock = threading.Lock()
 
     def __call__(self, request: PreparedRequest) -> PreparedRequest:
         """Perform the actual authentication"""
@@ -59,30 +104,98 @@ class RequestsSASAuth(AuthBase):
             for k, v in self.headers.items():
                 request.headers[k] = v
 
-        # request the signed_url
-        req_signed_url = self.auth_uri.format(url=request.url)
-        if req_signed_url not in self.signed_urls.keys():
-            logger.debug(f"Signed URL request: {req_signed_url}")
-            try:
-                response = requests.get(
-                    req_signed_url,
-                    headers=self.headers,
-                    timeout=HTTP_REQ_TIMEOUT,
-                    verify=self.ssl_verify,
-                )
-                response.raise_for_status()
-                signed_url = response.json().get(self.signed_url_key)
-            except requests.exceptions.Timeout as exc:
-                raise TimeOutError(exc, timeout=HTTP_REQ_TIMEOUT) from exc
-            except (requests.RequestException, JSONDecodeError, KeyError) as e:
-                raise AuthenticationError("Could no get signed url", str(e)) from e
-            else:
-                self.signed_urls[req_signed_url] = signed_url
-
-        request.url = self.signed_urls[req_signed_url]
+        request.url = self.sign_url(str(request.url))
 
         return request
 
+    def _get_cached_signed_url(self, req_signed_url: str) -> Optional[str]:
+        with self._lock:
+            cached = self.signed_urls.get(req_signed_url)
+            if cached is None:
+                return None
+            signed_url, expiry = cached
+            if expiry is not None and expiry - SIGNED_URL_EXPIRY_MARGIN <= time.time():
+                del self.signed_urls[req_signed_url]
+                return None
+            self.signed_urls.move_to_end(req_signed_url)
+            return signed_url
+
+    def _cache_signed_url(self, req_signed_url: str, signed_url: str) -> None:
+        with self._lock:
+            self.signed_urls[req_signed_url] = (
+                signed_url,
+                get_signed_url_expiry(signed_url),
+            )
+            self.signed_urls.move_to_end(req_signed_url)
+            while len(self.signed_urls) > self.max_signed_urls:
+                self.signed_urls.popitem(last=False)
+
+    def sign_url(self, url: str) -> str:
+        """Get the signed version of an url, from cache if not expired
+
+        :param url: url to sign
+        :returns: the signed url
+        :raises: :class:`~eodag.utils.exceptions.AuthenticationError`
+        :raises: :class:`~eodag.utils.exceptions.TimeOutError`
+        """
+        req_signed_url = self.auth_uri.format(url=url)
+        signed_url = self._get_cached_signed_url(req_signed_url)
+        if signed_url is not None:
+            return signed_url
+
+        logger.debug(f"Signed URL request: {req_signed_url}")
+        try:
+            response = self.session.get(
+                req_signed_url,
+                headers=self.headers,
+                timeout=HTTP_REQ_TIMEOUT,
+                verify=self.ssl_verify,
+            )
+            response.raise_for_status()
+            signed_url = response.json().get(self.signed_url_key)
+        except requests.exceptions.Timeout as exc:
+            raise TimeOutError(exc, timeout=HTTP_REQ_TIMEOUT) from exc
+        except (requests.RequestException, JSONDecodeError, KeyError) as e:
+            raise AuthenticationError("Could no get signed url", str(e)) from e
+        if not signed_url:
+            raise AuthenticationError(
+                "Could no get signed url",
+                f"{self.signed_url_key} not found in {req_signed_url} response",
+            )
+        self._cache_signed_url(req_signed_url, signed_url)
+        return signed_url
+
+    def sign_urls(self, urls: Iterable[str]) -> Dict[str, str]:
+        """Concurrently sign several urls, for instance all the assets of a product.
+
+        Errors are only logged: signing will be tried again when the urls are requested.
+
+        :param urls: urls to sign
+        :returns: the signed urls, per url
+        """
+        signed_urls: Dict[str, str] = {}
+        to_sign = []
+        for url in dict.fromkeys(urls):
+            signed_url = self._get_cached_signed_url(self.auth_uri.format(url=url))
+            if signed_url is None:
+                to_sign.append(url)
+            else:
+                signed_urls[url] = signed_url
+        if not to_sign:
+            return signed_urls
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(self.max_connections, len(to_sign))),
+            thread_name_prefix="eodag-sas",
+        ) as executor:
+            futures = {executor.submit(self.sign_url, url): url for url in to_sign}
+            for future in as_completed(futures):
+                try:
+                    signed_urls[futures[future]] = future.result()
+                except (AuthenticationError, TimeOutError) as e:
+                    logger.debug(f"Could not sign {futures[future]}: {e}")
+        return signed_urls
+
 
 class SASAuth(Authentication):
     """SASAuth authentication plugin
@@ -101,6 +214,10 @@ class SASAuth(Authentication):
           apiKey is used**): headers to be added to the requests
         * :attr:`~eodag.config.PluginConfig.ssl_verify` (``bool``): if the ssl certificates should be
           verified in the requests; default: ``True``
+        * :attr:`~eodag.config.PluginConfig.max_signed_urls` (``int``): maximum number of signed urls
+          kept in cache; default: ``1000``
+        * :attr:`~eodag.config.PluginConfig.max_connections` (``int``): maximum number of concurrent
+          requests used to sign all the assets of a product; default: ``10``
 
     """
 
@@ -127,4 +244,11 @@ class SASAuth(Authentication):
             signed_url_key=self.config.signed_url_key,
             headers=headers,
             ssl_verify=ssl_verify,
+            session=get_provider_session(self.provider, self.config, retries=False),
+            max_signed_urls=getattr(
+                self.config, "max_signed_urls", DEFAULT_MAX_SIGNED_URLS
+            ),
+            max_connections=getattr(
+                self.config, "max_connections", DEFAULT_SIGN_MAX_CONNECTIONS
+            ),
         )
@@ -23,19 +23,12 @@ from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
 import requests
 from requests import RequestException
-from requests.adapters import HTTPAdapter
 from requests.auth import AuthBase
-from urllib3 import Retry
 
 from eodag.plugins.authentication.base import Authentication
-from eodag.utils import (
-    HTTP_REQ_TIMEOUT,
-    REQ_RETRY_BACKOFF_FACTOR,
-    REQ_RETRY_STATUS_FORCELIST,
-    REQ_RETRY_TOTAL,
-    USER_AGENT,
-)
+from eodag.utils import HTTP_REQ_TIMEOUT, USER_AGENT
 from eodag.utils.exceptions import AuthenticationError, MisconfiguredError, TimeOutError
+from eodag.utils.requests import get_provider_session
 
 if TYPE_CHECKING:
     from requests import PreparedRequest
@@ -105,7 +98,8 @@ class TokenAuth(Authentication):
         """Authenticate"""
         self.validate_config_credentials()
 
-        s = requests.Session()
+        # pooled session, with retries configured for this provider
+        s = get_provider_session(self.provider, self.config)
         try:
             # First get the token
             response = self._token_request(session=s)
@@ -152,20 +146,6 @@ class TokenAuth(Authentication):
         self,
         session: requests.Session,
     ) -> requests.Response:
-        retry_total = getattr(self.config, "retry_total", REQ_RETRY_TOTAL)
-        retry_backoff_factor = getattr(
-            self.config, "retry_backoff_factor", REQ_RETRY_BACKOFF_FACTOR
-        )
-        retry_status_forcelist = getattr(
-            self.config, "retry_status_forcelist", REQ_RETRY_STATUS_FORCELIST
-        )
-
-        retries = Retry(
-            total=retry_total,
-            backoff_factor=retry_backoff_factor,
-            status_forcelist=retry_status_forcelist,
-        )
-
         # append headers to req if some are specified in config
         req_kwargs: Dict[str, Any] = {
             "headers": dict(self.config.headers, **USER_AGENT)
@@ -174,7 +154,6 @@ class TokenAuth(Authentication):
 
         if self.refresh_token:
             logger.debug("fetching access token with refresh token")
-            session.mount(self.config.refresh_uri, HTTPAdapter(max_retries=retries))
             try:
                 response = session.post(
                     self.config.refresh_uri,
@@ -190,7 +169,6 @@ class TokenAuth(Authentication):
 
         logger.debug("fetching access token from %s", self.config.auth_uri)
         # append headers to req if some are specified in config
-        session.mount(self.config.auth_uri, HTTPAdapter(max_retries=retries))
         method = getattr(self.config, "request_method", "POST")
 
         # send credentials also as data in POST requests
@@ -19,6 +19,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+from eodag.api.columns import SearchResultColumns
 from eodag.config import PluginConfig
 from eodag.plugins.base import PluginTopic
 
@@ -41,3 +42,16 @@ class Crunch(PluginTopic):
     ) -> List[EOProduct]:
         """Implementation of how the results must be crunched"""
         raise NotImplementedError
+
+    @staticmethod
+    def get_columns(products: List[EOProduct]) -> SearchResultColumns:
+        """Columnar view of the products, cached by
+        :class:`~eodag.api.search_result.SearchResult`
+
+        :param products: The products to crunch
+        :returns: The products columns
+        """
+        columns = getattr(products, "columns", None)
+        if columns is None:
+            columns = SearchResultColumns(products)
+        return columns
@@ -24,11 +24,13 @@ from datetime import datetime as dt
 from typing import TYPE_CHECKING, Any, List
 
 import dateutil.parser
+import numpy as np
 from dateutil import tz
 
 if TYPE_CHECKING:
     from eodag.api.product import EOProduct
 
+from eodag.api.columns import parse_date
 from eodag.plugins.crunch.base import Crunch
 
 logger = logging.getLogger("eodag.crunch.date")
@@ -89,38 +91,17 @@ class FilterDate(Crunch):
         if not filter_start and not filter_end:
             return products
 
-        filtered: List[EOProduct] = []
-        for product in products:
-
-            # product start date
-            product_start_str = product.properties.get(
-                "startTimeFromAscendingNode", None
-            )
-            if product_start_str:
-                product_start = dateutil.parser.parse(product_start_str)
-                if not product_start.tzinfo:
-                    product_start = product_start.replace(tzinfo=tz.UTC)
-            else:
-                product_start = None
-
-            # product end date
-            product_end_str = product.properties.get(
-                "completionTimeFromAscendingNode", None
-            )
-            if product_end_str:
-                product_end = dateutil.parser.parse(product_end_str)
-                if not product_end.tzinfo:
-                    product_end = product_end.replace(tzinfo=tz.UTC)
-            else:
-                product_end = None
-
-            if filter_start and product_start and product_start < filter_start:
-                continue
-            if filter_end and product_end and product_end > filter_end:
-                continue
-            if filter_end and product_start and product_start > filter_end:
-                continue
-
-            filtered.append(product)
+        # products dates, NaT where missing, are never filtered out when missing
+        columns = self.get_columns(products)
+        products_start = columns.start_dates
+        products_end = columns.end_dates
+        keep = np.ones(len(products), dtype=bool)
+        if filter_start:
+            keep &= ~(products_start < parse_date(filter_start))
+        if filter_end:
+            keep &= ~(products_end > parse_date(filter_end))
+            keep &= ~(products_start > parse_date(filter_end))
+
+        filtered = [product for product, kept in zip(products, keep) if kept]
         logger.info("Finished filtering products. %s resulting products", len(filtered))
         return filtered
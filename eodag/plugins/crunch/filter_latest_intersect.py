@@ -20,10 +20,13 @@ from __future__ import annotations
 import datetime
 import logging
 import time
-from typing import TYPE_CHECKING, Any, Dict, List, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 import dateutil.parser
+import numpy as np
+import shapely
 from shapely import geometry
+from shapely.errors import GEOSException
 from shapely.geometry.base import BaseGeometry
 
 from eodag.plugins.crunch.base import Crunch
@@ -51,7 +54,11 @@ class FilterLatestIntersect(Crunch):
             # Retrieve year, month, day, hour, minute, second of EPOCH start
             epoch = time.gmtime(0)[:-3]
             start_date = datetime.datetime(*epoch).isoformat()
-        return dateutil.parser.parse(start_date)
+        try:
+            # fast path for ISO 8601 dates
+            return datetime.datetime.fromisoformat(start_date.replace("Z", "+00:00"))
+        except ValueError:
+            return dateutil.parser.parse(start_date)
 
     def proceed(
         self, products: List[EOProduct], **search_params: Dict[str, Any]
@@ -68,9 +75,10 @@ class FilterLatestIntersect(Crunch):
         if not products:
             return []
         # Warning: May crash if startTimeFromAscendingNode is not in the appropriate format
-        products.sort(key=self.sort_product_by_start_date, reverse=True)
-        filtered: List[EOProduct] = []
-        add_to_filtered = filtered.append
+        order = self.get_columns(products).argsort_dates(
+            "startTimeFromAscendingNode", reverse=True
+        )
+        products[:] = [products[i] for i in order]
         footprint: Union[Dict[str, Any], BaseGeometry, Any] = search_params.get(
             "geometry"
         ) or search_params.get("geom")
@@ -94,19 +102,65 @@ class FilterLatestIntersect(Crunch):
         else:
             search_extent = footprint
         logger.debug("Initial requested extent area: %s", search_extent.area)
-        for product in products:
-            logger.debug("Uncovered extent area: %s", search_extent.area)
-            if product.search_intersection:
-                logger.debug(
-                    "Product %r intersects the requested extent. Adding it to the final result",
-                    product,
-                )
-                add_to_filtered(product)
-            search_extent = search_extent.difference(product.geometry)
-            if search_extent.is_empty:
-                logger.debug(
-                    "The requested extent is now entirely covered by the search result"
-                )
-                break
+        columns = self.get_columns(products)
+        geometries = columns.geometries
+        search_intersections = columns.search_intersections
+        has_search_intersection = ~shapely.is_empty(
+            search_intersections
+        ) & ~shapely.is_missing(search_intersections)
+        # only products intersecting the requested extent reduce the uncovered extent
+        candidates = np.sort(
+            columns.strtree.query(search_extent, predicate="intersects")
+        )
+        covering = self._covering_product(geometries, candidates, search_extent)
+        if covering is None:
+            covering = len(products) - 1
+        else:
+            logger.debug(
+                "The requested extent is now entirely covered by the search result"
+            )
+        filtered = [
+            product
+            for product, intersects in zip(
+                products[: covering + 1], has_search_intersection[: covering + 1]
+            )
+            if intersects
+        ]
         logger.info("Finished filtering products. %s resulting products", len(filtered))
         return filtered
+
+    @staticmethod
+    def _covering_product(
+        geometries: np.ndarray, candidates: np.ndarray, search_extent: BaseGeometry
+    ) -> Optional[int]:
+        """Index of the product with which the products geometries, taken in order,
+        entirely cover the search extent
+
+        The uncovered extent is reduced by unions of batches of growing size of the
+        candidate geometries, and the batch covering the extent is then refined.
+
+        :returns: The index of the covering product, or ``None`` if the products do not
+                  cover the search extent
+        """
+        start, batch_size = 0, 1
+        while start < len(candidates):
+            batch = candidates[start : start + batch_size]
+            try:
+                uncovered = search_extent.difference(
+                    shapely.union_all(geometries[batch])
+                )
+                covered = uncovered.is_empty
+            except GEOSException:
+                # invalid geometries, the batch is processed product by product
+                covered = True
+            if covered:
+                for i in batch:
+                    search_extent = search_extent.difference(geometries[i])
+                    if search_extent.is_empty:
+                        return int(i)
+            else:
+                search_extent = uncovered
+            logger.debug("Uncovered extent area: %s", search_extent.area)
+            start += len(batch)
+            batch_size *= 2
+        return None
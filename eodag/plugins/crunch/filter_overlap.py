@@ -20,6 +20,9 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any, List
 
+import numpy as np
+import shapely
+
 from eodag.plugins.crunch.base import Crunch
 from eodag.utils import get_geometry_from_various
 
@@ -30,6 +33,8 @@ except ImportError:
     from shapely.errors import TopologicalError as GEOSException
 
 if TYPE_CHECKING:
+    from shapely.geometry.base import BaseGeometry
+
     from eodag.api.product import EOProduct
 
 logger = logging.getLogger("eodag.crunch.overlap")
@@ -59,7 +64,6 @@ class FilterOverlap(Crunch):
         """
         logger.debug("Start filtering for overlapping products")
         filtered: List[EOProduct] = []
-        add_to_filtered = filtered.append
 
         search_geom = get_geometry_from_various(**search_params)
         if not search_geom:
@@ -94,74 +98,99 @@ class FilterOverlap(Crunch):
                 "No product can overlap a requested extent that is not a polygon (i.e with area=0)"
             )
         else:
-            for product in products:
-                logger.debug("Uncovered extent area: %s", search_geom.area)
-                if product.search_intersection:
-                    intersection = product.search_intersection
-                    product_geometry = product.geometry
-                else:  # Product geometry may be invalid
-                    if not product.geometry.is_valid:
-                        logger.debug(
-                            "Trying our best to deal with invalid geometry on product: %r",
-                            product,
-                        )
-                        product_geometry = product.geometry.buffer(0)
-                        try:
-                            intersection = search_geom.intersection(product_geometry)
-                        except GEOSException:
-                            logger.debug(
-                                "Product geometry still invalid. Overlap test restricted to containment"
-                            )
-                            if search_geom.contains(product_geometry):
-                                logger.debug(
-                                    "Product %r overlaps the search extent. Adding it to filtered results"
-                                )
-                                add_to_filtered(product)
-                            continue
-                    else:
-                        product_geometry = product.geometry
-                        intersection = search_geom.intersection(product_geometry)
-
-                if (
-                    (contains and product_geometry.contains(search_geom))
-                    or (within and product_geometry.within(search_geom))
-                    or (intersects and product_geometry.intersects(search_geom))
-                ):
-                    add_to_filtered(product)
-                    continue
-                elif contains or within or intersects:
-                    continue
-
-                ipos = (intersection.area / search_geom.area) * 100
-                ipop = (intersection.area / product_geometry.area) * 100
-                logger.debug(
-                    "Intersection of product extent and search extent covers %f percent of the search extent "
-                    "area",
-                    ipos,
-                )
-                logger.debug(
-                    "Intersection of product extent and search extent covers %f percent of the product extent "
-                    "area",
-                    ipop,
-                )
-                if any(
-                    (
-                        search_geom.contains(product.geometry),
-                        ipos >= minimum_overlap,
-                        ipop >= minimum_overlap,
-                    )
-                ):
-                    logger.debug(
-                        "Product %r overlaps the search extent by the specified constraint. Adding it to "
-                        "filtered results",
-                        product,
-                    )
-                    add_to_filtered(product)
-                else:
-                    logger.debug(
-                        "Product %r does not overlaps the search extent by the specified constraint. "
-                        "Skipping it",
-                        product,
-                    )
+            overlapping = self._overlapping(
+                products, search_geom, minimum_overlap, contains, intersects, within
+            )
+            filtered = [
+                product
+                for product, is_overlapping in zip(products, overlapping)
+                if is_overlapping
+            ]
         logger.info("Finished filtering products. %s resulting products", len(filtered))
         return filtered
+
+    def _overlapping(
+        self,
+        products: List[EOProduct],
+        search_geom: BaseGeometry,
+        minimum_overlap: float,
+        contains: bool,
+        intersects: bool,
+        within: bool,
+    ) -> np.ndarray:
+        """Vectorized overlap test of the products with the search extent
+
+        :returns: A boolean array, ``True`` for products overlapping the search extent
+        """
+        overlapping = np.zeros(len(products), dtype=bool)
+        if not len(products):
+            return overlapping
+        columns = self.get_columns(products)
+        product_geometries = columns.geometries
+        # intersections with the extent of the search which returned the products
+        search_intersections = columns.search_intersections
+        has_search_intersection = ~shapely.is_empty(
+            search_intersections
+        ) & ~shapely.is_missing(search_intersections)
+
+        if contains or intersects or within:
+            # only products whose bounding box intersects the search extent can match
+            candidates = np.sort(columns.strtree.query(search_geom))
+        elif minimum_overlap > 0:
+            # products overlap the search extent by their bounding box or by their
+            # intersection with the extent of the search
+            candidates = np.union1d(
+                columns.strtree.query(search_geom),
+                np.flatnonzero(has_search_intersection),
+            ).astype(int)
+        else:
+            candidates = np.arange(len(products))
+        geometries = product_geometries[candidates].copy()
+        intersections = search_intersections[candidates].copy()
+
+        # product geometries may be invalid
+        to_intersect = np.flatnonzero(~has_search_intersection[candidates])
+        invalid = to_intersect[~shapely.is_valid(geometries[to_intersect])]
+        if len(invalid):
+            logger.debug(
+                "Trying our best to deal with invalid geometry on %s products",
+                len(invalid),
+            )
+            geometries[invalid] = shapely.buffer(geometries[invalid], 0)
+        failed = np.zeros(len(candidates), dtype=bool)
+        try:
+            intersections[to_intersect] = shapely.intersection(
+                search_geom, geometries[to_intersect]
+            )
+        except GEOSException:
+            for i in to_intersect:
+                try:
+                    intersections[i] = search_geom.intersection(geometries[i])
+                except GEOSException:
+                    failed[i] = True
+            logger.debug(
+                "%s product geometries still invalid. Overlap test restricted to containment",
+                failed.sum(),
+            )
+
+        if contains:
+            is_overlapping = shapely.contains(geometries, search_geom)
+        elif within:
+            is_overlapping = shapely.within(geometries, search_geom)
+        elif intersects:
+            is_overlapping = shapely.intersects(geometries, search_geom)
+        else:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                intersections_areas = shapely.area(intersections)
+                # percentages of the search extent and of the products extents covered
+                ipos = intersections_areas / search_geom.area * 100
+                ipop = intersections_areas / shapely.area(geometries) * 100
+            is_overlapping = (
+                shapely.contains(search_geom, product_geometries[candidates])
+                | (ipos >= minimum_overlap)
+                | (ipop >= minimum_overlap)
+            )
+        overlapping[candidates] = np.where(
+            failed, shapely.contains(search_geom, geometries), is_overlapping
+        )
+        return overlapping
@@ -21,10 +21,15 @@ import logging
 import operator
 from typing import TYPE_CHECKING, Any, List
 
+import numpy as np
+
 from eodag.plugins.crunch.base import Crunch
 
 logger = logging.getLogger("eodag.crunch.property")
 
+#: Operators comparing all the products values at once
+COMPARISON_OPERATORS = ("lt", "le", "eq", "ne", "ge", "gt")
+
 if TYPE_CHECKING:
     from eodag.api.product import EOProduct
 
@@ -72,18 +77,24 @@ class FilterProperty(Crunch):
             property_key,
             property_value,
         )
-        filtered: List[EOProduct] = []
-        add_to_filtered = filtered.append
-
-        for product in products:
-            if property_key not in product.properties.keys():
-                logger.warning(
-                    "%s not found in product.properties, filtering disabled.",
-                    property_key,
-                )
-                return products
-            if operator_method(product.properties[property_key], property_value):
-                add_to_filtered(product)
+        columns = self.get_columns(products)
+        if not columns.has_property(property_key):
+            logger.warning(
+                "%s not found in product.properties, filtering disabled.",
+                property_key,
+            )
+            return products
+        if operator_name in COMPARISON_OPERATORS and np.isscalar(property_value):
+            values = columns.column(property_key)
+            matching = np.asarray(operator_method(values, property_value), dtype=bool)
+            filtered = [product for product, match in zip(products, matching) if match]
+        else:
+            # other operators, or comparisons to sequences or objects, on each product
+            filtered = [
+                product
+                for product in products
+                if operator_method(product.properties[property_key], property_value)
+            ]
 
         logger.info("Finished filtering products. %s resulting products", len(filtered))
         return filtered
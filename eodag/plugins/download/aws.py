@@ -20,6 +20,7 @@ from __future__ import annotations
 import logging
 import os
 import re
+from collections import deque
 from datetime import datetime
 from itertools import chain
 from pathlib import Path
@@ -27,6 +28,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Deque,
     Dict,
     Iterator,
     List,
@@ -41,8 +43,10 @@ from typing import (
 
 import boto3
 import requests
+from botocore.config import Config
 from botocore.exceptions import ClientError, ProfileNotFound
 from botocore.handlers import disable_signing
+from concurrent.futures import Future, ThreadPoolExecutor
 from lxml import etree
 from requests.auth import AuthBase
 from stream_zip import ZIP_AUTO, stream_zip
@@ -52,7 +56,7 @@ from eodag.api.product.metadata_mapping import (
     properties_from_json,
     properties_from_xml,
 )
-from eodag.plugins.download.base import Download
+from eodag.plugins.download.base import Download, PartialDownload
 from eodag.utils import (
     DEFAULT_DOWNLOAD_TIMEOUT,
     DEFAULT_DOWNLOAD_WAIT,
@@ -210,6 +214,82 @@ AWS_AUTH_ERROR_MESSAGES = [
     "SignatureDoesNotMatch",
 ]
 
+# S3 ranged GETs defaults -----------------------------------------------------
+DEFAULT_RANGE_SIZE = 4096 * 1024
+DEFAULT_RANGES_IN_FLIGHT = 4
+DEFAULT_OBJECTS_IN_FLIGHT = 4
+
+
+class S3ObjectRanges:
+    """Iterate over the bytes of a S3 object, fetched as concurrent ranged GETs.
+
+    At most ``ranges_in_flight`` ranges of the object are requested or buffered at the
+    same time, and parts are yielded in the object byte order.
+
+    Ranges are requested using the low-level client of the object, which unlike boto3
+    resources is thread-safe.
+
+    :param s3_object: boto3 ``ObjectSummary`` to read
+    :param executor: Executor running the ranged GETs
+    :param range_size: Size in bytes of each range
+    :param ranges_in_flight: Maximum number of ranges requested or buffered at once
+    :param get_kwargs: (optional) Additional keyword arguments of the GET requests
+    :param start: (optional) Offset in bytes from which the object is read
+    """
+
+    def __init__(
+        self,
+        s3_object: Any,
+        executor: ThreadPoolExecutor,
+        range_size: int = DEFAULT_RANGE_SIZE,
+        ranges_in_flight: int = DEFAULT_RANGES_IN_FLIGHT,
+        get_kwargs: Optional[Dict[str, Any]] = None,
+        start: int = 0,
+    ) -> None:
+        self.s3_object = s3_object
+        self.executor = executor
+        self._client = s3_object.meta.client
+        self._bucket_name = s3_object.bucket_name
+        self._key = s3_object.key
+        self.ranges_in_flight = max(1, ranges_in_flight)
+        self.get_kwargs = get_kwargs or {}
+        self._ranges = (
+            (start, min(start + range_size, s3_object.size) - 1)
+            for start in range(start, s3_object.size, max(1, range_size))
+        )
+        self._futures: Deque[Future] = deque()
+
+    def _get_range(self, start: int, end: int) -> bytes:
+        return self._client.get_object(
+            Bucket=self._bucket_name,
+            Key=self._key,
+            Range=f"bytes={start}-{end}",
+            **self.get_kwargs,
+        )["Body"].read()
+
+    def prefetch(self) -> None:
+        """Request the next ranges of the object, up to ``ranges_in_flight``"""
+        while len(self._futures) < self.ranges_in_flight:
+            next_range = next(self._ranges, None)
+            if next_range is None:
+                break
+            self._futures.append(self.executor.submit(self._get_range, *next_range))
+
+    def cancel(self) -> None:
+        """Cancel the ranges requests that are not started yet"""
+        while self._futures:
+            self._futures.popleft().cancel()
+
+    def __iter__(self) -> Iterator[bytes]:
+        try:
+            self.prefetch()
+            while self._futures:
+                part = self._futures.popleft().result()
+                self.prefetch()
+                yield part
+        finally:
+            self.cancel()
+
 
 class AwsDownload(Download):
     """Download on AWS using S3 protocol.
@@ -230,6 +310,13 @@ class AwsDownload(Download):
         * :attr:`~eodag.config.PluginConfig.bucket_path_level` (``int``): at which level of the
           path part of the url the bucket can be found; If no bucket_path_level is given, the bucket
           is taken from the first element of the netloc part.
+        * :attr:`~eodag.config.PluginConfig.range_size` (``int``): size in bytes of the ranged GETs
+          used to download S3 objects; default: ``4194304``
+        * :attr:`~eodag.config.PluginConfig.ranges_in_flight` (``int``): maximum number of ranges
+          of a S3 object downloaded concurrently; default: ``4``
+        * :attr:`~eodag.config.PluginConfig.objects_in_flight` (``int``): maximum number of S3
+          objects of a product downloaded concurrently; default: ``4``. When streamed, at most
+          ``range_size * ranges_in_flight * objects_in_flight`` bytes are buffered in memory
         * :attr:`~eodag.config.PluginConfig.products` (``Dict[str, Dict[str, Any]``): product type
           specific config; the keys are the product types, the values are dictionaries which can contain the keys:
 
@@ -245,6 +332,20 @@ class AwsDownload(Download):
         super(AwsDownload, self).__init__(provider, config)
         self.requester_pays = getattr(self.config, "requester_pays", False)
         self.s3_session: Optional[boto3.session.Session] = None
+        self.range_size = int(getattr(self.config, "range_size", DEFAULT_RANGE_SIZE))
+        self.ranges_in_flight = max(
+            1, int(getattr(self.config, "ranges_in_flight", DEFAULT_RANGES_IN_FLIGHT))
+        )
+        self.objects_in_flight = max(
+            1,
+            int(getattr(self.config, "objects_in_flight", DEFAULT_OBJECTS_IN_FLIGHT)),
+        )
+
+    def _get_s3_client_config(self) -> Config:
+        """botocore client configuration, with enough pooled connections for concurrent ranged GETs"""
+        return Config(
+            max_pool_connections=max(10, self.ranges_in_flight * self.objects_in_flight)
+        )
 
     def download(
         self,
@@ -351,30 +452,50 @@ class AwsDownload(Download):
 
         # download
         progress_callback.reset(total=total_size)
+        # each object is downloaded using concurrent ranged GETs
+        get_kwargs = dict(RequestPayer="requester") if self.requester_pays else {}
         try:
-            for product_chunk in unique_product_chunks:
+            with ThreadPoolExecutor(
+                max_workers=self.objects_in_flight,
+                thread_name_prefix="eodag-s3-download",
+            ) as executor, ThreadPoolExecutor(
+                max_workers=self.ranges_in_flight * self.objects_in_flight,
+                thread_name_prefix="eodag-s3-ranges",
+            ) as ranges_executor:
+                futures = []
+                for product_chunk in unique_product_chunks:
+                    try:
+                        chunk_rel_path = self.get_chunk_dest_path(
+                            product,
+                            product_chunk,
+                            build_safe=build_safe,
+                        )
+                    except NotAvailableError as e:
+                        # out of SAFE format chunk
+                        logger.warning(e)
+                        continue
+                    chunk_abs_path = os.path.join(product_local_path, chunk_rel_path)
+                    chunk_abs_path_dir = os.path.dirname(chunk_abs_path)
+                    if not os.path.isdir(chunk_abs_path_dir):
+                        os.makedirs(chunk_abs_path_dir)
+
+                    if not os.path.isfile(chunk_abs_path):
+                        futures.append(
+                            executor.submit(
+                                self._download_object,
+                                product_chunk,
+                                chunk_abs_path,
+                                ranges_executor,
+                                progress_callback,
+                                get_kwargs,
+                            )
+                        )
                 try:
-                    chunk_rel_path = self.get_chunk_dest_path(
-                        product,
-                        product_chunk,
-                        build_safe=build_safe,
-                    )
-                except NotAvailableError as e:
-                    # out of SAFE format chunk
-                    logger.warning(e)
-                    continue
-                chunk_abs_path = os.path.join(product_local_path, chunk_rel_path)
-                chunk_abs_path_dir = os.path.dirname(chunk_abs_path)
-                if not os.path.isdir(chunk_abs_path_dir):
-                    os.makedirs(chunk_abs_path_dir)
-
-                if not os.path.isfile(chunk_abs_path):
-                    product_chunk.Bucket().download_file(
-                        product_chunk.key,
-                        chunk_abs_path,
-                        ExtraArgs=getattr(s3_objects, "_params", {}),
-                        Callback=progress_callback,
-                    )
+                    for future in futures:
+                        future.result()
+                finally:
+                    for future in futures:
+                        future.cancel()
 
         except AuthenticationError as e:
             logger.warning("Unexpected error: %s" % e)
@@ -402,6 +523,47 @@ class AwsDownload(Download):
 
         return product_local_path
 
+    def _download_object(
+        self,
+        s3_object: Any,
+        path: str,
+        executor: ThreadPoolExecutor,
+        progress_callback: ProgressCallback,
+        get_kwargs: Dict[str, Any],
+    ) -> None:
+        """Download a S3 object to ``path``, resuming its interrupted download if the
+        object did not change since.
+
+        :param s3_object: boto3 ``ObjectSummary`` to download
+        :param path: Destination path of the object
+        :param executor: Executor running the ranged GETs
+        :param progress_callback: A progress callback
+        :param get_kwargs: Additional keyword arguments of the GET requests
+        """
+        partial_download = PartialDownload(path)
+        e_tag = getattr(s3_object, "e_tag", None)
+        offset = partial_download.resume(
+            f"s3://{s3_object.bucket_name}/{s3_object.key}",
+            e_tag if isinstance(e_tag, str) else None,
+            s3_object.size,
+        )
+        if offset:
+            # fail instead of mixing contents if the object changes meanwhile
+            get_kwargs = dict(get_kwargs, IfMatch=e_tag)
+            progress_callback(offset)
+        with partial_download.open() as fhandle:
+            for part in S3ObjectRanges(
+                s3_object,
+                executor,
+                range_size=self.range_size,
+                ranges_in_flight=self.ranges_in_flight,
+                get_kwargs=get_kwargs,
+                start=offset,
+            ):
+                fhandle.write(part)
+                progress_callback(len(part))
+        partial_download.complete()
+
     def _download_preparation(
         self,
         product: EOProduct,
@@ -759,29 +921,24 @@ class AwsDownload(Download):
         progress_callback: ProgressCallback,
         assets_values: List[Dict[str, Any]],
     ) -> Iterator[Any]:
-        """Yield product data chunks"""
+        """Yield product data chunks
+
+        Objects are read using concurrent ranged GETs: up to
+        :attr:`~eodag.config.PluginConfig.objects_in_flight` objects are prefetched, each with
+        up to :attr:`~eodag.config.PluginConfig.ranges_in_flight` ranges in flight, and parts
+        are yielded in order.
+        """
 
-        chunk_size = 4096 * 1024
         modified_at = datetime.now()
         perms = 0o600
+        get_kwargs = dict(RequestPayer="requester") if self.requester_pays else {}
 
         def get_chunk_parts(
-            product_chunk: Any, progress_callback: ProgressCallback
+            object_ranges: S3ObjectRanges, progress_callback: ProgressCallback
         ) -> Any:
             try:
-                chunk_start = 0
-                chunk_end = chunk_start + chunk_size - 1
-
-                while chunk_start <= product_chunk.size:
-                    get_kwargs = (
-                        dict(RequestPayer="requester") if self.requester_pays else {}
-                    )
-                    chunk_part = product_chunk.get(
-                        Range=f"bytes={chunk_start}-{chunk_end}", **get_kwargs
-                    )["Body"].read()
+                for chunk_part in object_ranges:
                     progress_callback(len(chunk_part))
-                    chunk_start += chunk_size
-                    chunk_end += chunk_size
                     yield chunk_part
 
             except ClientError as e:
@@ -800,6 +957,7 @@ class AwsDownload(Download):
                 product, unique_product_chunks, build_safe
             )
 
+        chunks_with_paths: List[Tuple[Any, str]] = []
         for product_chunk in unique_product_chunks:
             try:
                 chunk_rel_path = self.get_chunk_dest_path(
@@ -817,17 +975,45 @@ class AwsDownload(Download):
                 # out of SAFE format chunk
                 logger.warning(e)
                 continue
+            chunks_with_paths.append((product_chunk, chunk_rel_path))
 
-            if len(assets_values) == 1:
-                yield from get_chunk_parts(product_chunk, progress_callback)
-            else:
-                yield (
-                    chunk_rel_path,
-                    modified_at,
-                    perms,
-                    ZIP_AUTO(product_chunk.size),
-                    get_chunk_parts(product_chunk, progress_callback),
-                )
+        executor = ThreadPoolExecutor(
+            max_workers=self.ranges_in_flight * self.objects_in_flight,
+            thread_name_prefix="eodag-s3-stream",
+        )
+        objects_ranges = [
+            S3ObjectRanges(
+                product_chunk,
+                executor,
+                range_size=self.range_size,
+                ranges_in_flight=self.ranges_in_flight,
+                get_kwargs=get_kwargs,
+            )
+            for product_chunk, _ in chunks_with_paths
+        ]
+        try:
+            for i, (product_chunk, chunk_rel_path) in enumerate(chunks_with_paths):
+                # prefetch the first ranges of the next objects
+                for next_object_ranges in objects_ranges[
+                    i : i + self.objects_in_flight
+                ]:
+                    next_object_ranges.prefetch()
+
+                if len(assets_values) == 1:
+                    yield from get_chunk_parts(objects_ranges[i], progress_callback)
+                else:
+                    yield (
+                        chunk_rel_path,
+                        modified_at,
+                        perms,
+                        ZIP_AUTO(product_chunk.size),
+                        get_chunk_parts(objects_ranges[i], progress_callback),
+                    )
+        finally:
+            # do not leave ranged GETs running once the consumer stopped
+            for object_ranges in objects_ranges:
+                object_ranges.cancel()
+            executor.shutdown(wait=True, cancel_futures=True)
 
     def _get_commonpath(
         self, product: EOProduct, product_chunks: Set[Any], build_safe: bool
@@ -918,7 +1104,9 @@ class AwsDownload(Download):
         """Auth strategy using no-sign-request"""
 
         s3_resource = boto3.resource(
-            service_name="s3", endpoint_url=getattr(self.config, "s3_endpoint", None)
+            service_name="s3",
+            endpoint_url=getattr(self.config, "s3_endpoint", None),
+            config=self._get_s3_client_config(),
         )
         s3_resource.meta.client.meta.events.register(
             "choose-signer.s3.*", disable_signing
@@ -937,6 +1125,7 @@ class AwsDownload(Download):
             s3_resource = s3_session.resource(
                 service_name="s3",
                 endpoint_url=getattr(self.config, "s3_endpoint", None),
+                config=self._get_s3_client_config(),
             )
             if self.requester_pays:
                 objects = s3_resource.Bucket(bucket_name).objects.filter(
@@ -976,6 +1165,7 @@ class AwsDownload(Download):
             s3_resource = s3_session.resource(
                 service_name="s3",
                 endpoint_url=getattr(self.config, "s3_endpoint", None),
+                config=self._get_s3_client_config(),
             )
             if self.requester_pays:
                 objects = s3_resource.Bucket(bucket_name).objects.filter(
@@ -996,7 +1186,9 @@ class AwsDownload(Download):
 
         s3_session = boto3.session.Session()
         s3_resource = s3_session.resource(
-            service_name="s3", endpoint_url=getattr(self.config, "s3_endpoint", None)
+            service_name="s3",
+            endpoint_url=getattr(self.config, "s3_endpoint", None),
+            config=self._get_s3_client_config(),
         )
         if self.requester_pays:
             objects = s3_resource.Bucket(bucket_name).objects.filter(
@@ -1332,6 +1524,7 @@ class AwsDownload(Download):
         progress_callback: Optional[ProgressCallback] = None,
         wait: float = DEFAULT_DOWNLOAD_WAIT,
         timeout: float = DEFAULT_DOWNLOAD_TIMEOUT,
+        max_workers: int = 1,
         **kwargs: Unpack[DownloadConf],
     ) -> List[str]:
         """
@@ -1344,5 +1537,6 @@ class AwsDownload(Download):
             progress_callback=progress_callback,
             wait=wait,
             timeout=timeout,
+            max_workers=max_workers,
             **kwargs,
         )
@@ -17,28 +17,41 @@
 # limitations under the License.
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import json
 import logging
 import os
 import shutil
+import sqlite3
 import tarfile
 import tempfile
 import zipfile
+from collections import defaultdict
 from datetime import datetime, timedelta
+from functools import partial
+from math import inf
 from time import sleep
 from typing import (
     TYPE_CHECKING,
     Any,
+    BinaryIO,
     Callable,
     Dict,
+    Iterable,
     List,
+    Mapping,
     Optional,
     Tuple,
     TypeVar,
     Union,
+    cast,
 )
 
+import concurrent.futures
+
 from eodag.plugins.base import PluginTopic
+from eodag.plugins.download.staging import DEFAULT_STAGING_WORKERS, StagingManager
 from eodag.utils import (
     DEFAULT_DOWNLOAD_TIMEOUT,
     DEFAULT_DOWNLOAD_WAIT,
@@ -47,12 +60,14 @@ from eodag.utils import (
     sanitize,
     uri_to_path,
 )
+from eodag.utils.archive import stream_extract
 from eodag.utils.exceptions import (
     AuthenticationError,
     MisconfiguredError,
     NotAvailableError,
 )
 from eodag.utils.notebook import NotebookWidgets
+from eodag.utils.product_store import ProductStore, get_product_store
 
 if TYPE_CHECKING:
     from requests.auth import AuthBase
@@ -60,6 +75,7 @@ if TYPE_CHECKING:
     from eodag.api.product import EOProduct
     from eodag.api.search_result import SearchResult
     from eodag.config import PluginConfig
+    from eodag.plugins.download.http import HTTPDownload
     from eodag.types.download_args import DownloadConf
     from eodag.utils import DownloadedCallback, Unpack
 
@@ -68,6 +84,138 @@ logger = logging.getLogger("eodag.download.base")
 
 T = TypeVar("T")
 
+#: Maximum time in seconds before products handed over by the staging manager are
+#: downloaded, when download workers are free
+STAGING_CHECK_INTERVAL = 1.0
+
+
+class PartialDownload:
+    """A file downloaded to a temporary ``<path>~`` file, renamed once complete.
+
+    A ``<path>~.json`` manifest describes the content being downloaded (url, validator and
+    size), so that an interrupted download can be resumed from the size of the temporary
+    file if the remote content did not change. The validator is an ETag or a Last-Modified
+    date.
+
+    :param path: Path of the downloaded file
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.temp_path = f"{path}~"
+        self.manifest_path = f"{path}~.json"
+        #: Size of the content already downloaded, from which the download is resumed
+        self.offset = 0
+        self.url: Optional[str] = None
+        self.validator: Optional[str] = None
+        self.size: Optional[int] = None
+
+    def _resumable_offset(self, url: str) -> int:
+        """Size of the temporary file if it holds the beginning of the content of ``url``"""
+        try:
+            with open(self.manifest_path) as fh:
+                manifest = json.load(fh)
+            offset = os.path.getsize(self.temp_path)
+        except (OSError, ValueError):
+            return 0
+        size = manifest.get("size")
+        if (
+            manifest.get("url") != url
+            or not manifest.get("validator")
+            or (size is not None and offset >= size)
+        ):
+            return 0
+        self.validator = manifest["validator"]
+        self.size = size
+        return offset
+
+    def resume(
+        self, url: str, validator: Optional[str], size: Optional[int] = None
+    ) -> int:
+        """Prepare the download of ``url`` whose validator is already known, and get the
+        offset from which it can be resumed
+
+        :param url: Url of the content
+        :param validator: Current ETag or Last-Modified date of the content, if any
+        :param size: (optional) Size of the content
+        :returns: The size of the content already downloaded, ``0`` to restart the download
+        """
+        self.url = url
+        self.offset = self._resumable_offset(url) if validator else 0
+        if self.offset and (self.validator != validator or self.size != size):
+            self.offset = 0
+        self.validator = validator
+        self.size = size
+        return self.offset
+
+    def range_headers(self, url: str) -> Dict[str, str]:
+        """Prepare the HTTP download of ``url``, requesting only its missing part if the
+        download can be resumed.
+
+        :meth:`response_received` must then be called with the response of the request.
+
+        :param url: Url of the content
+        :returns: ``Range`` and ``If-Range`` headers to send, empty if not resumed
+        """
+        self.url = url
+        self.offset = self._resumable_offset(url)
+        if not self.offset or not self.validator:
+            self.offset = 0
+            return {}
+        return {"Range": f"bytes={self.offset}-", "If-Range": self.validator}
+
+    def response_received(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """Check if the server resumed the HTTP download, and get the content validator
+
+        :param status_code: Status code of the download response
+        :param headers: Headers of the download response
+        """
+        content_range = str(headers.get("Content-Range", ""))
+        if not (
+            self.offset
+            and status_code == 206
+            and content_range.startswith(f"bytes {self.offset}-")
+        ):
+            # whole content sent
+            self.offset = 0
+            etag = headers.get("ETag")
+            last_modified = headers.get("Last-Modified")
+            # weak ETags cannot be used to request byte ranges
+            if isinstance(etag, str) and etag and not etag.startswith("W/"):
+                self.validator = etag
+            elif isinstance(last_modified, str) and last_modified:
+                self.validator = last_modified
+            else:
+                self.validator = None
+            content_length = str(headers.get("Content-Length", ""))
+            self.size = int(content_length) if content_length.isdigit() else None
+            return
+        total_size = content_range.rpartition("/")[2]
+        self.size = int(total_size) if total_size.isdigit() else self.size
+
+    def open(self) -> BinaryIO:
+        """Open the temporary file, to append data if the download is resumed
+
+        :returns: The opened temporary file
+        """
+        if self.offset:
+            logger.info("Resuming download of %s from byte %s", self.url, self.offset)
+        if self.validator:
+            with open(self.manifest_path, "w") as fh:
+                json.dump(
+                    {"url": self.url, "validator": self.validator, "size": self.size},
+                    fh,
+                )
+        elif os.path.isfile(self.manifest_path):
+            os.remove(self.manifest_path)
+        return open(self.temp_path, "ab" if self.offset else "wb")
+
+    def complete(self) -> None:
+        """Rename the temporary file once the download is complete"""
+        os.replace(self.temp_path, self.path)
+        if os.path.isfile(self.manifest_path):
+            os.remove(self.manifest_path)
+
 
 class Download(PluginTopic):
     """Base Download Plugin.
@@ -165,6 +313,45 @@ class Download(PluginTopic):
             "Download streaming must be implemented using a method named _stream_download_dict"
         )
 
+    async def _async_stream_download_dict(
+        self,
+        product: EOProduct,
+        auth: Optional[Union[AuthBase, Dict[str, str]]] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        wait: float = DEFAULT_DOWNLOAD_WAIT,
+        timeout: float = DEFAULT_DOWNLOAD_TIMEOUT,
+        **kwargs: Unpack[DownloadConf],
+    ) -> StreamResponse:
+        r"""
+        Asynchronous version of :meth:`_stream_download_dict`. By default, the download request
+        is sent from a worker thread; plugins able to stream the download without blocking the
+        event loop override this method.
+
+        :param product: The EO product to download
+        :param auth: (optional) authenticated object
+        :param progress_callback: (optional) A progress callback
+        :param wait: (optional) If download fails, wait time in minutes between two download tries
+        :param timeout: (optional) If download fails, maximum time in minutes before stop retrying
+                        to download
+        :param kwargs: ``output_dir`` (str), ``extract`` (bool), ``delete_archive`` (bool)
+                        and ``dl_url_params`` (dict) can be provided as additional kwargs
+                        and will override any other values defined in a configuration
+                        file or with environment variables.
+        :returns: Dictionary of :class:`~fastapi.responses.StreamingResponse` keyword-arguments
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None,
+            partial(
+                self._stream_download_dict,
+                product,
+                auth=auth,
+                progress_callback=progress_callback,
+                wait=wait,
+                timeout=timeout,
+                **kwargs,
+            ),
+        )
+
     def _prepare_download(
         self,
         product: EOProduct,
@@ -268,8 +455,86 @@ class Download(PluginTopic):
             )
             os.remove(record_filename)
 
+        # identical products may have already been downloaded elsewhere
+        product_store = get_product_store()
+        product_store_key = (
+            self._get_product_store_key(product, **kwargs) if product_store else None
+        )
+        if product_store is not None and product_store_key is not None:
+            stored_path = product_store.get(product_store_key, prefix)
+            if stored_path is not None:
+                logger.info(
+                    f"Product materialized from the product store: {stored_path}"
+                )
+                with open(record_filename, "w") as fh:
+                    fh.write(url)
+                return stored_path, None
+
         return fs_path, record_filename
 
+    def _get_product_store_key(
+        self, product: EOProduct, **kwargs: Unpack[DownloadConf]
+    ) -> Optional[str]:
+        """Key of the product in the product store, ``None`` if it cannot be stored.
+
+        The key does not depend on the provider, but on the download plugin type and on
+        whether assets are downloaded, which decide how the product is packaged on disk.
+        """
+        if kwargs.get("asset", None) is not None:
+            # partial product
+            return None
+        extract = kwargs.get("extract", None)
+        if extract is None:
+            extract = getattr(self.config, "extract", True)
+        packaging = type(self).__name__
+        if len(product.assets) > 0 and not getattr(self.config, "ignore_assets", False):
+            packaging += "-assets"
+        if extract:
+            product_conf = getattr(self.config, "products", {}).get(
+                product.product_type, {}
+            )
+            flatten_top_dirs = product_conf.get(
+                "flatten_top_dirs", getattr(self.config, "flatten_top_dirs", True)
+            )
+            layout = (
+                f"{packaging},depth={getattr(self.config, 'archive_depth', 1)},"
+                f"flatten={flatten_top_dirs}"
+            )
+        else:
+            output_extension = kwargs.get("output_extension", None) or getattr(
+                self.config, "output_extension", ".zip"
+            )
+            layout = f"{packaging},extension={output_extension}"
+        return ProductStore.make_key(
+            product.product_type,
+            product.properties["title"],
+            extract,
+            layout,
+        )
+
+    def store_product(
+        self, product: EOProduct, fs_path: str, **kwargs: Unpack[DownloadConf]
+    ) -> None:
+        """Add a downloaded product to the product store, if it is enabled (see
+        :func:`~eodag.utils.product_store.get_product_store`), for it to be materialized
+        instead of downloaded again in any output directory, or from any provider
+        packaging it the same way.
+
+        :param product: The downloaded EO product
+        :param fs_path: The path to the downloaded product
+        :param kwargs: additional arguments the product was downloaded with
+        """
+        product_store = get_product_store()
+        product_store_key = (
+            self._get_product_store_key(product, **kwargs) if product_store else None
+        )
+        if product_store is None or product_store_key is None:
+            return
+        try:
+            product_store.add(product_store_key, fs_path, provider=self.provider)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Could not store {product} in the product store: {e}")
+
     def generate_record_hash(self, product: EOProduct) -> str:
         """Generate the record hash of the given product.
 
@@ -301,6 +566,81 @@ class Download(PluginTopic):
             count += 1
         return product_path
 
+    def _get_stream_extract_path(
+        self, fs_path: str, **kwargs: Unpack[DownloadConf]
+    ) -> Optional[str]:
+        """Get the path where the archive downloaded to ``fs_path`` is extracted while it is
+        downloaded, if this mode is enabled.
+
+        Archives are only extracted while downloaded if they are also extracted and deleted
+        once downloaded, and if the destination directory is missing or empty.
+
+        :param fs_path: The path to the local archive which would be downloaded
+        :returns: The absolute path to the product, or ``None`` if the archive is downloaded
+                  as is
+        """
+        stream_extract = kwargs.get("stream_extract", None)
+        extract = kwargs.get("extract", None)
+        delete_archive = kwargs.get("delete_archive", None)
+        if not (
+            (
+                stream_extract
+                if stream_extract is not None
+                else getattr(self.config, "stream_extract", False)
+            )
+            and (
+                extract
+                if extract is not None
+                else getattr(self.config, "extract", True)
+            )
+            and (
+                delete_archive
+                if delete_archive is not None
+                else getattr(self.config, "delete_archive", True)
+            )
+        ):
+            return None
+        output_extension = kwargs.get("output_extension", None) or ".zip"
+        product_path = (
+            fs_path[: fs_path.index(output_extension)]
+            if output_extension in fs_path
+            else fs_path
+        )
+        if os.path.isdir(product_path) and len(os.listdir(product_path)) > 0:
+            return None
+        return product_path
+
+    def _stream_extract(self, chunks: Iterable[bytes], product_path: str) -> str:
+        """Extract a zip or tar archive while it is downloaded, without writing it to disk.
+
+        :param chunks: The chunks of the downloaded archive
+        :param product_path: The path to the extracted product
+        :returns: The absolute path to the product
+        :raises: :class:`~eodag.utils.archive.UnsupportedArchiveError` if the archive cannot
+                 be extracted while downloaded, nothing being extracted to ``product_path``
+        """
+        logger.info("Extraction of %s while downloading it", product_path)
+        with tempfile.TemporaryDirectory(
+            dir=os.path.dirname(product_path), prefix=".extract-"
+        ) as tmp_dir:
+            extraction_dir = os.path.join(tmp_dir, os.path.basename(product_path))
+            stream_extract(chunks, extraction_dir)
+
+            if os.path.isfile(product_path):
+                logger.info(
+                    f"Remove existing partially downloaded file: {product_path}"
+                )
+                os.remove(product_path)
+            elif os.path.isdir(product_path):
+                os.rmdir(product_path)
+            # in some cases, only a lone file is extracted without being in a directory
+            # then, we create a directory in which we place this file
+            product_extraction_path = self._resolve_archive_depth(extraction_dir)
+            if os.path.isfile(product_extraction_path):
+                os.makedirs(product_path)
+            shutil.move(product_extraction_path, product_path)
+        return product_path
+
     def _finalize(
         self,
         fs_path: str,
@@ -442,6 +782,74 @@ class Download(PluginTopic):
 
         return product_path
 
+    def _needs_order(self, product: EOProduct) -> bool:
+        """Whether the product must be ordered and staged before its download
+
+        :param product: The EO product to download
+        :returns: ``True`` if the product must be ordered
+        """
+        return False
+
+    def _start_staging(
+        self, products: Iterable[EOProduct], wait: float, timeout: float, **kwargs: Any
+    ) -> Optional[StagingManager]:
+        """Order the products that must be ordered before their download, not downloaded
+        yet, and check their order status in the background
+
+        :param products: Products to download
+        :param wait: Maximum delay in minutes between two order status checks
+        :param timeout: Time in minutes after which a product order is given up
+        :param kwargs: download additional kwargs
+        :returns: The staging manager, if products are ordered
+        """
+        output_dir = (
+            kwargs.get("output_dir", None)
+            or getattr(self.config, "output_dir", None)
+            or tempfile.gettempdir()
+        )
+        records_dir = os.path.join(os.path.abspath(output_dir), ".downloaded")
+        to_order = []
+        for product in products:
+            downloader = product.downloader if product.downloader is not None else self
+            if downloader._needs_order(product) and not os.path.isfile(
+                os.path.join(records_dir, downloader.generate_record_hash(product))
+            ):
+                to_order.append((product, downloader))
+        if not to_order:
+            return None
+
+        logger.info(f"Ordering {len(to_order)} offline products")
+        staging = StagingManager(
+            os.path.join(records_dir, "staging.json"),
+            wait=wait,
+            timeout=timeout,
+            max_workers=int(
+                getattr(self.config, "max_workers", None) or DEFAULT_STAGING_WORKERS
+            ),
+        )
+        # authenticate once per provider and authentication plugin
+        auths: Dict[Tuple[str, int], Optional[Union[AuthBase, Dict[str, str]]]] = {}
+        for product, _ in to_order:
+            auth_key = (product.provider, id(product.downloader_auth))
+            if auth_key not in auths:
+                auths[auth_key] = (
+                    product.downloader_auth.authenticate()
+                    if product.downloader_auth is not None
+                    else None
+                )
+        staging.start(
+            [product for product, _ in to_order],
+            [cast("HTTPDownload", downloader) for _, downloader in to_order],
+            [
+                cast(
+                    "Optional[AuthBase]",
+                    auths[(product.provider, id(product.downloader_auth))],
+                )
+                for product, _ in to_order
+            ],
+        )
+        return staging
+
     def download_all(
         self,
         products: SearchResult,
@@ -450,13 +858,15 @@ class Download(PluginTopic):
         progress_callback: Optional[ProgressCallback] = None,
         wait: float = DEFAULT_DOWNLOAD_WAIT,
         timeout: float = DEFAULT_DOWNLOAD_TIMEOUT,
+        max_workers: int = 1,
         **kwargs: Unpack[DownloadConf],
     ) -> List[str]:
         """
         Base download_all method.
 
         This specific implementation uses the :meth:`eodag.plugins.download.base.Download.download` method
-        implemented by the plugin to **sequentially** attempt to download products.
+        implemented by the plugin to **sequentially** attempt to download products, or **concurrently** if
+        ``max_workers`` is greater than 1.
 
         :param products: Products to download
         :param auth: (optional) authenticated object
@@ -469,6 +879,9 @@ class Download(PluginTopic):
         :param wait: (optional) If download fails, wait time in minutes between two download tries
         :param timeout: (optional) If download fails, maximum time in minutes before stop retrying
                         to download
+        :param max_workers: (optional) Maximum number of products downloaded concurrently. The number of
+                            concurrent downloads per provider is also limited by the
+                            :attr:`~eodag.config.PluginConfig.max_workers` download plugin parameter
         :param kwargs: `output_dir` (str), `extract` (bool), `delete_archive` (bool)
                         and `dl_url_params` (dict) can be provided as additional kwargs
                         and will override any other values defined in a configuration
@@ -480,17 +893,7 @@ class Download(PluginTopic):
         # Products are going to be removed one by one from this sequence once
         # downloaded.
         products = products[:]
-        paths: List[str] = []
-        # initiate retry loop
-        start_time = datetime.now()
-        stop_time = start_time + timedelta(minutes=timeout)
         nb_products = len(products)
-        retry_count = 0
-        # another output for notbooks
-        nb_info = NotebookWidgets()
-
-        for product in products:
-            product.next_try = start_time
 
         # progress bar init
         if progress_callback is None:
@@ -509,6 +912,33 @@ class Download(PluginTopic):
             progress_callback.unit_scale = False
         progress_callback.refresh()
 
+        # offline products are ordered up front, and downloaded once online
+        staging = self._start_staging(products, wait, timeout, **kwargs)
+
+        if (max_workers > 1 and nb_products > 1) or staging is not None:
+            return self._download_all_concurrently(
+                products,
+                downloaded_callback=downloaded_callback,
+                progress_callback=progress_callback,
+                product_progress_callback=product_progress_callback,
+                wait=wait,
+                timeout=timeout,
+                max_workers=max_workers,
+                staging=staging,
+                **kwargs,
+            )
+
+        paths: List[str] = []
+        # initiate retry loop
+        start_time = datetime.now()
+        stop_time = start_time + timedelta(minutes=timeout)
+        retry_count = 0
+        # another output for notbooks
+        nb_info = NotebookWidgets()
+
+        for product in products:
+            product.next_try = start_time
+
         with progress_callback as bar:
             while "Loop until all products are download or timeout is reached":
                 # try downloading each product before retry
@@ -589,6 +1019,253 @@ class Download(PluginTopic):
 
         return paths
 
+    def _download_all_concurrently(
+        self,
+        products: Union[SearchResult, List[EOProduct]],
+        downloaded_callback: Optional[DownloadedCallback],
+        progress_callback: ProgressCallback,
+        product_progress_callback: Optional[ProgressCallback],
+        wait: float,
+        timeout: float,
+        max_workers: int,
+        staging: Optional[StagingManager] = None,
+        **kwargs: Unpack[DownloadConf],
+    ) -> List[str]:
+        """Download products using a bounded pool of workers.
+
+        Products that are not available yet (e.g. ordered ones) are put back in a retry queue
+        and tried again ``wait`` minutes later, without blocking the download of products
+        that are ready. Products staged by ``staging`` are downloaded once it hands them
+        over. ``downloaded_callback`` and the products progress bar are only called from
+        the calling thread.
+
+        :param products: Products to download
+        :param downloaded_callback: A callable called each time a product finishes downloading
+        :param progress_callback: Products progress callback
+        :param product_progress_callback: Progress callback copied for each product download
+        :param wait: If download fails, wait time in minutes between two download tries
+        :param timeout: If download fails, maximum time in minutes before stop retrying
+        :param max_workers: Maximum number of products downloaded concurrently
+        :param staging: (optional) Staging manager of the ordered products
+        :param kwargs: download additional kwargs
+        :returns: List of absolute paths to the downloaded products
+        """
+        paths: List[str] = []
+        start_time = datetime.now()
+        stop_time = start_time + timedelta(minutes=timeout)
+        nb_products = len(products)
+        retry_count = 0
+        # another output for notbooks
+        nb_info = NotebookWidgets()
+
+        # products waiting for their first or next download try
+        pending = [p for p in products if staging is None or p not in staging]
+        tried: List[EOProduct] = []
+        for product in pending:
+            product.next_try = start_time
+        running: Dict[concurrent.futures.Future[str], EOProduct] = {}
+        running_progress: Dict[
+            concurrent.futures.Future[str], Optional[ProgressCallback]
+        ] = {}
+        running_per_provider: Dict[str, int] = defaultdict(int)
+        # retry deadlines of the products handed over by the staging manager
+        staged_stop_times: Dict[str, datetime] = {}
+
+        def receive_staged(staged_products: List[EOProduct]) -> None:
+            """Queue products handed over by the staging manager, keeping the remaining
+            time before their order deadline as retry deadline"""
+            now = datetime.now()
+            for product in staged_products:
+                product.next_try = now
+                staged_stop_times[
+                    StagingManager.product_key(product)
+                ] = now + timedelta(
+                    seconds=cast(StagingManager, staging).remaining(product)
+                )
+                pending.append(product)
+
+        def product_stop_time(product: EOProduct) -> datetime:
+            if staging is not None and product in staging:
+                return staged_stop_times.get(
+                    StagingManager.product_key(product), stop_time
+                )
+            return stop_time
+
+        def provider_max_workers(product: EOProduct) -> int:
+            downloader_config = getattr(product.downloader, "config", self.config)
+            return int(getattr(downloader_config, "max_workers", None) or max_workers)
+
+        def can_be_submitted(product: EOProduct, now: datetime) -> bool:
+            """Whether a pending product can be submitted at its next try, being
+            neither past the retry deadline nor held back by its provider quota"""
+            if product in tried and now >= product_stop_time(product):
+                return False
+            return running_per_provider[product.provider] < provider_max_workers(
+                product
+            )
+
+        with progress_callback as bar, concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="eodag-download"
+        ) as executor:
+            try:
+                while pending or running or (staging is not None and staging.active):
+                    now = datetime.now()
+                    if staging is not None:
+                        receive_staged(staging.ready())
+                        for product in [
+                            p
+                            for p in pending
+                            if p in tried
+                            and p in staging
+                            and now >= product_stop_time(p)
+                        ]:
+                            logger.warning(
+                                f"{product.properties['title']} could not be downloaded "
+                                "before its order timeout"
+                            )
+                            pending.remove(product)
+                    # submit ready products, in the limit of free workers and providers quotas
+                    for product in sorted(pending, key=lambda p: p.next_try):
+                        if len(running) >= max_workers or product.next_try > now:
+                            break
+                        if not can_be_submitted(product, now):
+                            continue
+                        pending.remove(product)
+                        product.next_try = now + timedelta(minutes=wait)
+                        product_progress = (
+                            product_progress_callback.copy()
+                            if product_progress_callback is not None
+                            else None
+                        )
+                        future = executor.submit(
+                            partial(product.download, **kwargs),
+                            progress_callback=product_progress,
+                            wait=wait,
+                            timeout=-1,
+                        )
+                        running[future] = product
+                        running_progress[future] = product_progress
+                        running_per_provider[product.provider] += 1
+
+                    if not running:
+                        staging_active = staging is not None and staging.active
+                        if not pending and not staging_active:
+                            break
+                        if now >= stop_time and not staging_active:
+                            logger.warning(
+                                f"{len(pending)} products could not be downloaded: "
+                                + str([prod.properties["title"] for prod in pending])
+                            )
+                            break
+                        if pending and now < stop_time:
+                            next_try = min(p.next_try for p in pending)
+                            wait_seconds = max((next_try - now).total_seconds(), 0)
+                            retry_count += 1
+                            info_message = (
+                                f"[Retry #{retry_count}, {len(paths)}/{nb_products} D/L] "
+                                f"Waiting {int(wait_seconds)}s until next download try "
+                                f"(retry every {wait}' for {timeout}')"
+                            )
+                            logger.info(info_message)
+                            nb_info.display_html(info_message)
+                        else:
+                            # only ordered products may still be downloaded
+                            wait_seconds = wait * 60
+                        if staging is not None and staging_active:
+                            # wake up as soon as an ordered product is online
+                            receive_staged(staging.ready(timeout=wait_seconds))
+                        else:
+                            sleep(wait_seconds)
+                        continue
+
+                    # wait for a download to finish, or for the next retry of a pending product
+                    # that could be submitted to a free worker
+                    wait_timeout: Optional[float] = None
+                    submittable = (
+                        [p for p in pending if can_be_submitted(p, now)]
+                        if len(running) < max_workers
+                        else []
+                    )
+                    if submittable:
+                        next_try = min(p.next_try for p in submittable)
+                        wait_timeout = max((next_try - now).total_seconds(), 0)
+                    if (
+                        staging is not None
+                        and staging.active
+                        and len(running) < max_workers
+                    ):
+                        wait_timeout = min(
+                            wait_timeout if wait_timeout is not None else inf,
+                            STAGING_CHECK_INTERVAL,
+                        )
+                    done, _ = concurrent.futures.wait(
+                        running,
+                        timeout=wait_timeout,
+                        return_when=concurrent.futures.FIRST_COMPLETED,
+                    )
+                    for future in done:
+                        product = running.pop(future)
+                        running_per_provider[product.provider] -= 1
+                        product_progress = running_progress.pop(future)
+                        if product_progress is not None:
+                            product_progress.close()
+                        try:
+                            path = future.result()
+                        except NotAvailableError as e:
+                            logger.info(e)
+                            tried.append(product)
+                            pending.append(product)
+                            continue
+
+                        except (AuthenticationError, MisconfiguredError):
+                            logger.exception(
+                                f"Stopped because of credentials problems with provider {self.provider}"
+                            )
+                            raise
+
+                        except RuntimeError:
+                            import traceback as tb
+
+                            logger.error(
+                                f"A problem occurred during download of product: {product}. "
+                                "Skipping it"
+                            )
+                            logger.debug(f"\n{tb.format_exc()}")
+                            stop_time = datetime.now()
+                            tried.append(product)
+                            pending.append(product)
+
+                        except Exception:
+                            import traceback as tb
+
+                            logger.warning(
+                                f"A problem occurred during download of product: {product}. "
+                                "Skipping it",
+                            )
+                            logger.debug(f"\n{tb.format_exc()}")
+                            tried.append(product)
+                            pending.append(product)
+
+                        else:
+                            paths.append(path)
+                            if staging is not None:
+                                staging.done(product)
+                            if downloaded_callback:
+                                downloaded_callback(product)
+                            bar(1)
+                            # reset stop time for next product
+                            stop_time = datetime.now() + timedelta(minutes=timeout)
+            except BaseException:
+                # do not start downloads that are still queued
+                for future in running:
+                    future.cancel()
+                raise
+            finally:
+                if staging is not None:
+                    staging.stop()
+
+        return paths
+
     def _order_download_retry(
         self, product: EOProduct, wait: float, timeout: float
     ) -> Callable[[Callable[..., T]], Callable[..., T]]:
@@ -631,6 +1308,11 @@ class Download(PluginTopic):
                                     f" {self.provider}, {e}"
                                 )
                             not_available_info = str(e)
+                            if e.retry_after is not None:
+                                # try again when advised by the provider
+                                product.next_try = datetime.now() + timedelta(
+                                    seconds=e.retry_after
+                                )
 
                     if datetime_now >= product.next_try and datetime_now < stop_time:
                         wait_seconds: Union[float, int] = (
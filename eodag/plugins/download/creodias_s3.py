@@ -59,7 +59,9 @@ class CreodiasS3Download(AwsDownload):
 
         s3_session = boto3.session.Session(**auth_dict)
         s3_resource = s3_session.resource(
-            "s3", endpoint_url=getattr(self.config, "s3_endpoint", None)
+            "s3",
+            endpoint_url=getattr(self.config, "s3_endpoint", None),
+            config=self._get_s3_client_config(),
         )
         objects = s3_resource.Bucket(bucket_name).objects.filter()
         list(objects.filter(Prefix=prefix).limit(1))
@@ -17,23 +17,35 @@
 # limitations under the License.
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import re
 import shutil
 import tarfile
+import threading
 import zipfile
+from contextlib import contextmanager
 from datetime import datetime
 from email.message import Message
+from functools import partial
 from itertools import chain
 from json import JSONDecodeError
+from queue import Empty, Queue
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterator,
+    BinaryIO,
+    Callable,
+    ContextManager,
     Dict,
+    Generator,
     Iterator,
     List,
     Optional,
+    Set,
+    Tuple,
     TypedDict,
     Union,
     cast,
@@ -42,6 +54,13 @@ from urllib.parse import parse_qs, urlparse
 
 import geojson
 import requests
+from concurrent.futures import (
+    FIRST_EXCEPTION,
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
 from lxml import etree
 from requests import RequestException
 from requests.auth import AuthBase
@@ -57,7 +76,7 @@ from eodag.api.product.metadata_mapping import (
     properties_from_json,
     properties_from_xml,
 )
-from eodag.plugins.download.base import Download
+from eodag.plugins.download.base import Download, PartialDownload
 from eodag.utils import (
     DEFAULT_DOWNLOAD_TIMEOUT,
     DEFAULT_DOWNLOAD_WAIT,
@@ -75,6 +94,7 @@ from eodag.utils import (
     string_to_jsonpath,
     uri_to_path,
 )
+from eodag.utils.archive import UnsupportedArchiveError, check_stream_extractable
 from eodag.utils.exceptions import (
     AuthenticationError,
     DownloadError,
@@ -83,6 +103,11 @@ from eodag.utils.exceptions import (
     TimeOutError,
     ValidationError,
 )
+from eodag.utils.requests import (
+    async_requests_available,
+    get_provider_session,
+    parse_retry_after,
+)
 
 if TYPE_CHECKING:
     from requests import Response
@@ -95,6 +120,149 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("eodag.download.http")
 
+# size of the chunks of streamed downloads
+CHUNK_SIZE = 64 * 1024
+DEFAULT_ASSETS_IN_FLIGHT = 4
+# size of the chunks of the assets of a product buffered in memory until they are read
+ASSETS_BUFFER_SIZE = 16 * 1024 * 1024
+
+
+class BufferBudget:
+    """Memory shared by the buffers of the assets of a product downloaded concurrently.
+
+    An asset whose buffer is empty can always buffer a chunk, so that the asset being read
+    is never blocked by the others.
+
+    :param size: Maximum size of the buffered chunks, in bytes
+    """
+
+    def __init__(self, size: int = ASSETS_BUFFER_SIZE) -> None:
+        self.size = size
+        self.used = 0
+        self._condition = threading.Condition()
+
+    def acquire(
+        self, chunk_size: int, buffer: Queue[Any], stop: threading.Event
+    ) -> bool:
+        """Wait until a chunk can be buffered
+
+        :param chunk_size: Size of the chunk
+        :param buffer: Buffer where the chunk will be put
+        :param stop: Event set when the download is cancelled
+        :returns: ``False`` if the download was cancelled while waiting
+        """
+        with self._condition:
+            while self.used + chunk_size > self.size and not buffer.empty():
+                if stop.is_set():
+                    return False
+                self._condition.wait(0.1)
+            self.used += chunk_size
+        return True
+
+    def release(self, chunk_size: int) -> None:
+        """Free the memory of a chunk which was read
+
+        :param chunk_size: Size of the chunk
+        """
+        with self._condition:
+            self.used -= chunk_size
+            self._condition.notify_all()
+
+
+class BufferedAssetStream:
+    """Download of an asset in background, whose response and chunks are buffered until
+    they are read, in order. Iterating over it returns the chunks of the asset.
+
+    :param open_stream: Function sending the asset download request, returning its streamed
+                        response after having checked its status
+    :param executor: Executor where the asset is downloaded
+    :param budget: (optional) Memory shared with the buffers of the other assets
+    """
+
+    def __init__(
+        self,
+        open_stream: Callable[[], ContextManager[Response]],
+        executor: Executor,
+        budget: Optional[BufferBudget] = None,
+    ) -> None:
+        self._buffer: Queue[Tuple[bool, Any]] = Queue()
+        self._stop = threading.Event()
+        self._budget = budget or BufferBudget()
+        # the download must not keep a reference to self, to be cancelled when self is deleted
+        executor.submit(
+            self._fetch, open_stream, self._buffer, self._budget, self._stop
+        )
+
+    @staticmethod
+    def _fetch(
+        open_stream: Callable[[], ContextManager[Response]],
+        buffer: Queue[Tuple[bool, Any]],
+        budget: BufferBudget,
+        stop: threading.Event,
+    ) -> None:
+        if stop.is_set():
+            return
+        try:
+            with open_stream() as stream:
+                buffer.put((True, stream))
+                for chunk in stream.iter_content(chunk_size=CHUNK_SIZE):
+                    if stop.is_set() or (
+                        chunk and not budget.acquire(len(chunk), buffer, stop)
+                    ):
+                        return
+                    if chunk:
+                        buffer.put((True, chunk))
+        except BaseException as e:
+            buffer.put((False, e))
+            return
+        buffer.put((True, None))
+
+    def _get(self) -> Any:
+        while True:
+            try:
+                ok, item = self._buffer.get(timeout=0.1)
+            except Empty:
+                if self._stop.is_set():
+                    raise DownloadError("Asset download cancelled")
+                continue
+            if not ok:
+                self.cancel()
+                raise item
+            if isinstance(item, bytes):
+                self._budget.release(len(item))
+            return item
+
+    def response(self) -> Response:
+        """Wait for the response of the asset download request. Must be called before
+        iterating over the chunks.
+
+        :returns: The streamed response
+        """
+        return self._get()
+
+    def __iter__(self) -> BufferedAssetStream:
+        return self
+
+    def __next__(self) -> bytes:
+        chunk = self._get()
+        if chunk is None:
+            raise StopIteration
+        return chunk
+
+    def cancel(self) -> None:
+        """Stop the download, and free the memory of the chunks which were not read"""
+        self._stop.set()
+        while True:
+            try:
+                _, item = self._buffer.get_nowait()
+            except Empty:
+                return
+            if isinstance(item, bytes):
+                self._budget.release(len(item))
+
+    def __del__(self) -> None:
+        self.cancel()
+
 
 class HTTPDownload(Download):
     """HTTPDownload plugin. Handles product download over HTTP protocol
@@ -108,6 +276,9 @@ class HTTPDownload(Download):
           ``POST``); default: ``GET``
         * :attr:`~eodag.config.PluginConfig.extract` (``bool``): if the content of the downloaded file should be
           extracted; default: ``True``
+        * :attr:`~eodag.config.PluginConfig.stream_extract` (``bool``): if zip or tar archives should be extracted
+          while they are downloaded, without writing them to disk; only applies if ``extract`` and
+          ``delete_archive`` are enabled; default: ``False``
         * :attr:`~eodag.config.PluginConfig.auth_error_code` (``int``): which error code is returned in case of an
           authentication error
         * :attr:`~eodag.config.PluginConfig.dl_url_params` (``Dict[str, Any]``): parameters to be
@@ -118,6 +289,9 @@ class HTTPDownload(Download):
           flattened; default: ``True``
         * :attr:`~eodag.config.PluginConfig.ignore_assets` (``bool``): ignore assets and download using downloadLink;
           default: ``False``
+        * :attr:`~eodag.config.PluginConfig.assets_in_flight` (``int``): maximum number of assets of a product
+          downloaded concurrently; default: ``4``. Up to 16 MiB of the assets in flight are buffered in memory
+          until they are written
         * :attr:`~eodag.config.PluginConfig.timeout` (``int``): time to wait until request timeout in seconds;
           default: ``5``
         * :attr:`~eodag.config.PluginConfig.ssl_verify` (``bool``): if the ssl certificates should be verified in
@@ -148,6 +322,21 @@ class HTTPDownload(Download):
 
     def __init__(self, provider: str, config: PluginConfig) -> None:
         super(HTTPDownload, self).__init__(provider, config)
+        # download responses are kept per thread, as products may be downloaded concurrently
+        self._thread_local = threading.local()
+        self.assets_in_flight = max(
+            1,
+            int(getattr(self.config, "assets_in_flight", DEFAULT_ASSETS_IN_FLIGHT)),
+        )
+
+    @property
+    def stream(self) -> Response:
+        """Response of the last product download request sent from the current thread"""
+        return self._thread_local.stream
+
+    @stream.setter
+    def stream(self, stream: Response) -> None:
+        self._thread_local.stream = stream
 
     def _order(
         self,
@@ -452,6 +641,7 @@ class HTTPDownload(Download):
             success_code and success_code != response.status_code
         ):
             error = NotAvailableError(status_message)
+            error.retry_after = parse_retry_after(response.headers.get("Retry-After"))
             raise error
 
         product.properties["storageStatus"] = ONLINE_STATUS
@@ -626,6 +816,8 @@ class HTTPDownload(Download):
                     pass
 
         url = product.remote_location
+        # archive extracted while downloaded, if enabled
+        product_path = self._get_stream_extract_path(fs_path, **kwargs)
 
         @self._order_download_retry(product, wait, timeout)
         def download_request(
@@ -636,16 +828,45 @@ class HTTPDownload(Download):
             timeout: float,
             **kwargs: Unpack[DownloadConf],
         ) -> None:
-            chunks = self._stream_download(product, auth, progress_callback, **kwargs)
-            is_empty = True
-
-            with open(fs_path, "wb") as fhandle:
+            nonlocal product_path
+            chunks: Optional[Iterator[bytes]] = None
+            if product_path is not None:
+                stream_chunks = self._stream_download(
+                    product, auth, progress_callback, **kwargs
+                )
+                extractable, chunks = check_stream_extractable(stream_chunks)
+                if extractable:
+                    try:
+                        self._stream_extract(chunks, product_path)
+                        return
+                    except UnsupportedArchiveError as e:
+                        logger.info(f"{e}, downloading {fs_path} first")
+                        stream_chunks.close()
+                        chunks = None
+                else:
+                    logger.info(f"Not a supported archive, downloading {fs_path} as is")
+                # written then extracted like other downloads
+                product_path = None
+            # interrupted downloads are resumed from the partially downloaded file
+            partial = PartialDownload(fs_path)
+            if chunks is None:
+                chunks = self._stream_download(
+                    product, auth, progress_callback, partial=partial, **kwargs
+                )
+            fhandle: Optional[BinaryIO] = None
+            try:
                 for chunk in chunks:
-                    is_empty = False
+                    if fhandle is None:
+                        # opened once the response is received
+                        fhandle = partial.open()
                     fhandle.write(chunk)
+            finally:
+                if fhandle is not None:
+                    fhandle.close()
 
-            if is_empty:
+            if fhandle is None:
                 raise DownloadError(f"product {product.properties['id']} is empty")
+            partial.complete()
 
         download_request(product, auth, progress_callback, wait, timeout, **kwargs)
 
@@ -653,6 +874,10 @@ class HTTPDownload(Download):
             fh.write(url)
         logger.debug("Download recorded in %s", record_filename)
 
+        if product_path is not None:
+            product.location = path_to_uri(product_path)
+            return product_path
+
         # Check that the downloaded file is really a zip file
         if not zipfile.is_zipfile(fs_path) and output_extension == ".zip":
             logger.warning(
@@ -709,8 +934,11 @@ class HTTPDownload(Download):
         product.location = path_to_uri(product_path)
         return product_path
 
-    def _check_stream_size(self, product: EOProduct) -> int:
-        stream_size = int(self.stream.headers.get("content-length", 0))
+    def _check_stream_size(
+        self, product: EOProduct, stream: Optional[Response] = None
+    ) -> int:
+        stream = self.stream if stream is None else stream
+        stream_size = int(stream.headers.get("content-length", 0))
         if (
             stream_size == 0
             and "storageStatus" in product.properties
@@ -721,14 +949,17 @@ class HTTPDownload(Download):
                 % (
                     product.properties["title"],
                     product.properties["storageStatus"],
-                    self.stream.reason,
+                    stream.reason,
                 )
             )
         return stream_size
 
-    def _check_product_filename(self, product: EOProduct) -> str:
+    def _check_product_filename(
+        self, product: EOProduct, stream: Optional[Response] = None
+    ) -> str:
+        stream = self.stream if stream is None else stream
         filename = None
-        asset_content_disposition = self.stream.headers.get("content-disposition", None)
+        asset_content_disposition = stream.headers.get("content-disposition", None)
         if asset_content_disposition:
             filename = cast(
                 Optional[str],
@@ -736,7 +967,7 @@ class HTTPDownload(Download):
             )
         if not filename:
             # default filename extracted from path
-            filename = str(os.path.basename(self.stream.url))
+            filename = str(os.path.basename(stream.url))
             filename_extension = os.path.splitext(filename)[1]
             if not filename_extension:
                 if content_type := getattr(product, "headers", {}).get("Content-Type"):
@@ -848,6 +1079,136 @@ class HTTPDownload(Download):
             headers=product.headers,
         )
 
+    async def _async_stream_download_dict(
+        self,
+        product: EOProduct,
+        auth: Optional[Union[AuthBase, Dict[str, str]]] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        wait: float = DEFAULT_DOWNLOAD_WAIT,
+        timeout: float = DEFAULT_DOWNLOAD_TIMEOUT,
+        **kwargs: Unpack[DownloadConf],
+    ) -> StreamResponse:
+        r"""
+        Asynchronous version of :meth:`_stream_download_dict`.
+
+        The product download is streamed without holding a worker thread. Assets downloads
+        and orders are still handled from worker threads.
+
+        :param product: The EO product to download
+        :param auth: (optional) authenticated object
+        :param progress_callback: (optional) A progress callback
+        :param wait: (optional) If download fails, wait time in minutes between two download tries
+        :param timeout: (optional) If download fails, maximum time in minutes before stop retrying
+                        to download
+        :param kwargs: `output_dir` (str), `extract` (bool), `delete_archive` (bool)
+                        and `dl_url_params` (dict) can be provided as additional kwargs
+                        and will override any other values defined in a configuration
+                        file or with environment variables.
+        :returns: Dictionary of :class:`~fastapi.responses.StreamingResponse` keyword-arguments
+        """
+        if auth is not None and not isinstance(auth, AuthBase):
+            raise MisconfiguredError(f"Incompatible auth plugin: {type(auth)}")
+
+        if not async_requests_available() or (
+            len(product.assets) > 0
+            and (
+                not getattr(self.config, "ignore_assets", False)
+                or kwargs.get("asset") is not None
+            )
+        ):
+            return await super(HTTPDownload, self)._async_stream_download_dict(
+                product,
+                auth=auth,
+                progress_callback=progress_callback,
+                wait=wait,
+                timeout=timeout,
+                **kwargs,
+            )
+
+        if progress_callback is None:
+            progress_callback = ProgressCallback(disable=True)
+
+        loop = asyncio.get_running_loop()
+        # retry handled at download level
+        await loop.run_in_executor(None, partial(self._order_request, product, auth))
+
+        req_method, req_url, req_kwargs = self._stream_request_args(product, **kwargs)
+
+        if getattr(self.config, "no_auth_download", False):
+            auth = None
+
+        session = get_provider_session(self.provider, self.config, retries=False)
+        request = session.prepare_request(
+            requests.Request(
+                req_method.upper(),
+                req_url,
+                auth=auth,
+                headers=USER_AGENT,
+                **req_kwargs,
+            )
+        )
+        adapter = session.get_adapter(request.url or req_url)
+        if not hasattr(adapter, "send_stream_async"):
+            return await super(HTTPDownload, self)._async_stream_download_dict(
+                product,
+                auth=auth,
+                progress_callback=progress_callback,
+                wait=wait,
+                timeout=timeout,
+                **kwargs,
+            )
+
+        try:
+            stream = await adapter.send_stream_async(
+                request,
+                timeout=DEFAULT_STREAM_REQUESTS_TIMEOUT,
+                verify=getattr(self.config, "ssl_verify", True),
+            )
+        except requests.exceptions.Timeout as exc:
+            raise TimeOutError(exc, timeout=DEFAULT_STREAM_REQUESTS_TIMEOUT) from exc
+        async_stream = stream.raw
+
+        try:
+            if stream.status_code >= 400:
+                # read the error message
+                await async_stream.aread()
+                stream._content = async_stream.content
+            try:
+                stream.raise_for_status()
+            except RequestException as e:
+                self._process_exception(e, product, "")
+                raise NotAvailableError(
+                    f"product {product.properties['id']} could not be downloaded"
+                ) from e
+            stream_size = self._process_stream_response(product, stream)
+            progress_callback.reset(total=stream_size)
+
+            chunks = async_stream.aiter_bytes(chunk_size=CHUNK_SIZE)
+            first_chunk = b""
+            async for first_chunk in chunks:
+                if first_chunk:
+                    break
+            if not first_chunk:
+                # product is empty file
+                logger.error("product %s is empty", product.properties["id"])
+                raise NotAvailableError(f"product {product.properties['id']} is empty")
+        except BaseException:
+            await async_stream.aclose()
+            raise
+
+        async def content() -> AsyncIterator[bytes]:
+            try:
+                progress_callback(len(first_chunk))
+                yield first_chunk
+                async for chunk in chunks:
+                    if chunk:
+                        progress_callback(len(chunk))
+                        yield chunk
+            finally:
+                await async_stream.aclose()
+
+        return StreamResponse(content=content(), headers=product.headers)
+
     def _check_auth_exception(self, e: Optional[RequestException]) -> None:
         # check if error is identified as auth_error in provider conf
         auth_errors = getattr(self.config, "auth_error_code", [None])
@@ -902,6 +1263,21 @@ class HTTPDownload(Download):
             else:
                 logger.error("Error while getting resource :\n%s", tb.format_exc())
 
+    def _needs_order(self, product: EOProduct) -> bool:
+        """Whether the product must be ordered and staged before its download
+
+        :param product: The EO product to download
+        :returns: ``True`` if order is enabled and the product is not online
+        """
+        return (
+            bool(getattr(self.config, "order_enabled", False))
+            and product.properties.get("storageStatus", ONLINE_STATUS) != ONLINE_STATUS
+            and (
+                "orderLink" in product.properties
+                or bool(product.properties.get("orderStatusLink"))
+            )
+        )
+
     def _order_request(
         self,
         product: EOProduct,
@@ -940,13 +1316,86 @@ class HTTPDownload(Download):
             product, auth
         )
 
+    def _stream_request_args(
+        self, product: EOProduct, **kwargs: Unpack[DownloadConf]
+    ) -> Tuple[str, str, Dict[str, Any]]:
+        """Method, url and keyword-arguments of the request streaming the product download
+
+        :param product: product to download
+        :param kwargs: additional arguments, ``dl_url_params`` (dict) overrides the configured
+                       query parameters
+        :returns: request method, url and keyword-arguments
+        """
+        params = kwargs.get("dl_url_params", None) or getattr(
+            self.config, "dl_url_params", {}
+        )
+
+        req_method = (
+            product.properties.get("downloadMethod", "").lower()
+            or getattr(self.config, "method", "GET").lower()
+        )
+        url = product.remote_location
+        req_kwargs: Dict[str, Any] = {"params": params}
+        if req_method == "post":
+            # separate url & parameters
+            parts = urlparse(url)
+            query_dict = parse_qs(parts.query)
+            if not query_dict and parts.query:
+                query_dict = geojson.loads(parts.query)
+            req_url = parts._replace(query="").geturl()
+            if query_dict:
+                req_kwargs["json"] = query_dict
+        else:
+            req_url = url
+
+        if req_url.startswith(NOT_AVAILABLE):
+            raise NotAvailableError("Download link is not available")
+
+        return req_method, req_url, req_kwargs
+
+    def _process_stream_response(
+        self, product: EOProduct, stream: Response, ordered_message: str = ""
+    ) -> Optional[int]:
+        """Check the response of a successful download request and set product headers
+
+        :param product: downloaded product
+        :param stream: response of the download request
+        :param ordered_message: message used if the product is not available yet
+        :returns: size of the downloaded content, if known
+        """
+        # check if product was ordered
+        if getattr(
+            stream, "status_code", None
+        ) is not None and stream.status_code == getattr(
+            self.config, "order_status", {}
+        ).get(
+            "ordered", {}
+        ).get(
+            "http_code"
+        ):
+            product.properties["storageStatus"] = "ORDERED"
+            self._process_exception(None, product, ordered_message)
+        stream_size = self._check_stream_size(product, stream) or None
+
+        product.headers = stream.headers
+        filename = self._check_product_filename(product, stream) or None
+        product.headers["content-disposition"] = f"attachment; filename={filename}"
+        content_type = product.headers.get("Content-Type")
+        guessed_content_type = (
+            guess_file_type(filename) if filename and not content_type else None
+        )
+        if guessed_content_type is not None:
+            product.headers["Content-Type"] = guessed_content_type
+        return stream_size
+
     def _stream_download(
         self,
         product: EOProduct,
         auth: Optional[AuthBase] = None,
         progress_callback: Optional[ProgressCallback] = None,
+        partial: Optional[PartialDownload] = None,
         **kwargs: Unpack[DownloadConf],
-    ) -> Iterator[Any]:
+    ) -> Generator[Any, None, None]:
         """
         Fetches a zip file containing the assets of a given product as a stream
         and returns a generator yielding the chunks of the file
@@ -958,6 +1407,8 @@ class HTTPDownload(Download):
                                   size as inputs and handle progress bar
                                   creation and update to give the user a
                                   feedback on the download progress
+        :param partial: (optional) partially downloaded file, whose download is resumed
+                        if possible; only the missing chunks are then yielded
         :param kwargs: additional arguments
         """
         if progress_callback is None:
@@ -970,41 +1421,22 @@ class HTTPDownload(Download):
         # retry handled at download level
         self._order_request(product, auth)
 
-        params = kwargs.pop("dl_url_params", None) or getattr(
-            self.config, "dl_url_params", {}
-        )
-
-        req_method = (
-            product.properties.get("downloadMethod", "").lower()
-            or getattr(self.config, "method", "GET").lower()
-        )
-        url = product.remote_location
-        if req_method == "post":
-            # separate url & parameters
-            parts = urlparse(url)
-            query_dict = parse_qs(parts.query)
-            if not query_dict and parts.query:
-                query_dict = geojson.loads(parts.query)
-            req_url = parts._replace(query="").geturl()
-            req_kwargs: Dict[str, Any] = {"json": query_dict} if query_dict else {}
-        else:
-            req_url = url
-            req_kwargs = {}
-
-        if req_url.startswith(NOT_AVAILABLE):
-            raise NotAvailableError("Download link is not available")
+        req_method, req_url, req_kwargs = self._stream_request_args(product, **kwargs)
 
         if getattr(self.config, "no_auth_download", False):
             auth = None
 
-        s = requests.Session()
+        headers = USER_AGENT
+        if partial is not None and (range_headers := partial.range_headers(req_url)):
+            headers = {**USER_AGENT, **range_headers}
+
+        s = get_provider_session(self.provider, self.config, retries=False)
         with s.request(
             req_method,
             req_url,
             stream=True,
             auth=auth,
-            params=params,
-            headers=USER_AGENT,
+            headers=headers,
             timeout=DEFAULT_STREAM_REQUESTS_TIMEOUT,
             verify=ssl_verify,
             **req_kwargs,
@@ -1018,35 +1450,15 @@ class HTTPDownload(Download):
             except RequestException as e:
                 self._process_exception(e, product, ordered_message)
             else:
-                # check if product was ordered
-
-                if getattr(
-                    self.stream, "status_code", None
-                ) is not None and self.stream.status_code == getattr(
-                    self.config, "order_status", {}
-                ).get(
-                    "ordered", {}
-                ).get(
-                    "http_code"
-                ):
-                    product.properties["storageStatus"] = "ORDERED"
-                    self._process_exception(None, product, ordered_message)
-                stream_size = self._check_stream_size(product) or None
-
-                product.headers = self.stream.headers
-                filename = self._check_product_filename(product) or None
-                product.headers[
-                    "content-disposition"
-                ] = f"attachment; filename={filename}"
-                content_type = product.headers.get("Content-Type")
-                guessed_content_type = (
-                    guess_file_type(filename) if filename and not content_type else None
+                stream_size = self._process_stream_response(
+                    product, self.stream, ordered_message
                 )
-                if guessed_content_type is not None:
-                    product.headers["Content-Type"] = guessed_content_type
-
+                if partial is not None:
+                    partial.response_received(
+                        getattr(self.stream, "status_code", 200), self.stream.headers
+                    )
                 progress_callback.reset(total=stream_size)
-                for chunk in self.stream.iter_content(chunk_size=64 * 1024):
+                for chunk in self.stream.iter_content(chunk_size=CHUNK_SIZE):
                     if chunk:
                         progress_callback(len(chunk))
                         yield chunk
@@ -1057,8 +1469,21 @@ class HTTPDownload(Download):
         auth: Optional[AuthBase] = None,
         progress_callback: Optional[ProgressCallback] = None,
         assets_values: List[Asset] = [],
+        asset_partial: Optional[Callable[[str], PartialDownload]] = None,
         **kwargs: Unpack[DownloadConf],
     ) -> Iterator[Any]:
+        """Stream the assets of a product, zipped if there are several of them
+
+        :param product: The EO product whose assets are downloaded
+        :param auth: (optional) authenticated object
+        :param progress_callback: (optional) A progress callback
+        :param assets_values: assets to download
+        :param asset_partial: (optional) callable returning the partially downloaded file
+                              of an asset from its relative path, to resume its download
+        :param kwargs: additional arguments
+        :returns: chunks of the asset if there is only one, else tuples of each asset
+                  relative path, modification date, permissions, zip method and chunks
+        """
         if progress_callback is None:
             logger.info("Progress bar unavailable, please call product.download()")
             progress_callback = ProgressCallback(disable=True)
@@ -1075,15 +1500,26 @@ class HTTPDownload(Download):
             self.config, "dl_url_params", {}
         )
 
+        # sign all assets urls at once if the authentication allows it (SASAuth)
+        sign_urls = getattr(auth, "sign_urls", None)
+        if callable(sign_urls):
+            sign_urls(
+                requests.Request("GET", asset["href"], params=params).prepare().url
+                for asset in assets_values
+                if asset["href"] and asset["href"].startswith("http")
+            )
+
         total_size = self._get_asset_sizes(assets_values, auth, params) or None
 
         progress_callback.reset(total=total_size)
 
-        def get_chunks(stream: Response) -> Any:
-            for chunk in stream.iter_content(chunk_size=64 * 1024):
-                if chunk:
+        progress_lock = threading.Lock()
+
+        def get_chunks(asset_stream: BufferedAssetStream) -> Any:
+            for chunk in asset_stream:
+                with progress_lock:
                     progress_callback(len(chunk))
-                    yield chunk
+                yield chunk
 
         # zipped files properties
         modified_at = datetime.now()
@@ -1120,25 +1556,46 @@ class HTTPDownload(Download):
             else None
         )
 
-        # loop for assets download
-        for asset in assets_values:
-            if not asset["href"] or asset["href"].startswith("file:"):
-                logger.info(
-                    f"Local asset detected. Download skipped for {asset['href']}"
-                )
-                continue
+        session = get_provider_session(self.provider, self.config, retries=False)
+
+        def asset_rel_dir(asset: Asset) -> str:
+            asset_rel_path = (
+                asset.rel_path.replace(assets_common_subdir, "").strip(os.sep)
+                if flatten_top_dirs
+                else asset.rel_path
+            )
+            return os.path.dirname(asset_rel_path)
+
+        @contextmanager
+        def open_asset(asset: Asset) -> Iterator[Response]:
             if matching_conf or (
                 matching_url and re.match(matching_url, asset["href"])
             ):
                 auth_object = auth
             else:
                 auth_object = None
-            with requests.get(
+            headers = USER_AGENT
+            partial_download = None
+            if asset_partial is not None:
+                # resume the download to the path the asset would have without
+                # content-disposition header
+                partial_download = asset_partial(
+                    os.path.join(
+                        asset_rel_dir(asset),
+                        getattr(asset, "filename", None)
+                        or os.path.basename(asset.rel_path),
+                    )
+                )
+                headers = {
+                    **USER_AGENT,
+                    **partial_download.range_headers(asset["href"]),
+                }
+            with session.get(
                 asset["href"],
                 stream=True,
                 auth=auth_object,
                 params=params,
-                headers=USER_AGENT,
+                headers=headers,
                 timeout=DEFAULT_STREAM_REQUESTS_TIMEOUT,
                 verify=ssl_verify,
             ) as stream:
@@ -1150,49 +1607,78 @@ class HTTPDownload(Download):
                     ) from exc
                 except RequestException as e:
                     self._handle_asset_exception(e, asset)
-                else:
-                    asset_rel_path = (
-                        asset.rel_path.replace(assets_common_subdir, "").strip(os.sep)
-                        if flatten_top_dirs
-                        else asset.rel_path
+                if partial_download is not None:
+                    partial_download.response_received(
+                        getattr(stream, "status_code", 200), stream.headers
                     )
-                    asset_rel_dir = os.path.dirname(asset_rel_path)
+                    if partial_download.offset:
+                        # keep the path of the resumed download
+                        asset.filename = os.path.basename(partial_download.path)
+                yield stream
 
-                    if not getattr(asset, "filename", None):
-                        # try getting filename in GET header if was not found in HEAD result
-                        asset_content_disposition = stream.headers.get(
-                            "content-disposition", None
-                        )
-                        if asset_content_disposition:
-                            asset.filename = cast(
-                                Optional[str],
-                                parse_header(asset_content_disposition).get_param(
-                                    "filename", None
-                                ),
-                            )
-
-                    if not getattr(asset, "filename", None):
-                        # default filename extracted from path
-                        asset.filename = os.path.basename(asset.rel_path)
-
-                    asset.rel_path = os.path.join(
-                        asset_rel_dir, cast(str, asset.filename)
-                    )
+        remote_assets = []
+        for asset in assets_values:
+            if not asset["href"] or asset["href"].startswith("file:"):
+                logger.info(
+                    f"Local asset detected. Download skipped for {asset['href']}"
+                )
+            else:
+                remote_assets.append(asset)
 
-                    if len(assets_values) == 1:
-                        # apply headers to asset
-                        product.assets[assets_values[0].key].headers = stream.headers
-                        yield from get_chunks(stream)
-                    else:
-                        # several assets to zip
-                        yield (
-                            asset.rel_path,
-                            modified_at,
-                            perms,
-                            ZIP_AUTO(asset.size),
-                            get_chunks(stream),
+        # assets are downloaded concurrently, and yielded in order
+        executor = ThreadPoolExecutor(
+            max_workers=self.assets_in_flight, thread_name_prefix="eodag-assets"
+        )
+        budget = BufferBudget()
+        assets_streams = [
+            BufferedAssetStream(partial(open_asset, asset), executor, budget)
+            for asset in remote_assets
+        ]
+        try:
+            for asset, asset_stream in zip(remote_assets, assets_streams):
+                stream = asset_stream.response()
+
+                if not getattr(asset, "filename", None):
+                    # try getting filename in GET header if was not found in HEAD result
+                    asset_content_disposition = stream.headers.get(
+                        "content-disposition", None
+                    )
+                    if asset_content_disposition:
+                        asset.filename = cast(
+                            Optional[str],
+                            parse_header(asset_content_disposition).get_param(
+                                "filename", None
+                            ),
                         )
 
+                if not getattr(asset, "filename", None):
+                    # default filename extracted from path
+                    asset.filename = os.path.basename(asset.rel_path)
+
+                asset.rel_path = os.path.join(
+                    asset_rel_dir(asset), cast(str, asset.filename)
+                )
+
+                if len(assets_values) == 1:
+                    # apply headers to asset
+                    product.assets[assets_values[0].key].headers = stream.headers
+                    yield from get_chunks(asset_stream)
+                else:
+                    # several assets to zip
+                    yield (
+                        asset.rel_path,
+                        modified_at,
+                        perms,
+                        ZIP_AUTO(asset.size),
+                        get_chunks(asset_stream),
+                    )
+        except BaseException:
+            for asset_stream in assets_streams:
+                asset_stream.cancel()
+            raise
+        finally:
+            executor.shutdown(wait=False)
+
     def _download_assets(
         self,
         product: EOProduct,
@@ -1215,8 +1701,22 @@ class HTTPDownload(Download):
 
         assets_values = product.assets.get_values(kwargs.get("asset", None))
 
+        # partially downloaded assets, by relative path
+        partials: Dict[str, PartialDownload] = {}
+
+        def asset_partial(asset_path: str) -> PartialDownload:
+            partials[asset_path] = PartialDownload(
+                os.path.join(fs_dir_path, asset_path)
+            )
+            return partials[asset_path]
+
         chunks_tuples = self._stream_download_assets(
-            product, auth, progress_callback, assets_values=assets_values, **kwargs
+            product,
+            auth,
+            progress_callback,
+            assets_values=assets_values,
+            asset_partial=asset_partial,
+            **kwargs,
         )
 
         # remove existing incomplete file
@@ -1249,31 +1749,58 @@ class HTTPDownload(Download):
                 [(assets_values[0].rel_path, None, None, None, chunks)]
             )
 
-        for chunk_tuple in chunks_tuples:
-            asset_path = chunk_tuple[0]
-            asset_chunks = chunk_tuple[4]
+        progress_lock = threading.Lock()
+        failed = threading.Event()
+
+        def write_asset(asset_path: str, asset_chunks: Iterator[bytes]) -> None:
             asset_abs_path = os.path.join(fs_dir_path, asset_path)
-            asset_abs_path_temp = asset_abs_path + "~"
             # create asset subdir if not exist
             asset_abs_path_dir = os.path.dirname(asset_abs_path)
-            if not os.path.isdir(asset_abs_path_dir):
-                os.makedirs(asset_abs_path_dir)
-            # remove temporary file
-            if os.path.isfile(asset_abs_path_temp):
-                os.remove(asset_abs_path_temp)
+            os.makedirs(asset_abs_path_dir, exist_ok=True)
             if not os.path.isfile(asset_abs_path):
-                logger.debug("Downloading to temporary file '%s'", asset_abs_path_temp)
-                with open(asset_abs_path_temp, "wb") as fhandle:
+                # a temporary file not matching a resumed download is overwritten
+                partial_download = partials.pop(asset_path, None) or PartialDownload(
+                    asset_abs_path
+                )
+                logger.debug(
+                    "Downloading to temporary file '%s'", partial_download.temp_path
+                )
+                with partial_download.open() as fhandle:
                     for chunk in asset_chunks:
+                        if failed.is_set():
+                            # stop downloading, another asset failed
+                            return
                         if chunk:
                             fhandle.write(chunk)
-                            progress_callback(len(chunk))
+                            with progress_lock:
+                                progress_callback(len(chunk))
                 logger.debug(
                     "Download completed. Renaming temporary file '%s' to '%s'",
-                    os.path.basename(asset_abs_path_temp),
+                    os.path.basename(partial_download.temp_path),
                     os.path.basename(asset_abs_path),
                 )
-                os.rename(asset_abs_path_temp, asset_abs_path)
+                partial_download.complete()
+
+        # assets are received in order, and written concurrently
+        with ThreadPoolExecutor(
+            max_workers=self.assets_in_flight, thread_name_prefix="eodag-assets-write"
+        ) as writer:
+            writes: Set[Future[None]] = set()
+            try:
+                for chunk_tuple in chunks_tuples:
+                    writes.add(
+                        writer.submit(write_asset, chunk_tuple[0], chunk_tuple[4])
+                    )
+                    # stop as soon as a write failed
+                    done, writes = wait(writes, timeout=0, return_when=FIRST_EXCEPTION)
+                    for write in done:
+                        write.result()
+                done, _ = wait(writes, return_when=FIRST_EXCEPTION)
+                for write in done:
+                    write.result()
+            except BaseException:
+                failed.set()
+                raise
         # only one local asset
         if local_assets_count == len(assets_urls) and local_assets_count == 1:
             # remove empty {fs_dir_path}
@@ -1331,72 +1858,80 @@ class HTTPDownload(Download):
         params: Optional[Dict[str, str]],
         zipped: bool = False,
     ) -> int:
-        total_size = 0
-
         timeout = getattr(self.config, "timeout", HTTP_REQ_TIMEOUT)
         ssl_verify = getattr(self.config, "ssl_verify", True)
-        # loop for assets size & filename
-        for asset in assets_values:
-            if asset["href"] and not asset["href"].startswith("file:"):
-                # HEAD request for size & filename
-                try:
-                    asset_headers = requests.head(
-                        asset["href"],
-                        auth=auth,
-                        params=params,
-                        headers=USER_AGENT,
-                        timeout=timeout,
-                        verify=ssl_verify,
-                    ).headers
-                except RequestException as e:
-                    logger.debug(f"HEAD request failed: {str(e)}")
-                    asset_headers = CaseInsensitiveDict()
-
-                if not getattr(asset, "size", 0):
-                    # size from HEAD header / Content-length
-                    asset.size = int(asset_headers.get("Content-length", 0))
-
-                header_content_disposition = Message()
-                if not getattr(asset, "size", 0) or not getattr(asset, "filename", 0):
-                    # header content-disposition
-                    header_content_disposition = parse_header(
-                        asset_headers.get("content-disposition", "")
-                    )
-                if not getattr(asset, "size", 0):
-                    # size from HEAD header / content-disposition / size
-                    size_str = str(header_content_disposition.get_param("size", 0))
-                    asset.size = int(size_str) if size_str.isdigit() else 0
-                if not getattr(asset, "filename", 0):
-                    # filename from HEAD header / content-disposition / size
-                    asset_filename = header_content_disposition.get_param(
-                        "filename", None
-                    )
-                    asset.filename = str(asset_filename) if asset_filename else None
-
-                if not getattr(asset, "size", 0):
-                    # GET request for size
-                    with requests.get(
-                        asset["href"],
-                        stream=True,
-                        auth=auth,
-                        params=params,
-                        headers=USER_AGENT,
-                        timeout=DEFAULT_STREAM_REQUESTS_TIMEOUT,
-                        verify=ssl_verify,
-                    ) as stream:
-                        # size from GET header / Content-length
-                        asset.size = int(stream.headers.get("Content-length", 0))
-                        if not getattr(asset, "size", 0):
-                            # size from GET header / content-disposition / size
-                            size_str = str(
-                                parse_header(
-                                    stream.headers.get("content-disposition", "")
-                                ).get_param("size", 0)
-                            )
-                            asset.size = int(size_str) if size_str.isdigit() else 0
-
-                total_size += asset.size
-        return total_size
+        session = get_provider_session(self.provider, self.config, retries=False)
+
+        def get_asset_size(asset: Asset) -> int:
+            # HEAD request for size & filename
+            try:
+                asset_headers = session.head(
+                    asset["href"],
+                    auth=auth,
+                    params=params,
+                    headers=USER_AGENT,
+                    timeout=timeout,
+                    verify=ssl_verify,
+                ).headers
+            except RequestException as e:
+                logger.debug(f"HEAD request failed: {str(e)}")
+                asset_headers = CaseInsensitiveDict()
+
+            if not getattr(asset, "size", 0):
+                # size from HEAD header / Content-length
+                asset.size = int(asset_headers.get("Content-length", 0))
+
+            header_content_disposition = Message()
+            if not getattr(asset, "size", 0) or not getattr(asset, "filename", 0):
+                # header content-disposition
+                header_content_disposition = parse_header(
+                    asset_headers.get("content-disposition", "")
+                )
+            if not getattr(asset, "size", 0):
+                # size from HEAD header / content-disposition / size
+                size_str = str(header_content_disposition.get_param("size", 0))
+                asset.size = int(size_str) if size_str.isdigit() else 0
+            if not getattr(asset, "filename", 0):
+                # filename from HEAD header / content-disposition / size
+                asset_filename = header_content_disposition.get_param("filename", None)
+                asset.filename = str(asset_filename) if asset_filename else None
+
+            if not getattr(asset, "size", 0):
+                # GET request for size
+                with session.get(
+                    asset["href"],
+                    stream=True,
+                    auth=auth,
+                    params=params,
+                    headers=USER_AGENT,
+                    timeout=DEFAULT_STREAM_REQUESTS_TIMEOUT,
+                    verify=ssl_verify,
+                ) as stream:
+                    # size from GET header / Content-length
+                    asset.size = int(stream.headers.get("Content-length", 0))
+                    if not getattr(asset, "size", 0):
+                        # size from GET header / content-disposition / size
+                        size_str = str(
+                            parse_header(
+                                stream.headers.get("content-disposition", "")
+                            ).get_param("size", 0)
+                        )
+                        asset.size = int(size_str) if size_str.isdigit() else 0
+            return asset.size
+
+        remote_assets = [
+            asset
+            for asset in assets_values
+            if asset["href"] and not asset["href"].startswith("file:")
+        ]
+        if self.assets_in_flight == 1 or len(remote_assets) < 2:
+            return sum(get_asset_size(asset) for asset in remote_assets)
+
+        # assets sizes & filenames are requested concurrently
+        with ThreadPoolExecutor(
+            max_workers=self.assets_in_flight, thread_name_prefix="eodag-assets-size"
+        ) as executor:
+            return sum(executor.map(get_asset_size, remote_assets))
 
     def download_all(
         self,
@@ -1406,6 +1941,7 @@ class HTTPDownload(Download):
         progress_callback: Optional[ProgressCallback] = None,
         wait: float = DEFAULT_DOWNLOAD_WAIT,
         timeout: float = DEFAULT_DOWNLOAD_TIMEOUT,
+        max_workers: int = 1,
         **kwargs: Unpack[DownloadConf],
     ):
         """
@@ -1418,5 +1954,6 @@ class HTTPDownload(Download):
             progress_callback=progress_callback,
             wait=wait,
             timeout=timeout,
+            max_workers=max_workers,
             **kwargs,
         )
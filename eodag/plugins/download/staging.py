@@ -0,0 +1,342 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024, CS GROUP - France, https://www.csgroup.eu/
+#
+# This file is part of EODAG project
+#     https://www.github.com/CS-SI/EODAG
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Staging of offline products, ordered and polled until they are online"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+
+import concurrent.futures
+
+from eodag.api.product.metadata_mapping import OFFLINE_STATUS, ONLINE_STATUS
+from eodag.utils import DEFAULT_DOWNLOAD_TIMEOUT, DEFAULT_DOWNLOAD_WAIT
+from eodag.utils.exceptions import NotAvailableError
+
+if TYPE_CHECKING:
+    from requests.auth import AuthBase
+
+    from eodag.api.product import EOProduct
+    from eodag.plugins.download.http import HTTPDownload
+
+logger = logging.getLogger("eodag.download.staging")
+
+#: Delay in seconds before the first order status check of a product, doubled after
+#: each check up to the ``wait`` delay
+STAGING_FIRST_POLL_DELAY = 10.0
+
+#: Default number of order requests sent concurrently
+DEFAULT_STAGING_WORKERS = 4
+
+
+@dataclass
+class _StagedProduct:
+    """An ordered product, and the schedule of its order status checks"""
+
+    product: EOProduct
+    downloader: HTTPDownload
+    auth: Optional[AuthBase]
+    key: str
+    deadline: float
+    delay: float
+    next_poll: float = 0.0
+    initial_properties: Dict[str, Any] = field(default_factory=dict)
+
+
+class StagingManager:
+    """Order offline products and check their order status in the background, handing
+    them over as soon as they are online.
+
+    All products are ordered up front. Then the order status of the products due for a
+    check are checked together. Checks of a product are delayed by
+    :data:`STAGING_FIRST_POLL_DELAY`, doubled after each check up to ``wait`` minutes,
+    or by the delay of the ``Retry-After`` header of the provider response.
+
+    Products are handed over (see :meth:`ready`) once online, or once their order failed
+    or took more than ``timeout`` minutes. Their download is then tried until their order
+    deadline (see :meth:`remaining`), which is not extended by the hand-over.
+
+    Outstanding orders are persisted in ``state_path``, so that a restarted download
+    checks them again instead of ordering the products again.
+
+    :param state_path: (optional) JSON file where outstanding orders are persisted
+    :param wait: (optional) Maximum delay in minutes between two checks of a product
+    :param timeout: (optional) Time in minutes after which a product order is given up
+    :param max_workers: (optional) Number of requests sent concurrently
+    """
+
+    def __init__(
+        self,
+        state_path: Optional[str] = None,
+        wait: float = DEFAULT_DOWNLOAD_WAIT,
+        timeout: float = DEFAULT_DOWNLOAD_TIMEOUT,
+        max_workers: int = DEFAULT_STAGING_WORKERS,
+    ) -> None:
+        self.state_path = state_path
+        self.wait = wait
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._ready: queue.Queue[EOProduct] = queue.Queue()
+        self._staged: Dict[str, _StagedProduct] = {}
+        self._keys: Set[str] = set()
+        self._deadlines: Dict[str, float] = {}
+        self._state: Dict[str, Dict[str, Any]] = self._load_state()
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def product_key(product: EOProduct) -> str:
+        """Key of a product order in the persisted state
+
+        :param product: The ordered product
+        :returns: The product key
+        """
+        return f"{product.provider}/{product.product_type}/{product.properties['id']}"
+
+    def _load_state(self) -> Dict[str, Dict[str, Any]]:
+        if not self.state_path or not os.path.isfile(self.state_path):
+            return {}
+        try:
+            with open(self.state_path) as fh:
+                return json.load(fh)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring invalid staging state {self.state_path}: {e}")
+            return {}
+
+    def _save_state(self) -> None:
+        """Persist the outstanding orders, must be called with the lock held"""
+        if not self.state_path:
+            return
+        try:
+            if not self._state:
+                if os.path.isfile(self.state_path):
+                    os.remove(self.state_path)
+                return
+            os.makedirs(os.path.dirname(self.state_path) or ".", exist_ok=True)
+            tmp_path = f"{self.state_path}~"
+            with open(tmp_path, "w") as fh:
+                json.dump(self._state, fh, default=str)
+            os.replace(tmp_path, self.state_path)
+        except OSError as e:
+            logger.warning(f"Cannot save the staging state {self.state_path}: {e}")
+
+    def _persist(self, staged: _StagedProduct) -> None:
+        """Persist the product properties updated by its order and status checks"""
+        properties = {
+            key: value
+            for key, value in staged.product.properties.items()
+            if staged.initial_properties.get(key) != value
+        }
+        with self._lock:
+            self._state[staged.key] = {
+                "properties": properties,
+                "remote_location": staged.product.remote_location,
+            }
+            self._save_state()
+
+    def start(
+        self,
+        products: List[EOProduct],
+        downloaders: List[HTTPDownload],
+        auths: List[Optional[AuthBase]],
+    ) -> None:
+        """Start ordering products and checking their status in a background thread
+
+        :param products: Products to order
+        :param downloaders: Download plugins of the products
+        :param auths: Authentications of the products downloads
+        """
+        now = time.monotonic()
+        for product, downloader, auth in zip(products, downloaders, auths):
+            key = self.product_key(product)
+            self._deadlines[key] = now + self.timeout * 60
+            self._staged[key] = _StagedProduct(
+                product=product,
+                downloader=downloader,
+                auth=auth,
+                key=key,
+                deadline=self._deadlines[key],
+                delay=min(STAGING_FIRST_POLL_DELAY, self.wait * 60),
+                initial_properties=dict(product.properties),
+            )
+        self._keys.update(self._staged)
+        self._thread = threading.Thread(
+            target=self._run, name="eodag-staging", daemon=True
+        )
+        self._thread.start()
+
+    def __contains__(self, product: EOProduct) -> bool:
+        return self.product_key(product) in self._keys
+
+    @property
+    def active(self) -> bool:
+        """Whether products are still staged or not handed over yet"""
+        thread_alive = self._thread is not None and self._thread.is_alive()
+        with self._lock:
+            return (bool(self._staged) and thread_alive) or not self._ready.empty()
+
+    def remaining(self, product: EOProduct) -> float:
+        """Time left before the order deadline of a staged product
+
+        :param product: A staged product
+        :returns: The remaining time in seconds, ``0`` once the deadline is reached
+        """
+        deadline = self._deadlines.get(self.product_key(product))
+        if deadline is None:
+            return self.timeout * 60
+        return max(deadline - time.monotonic(), 0.0)
+
+    def ready(self, timeout: float = 0) -> List[EOProduct]:
+        """Products handed over since the last call
+
+        :param timeout: (optional) Time in seconds to wait for a product if none is ready
+        :returns: The products to download
+        """
+        products: List[EOProduct] = []
+        try:
+            products.append(
+                self._ready.get(timeout=timeout)
+                if timeout > 0
+                else self._ready.get_nowait()
+            )
+            while True:
+                products.append(self._ready.get_nowait())
+        except queue.Empty:
+            pass
+        return products
+
+    def done(self, product: EOProduct) -> None:
+        """Forget the order of a downloaded product
+
+        :param product: The downloaded product
+        """
+        with self._lock:
+            if self._state.pop(self.product_key(product), None) is not None:
+                self._save_state()
+
+    def stop(self) -> None:
+        """Stop checking orders, outstanding ones stay persisted"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _hand_over(self, staged: _StagedProduct) -> None:
+        with self._lock:
+            self._staged.pop(staged.key, None)
+            self._ready.put(staged.product)
+
+    def _run(self) -> None:
+        try:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="eodag-staging"
+            ) as executor:
+                with self._lock:
+                    staged_products = list(self._staged.values())
+                # order all products up front
+                for _ in executor.map(self._order, staged_products):
+                    pass
+                while not self._stop.is_set():
+                    with self._lock:
+                        staged_products = list(self._staged.values())
+                    if not staged_products:
+                        break
+                    now = time.monotonic()
+                    due = [s for s in staged_products if s.next_poll <= now]
+                    if not due:
+                        self._stop.wait(min(s.next_poll for s in staged_products) - now)
+                        continue
+                    logger.debug("Checking the order status of %s products", len(due))
+                    for _ in executor.map(self._check_status, due):
+                        pass
+        except Exception as e:
+            logger.warning(f"Orders status checks stopped: {e}")
+        finally:
+            # products still staged are tried to be downloaded as usual
+            with self._lock:
+                staged_products = list(self._staged.values())
+            for staged in staged_products:
+                self._hand_over(staged)
+
+    def _order(self, staged: _StagedProduct) -> None:
+        product = staged.product
+        with self._lock:
+            persisted = self._state.get(staged.key)
+        if persisted is not None:
+            # ordered by a previous download
+            logger.info(f"Resuming the order of {product.properties['title']}")
+            product.properties.update(persisted["properties"])
+            if persisted.get("remote_location"):
+                product.remote_location = product.location = persisted[
+                    "remote_location"
+                ]
+        elif (
+            "orderLink" in product.properties
+            and product.properties.get("storageStatus") == OFFLINE_STATUS
+            and not product.properties.get("orderStatus")
+        ):
+            try:
+                staged.downloader._order(product=product, auth=staged.auth)
+            except Exception as e:
+                logger.warning(
+                    f"{product.properties['title']} could not be ordered: {e}"
+                )
+                self._hand_over(staged)
+                return
+            self._persist(staged)
+
+        if product.properties.get("storageStatus") == ONLINE_STATUS or not (
+            product.properties.get("orderStatusLink")
+        ):
+            self._hand_over(staged)
+
+    def _check_status(self, staged: _StagedProduct) -> None:
+        product = staged.product
+        try:
+            staged.downloader._order_status(product=product, auth=staged.auth)
+        except NotAvailableError as e:
+            delay = e.retry_after if e.retry_after is not None else staged.delay
+            staged.delay = min(staged.delay * 2, max(self.wait * 60, staged.delay))
+            now = time.monotonic()
+            if now + delay > staged.deadline:
+                logger.warning(
+                    f"{product.properties['title']} order timeout reached, trying to download it"
+                )
+                self._hand_over(staged)
+                return
+            logger.debug(
+                f"{product.properties['title']} is not online yet ({e}), "
+                f"next order status check in {delay:.0f}s"
+            )
+            staged.next_poll = now + delay
+            self._persist(staged)
+            return
+        except Exception as e:
+            logger.warning(
+                f"{product.properties['title']} order status could not be checked: {e}"
+            )
+            self._hand_over(staged)
+            return
+        logger.info(f"{product.properties['title']} is online")
+        self._persist(staged)
+        self._hand_over(staged)
@@ -19,12 +19,21 @@ from __future__ import annotations
 
 import logging
 import re
+import sys
+from importlib.metadata import (
+    Distribution,
+    EntryPoint,
+    PackageNotFoundError,
+    distribution,
+    entry_points,
+)
 from operator import attrgetter
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
+    Iterable,
     Iterator,
     List,
     Optional,
@@ -34,8 +43,6 @@ from typing import (
     cast,
 )
 
-import pkg_resources
-
 from eodag.config import (
     AUTH_TOPIC_KEYS,
     PLUGINS_TOPICS_KEYS,
@@ -52,6 +59,7 @@ from eodag.utils import GENERIC_PRODUCT_TYPE, deepcopy, dict_md5sum
 from eodag.utils.exceptions import (
     AuthenticationError,
     MisconfiguredError,
+    PluginNotFoundError,
     UnsupportedProvider,
 )
 
@@ -65,6 +73,48 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("eodag.plugins.manager")
 
+#: Name of the distribution required by a requirement
+_REQUIREMENT_NAME = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)")
+
+
+def _group_entry_points(group: str) -> Iterable[EntryPoint]:
+    """Entry points of a group, without the ``group`` selection of python >= 3.10
+
+    :param group: Name of the entry points group
+    :returns: The entry points of the group
+    """
+    if sys.version_info >= (3, 10):
+        return entry_points(group=group)
+    return entry_points().get(group, [])
+
+
+def _missing_extras_requirements(entry_point: EntryPoint) -> List[str]:
+    """Names of the distributions required by the extras of a plugin entry point which
+    are not installed
+
+    :param entry_point: The plugin entry point
+    :returns: The missing distributions names
+    """
+    dist = getattr(entry_point, "dist", None)
+    if not entry_point.extras or dist is None:
+        return []
+    missing = []
+    for requirement in dist.requires or []:
+        spec, _, marker = requirement.partition(";")
+        if not any(
+            re.search(rf"extra\s*==\s*[\"']{re.escape(extra)}[\"']", marker)
+            for extra in entry_point.extras
+        ):
+            continue
+        match = _REQUIREMENT_NAME.match(spec)
+        if not match or match.group(1).lower() == dist.name.lower():
+            continue
+        try:
+            distribution(match.group(1))
+        except PackageNotFoundError:
+            missing.append(match.group(1))
+    return missing
+
 
 class PluginManager:
     """A manager for the plugins.
@@ -91,56 +141,43 @@ class PluginManager:
     def __init__(self, providers_config: Dict[str, ProviderConfig]) -> None:
         self.skipped_plugins = []
         self.providers_config = providers_config
-        # Load all the plugins. This will make all plugin classes of a particular
-        # type to be available in the base plugin class's 'plugins' attribute.
-        # For example, by importing module 'eodag.plugins.search.resto', the plugin
-        # 'RestoSearch' will be available in self.supported_topics['search'].plugins
+        # Plugins entry points, by name. Their modules are imported on first use, which
+        # will make the plugin classes available in the base plugin class's 'plugins'
+        # attribute. For example, by importing module 'eodag.plugins.search.resto',
+        # the plugin 'RestoSearch' will be available in Search.plugins
+        self._plugins_entry_points: Dict[str, EntryPoint] = {}
+        plugins_dists: Dict[str, Distribution] = {}
         for topic in self.supported_topics:
             # This way of discovering plugins means that anyone can create eodag
             # plugins as a separate python package (though it must require eodag), and
             # have it discovered as long as they declare an entry point of the type
             # 'eodag.plugins.search' for example in its setup script. See the setup
             # script of eodag for an example of how to do this.
-            for entry_point in pkg_resources.iter_entry_points(
-                "eodag.plugins.{}".format(topic)
-            ):
-                try:
-                    entry_point.load()
-                except pkg_resources.DistributionNotFound:
+            for entry_point in _group_entry_points("eodag.plugins.{}".format(topic)):
+                if _missing_extras_requirements(entry_point):
                     logger.debug(
                         "%s plugin skipped, eodag[%s] or eodag[all] needed",
                         entry_point.name,
                         ",".join(entry_point.extras),
                     )
                     self.skipped_plugins.append(entry_point.name)
-                except ImportError:
-                    import traceback as tb
-
-                    logger.warning("Unable to load plugin: %s.", entry_point.name)
-                    logger.warning("Reason:\n%s", tb.format_exc())
-                    logger.warning(
-                        "Check that the plugin module (%s) is importable",
-                        entry_point.module_name,
-                    )
-                if (
-                    entry_point.dist
-                    and entry_point.dist.key != "eodag"
-                    and entry_point.dist.location is not None
-                ):
-                    # use plugin providers if any
-                    plugin_providers_config_path = [
-                        str(x)
-                        for x in Path(
-                            entry_point.dist.location,
-                            pkg_resources.to_filename(entry_point.dist.key),
-                        ).rglob("providers.yml")
-                    ]
-                    if plugin_providers_config_path:
-                        plugin_providers_config = load_config(
-                            plugin_providers_config_path[0]
-                        )
-                        merge_configs(plugin_providers_config, self.providers_config)
-                        self.providers_config = plugin_providers_config
+                    continue
+                self._plugins_entry_points.setdefault(entry_point.name, entry_point)
+                dist = getattr(entry_point, "dist", None)
+                if dist is not None and dist.name.lower() != "eodag":
+                    plugins_dists.setdefault(dist.name, dist)
+        for dist_name, dist in plugins_dists.items():
+            # use plugin providers if any
+            plugin_providers_config_path = [
+                str(x)
+                for x in Path(
+                    str(dist.locate_file("")), dist_name.lower().replace("-", "_")
+                ).rglob("providers.yml")
+            ]
+            if plugin_providers_config_path:
+                plugin_providers_config = load_config(plugin_providers_config_path[0])
+                merge_configs(plugin_providers_config, self.providers_config)
+                self.providers_config = plugin_providers_config
         self.rebuild()
 
     def rebuild(
@@ -443,6 +480,44 @@ class PluginManager:
                     (provider, topic_class, auth_match_md5)
                 ].priority = priority
 
+    def _get_plugin_class(
+        self, topic_class: Type[PluginTopic], name: str
+    ) -> EODAGPluginMount:
+        """Get a plugin class, importing its module on first use
+
+        :param topic_class: The type of plugin
+        :param name: The name of the plugin class
+        :returns: The plugin class
+        :raises: :class:`~eodag.utils.exceptions.PluginNotFoundError`
+        """
+        try:
+            return EODAGPluginMount.get_plugin_by_class_name(topic_class, name)
+        except PluginNotFoundError:
+            if name in self._plugins_entry_points:
+                self._load_entry_point(self._plugins_entry_points.pop(name))
+            else:
+                # the plugin class may be registered under another entry point name
+                for entry_point_name in list(self._plugins_entry_points):
+                    self._load_entry_point(
+                        self._plugins_entry_points.pop(entry_point_name)
+                    )
+            return EODAGPluginMount.get_plugin_by_class_name(topic_class, name)
+
+    @staticmethod
+    def _load_entry_point(entry_point: EntryPoint) -> None:
+        """Import the module of a plugin entry point"""
+        try:
+            entry_point.load()
+        except ImportError:
+            import traceback as tb
+
+            logger.warning("Unable to load plugin: %s.", entry_point.name)
+            logger.warning("Reason:\n%s", tb.format_exc())
+            logger.warning(
+                "Check that the plugin module (%s) is importable",
+                entry_point.module,
+            )
+
     def _build_plugin(
         self,
         provider: str,
@@ -473,9 +548,7 @@ class PluginManager:
         )
         if cached_instance is not None:
             return cached_instance
-        plugin_class = EODAGPluginMount.get_plugin_by_class_name(
-            topic_class, getattr(plugin_conf, "type")
-        )
+        plugin_class = self._get_plugin_class(topic_class, getattr(plugin_conf, "type"))
         plugin: Union[Api, Search, Download, Authentication, Crunch] = plugin_class(
             provider, plugin_conf
         )
@@ -44,6 +44,13 @@ class PreparedSearch:
     url: Optional[str] = None
     info_message: Optional[str] = None
     exception_message: Optional[str] = None
+    #: If ``False``, request errors are only logged at debug level, for requests which
+    #: are expected to fail
+    log_errors: bool = True
+    #: If ``False``, plugins supporting it return the
+    #: :class:`~eodag.api.search_result.RawSearchResult` of the provider instead of
+    #: products, to be built later using their ``normalize_results`` method
+    normalize: bool = True
 
     need_count: bool = field(init=False, repr=False)
     query_params: Dict[str, Any] = field(init=False, repr=False)
@@ -17,7 +17,9 @@
 # limitations under the License.
 from __future__ import annotations
 
+import asyncio
 import logging
+from functools import partial
 from typing import TYPE_CHECKING, Annotated, get_args
 
 import orjson
@@ -41,6 +43,7 @@ from eodag.utils import (
     update_nested_dict,
 )
 from eodag.utils.exceptions import ValidationError
+from eodag.utils.requests import get_async_executor
 
 if TYPE_CHECKING:
     from typing import Any, Dict, List, Optional, Tuple, Union
@@ -96,9 +99,25 @@ class Search(PluginTopic):
         This method must return a tuple with (1) a list of :class:`~eodag.api.product._product.EOProduct` instances
         which will be processed by a :class:`~eodag.plugins.download.base.Download` plugin (2) and the total number of
         products matching the search criteria. If ``prep.count`` is False, the second element returned must be ``None``.
+        Plugins may return a :class:`~eodag.api.search_result.RawSearchResult` instead of products if ``prep.normalize``
+        is False, which are then built by the caller using the ``normalize_results`` method of the plugin.
         """
         raise NotImplementedError("A Search plugin must implement a method named query")
 
+    async def async_query(
+        self,
+        prep: PreparedSearch = PreparedSearch(),
+        **kwargs: Any,
+    ) -> Tuple[List[EOProduct], Optional[int]]:
+        """Asynchronous version of :meth:`query`, used by the server mode.
+
+        Plugins that cannot send their requests asynchronously run :meth:`query` in a
+        worker thread of :func:`~eodag.utils.requests.get_async_executor`.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            get_async_executor(), partial(self.query, prep, **kwargs)
+        )
+
     def discover_product_types(self, **kwargs: Any) -> Optional[Dict[str, Any]]:
         """Fetch product types list from provider using `discover_product_types` conf"""
         return None
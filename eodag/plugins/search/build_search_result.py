@@ -345,6 +345,9 @@ class ECMWFSearch(PostJsonSearch):
             used to build queryables
     """
 
+    #: constraints and forms are not fetched using the provider pooled session
+    async_requests = False
+
     def __init__(self, provider: str, config: PluginConfig) -> None:
         # cache fetching method
         self.fetch_data = functools.lru_cache()(self._fetch_data)
@@ -26,9 +26,9 @@ import requests
 
 from eodag import EOProduct
 from eodag.api.product.metadata_mapping import (
+    CompiledJsonMapping,
     format_query_params,
     mtd_cfg_as_conversion_and_querypath,
-    properties_from_json,
 )
 from eodag.plugins.search import PreparedSearch
 from eodag.plugins.search.base import Search
@@ -461,15 +461,15 @@ class DataRequestSearch(Search):
         logger.debug(
             "Adapting %s plugin results to eodag product representation" % len(results)
         )
+        extract_properties = CompiledJsonMapping(
+            self.get_metadata_mapping(kwargs.get("productType")),
+            discovery_config=getattr(self.config, "discover_metadata", {}),
+        )
         products: List[EOProduct] = []
         for result in results:
             product = EOProduct(
                 self.provider,
-                properties_from_json(
-                    result,
-                    self.get_metadata_mapping(kwargs.get("productType")),
-                    discovery_config=getattr(self.config, "discover_metadata", {}),
-                ),
+                extract_properties(result),
                 **kwargs,
             )
             # use product_type_config as default properties
@@ -19,8 +19,10 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
 from copy import copy as copy_copy
 from datetime import datetime, timedelta
+from functools import partial
 from typing import (
     TYPE_CHECKING,
     Annotated,
@@ -60,11 +62,11 @@ from pydantic.fields import FieldInfo
 from requests import Response
 from requests.adapters import HTTPAdapter
 from requests.auth import AuthBase
-from urllib3 import Retry
 
 from eodag.api.product import EOProduct
 from eodag.api.product.metadata_mapping import (
     NOT_AVAILABLE,
+    CompiledJsonMapping,
     format_query_params,
     get_queryable_from_provider,
     mtd_cfg_as_conversion_and_querypath,
@@ -80,9 +82,6 @@ from eodag.utils import (
     DEFAULT_MISSION_START_DATE,
     GENERIC_PRODUCT_TYPE,
     HTTP_REQ_TIMEOUT,
-    REQ_RETRY_BACKOFF_FACTOR,
-    REQ_RETRY_STATUS_FORCELIST,
-    REQ_RETRY_TOTAL,
     USER_AGENT,
     _deprecated,
     deepcopy,
@@ -102,12 +101,22 @@ from eodag.utils.exceptions import (
     TimeOutError,
     ValidationError,
 )
+from eodag.utils.requests import (
+    async_requests_available,
+    get_provider_session,
+    run_with_async_requests,
+)
+from eodag.utils.response_cache import cached_request
+from eodag.utils.snapshot import load_content_snapshot
 
 if TYPE_CHECKING:
     from eodag.config import PluginConfig
 
 logger = logging.getLogger("eodag.search.qssearch")
 
+#: Default number of product types discovery pages fetched concurrently
+DEFAULT_DISCOVER_PRODUCT_TYPES_PAGES_WINDOW = 4
+
 
 class QueryStringSearch(Search):
     """A plugin that helps implementing any kind of search protocol that relies on
@@ -130,6 +139,11 @@ class QueryStringSearch(Search):
           requests; default: ``True``
         * :attr:`~eodag.config.PluginConfig.dont_quote` (``List[str]``): characters that should not be quoted in the
           url params
+        * :attr:`~eodag.config.PluginConfig.response_cache_ttl` (``int``): duration in seconds during which identical
+          search requests are answered from the on-disk responses cache (see
+          :func:`~eodag.utils.response_cache.cached_request`), stale responses being revalidated with the provider
+          when possible; default: ``$EODAG_RESPONSE_CACHE_TTL`` or ``0`` (disabled). Requests sent with
+          ``dont_quote`` are not cached
         * :attr:`~eodag.config.PluginConfig.timeout` (``int``): time to wait until request timeout in seconds;
           default: ``5``
         * :attr:`~eodag.config.PluginConfig.retry_total` (``int``): :class:`urllib3.util.Retry` ``total`` parameter,
@@ -139,6 +153,10 @@ class QueryStringSearch(Search):
         * :attr:`~eodag.config.PluginConfig.retry_status_forcelist` (``List[int]``): :class:`urllib3.util.Retry`
           ``status_forcelist`` parameter, list of integer HTTP status codes that we should force a retry on; default:
           ``[401, 429, 500, 502, 503, 504]``
+        * :attr:`~eodag.config.PluginConfig.pool_maxsize` (``int``): maximum number of connections kept open per
+          host in the connection pool shared by the provider plugins; default: ``10``
+        * :attr:`~eodag.config.PluginConfig.keep_alive` (``bool``): whether connections of the pool shared by the
+          provider plugins are kept open between requests; default: ``True``
         * :attr:`~eodag.config.PluginConfig.literal_search_params` (``Dict[str, str]``): A mapping of (search_param =>
           search_value) pairs giving search parameters to be passed as is in the search url query string. This is useful
           for example in situations where the user wants to add a fixed search query parameter exactly
@@ -175,7 +193,8 @@ class QueryStringSearch(Search):
           * :attr:`~eodag.config.PluginConfig.DiscoverProductTypes.fetch_url` (``str``) (**mandatory**): url from which
             the product types can be fetched
           * :attr:`~eodag.config.PluginConfig.DiscoverProductTypes.max_connections` (``int``): Maximum number of
-            connections for concurrent HTTP requests
+            connections for concurrent HTTP requests, also the number of paginated ``fetch_url`` pages fetched
+            concurrently; default: ``4`` pages
           * :attr:`~eodag.config.PluginConfig.DiscoverProductTypes.result_type` (``str``): type of the provider result;
             currently only ``json`` is supported (other types could be used in an extension of this plugin)
           * :attr:`~eodag.config.PluginConfig.DiscoverProductTypes.results_entry` (``str``) (**mandatory**): json path
@@ -288,6 +307,10 @@ class QueryStringSearch(Search):
         "json": properties_from_json,
     }
 
+    #: Whether :meth:`query` only sends requests through the provider pooled session, so
+    #: that :meth:`async_query` can send them asynchronously
+    async_requests = True
+
     def __init__(self, provider: str, config: PluginConfig) -> None:
         super(QueryStringSearch, self).__init__(provider, config)
         self.config.__dict__.setdefault("result_type", "json")
@@ -433,8 +456,9 @@ class QueryStringSearch(Search):
     def clear(self) -> None:
         """Clear search context"""
         super().clear()
-        self.search_urls.clear()
-        self.query_params.clear()
+        # new containers, not shared with copies of the plugin
+        self.search_urls = []
+        self.query_params = dict()
         self.query_string = ""
         self.next_page_url = None
         self.next_page_query_obj = None
@@ -443,8 +467,15 @@ class QueryStringSearch(Search):
     def discover_product_types(self, **kwargs: Any) -> Optional[Dict[str, Any]]:
         """Fetch product types list from provider using `discover_product_types` conf
 
+        Paginated product types are fetched from the first page, whose size gives the one
+        of full pages, then by windows of concurrent requests until the first short or
+        empty page.
+
+        :param kwargs: discovery arguments, and ``stop_event``, a
+                       :class:`threading.Event` stopping the pages fetch once set
         :returns: configuration dict containing fetched product types information
         """
+        stop_event: Optional[threading.Event] = kwargs.pop("stop_event", None)
         unpaginated_fetch_url = self.config.discover_product_types.get("fetch_url")
         if not unpaginated_fetch_url:
             return None
@@ -462,30 +493,58 @@ class QueryStringSearch(Search):
             "product_types_config": {},
         }
 
-        while True:
-            fetch_url = next_page_url_tpl.format(url=unpaginated_fetch_url, page=page)
-
-            conf_update_dict_per_page = self.discover_product_types_per_page(
-                fetch_url=fetch_url, **kwargs
+        def fetch_page(page: int, log_errors: bool = True) -> Optional[Dict[str, Any]]:
+            return self.discover_product_types_per_page(
+                fetch_url=next_page_url_tpl.format(
+                    url=unpaginated_fetch_url, page=page
+                ),
+                log_errors=log_errors,
+                **kwargs,
             )
 
+        def merge_page(conf_update_dict_per_page: Optional[Dict[str, Any]]) -> int:
+            """Merge the product types of a page, returns their number, ``0`` if the page
+            is empty or a subset of the existing conf"""
             if (
                 not conf_update_dict_per_page
                 or not conf_update_dict_per_page.get("providers_config")
                 or conf_update_dict_per_page.items() <= conf_update_dict.items()
             ):
-                # conf_update_dict_per_page is empty or a subset on existing conf
-                break
-            else:
-                conf_update_dict["providers_config"].update(
-                    conf_update_dict_per_page["providers_config"]
-                )
-                conf_update_dict["product_types_config"].update(
-                    conf_update_dict_per_page["product_types_config"]
-                )
+                return 0
+            conf_update_dict["providers_config"].update(
+                conf_update_dict_per_page["providers_config"]
+            )
+            conf_update_dict["product_types_config"].update(
+                conf_update_dict_per_page["product_types_config"]
+            )
+            return len(conf_update_dict_per_page["providers_config"])
 
-            page += 1
+        page_size = merge_page(fetch_page(page))
+        if not page_size:
+            return conf_update_dict
+        page += 1
 
+        # next pages are fetched by windows of concurrent requests, and merged in order
+        pages_window = (
+            self.config.discover_product_types.get("max_connections")
+            or DEFAULT_DISCOVER_PRODUCT_TYPES_PAGES_WINDOW
+        )
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=pages_window, thread_name_prefix="eodag-discovery"
+        ) as executor:
+            while stop_event is None or not stop_event.is_set():
+                # the pages of the window past the last one are expected to fail
+                futures = [
+                    executor.submit(fetch_page, window_page, False)
+                    for window_page in range(page, page + pages_window)
+                ]
+                for future in futures:
+                    if merge_page(future.result()) < page_size:
+                        # short or empty page: the last one
+                        for late_future in futures:
+                            late_future.cancel()
+                        return conf_update_dict
+                page += pages_window
         return conf_update_dict
 
     def discover_product_types_per_page(
@@ -511,6 +570,7 @@ class QueryStringSearch(Search):
             # get auth if available
             if "auth" in kwargs:
                 prep.auth = kwargs.pop("auth")
+            prep.log_errors = kwargs.pop("log_errors", True)
 
             # try updating fetch_url qs using productType
             fetch_qs_dict = {}
@@ -546,147 +606,166 @@ class QueryStringSearch(Search):
                 response = QueryStringSearch._request(self, prep)
         except (RequestError, KeyError, AttributeError):
             return None
-        else:
-            try:
-                conf_update_dict: Dict[str, Any] = {
-                    "providers_config": {},
-                    "product_types_config": {},
-                }
-                if self.config.discover_product_types["result_type"] == "json":
-                    resp_as_json = response.json()
-                    # extract results from response json
-                    results_entry = self.config.discover_product_types["results_entry"]
-                    if not isinstance(results_entry, JSONPath):
-                        logger.warning(
-                            f"Could not parse {self.provider} discover_product_types.results_entry"
-                            f" as JSONPath: {results_entry}"
-                        )
-                        return None
-                    result = [match.value for match in results_entry.find(resp_as_json)]
-                    if result and isinstance(result[0], list):
-                        result = result[0]
-
-                    def conf_update_from_product_type_result(
-                        product_type_result: Dict[str, Any]
-                    ) -> None:
-                        """Update ``conf_update_dict`` using given product type json response"""
-                        # providers_config extraction
-                        extracted_mapping = properties_from_json(
-                            product_type_result,
-                            dict(
-                                self.config.discover_product_types[
-                                    "generic_product_type_parsable_properties"
-                                ],
-                                **{
-                                    "generic_product_type_id": self.config.discover_product_types[
-                                        "generic_product_type_id"
-                                    ]
-                                },
-                            ),
-                        )
-                        generic_product_type_id = extracted_mapping.pop(
-                            "generic_product_type_id"
-                        )
-                        conf_update_dict["providers_config"][
-                            generic_product_type_id
-                        ] = dict(
-                            extracted_mapping,
-                            **self.config.discover_product_types.get(
-                                "generic_product_type_unparsable_properties", {}
-                            ),
-                        )
-                        # product_types_config extraction
-                        conf_update_dict["product_types_config"][
+        try:
+            etag = response.headers.get("ETag")
+            if not isinstance(etag, str) or not etag:
+                return self._parse_discovered_product_types(response)
+            # parsed product types, including the ones fetched from single collection
+            # endpoints, are kept until the provider listing or the configuration change
+            return load_content_snapshot(
+                f"discover_product_types|{self.provider}|{prep.url}",
+                orjson.dumps(
+                    [etag, self.config.discover_product_types],
+                    default=str,
+                    option=orjson.OPT_SORT_KEYS,
+                ),
+                lambda _: self._parse_discovered_product_types(response),
+            )
+        except KeyError as e:
+            logger.warning(
+                "Incomplete %s discover_product_types configuration: %s",
+                self.provider,
+                e,
+            )
+            return None
+        except requests.RequestException as e:
+            logger.debug(
+                "Could not parse discovered product types response from "
+                f"{self.provider}, {type(e).__name__}: {e.args}"
+            )
+            return None
+
+    def _parse_discovered_product_types(
+        self, response: Response
+    ) -> Optional[Dict[str, Any]]:
+        """Build the product types configuration from a ``discover_product_types`` response
+
+        :param response: response of the provider ``fetch_url``
+        :returns: configuration dict containing fetched product types information
+        :raises: :class:`KeyError` if the ``discover_product_types`` configuration is incomplete
+        :raises: :class:`requests.RequestException` if the response cannot be parsed
+        """
+        conf_update_dict: Dict[str, Any] = {
+            "providers_config": {},
+            "product_types_config": {},
+        }
+        if self.config.discover_product_types["result_type"] == "json":
+            resp_as_json = response.json()
+            # extract results from response json
+            results_entry = self.config.discover_product_types["results_entry"]
+            if not isinstance(results_entry, JSONPath):
+                logger.warning(
+                    f"Could not parse {self.provider} discover_product_types.results_entry"
+                    f" as JSONPath: {results_entry}"
+                )
+                return None
+            result = [match.value for match in results_entry.find(resp_as_json)]
+            if result and isinstance(result[0], list):
+                result = result[0]
+
+            def conf_update_from_product_type_result(
+                product_type_result: Dict[str, Any]
+            ) -> None:
+                """Update ``conf_update_dict`` using given product type json response"""
+                # providers_config extraction
+                extracted_mapping = properties_from_json(
+                    product_type_result,
+                    dict(
+                        self.config.discover_product_types[
+                            "generic_product_type_parsable_properties"
+                        ],
+                        **{
+                            "generic_product_type_id": self.config.discover_product_types[
+                                "generic_product_type_id"
+                            ]
+                        },
+                    ),
+                )
+                generic_product_type_id = extracted_mapping.pop(
+                    "generic_product_type_id"
+                )
+                conf_update_dict["providers_config"][generic_product_type_id] = dict(
+                    extracted_mapping,
+                    **self.config.discover_product_types.get(
+                        "generic_product_type_unparsable_properties", {}
+                    ),
+                )
+                # product_types_config extraction
+                conf_update_dict["product_types_config"][
+                    generic_product_type_id
+                ] = properties_from_json(
+                    product_type_result,
+                    self.config.discover_product_types[
+                        "generic_product_type_parsable_metadata"
+                    ],
+                )
+
+                if (
+                    "single_product_type_parsable_metadata"
+                    in self.config.discover_product_types
+                ):
+                    collection_data = (
+                        self._get_product_type_metadata_from_single_collection_endpoint(
                             generic_product_type_id
-                        ] = properties_from_json(
-                            product_type_result,
-                            self.config.discover_product_types[
-                                "generic_product_type_parsable_metadata"
-                            ],
                         )
-
-                        if (
-                            "single_product_type_parsable_metadata"
-                            in self.config.discover_product_types
-                        ):
-                            collection_data = self._get_product_type_metadata_from_single_collection_endpoint(
-                                generic_product_type_id
-                            )
+                    )
+                    conf_update_dict["product_types_config"][
+                        generic_product_type_id
+                    ].update(collection_data)
+
+                # update keywords
+                keywords_fields = [
+                    "instrument",
+                    "platform",
+                    "platformSerialIdentifier",
+                    "processingLevel",
+                    "keywords",
+                ]
+                keywords_values_str = ",".join(
+                    [generic_product_type_id]
+                    + [
+                        str(
                             conf_update_dict["product_types_config"][
                                 generic_product_type_id
-                            ].update(collection_data)
-
-                        # update keywords
-                        keywords_fields = [
-                            "instrument",
-                            "platform",
-                            "platformSerialIdentifier",
-                            "processingLevel",
-                            "keywords",
-                        ]
-                        keywords_values_str = ",".join(
-                            [generic_product_type_id]
-                            + [
-                                str(
-                                    conf_update_dict["product_types_config"][
-                                        generic_product_type_id
-                                    ][kf]
-                                )
-                                for kf in keywords_fields
-                                if kf
-                                in conf_update_dict["product_types_config"][
-                                    generic_product_type_id
-                                ]
-                                and conf_update_dict["product_types_config"][
-                                    generic_product_type_id
-                                ][kf]
-                                != NOT_AVAILABLE
-                            ]
-                        )
-                        # cleanup str list from unwanted characters
-                        keywords_values_str = (
-                            keywords_values_str.replace(", ", ",")
-                            .replace(" ", "-")
-                            .replace("_", "-")
-                            .lower()
-                        )
-                        keywords_values_str = re.sub(
-                            r"[\[\]'\"]", "", keywords_values_str
-                        )
-                        # sorted list of unique lowercase keywords
-                        keywords_values_str = ",".join(
-                            sorted(set(keywords_values_str.split(",")))
+                            ][kf]
                         )
-                        conf_update_dict["product_types_config"][
+                        for kf in keywords_fields
+                        if kf
+                        in conf_update_dict["product_types_config"][
                             generic_product_type_id
-                        ]["keywords"] = keywords_values_str
-
-                    # runs concurrent requests and aggregate results in conf_update_dict
-                    max_connections = self.config.discover_product_types.get(
-                        "max_connections"
-                    )
-                    with concurrent.futures.ThreadPoolExecutor(
-                        max_workers=max_connections
-                    ) as executor:
-                        futures = (
-                            executor.submit(conf_update_from_product_type_result, r)
-                            for r in result
-                        )
-                        [f.result() for f in concurrent.futures.as_completed(futures)]
-
-            except KeyError as e:
-                logger.warning(
-                    "Incomplete %s discover_product_types configuration: %s",
-                    self.provider,
-                    e,
+                        ]
+                        and conf_update_dict["product_types_config"][
+                            generic_product_type_id
+                        ][kf]
+                        != NOT_AVAILABLE
+                    ]
                 )
-                return None
-            except requests.RequestException as e:
-                logger.debug(
-                    "Could not parse discovered product types response from "
-                    f"{self.provider}, {type(e).__name__}: {e.args}"
+                # cleanup str list from unwanted characters
+                keywords_values_str = (
+                    keywords_values_str.replace(", ", ",")
+                    .replace(" ", "-")
+                    .replace("_", "-")
+                    .lower()
                 )
-                return None
+                keywords_values_str = re.sub(r"[\[\]'\"]", "", keywords_values_str)
+                # sorted list of unique lowercase keywords
+                keywords_values_str = ",".join(
+                    sorted(set(keywords_values_str.split(",")))
+                )
+                conf_update_dict["product_types_config"][generic_product_type_id][
+                    "keywords"
+                ] = keywords_values_str
+
+            # runs concurrent requests and aggregate results in conf_update_dict
+            max_connections = self.config.discover_product_types.get("max_connections")
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_connections
+            ) as executor:
+                futures = (
+                    executor.submit(conf_update_from_product_type_result, r)
+                    for r in result
+                )
+                [f.result() for f in concurrent.futures.as_completed(futures)]
         conf_update_dict["product_types_config"] = dict_items_recursive_apply(
             conf_update_dict["product_types_config"],
             lambda k, v: v if v != NOT_AVAILABLE else None,
@@ -795,10 +874,38 @@ class QueryStringSearch(Search):
         raw_search_result = RawSearchResult(provider_results)
         raw_search_result.query_params = prep.query_params
         raw_search_result.product_type_def_params = prep.product_type_def_params
+        if not prep.normalize:
+            return raw_search_result, total_items  # type: ignore[return-value]
 
         eo_products = self.normalize_results(raw_search_result, **kwargs)
         return eo_products, total_items
 
+    async def async_query(
+        self,
+        prep: PreparedSearch = PreparedSearch(),
+        **kwargs: Any,
+    ) -> Tuple[List[EOProduct], Optional[int]]:
+        """Perform a search on an OpenSearch-like interface, sending the requests
+        asynchronously.
+
+        :meth:`query` is run once in a worker thread, its requests being sent by the event
+        loop (see :func:`~eodag.utils.requests.run_with_async_requests`). The thread is
+        held until the search ends, the number of concurrent searches being bounded by
+        ``$EODAG_ASYNC_WORKERS``. Falls back to
+        sending them from the worker thread if they cannot be sent asynchronously
+        (``async_requests`` disabled for the plugin, ``dont_quote`` configured, or
+        ``httpx`` not installed).
+
+        :param prep: Object collecting needed information for search.
+        """
+        if (
+            not self.async_requests
+            or hasattr(self.config, "dont_quote")
+            or not async_requests_available()
+        ):
+            return await super(QueryStringSearch, self).async_query(prep, **kwargs)
+        return await run_with_async_requests(self.query, prep, **kwargs)
+
     @_deprecated(
         reason="Simply run `self.config.metadata_mapping.update(metadata_mapping)` instead",
         version="2.10.0",
@@ -1069,15 +1176,24 @@ class QueryStringSearch(Search):
             "Adapting %s plugin results to eodag product representation"
             % normalize_remaining_count
         )
+        mapping = self.get_metadata_mapping(kwargs.get("productType"))
+        discovery_config = getattr(self.config, "discover_metadata", {})
+        if self.config.result_type == "json":
+            # compile the mapping once for the whole page
+            extract_properties: Callable[..., Dict[str, Any]] = CompiledJsonMapping(
+                mapping, discovery_config
+            )
+        else:
+            extract_properties = partial(
+                QueryStringSearch.extract_properties[self.config.result_type],
+                mapping=mapping,
+                discovery_config=discovery_config,
+            )
         products: List[EOProduct] = []
         for result in results:
             product = EOProduct(
                 self.provider,
-                QueryStringSearch.extract_properties[self.config.result_type](
-                    result,
-                    self.get_metadata_mapping(kwargs.get("productType")),
-                    discovery_config=getattr(self.config, "discover_metadata", {}),
-                ),
+                extract_properties(result),
                 **kwargs,
             )
             # use product_type_config as default properties
@@ -1183,14 +1299,6 @@ class QueryStringSearch(Search):
             timeout = getattr(self.config, "timeout", HTTP_REQ_TIMEOUT)
             ssl_verify = getattr(self.config, "ssl_verify", True)
 
-            retry_total = getattr(self.config, "retry_total", REQ_RETRY_TOTAL)
-            retry_backoff_factor = getattr(
-                self.config, "retry_backoff_factor", REQ_RETRY_BACKOFF_FACTOR
-            )
-            retry_status_forcelist = getattr(
-                self.config, "retry_status_forcelist", REQ_RETRY_STATUS_FORCELIST
-            )
-
             ssl_ctx = get_ssl_context(ssl_verify)
             # auth if needed
             kwargs: Dict[str, Any] = {}
@@ -1230,30 +1338,41 @@ class QueryStringSearch(Search):
                 if info_message:
                     logger.info(info_message)
 
-                session = requests.Session()
-                retries = Retry(
-                    total=retry_total,
-                    backoff_factor=retry_backoff_factor,
-                    status_forcelist=retry_status_forcelist,
-                )
-                session.mount(url, HTTPAdapter(max_retries=retries))
+                # pooled session, with retries configured for this provider
+                session = get_provider_session(self.provider, self.config)
 
-                response = session.get(
+                def send(headers: Dict[str, str]) -> Response:
+                    response = session.get(
+                        url,
+                        timeout=timeout,
+                        headers=dict(USER_AGENT, **headers),
+                        verify=ssl_verify,
+                        **kwargs,
+                    )
+                    response.raise_for_status()
+                    return response
+
+                response = cached_request(
+                    self.provider,
+                    self.config,
+                    "GET",
                     url,
-                    timeout=timeout,
-                    headers=USER_AGENT,
-                    verify=ssl_verify,
-                    **kwargs,
+                    send,
+                    auth=kwargs.get("auth"),
                 )
-                response.raise_for_status()
         except requests.exceptions.Timeout as exc:
             raise TimeOutError(exc, timeout=timeout) from exc
         except (requests.RequestException, URLError) as err:
             err_msg = err.readlines() if hasattr(err, "readlines") else ""
+            log_error = (
+                logger.exception
+                if prep.log_errors
+                else partial(logger.debug, exc_info=True)
+            )
             if exception_message:
-                logger.exception("%s %s" % (exception_message, err_msg))
+                log_error("%s %s" % (exception_message, err_msg))
             else:
-                logger.exception(
+                log_error(
                     "Skipping error while requesting: %s (provider:%s, plugin:%s): %s",
                     url,
                     self.provider,
@@ -1309,6 +1428,10 @@ class ODataV4Search(QueryStringSearch):
 
     """
 
+    #: per product metadata requests are sent one after another, and each one would run
+    #: the query again
+    async_requests = False
+
     def __init__(self, provider: str, config: PluginConfig) -> None:
         super(ODataV4Search, self).__init__(provider, config)
 
@@ -1335,7 +1458,9 @@ class ODataV4Search(QueryStringSearch):
                 metadata_url = self.get_metadata_search_url(entity)
                 try:
                     logger.debug("Sending metadata request: %s", metadata_url)
-                    response = requests.get(
+                    response = get_provider_session(
+                        self.provider, self.config, retries=False
+                    ).get(
                         metadata_url,
                         headers=USER_AGENT,
                         timeout=HTTP_REQ_TIMEOUT,
@@ -1587,6 +1712,8 @@ class PostJsonSearch(QueryStringSearch):
                 def _request(self, *x, **y):
                     return super(PostJsonSearch, self)._request(*x, **y)
 
+                # results must be normalized before the configuration is restored
+                prep.normalize = True
                 try:
                     eo_products, total_items = super(PostJsonSearch, self).query(
                         prep, **kwargs
@@ -1628,6 +1755,8 @@ class PostJsonSearch(QueryStringSearch):
         raw_search_result = RawSearchResult(provider_results)
         raw_search_result.query_params = prep.query_params
         raw_search_result.product_type_def_params = prep.product_type_def_params
+        if not prep.normalize:
+            return raw_search_result, total_items  # type: ignore[return-value]
 
         eo_products = self.normalize_results(raw_search_result, **kwargs)
         return eo_products, total_items
@@ -1774,19 +1903,35 @@ class PostJsonSearch(QueryStringSearch):
                 logger.debug("Query kwargs: %s" % geojson.dumps(kwargs))
             except TypeError:
                 logger.debug("Query kwargs: %s" % kwargs)
-            response = requests.post(
+            session = get_provider_session(self.provider, self.config, retries=False)
+
+            def send(headers: Dict[str, str]) -> Response:
+                response = session.post(
+                    url,
+                    json=prep.query_params,
+                    headers=dict(USER_AGENT, **headers),
+                    timeout=timeout,
+                    verify=ssl_verify,
+                    **kwargs,
+                )
+                response.raise_for_status()
+                return response
+
+            response = cached_request(
+                self.provider,
+                self.config,
+                "POST",
                 url,
-                json=prep.query_params,
-                headers=USER_AGENT,
-                timeout=timeout,
-                verify=ssl_verify,
-                **kwargs,
+                send,
+                body=prep.query_params,
+                auth=kwargs.get("auth"),
             )
-            response.raise_for_status()
         except requests.exceptions.Timeout as exc:
             raise TimeOutError(exc, timeout=timeout) from exc
         except (requests.RequestException, URLError) as err:
-            response = locals().get("response", Response())
+            # URLError has no response, and error responses are falsy
+            err_response = getattr(err, "response", None)
+            response = err_response if err_response is not None else Response()
             # check if error is identified as auth_error in provider conf
             auth_errors = getattr(self.config, "auth_error_code", [None])
             if not isinstance(auth_errors, list):
@@ -1797,10 +1942,15 @@ class PostJsonSearch(QueryStringSearch):
                     f"HTTP Error {response.status_code} returned.",
                     response.text.strip(),
                 )
+            log_error = (
+                logger.exception
+                if prep.log_errors
+                else partial(logger.debug, exc_info=True)
+            )
             if exception_message:
-                logger.exception(exception_message)
+                log_error(exception_message)
             else:
-                logger.exception(
+                log_error(
                     "Skipping error while requesting: %s (provider:%s, plugin:%s):",
                     url,
                     self.provider,
@@ -18,6 +18,7 @@
 from __future__ import annotations
 
 import logging
+import os
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 from unittest import mock
 
@@ -31,11 +32,13 @@ from eodag.plugins.crunch.filter_property import FilterProperty
 from eodag.plugins.search import PreparedSearch
 from eodag.plugins.search.qssearch import StacSearch
 from eodag.utils import HTTP_REQ_TIMEOUT, MockResponse
-from eodag.utils.stac_reader import fetch_stac_collections, fetch_stac_items
+from eodag.utils.stac_index import StacItemsIndex
+from eodag.utils.stac_reader import fetch_stac_collections
 
 if TYPE_CHECKING:
     from eodag.api.product import EOProduct
     from eodag.config import PluginConfig
+    from eodag.plugins.crunch.base import Crunch
 
 
 logger = logging.getLogger("eodag.search.static_stac_search")
@@ -44,8 +47,10 @@ logger = logging.getLogger("eodag.search.static_stac_search")
 class StaticStacSearch(StacSearch):
     """Static STAC Catalog search plugin
 
-    This plugin first loads all STAC items found in the catalog, and converts them to
-    EOProducts using :class:`~eodag.plugins.search.qssearch.StacSearch`.
+    This plugin keeps a local index of all STAC items found in the catalog (see
+    :class:`~eodag.utils.stac_index.StacItemsIndex`), which is refreshed incrementally.
+    Items matching the query time and space extents are taken from the index and converted
+    to EOProducts using :class:`~eodag.plugins.search.qssearch.StacSearch`.
     Then it uses crunchers to only keep products matching query parameters.
 
     The plugin inherits the configuration parameters from :class:`~eodag.plugins.search.qssearch.PostJsonSearch`
@@ -60,9 +65,16 @@ class StaticStacSearch(StacSearch):
           connections for HTTP requests; default: ``100``
         * :attr:`~eodag.config.PluginConfig.timeout` (``int``): Timeout in seconds for each
           internal HTTP request; default: ``5``
+        * :attr:`~eodag.config.PluginConfig.index_dir` (``str``): Directory where the catalog index
+          is persisted; default: ``.stac_index`` in eodag configuration directory
+        * :attr:`~eodag.config.PluginConfig.index_ttl` (``int``): Duration in seconds during which the
+          catalog index is used without being refreshed; default: ``600``
 
     """
 
+    #: the catalog is not fetched using the provider pooled session
+    async_requests = False
+
     def __init__(self, provider: str, config: PluginConfig) -> None:
         # prevent search parameters from being queried when they are known in the configuration or not
         for param, mapping in config.metadata_mapping.items():
@@ -78,6 +90,18 @@ class StaticStacSearch(StacSearch):
         self.config.__dict__.setdefault("max_connections", 100)
         self.config.__dict__.setdefault("timeout", HTTP_REQ_TIMEOUT)
         self.config.__dict__.setdefault("ssl_verify", True)
+        self.config.__dict__.setdefault(
+            "index_dir",
+            os.path.join(
+                os.getenv(
+                    "EODAG_CFG_DIR",
+                    os.path.join(os.path.expanduser("~"), ".config", "eodag"),
+                ),
+                ".stac_index",
+            ),
+        )
+        self.config.__dict__.setdefault("index_ttl", 600)
+        self._indexes: Dict[str, StacItemsIndex] = {}
         self.config.__dict__.setdefault("pagination", {})
         self.config.__dict__["pagination"].setdefault(
             "total_items_nb_key_path", "$.null"
@@ -123,6 +147,25 @@ class StaticStacSearch(StacSearch):
 
         return conf_update_dict
 
+    def get_index(self, stac_path: str) -> StacItemsIndex:
+        """Get the refreshed local index of the given STAC catalog
+
+        :param stac_path: A STAC catalog or item path or url
+        :returns: The catalog index
+        """
+        if stac_path not in self._indexes:
+            self._indexes[stac_path] = StacItemsIndex(
+                stac_path,
+                index_dir=self.config.index_dir,
+                ttl=float(self.config.index_ttl),
+                max_connections=self.config.max_connections,
+                timeout=int(self.config.timeout),
+                ssl_verify=self.config.ssl_verify,
+            )
+        index = self._indexes[stac_path]
+        index.refresh()
+        return index
+
     def query(
         self,
         prep: PreparedSearch = PreparedSearch(),
@@ -155,48 +198,87 @@ class StaticStacSearch(StacSearch):
                 collection=collection
             )
 
-        features = fetch_stac_items(
-            search_endpoint,
-            recursive=True,
-            max_connections=self.config.max_connections,
-            timeout=int(self.config.timeout),
-            ssl_verify=self.config.ssl_verify,
+        # candidate items, using the catalog index
+        features = self.get_index(search_endpoint).search(
+            start=kwargs.get("startTimeFromAscendingNode"),
+            end=kwargs.get("completionTimeFromAscendingNode"),
+            geometry=kwargs.get("geometry"),
         )
-        nb_features = len(features)
-        feature_collection = geojson.FeatureCollection(features)
+        crunchers = self._get_crunchers(dict(kwargs))
 
-        # query on mocked StacSearch._request
-        with mock.patch(
-            "eodag.plugins.search.qssearch.StacSearch._request",
-            autospec=True,
-            return_value=MockResponse(feature_collection, 200),
-        ):
-            eo_products, _ = super(StaticStacSearch, self).query(
-                PreparedSearch(items_per_page=nb_features, page=1, count=True), **kwargs
-            )
-        # filter using query params
-        search_result = SearchResult(eo_products)
+        # requested page of the matching products
+        if prep.items_per_page is not None and prep.items_per_page > 0:
+            page_start = ((prep.page or 1) - 1) * prep.items_per_page
+            page_stop: Optional[int] = page_start + prep.items_per_page
+            chunk_size = prep.items_per_page
+        else:
+            page_start, page_stop = 0, None
+            chunk_size = max(1, len(features))
+
+        # candidates are converted and filtered by chunks, until the requested page is
+        # complete or, if products must be counted, until all candidates are filtered
+        matching: List[EOProduct] = []
+        for chunk_start in range(0, len(features), chunk_size):
+            if page_stop is not None and len(matching) >= page_stop and not prep.count:
+                break
+            chunk = features[chunk_start : chunk_start + chunk_size]
+            # query on mocked StacSearch._request
+            with mock.patch(
+                "eodag.plugins.search.qssearch.StacSearch._request",
+                autospec=True,
+                return_value=MockResponse(geojson.FeatureCollection(chunk), 200),
+            ):
+                eo_products, _ = super(StaticStacSearch, self).query(
+                    PreparedSearch(items_per_page=len(chunk), page=1, count=True),
+                    **kwargs,
+                )
+            search_result = SearchResult(eo_products)
+            for cruncher, search_params in crunchers:
+                search_result = search_result.crunch(cruncher, **search_params)
+            matching.extend(search_result.data)
+
+        return (
+            matching[page_start:page_stop],
+            len(matching) if prep.count else None,
+        )
+
+    @staticmethod
+    def _get_crunchers(kwargs: Dict[str, Any]) -> List[Tuple[Crunch, Dict[str, Any]]]:
+        """Crunchers keeping the products matching the query parameters, with their
+        search parameters. They filter products one by one, and can be applied to any
+        chunk of the search results.
+
+        :param kwargs: The query parameters, modified by this method
+        :returns: The crunchers and their search parameters
+        """
+        crunchers: List[Tuple[Crunch, Dict[str, Any]]] = []
         # Filter by date
         if "startTimeFromAscendingNode" in kwargs:
             kwargs["start"] = kwargs.pop("startTimeFromAscendingNode")
         if "completionTimeFromAscendingNode" in kwargs:
             kwargs["end"] = kwargs.pop("completionTimeFromAscendingNode")
         if any(k in ["start", "end"] for k in kwargs.keys()):
-            search_result = search_result.crunch(
-                FilterDate({k: kwargs[k] for k in ["start", "end"] if k in kwargs})
+            crunchers.append(
+                (
+                    FilterDate({k: kwargs[k] for k in ["start", "end"] if k in kwargs}),
+                    {},
+                )
             )
 
         # Filter by geometry
         geometry = kwargs.pop("geometry", None)
         if geometry:
-            search_result = search_result.crunch(
-                FilterOverlap({"intersects": True}), geometry=geometry
+            crunchers.append(
+                (FilterOverlap({"intersects": True}), {"geometry": geometry})
             )
         # Filter by cloudCover
         if "cloudCover" in kwargs.keys():
-            search_result = search_result.crunch(
-                FilterProperty(
-                    {"cloudCover": kwargs.pop("cloudCover"), "operator": "lt"}
+            crunchers.append(
+                (
+                    FilterProperty(
+                        {"cloudCover": kwargs.pop("cloudCover"), "operator": "lt"}
+                    ),
+                    {},
                 )
             )
         # Filter by other properties
@@ -211,12 +293,12 @@ class StaticStacSearch(StacSearch):
         ]
         for property_key, property_value in kwargs.items():
             if property_key not in skip_eodag_internal_parameters:
-                search_result = search_result.crunch(
-                    FilterProperty({property_key: property_value, "operator": "eq"})
+                crunchers.append(
+                    (
+                        FilterProperty(
+                            {property_key: property_value, "operator": "eq"}
+                        ),
+                        {},
+                    )
                 )
-
-        return (
-            (search_result.data, len(search_result))
-            if prep.count
-            else (search_result.data, None)
-        )
+        return crunchers
@@ -15,32 +15,464 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from __future__ import annotations
+
+import asyncio
+import copy
 import logging
-from typing import Any, Callable, Coroutine, Dict, TypeVar, cast
+import os
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterable,
+    MutableMapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    cast,
+)
 
 import orjson
-from cachetools import LRUCache
+from cachetools import LRUCache, TTLCache
 from fastapi import FastAPI, Request
 
+from eodag.api.product import AssetsDict
+from eodag.api.product.metadata_mapping import ONLINE_STATUS
 from eodag.rest.config import Settings
-from eodag.utils import urlsplit
+from eodag.rest.constants import CACHE_POLL_INTERVAL
+from eodag.utils import deepcopy, urlsplit
+
+if TYPE_CHECKING:
+    from eodag.api.product import EOProduct
 
 logger = logging.getLogger("eodag.rest.utils")
 
 T = TypeVar("T")
 
 
+class CacheBackend:
+    """Base class of the server cache backends, storing serialized results per key.
+
+    Concurrent computations of the same result in a worker are collapsed by :func:`cached`
+    using :attr:`pending`. Backends shared by several workers can also implement
+    :meth:`acquire` and :meth:`release` so that only one worker computes a missing result.
+
+    :param ttl: time to live of the cached results, in seconds; ``0`` for no expiration
+    """
+
+    #: Whether the backend methods do blocking I/O, and must not run in the event loop
+    blocking = False
+
+    def __init__(self, ttl: int = 0) -> None:
+        self.ttl = ttl
+        #: Results being computed in this worker, per key
+        self.pending: Dict[str, "asyncio.Future[Tuple[Any, Optional[bytes]]]"] = {}
+
+    async def run(self, method: Callable[..., T], *args: Any) -> T:
+        """Run one of the backend methods from the event loop, in the default executor
+        if the backend is :attr:`blocking`
+
+        :param method: backend method
+        :param args: method arguments
+        :returns: the method result
+        """
+        if not self.blocking:
+            return method(*args)
+        return await asyncio.get_running_loop().run_in_executor(None, method, *args)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Get a cached result
+
+        :param key: cache key
+        :returns: the serialized result, or ``None`` if not cached or expired
+        """
+        raise NotImplementedError
+
+    def set(self, key: str, value: bytes) -> None:
+        """Store a result
+
+        :param key: cache key
+        :param value: serialized result
+        """
+        raise NotImplementedError
+
+    def acquire(self, key: str, lease: float) -> bool:
+        """Try to become the only worker computing the result of a key
+
+        :param key: cache key
+        :param lease: duration after which the lock is released anyway, in seconds
+        :returns: ``False`` if another worker is already computing the result
+        """
+        return True
+
+    def release(self, key: str) -> None:
+        """Release a lock obtained with :meth:`acquire`
+
+        :param key: cache key
+        """
+        pass
+
+    def clear(self) -> None:
+        """Remove all cached results"""
+        raise NotImplementedError
+
+
+class MemoryCacheBackend(CacheBackend):
+    """:class:`CacheBackend` stored in the worker memory, with a size limit and an
+    expiration of its entries
+
+    :param maxsize: maximum number of cached results
+    :param ttl: time to live of the cached results, in seconds; ``0`` for no expiration
+    """
+
+    def __init__(self, maxsize: int, ttl: int = 0) -> None:
+        super(MemoryCacheBackend, self).__init__(ttl)
+        self._cache: MutableMapping[str, bytes] = (
+            TTLCache(maxsize=maxsize, ttl=ttl) if ttl > 0 else LRUCache(maxsize=maxsize)
+        )
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Get a cached result
+
+        :param key: cache key
+        :returns: the serialized result, or ``None`` if not cached or expired
+        """
+        return self._cache.get(key)
+
+    def set(self, key: str, value: bytes) -> None:
+        """Store a result
+
+        :param key: cache key
+        :param value: serialized result
+        """
+        self._cache[key] = value
+
+    def clear(self) -> None:
+        """Remove all cached results"""
+        self._cache.clear()
+
+
+class SqliteCacheBackend(CacheBackend):
+    """:class:`CacheBackend` stored in a local SQLite database, shared by all the workers
+    of a host.
+
+    Entries expire after ``ttl`` seconds; when more than ``maxsize`` results are stored,
+    those expiring first are evicted. Locks stored in the database let only one worker
+    compute a missing result while the others wait for it.
+
+    :param path: path of the database file
+    :param maxsize: maximum number of cached results
+    :param ttl: time to live of the cached results, in seconds; ``0`` for no expiration
+    """
+
+    blocking = True
+
+    def __init__(self, path: str, maxsize: int, ttl: int = 0) -> None:
+        super(SqliteCacheBackend, self).__init__(ttl)
+        self.path = path
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._pid: Optional[int] = None
+        self._connection: Optional[sqlite3.Connection] = None
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries "
+                "(key TEXT PRIMARY KEY, value BLOB, expires REAL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS entries_expires ON entries (expires)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS locks (key TEXT PRIMARY KEY, expires REAL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        """Connection of the current process, connections cannot be shared by forked workers"""
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = sqlite3.connect(
+                self.path, timeout=30, check_same_thread=False, isolation_level=None
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._pid = os.getpid()
+        return self._connection
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Get a cached result
+
+        :param key: cache key
+        :returns: the serialized result, or ``None`` if not cached or expired
+        """
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT value FROM entries WHERE key = ? AND expires > ?",
+                    (key, time.time()),
+                )
+                .fetchone()
+            )
+        return row[0] if row else None
+
+    def set(self, key: str, value: bytes) -> None:
+        """Store a result, evicting the results expiring first if needed
+
+        :param key: cache key
+        :param value: serialized result
+        """
+        now = time.time()
+        expires = now + self.ttl if self.ttl > 0 else float("inf")
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?)", (key, value, expires)
+            )
+            count = connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            if count <= self.maxsize:
+                return
+            count -= connection.execute(
+                "DELETE FROM entries WHERE expires <= ?", (now,)
+            ).rowcount
+            if count > self.maxsize:
+                connection.execute(
+                    "DELETE FROM entries WHERE key IN "
+                    "(SELECT key FROM entries WHERE key != ? ORDER BY expires LIMIT ?)",
+                    (key, count - self.maxsize),
+                )
+
+    def acquire(self, key: str, lease: float) -> bool:
+        """Try to become the only worker computing the result of a key
+
+        :param key: cache key
+        :param lease: duration after which the lock is released anyway, in seconds
+        :returns: ``False`` if another worker is already computing the result
+        """
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = connection.execute(
+                    "SELECT expires FROM locks WHERE key = ?", (key,)
+                ).fetchone()
+                if row and row[0] > now:
+                    return False
+                connection.execute(
+                    "INSERT OR REPLACE INTO locks VALUES (?, ?)", (key, now + lease)
+                )
+                return True
+            finally:
+                connection.execute("COMMIT")
+
+    def release(self, key: str) -> None:
+        """Release a lock obtained with :meth:`acquire`
+
+        :param key: cache key
+        """
+        with self._lock:
+            self._connect().execute("DELETE FROM locks WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """Remove all cached results"""
+        with self._lock:
+            self._connect().execute("DELETE FROM entries")
+
+
+class ProductsCache:
+    """Products recently returned by searches, to find them by id without searching them
+    again from their provider.
+
+    Products are found by provider and id, or by id only if they were returned by a search
+    made without provider. Copies of the products are stored and returned, so that they
+    can be updated by the caller. Products which are not online are not stored, so that
+    their storage status is refreshed by searching them again.
+
+    :param maxsize: maximum number of cached products
+    :param ttl: time to live of the cached products, in seconds
+    """
+
+    def __init__(self, maxsize: int, ttl: int) -> None:
+        self._cache: TTLCache[Tuple[Optional[str], str], EOProduct] = TTLCache(
+            maxsize=maxsize, ttl=ttl
+        )
+        self._lock = threading.Lock()
+
+    def add(self, products: Iterable[EOProduct], any_provider: bool = False) -> None:
+        """Store products
+
+        :param products: products to store
+        :param any_provider: whether the products are also found when no provider is given,
+                             i.e. they were returned by a search made without provider
+        """
+        with self._lock:
+            for product in products:
+                product_id = product.properties.get("id")
+                if (
+                    not product_id
+                    or product.properties.get("storageStatus", ONLINE_STATUS)
+                    != ONLINE_STATUS
+                ):
+                    continue
+                product_copy = self._copy(product)
+                self._cache[(product.provider, product_id)] = product_copy
+                if any_provider:
+                    self._cache[(None, product_id)] = product_copy
+
+    def get(
+        self,
+        product_id: str,
+        product_type: Optional[str] = None,
+        provider: Optional[str] = None,
+    ) -> Optional[EOProduct]:
+        """Get a copy of a stored product
+
+        :param product_id: id of the product
+        :param product_type: (optional) product type the product must have
+        :param provider: (optional) provider of the product
+        :returns: the product, or ``None`` if not stored or expired
+        """
+        with self._lock:
+            product = self._cache.get((provider, product_id))
+        if product is None or (
+            product_type is not None and product.product_type != product_type
+        ):
+            return None
+        return self._copy(product)
+
+    @staticmethod
+    def _copy(product: EOProduct) -> EOProduct:
+        """Copy of a product which can be updated without updating the original one"""
+        product_copy = copy.copy(product)
+        product_copy.properties = deepcopy(product.properties)
+        product_copy.search_kwargs = dict(product.search_kwargs)
+        product_copy.assets = AssetsDict(
+            product_copy, deepcopy(product.assets.as_dict())
+        )
+        return product_copy
+
+    def clear(self) -> None:
+        """Remove all stored products"""
+        with self._lock:
+            self._cache.clear()
+
+
+@lru_cache(maxsize=1)
+def get_products_cache() -> Optional[ProductsCache]:
+    """Products cache of the worker, configured with ``EODAG_PRODUCTS_CACHE_TTL`` and
+    ``EODAG_PRODUCTS_CACHE_MAXSIZE``
+
+    :returns: the products cache, or ``None`` if disabled
+    """
+    settings = Settings.from_environment()
+    if settings.products_cache_ttl <= 0 or settings.products_cache_maxsize <= 0:
+        return None
+    return ProductsCache(settings.products_cache_maxsize, settings.products_cache_ttl)
+
+
 def init_cache(app: FastAPI) -> None:
-    """Connect to local cache"""
+    """Connect to the cache backend configured with ``EODAG_CACHE_BACKEND``:
+    ``memory`` (default) for a cache local to each worker, or ``sqlite`` for a cache shared
+    by all the workers of the host, stored in ``EODAG_CACHE_PATH``"""
     settings = Settings.from_environment()
 
-    app.state.cache = LRUCache(maxsize=settings.cache_maxsize)
+    if settings.cache_backend == "sqlite":
+        cache_path = settings.cache_path or os.path.join(
+            os.getenv(
+                "EODAG_CFG_DIR",
+                os.path.join(os.path.expanduser("~"), ".config", "eodag"),
+            ),
+            ".server_cache.sqlite",
+        )
+        app.state.cache = SqliteCacheBackend(
+            cache_path, maxsize=settings.cache_maxsize, ttl=settings.cache_ttl
+        )
+    elif settings.cache_backend == "memory":
+        app.state.cache = MemoryCacheBackend(
+            maxsize=settings.cache_maxsize, ttl=settings.cache_ttl
+        )
+    else:
+        raise ValueError(
+            f"Unknown cache backend {settings.cache_backend}, "
+            "should be one of 'memory' or 'sqlite'"
+        )
+
+
+async def _compute(
+    fn: Callable[[], Coroutine[Any, Any, T]],
+    key: str,
+    cache: CacheBackend,
+    settings: Settings,
+) -> Tuple[T, Optional[bytes]]:
+    """Run the function and cache its result, or wait for the result of another worker.
+
+    Waiting workers try to acquire the lock again while polling the cache, so that one of
+    them computes the result if the worker holding the lock released it without result.
+    """
+    try:
+        acquired = await cache.run(cache.acquire, key, settings.cache_lock_timeout)
+    except Exception as e:
+        logger.error(f"Error in cache: {e}")
+        if settings.debug:
+            raise
+        acquired = True
+
+    if not acquired:
+        logger.debug("Waiting for the result of an identical request of another worker")
+    while not acquired:
+        await asyncio.sleep(CACHE_POLL_INTERVAL)
+        try:
+            if (dumped := await cache.run(cache.get, key)) is not None:
+                return orjson.loads(dumped), dumped
+            acquired = await cache.run(cache.acquire, key, settings.cache_lock_timeout)
+            # the result may have been stored just before the lock was released
+            if acquired and (dumped := await cache.run(cache.get, key)) is not None:
+                await cache.run(cache.release, key)
+                return orjson.loads(dumped), dumped
+        except Exception as e:
+            logger.error(f"Error in cache: {e}")
+            if settings.debug:
+                raise
+            break
+
+    try:
+        result = await fn()
+
+        dumped = None
+        try:
+            dumped = orjson.dumps(result)
+            await cache.run(cache.set, key, dumped)
+        except Exception as e:
+            logger.error(f"Error in cache: {e}")
+            if settings.debug:
+                raise
+    finally:
+        if acquired:
+            try:
+                await cache.run(cache.release, key)
+            except Exception as e:
+                logger.error(f"Error in cache: {e}")
+
+    return result, dumped
 
 
 async def cached(
     fn: Callable[[], Coroutine[Any, Any, T]], cache_key: str, request: Request
 ) -> T:
-    """Either get the result from local cache or run the function and cache the result."""
+    """Either get the result from cache or run the function and cache the result.
+
+    Identical requests received while the result is being computed wait for it instead of
+    running the function again. The computation runs in its own task, so that it is not
+    cancelled with the request which started it while other requests wait for it.
+    """
     settings = Settings.from_environment()
 
     host = urlsplit(cast(str, request.state.url_root)).netloc
@@ -48,23 +480,34 @@ async def cached(
     host_cache_key = f"{cache_key}:{host}"
 
     try:
-        c: Dict[str, Any] = request.app.state.cache
+        c: CacheBackend = request.app.state.cache
 
-        if cached := c.get(host_cache_key):
+        if (cached := await c.run(c.get, host_cache_key)) is not None:
             logger.debug("Cache result hit")
             return orjson.loads(cached)  # type: ignore
     except Exception as e:
         logger.error(f"Error in cache: {e}")
         if settings.debug:
             raise
+        if not isinstance(getattr(request.app.state, "cache", None), CacheBackend):
+            return await fn()
 
-    result = await fn()
+    if (pending := c.pending.get(host_cache_key)) is not None:
+        logger.debug("Waiting for the result of an identical request")
+        result, dumped = await asyncio.shield(pending)
+        # each request gets its own copy of the result
+        return orjson.loads(dumped) if dumped is not None else result
 
-    try:
-        c[host_cache_key] = orjson.dumps(result)  # type: ignore
-    except Exception as e:
-        logger.error(f"Error in cache: {e}")
-        if settings.debug:
-            raise
+    task = asyncio.ensure_future(_compute(fn, host_cache_key, c, settings))
+    c.pending[host_cache_key] = task
+
+    def done(task: asyncio.Future[Tuple[Any, Optional[bytes]]]) -> None:
+        del c.pending[host_cache_key]
+        # mark the exception as retrieved, even if all the waiting requests were cancelled
+        if not task.cancelled():
+            task.exception()
+
+    task.add_done_callback(done)
 
+    result, dumped = await asyncio.shield(task)
     return result
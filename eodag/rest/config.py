@@ -18,14 +18,20 @@
 from __future__ import annotations
 
 from functools import lru_cache
-from typing import Annotated, List, Union
+from typing import Annotated, List, Literal, Optional, Union
 
 from pydantic import Field
 from pydantic.functional_validators import BeforeValidator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing_extensions import Doc
 
-from eodag.rest.constants import DEFAULT_MAXSIZE, DEFAULT_TTL
+from eodag.rest.constants import (
+    DEFAULT_CACHE_LOCK_TIMEOUT,
+    DEFAULT_MAXSIZE,
+    DEFAULT_PRODUCTS_CACHE_MAXSIZE,
+    DEFAULT_PRODUCTS_CACHE_TTL,
+    DEFAULT_TTL,
+)
 
 
 def str2liststr(raw: Union[str, List[str]]) -> List[str]:
@@ -41,6 +47,31 @@ class Settings(BaseSettings):
     # local cache config
     cache_ttl: int = Field(default=DEFAULT_TTL)
     cache_maxsize: int = Field(default=DEFAULT_MAXSIZE)
+    cache_backend: Annotated[
+        Literal["memory", "sqlite"],
+        Doc(
+            "Cache local to each worker (memory), or shared by the workers of the host (sqlite)"
+        ),
+    ] = "memory"
+    cache_path: Annotated[
+        Optional[str],
+        Doc("Database file of the sqlite cache backend"),
+    ] = None
+    cache_lock_timeout: Annotated[
+        float,
+        Doc("Maximum time waiting for a result computed by another worker, in seconds"),
+    ] = Field(default=DEFAULT_CACHE_LOCK_TIMEOUT)
+    products_cache_ttl: Annotated[
+        int,
+        Doc(
+            "Time during which products returned by searches are found by id without "
+            "searching them again, in seconds; 0 to disable"
+        ),
+    ] = Field(default=DEFAULT_PRODUCTS_CACHE_TTL)
+    products_cache_maxsize: Annotated[
+        int,
+        Doc("Maximum number of products kept to be found by id"),
+    ] = Field(default=DEFAULT_PRODUCTS_CACHE_MAXSIZE)
 
     debug: bool = False
 
@@ -19,6 +19,13 @@
 DEFAULT_TTL = 600  # 10 min
 
 DEFAULT_MAXSIZE = 2048  # local cache maxsize
+# products returned by searches, kept to be found by id
+DEFAULT_PRODUCTS_CACHE_TTL = 300  # 5 min
+DEFAULT_PRODUCTS_CACHE_MAXSIZE = 10000
+# maximum time waiting for the result of an identical request computed by another worker
+DEFAULT_CACHE_LOCK_TIMEOUT = 60
+# interval between two checks of the result of another worker
+CACHE_POLL_INTERVAL = 0.05
 
 CACHE_KEY_COLLECTIONS = "collections"
 CACHE_KEY_COLLECTION = "collection"
@@ -17,10 +17,12 @@
 # limitations under the License.
 from __future__ import annotations
 
+import asyncio
 import datetime
 import logging
 import os
 import re
+from functools import partial
 from typing import TYPE_CHECKING, cast
 from unittest.mock import Mock
 
@@ -44,7 +46,7 @@ from eodag.config import load_stac_config
 from eodag.plugins.crunch.filter_latest_intersect import FilterLatestIntersect
 from eodag.plugins.crunch.filter_latest_tpl_name import FilterLatestByName
 from eodag.plugins.crunch.filter_overlap import FilterOverlap
-from eodag.rest.cache import cached
+from eodag.rest.cache import cached, get_products_cache
 from eodag.rest.constants import (
     CACHE_KEY_COLLECTION,
     CACHE_KEY_COLLECTIONS,
@@ -67,11 +69,11 @@ from eodag.utils import (
     deepcopy,
     dict_items_recursive_apply,
     format_dict_items,
-    obj_md5sum,
     urlencode,
 )
 from eodag.utils.exceptions import (
     MisconfiguredError,
+    NoMatchingProductType,
     NotAvailableError,
     ValidationError,
 )
@@ -127,7 +129,7 @@ def format_product_types(product_types: List[Dict[str, Any]]) -> str:
     return "\n".join(sorted(result))
 
 
-def search_stac_items(
+async def search_stac_items(
     request: Request,
     search_request: SearchPostRequest,
 ) -> Dict[str, Any]:
@@ -176,15 +178,9 @@ def search_stac_items(
 
     # get products by ids
     if eodag_args.ids:
-        results = SearchResult([])
-        for item_id in eodag_args.ids:
-            results.extend(
-                eodag_api.search(
-                    id=item_id,
-                    productType=eodag_args.productType,
-                    provider=eodag_args.provider,
-                )
-            )
+        results = await search_products_by_ids(
+            eodag_args.ids, eodag_args.productType, eodag_args.provider
+        )
         results.number_matched = len(results)
         total = len(results)
 
@@ -198,9 +194,12 @@ def search_stac_items(
                 new_key = key.split(":")[1]
                 criteria[new_key] = criteria.pop(key)
 
-        results = eodag_api.search(count=True, **criteria)
+        results = await eodag_api.async_search(count=True, **criteria)
         total = results.number_matched or 0
 
+    if products_cache := get_products_cache():
+        products_cache.add(results, any_provider=eodag_args.provider is None)
+
     if len(results) == 0 and results.errors:
         raise ResponseSearchError(results.errors)
 
@@ -230,7 +229,65 @@ def search_stac_items(
     return items
 
 
-def download_stac_item(
+def _get_cached_product(
+    item_id: str, product_type: Optional[str], provider: Optional[str]
+) -> Optional[EOProduct]:
+    """Product recently returned by a search, if the products cache is enabled"""
+    if not (products_cache := get_products_cache()):
+        return None
+    if product_type:
+        try:
+            product_type = eodag_api.get_product_type_from_alias(product_type)
+        except NoMatchingProductType:
+            pass
+    return products_cache.get(item_id, product_type, provider)
+
+
+async def search_products_by_ids(
+    ids: List[str], product_type: Optional[str], provider: Optional[str]
+) -> SearchResult:
+    """Get products by ids.
+
+    Products recently returned by a search are taken from the products cache, the others are
+    searched concurrently.
+
+    :param ids: ids of the products
+    :param product_type: (optional) product type of the products
+    :param provider: (optional) provider of the products
+    :returns: the products found, in the order of their ids
+    """
+    cached_products = {
+        item_id: _get_cached_product(item_id, product_type, provider) for item_id in ids
+    }
+    missing_ids = [item_id for item_id, p in cached_products.items() if p is None]
+    if cached_products and len(missing_ids) < len(cached_products):
+        logger.debug(
+            "%s product(s) found in cache", len(cached_products) - len(missing_ids)
+        )
+    searched_products = dict(
+        zip(
+            missing_ids,
+            await asyncio.gather(
+                *(
+                    eodag_api.async_search(
+                        id=item_id, productType=product_type, provider=provider
+                    )
+                    for item_id in missing_ids
+                )
+            ),
+        )
+    )
+
+    results = SearchResult([])
+    for item_id in ids:
+        if (product := cached_products.get(item_id)) is not None:
+            results.append(product)
+        elif item_id in searched_products:
+            results.extend(searched_products[item_id])
+    return results
+
+
+async def download_stac_item(
     request: Request,
     collection_id: str,
     item_id: str,
@@ -248,24 +305,34 @@ def download_stac_item(
     """
     product_type = collection_id
 
-    search_results = eodag_api.search(
-        id=item_id, productType=product_type, provider=provider, **kwargs
-    )
-    if len(search_results) > 0:
-        product = cast(EOProduct, search_results[0])
-
-    else:
-        raise NotAvailableError(
-            f"Could not find {item_id} item in {product_type} collection"
-            + (f" for provider {provider}" if provider else "")
+    loop = asyncio.get_running_loop()
+    # order arguments need a new search of the product
+    product = None if kwargs else _get_cached_product(item_id, product_type, provider)
+    if product is None:
+        search_results = await eodag_api.async_search(
+            id=item_id, productType=product_type, provider=provider, **kwargs
         )
-    auth = product.downloader_auth.authenticate() if product.downloader_auth else None
+        if len(search_results) > 0:
+            product = cast(EOProduct, search_results[0])
+
+        else:
+            raise NotAvailableError(
+                f"Could not find {item_id} item in {product_type} collection"
+                + (f" for provider {provider}" if provider else "")
+            )
+    auth = (
+        await loop.run_in_executor(None, product.downloader_auth.authenticate)
+        if product.downloader_auth
+        else None
+    )
 
     try:
         if product.properties.get("orderLink"):
-            _order_and_update(product, auth, kwargs)
+            await loop.run_in_executor(
+                None, partial(_order_and_update, product, auth, kwargs)
+            )
 
-        download_stream = product.downloader._stream_download_dict(
+        download_stream = await product.downloader._async_stream_download_dict(
             product,
             auth=auth,
             asset=asset,
@@ -278,7 +345,9 @@ def download_stac_item(
             product.downloader,
         )
         download_stream = file_to_stream(
-            eodag_api.download(product, extract=False, asset=asset)
+            await loop.run_in_executor(
+                None, partial(eodag_api.download, product, extract=False, asset=asset)
+            )
         )
     except NotAvailableError:
         if product.properties.get("storageStatus") != ONLINE_STATUS:
@@ -749,10 +818,6 @@ def eodag_api_init() -> None:
             clean = {k: v for k, v in update_fields.items() if v}
             p_f.update(clean)
 
-    eodag_api.product_types_config_md5 = obj_md5sum(
-        eodag_api.product_types_config.source
-    )
-
     eodag_api.build_index()
 
     # pre-build search plugins
@@ -35,7 +35,6 @@ from typing import (
 
 from fastapi import APIRouter as FastAPIRouter
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
 from fastapi.responses import ORJSONResponse
@@ -68,6 +67,7 @@ from eodag.rest.utils import (
     str2list,
 )
 from eodag.utils import parse_header, update_nested_dict
+from eodag.utils.requests import sessions_registry
 
 if TYPE_CHECKING:
     from fastapi.types import DecoratedCallable
@@ -117,6 +117,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     eodag_api_init()
     init_cache(app)
     yield
+    await sessions_registry.aclose()
 
 
 app = FastAPI(lifespan=lifespan, title="EODAG", docs_url="/api.html")
@@ -235,7 +236,7 @@ async def catalogs_root(request: Request) -> ORJSONResponse:
 
 
 @router.api_route(methods=["GET", "HEAD"], path="/conformance", tags=["Capabilities"])
-def conformance(request: Request) -> ORJSONResponse:
+async def conformance(request: Request) -> ORJSONResponse:
     """STAC conformance"""
     logger.info(f"{request.method} {request.state.url}")
     response = get_stac_conformance()
@@ -248,7 +249,7 @@ def conformance(request: Request) -> ORJSONResponse:
     path="/extensions/oseo/json-schema/schema.json",
     include_in_schema=False,
 )
-def stac_extension_oseo(request: Request) -> ORJSONResponse:
+async def stac_extension_oseo(request: Request) -> ORJSONResponse:
     """STAC OGC / OpenSearch extension for EO"""
     logger.info(f"{request.method} {request.state.url}")
     response = get_stac_extension_oseo(url=request.state.url)
@@ -262,7 +263,7 @@ def stac_extension_oseo(request: Request) -> ORJSONResponse:
     tags=["Data"],
     include_in_schema=False,
 )
-def stac_collections_item_download(
+async def stac_collections_item_download(
     collection_id: str, item_id: str, request: Request
 ) -> StarletteResponse:
     """STAC collection item download"""
@@ -271,7 +272,7 @@ def stac_collections_item_download(
     arguments = dict(request.query_params)
     provider = arguments.pop("provider", None)
 
-    return download_stac_item(
+    return await download_stac_item(
         request=request,
         collection_id=collection_id,
         item_id=item_id,
@@ -286,7 +287,7 @@ def stac_collections_item_download(
     tags=["Data"],
     include_in_schema=False,
 )
-def stac_collections_item_download_asset(
+async def stac_collections_item_download_asset(
     collection_id: str, item_id: str, asset: str, request: Request
 ):
     """STAC collection item asset download"""
@@ -295,7 +296,7 @@ def stac_collections_item_download_asset(
     arguments = dict(request.query_params)
     provider = arguments.pop("provider", None)
 
-    return download_stac_item(
+    return await download_stac_item(
         request=request,
         collection_id=collection_id,
         item_id=item_id,
@@ -310,7 +311,7 @@ def stac_collections_item_download_asset(
     tags=["Data"],
     include_in_schema=False,
 )
-def stac_collections_item(
+async def stac_collections_item(
     collection_id: str, item_id: str, request: Request, provider: Optional[str] = None
 ) -> ORJSONResponse:
     """STAC collection item by id"""
@@ -320,7 +321,7 @@ def stac_collections_item(
         provider=provider, ids=[item_id], collections=[collection_id], limit=1
     )
 
-    item_collection = search_stac_items(request, search_request)
+    item_collection = await search_stac_items(request, search_request)
 
     if not item_collection["features"]:
         raise HTTPException(
@@ -337,7 +338,7 @@ def stac_collections_item(
     tags=["Data"],
     include_in_schema=False,
 )
-def stac_collections_items(
+async def stac_collections_items(
     collection_id: str,
     request: Request,
     provider: Optional[str] = None,
@@ -353,7 +354,7 @@ def stac_collections_items(
 ) -> ORJSONResponse:
     """Fetch collection's features"""
 
-    return get_search(
+    return await get_search(
         request=request,
         provider=provider,
         collections=collection_id,
@@ -496,7 +497,7 @@ async def list_queryables(request: Request) -> ORJSONResponse:
     tags=["STAC"],
     include_in_schema=False,
 )
-def get_search(
+async def get_search(
     request: Request,
     provider: Optional[str] = None,
     collections: Optional[str] = None,
@@ -552,7 +553,7 @@ def get_search(
     except pydanticValidationError as e:
         raise HTTPException(status_code=400, detail=format_pydantic_error(e)) from e
 
-    response = search_stac_items(
+    response = await search_stac_items(
         request=request,
         search_request=search_request,
     )
@@ -588,11 +589,7 @@ async def post_search(request: Request) -> ORJSONResponse:
 
     logger.debug("Body: %s", search_request.model_dump(exclude_none=True))
 
-    response = await run_in_threadpool(
-        search_stac_items,
-        request,
-        search_request,
-    )
+    response = await search_stac_items(request, search_request)
 
     return ORJSONResponse(content=response, media_type="application/json")
 
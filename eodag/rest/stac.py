@@ -21,7 +21,7 @@ import logging
 import os
 from collections import defaultdict
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 from urllib.parse import (
     parse_qs,
     quote,
@@ -33,12 +33,15 @@ from urllib.parse import (
 )
 
 import geojson
-from jsonpath_ng.jsonpath import Child
+from jsonpath_ng.jsonpath import Child, Fields, Root
 
 from eodag.api.product.metadata_mapping import (
     DEFAULT_METADATA_MAPPING,
+    SEP,
+    MetadataFormatter,
     format_metadata,
     get_metadata_path,
+    literal_eval_or_self,
 )
 from eodag.rest.config import Settings
 from eodag.rest.utils.rfc3339 import str_to_interval
@@ -46,6 +49,7 @@ from eodag.utils import (
     deepcopy,
     dict_items_recursive_apply,
     format_dict_items,
+    format_string,
     guess_file_type,
     jsonpath_parse_dict_items,
     string_to_jsonpath,
@@ -60,6 +64,9 @@ from eodag.utils.exceptions import (
 from eodag.utils.requests import fetch_json
 
 if TYPE_CHECKING:
+    from jsonpath_ng import JSONPath
+    from shapely.geometry.base import BaseGeometry
+
     from eodag.api.core import EODataAccessGateway
     from eodag.api.product import EOProduct
     from eodag.api.search_result import SearchResult
@@ -96,6 +103,11 @@ IGNORED_ITEM_PROPERTIES = [
     "defaultGeometry",
     "_date",
 ]
+# coordinates precision of geojson objects
+GEOJSON_PRECISION = 6
+
+#: Kinds of nodes of a :class:`CompiledStacItem`
+_CONSTANT, _PATH, _CONVERTED_PATH, _TEMPLATE, _DICT, _LIST = range(6)
 
 
 def _quote_url_path(url: str) -> str:
@@ -105,6 +117,220 @@ def _quote_url_path(url: str) -> str:
     return urlunsplit(components)
 
 
+def _format_item_value(key: Any, value: Any, format_args: Dict[str, Any]) -> Any:
+    """Format a value as :func:`~eodag.utils.format_dict_items` would do, building new
+    containers instead of copying the value first"""
+    if isinstance(value, str):
+        if "{" in value:
+            return format_string(key, value, **format_args)
+        return literal_eval_or_self(value)
+    if isinstance(value, dict):
+        return {k: _format_item_value(k, v, format_args) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_format_item_value(key, v, format_args) for v in value]
+    return value
+
+
+def _round_coordinates(coordinates: Any, precision: int) -> Any:
+    if isinstance(coordinates, (list, tuple)):
+        return [_round_coordinates(c, precision) for c in coordinates]
+    return round(coordinates, precision)
+
+
+def _geometry_to_geojson(geometry: BaseGeometry) -> Dict[str, Any]:
+    """GeoJSON mapping of a shapely geometry, with the coordinates precision used by
+    :mod:`geojson` objects"""
+    geo_interface = getattr(geometry, "__geo_interface__", None)
+    if not isinstance(geo_interface, dict):
+        return geojson.loads(geojson.dumps(geometry))
+    if "geometries" in geo_interface:
+        return {
+            "type": geo_interface["type"],
+            "geometries": [_geometry_to_geojson(g) for g in geometry.geoms],
+        }
+    return {
+        "type": geo_interface["type"],
+        "coordinates": _round_coordinates(
+            geo_interface["coordinates"], GEOJSON_PRECISION
+        ),
+    }
+
+
+def _jsonpath_fields(path: JSONPath) -> Optional[Tuple[str, ...]]:
+    """Fields of a ``$.foo.bar``-like jsonpath, ``None`` for other jsonpaths"""
+    fields: List[str] = []
+    while isinstance(path, Child):
+        if not isinstance(path.right, Fields) or len(path.right.fields) != 1:
+            return None
+        field = path.right.fields[0]
+        if field == "*":
+            return None
+        fields.append(field)
+        path = path.left
+    if not isinstance(path, Root):
+        return None
+    return tuple(reversed(fields))
+
+
+class CompiledStacItem:
+    """STAC item model compiled once for a page of products of the same product type and
+    catalog, then rendered for each product.
+
+    Constant values of the model are formatted once, simple jsonpaths are resolved by
+    direct lookups in the product attributes without copying them, converters are resolved
+    to bound callables, and templates depending on the item itself (e.g. ``bbox`` or
+    ``links``) are formatted once the rest of the item is built. Rendering a product gives
+    the same item as parsing the model jsonpaths on a copy of the product and then
+    formatting the whole item with :func:`~eodag.utils.format_dict_items`.
+
+    :param item_model: Item model, filtered for the product type
+    :param need_conversion: Converter and its args, per item property needing conversion
+    :param format_args: Variables used to format the model, without the ``item`` itself
+    """
+
+    def __init__(
+        self,
+        item_model: Dict[str, Any],
+        need_conversion: Dict[str, Any],
+        format_args: Dict[str, Any],
+    ) -> None:
+        self.format_args = format_args
+        self.need_conversion = need_conversion
+        self._formatter = MetadataFormatter()
+        self.node = self._compile((), item_model)
+
+    def _compile(self, keys: Tuple[Any, ...], value: Any) -> Tuple[Any, ...]:
+        key: Any = keys[-1] if keys else None
+        if isinstance(value, dict):
+            return (
+                _DICT,
+                [(k, self._compile(keys + (k,), v)) for k, v in value.items()],
+            )
+        if isinstance(value, (list, tuple)):
+            return (_LIST, [self._compile(keys + (key,), v) for v in value])
+        if isinstance(value, Child):
+            if keys[:-1] == ("properties",) and key in self.need_conversion:
+                conv_func, conv_args = self.need_conversion[key]
+                converter = None
+                if conv_args is None or not any(c in conv_args for c in ":!{}"):
+                    converter = getattr(self._formatter, f"convert_{conv_func}", None)
+                return (
+                    _CONVERTED_PATH,
+                    key,
+                    value,
+                    _jsonpath_fields(value),
+                    conv_func,
+                    conv_args,
+                    converter,
+                )
+            return (_PATH, key, value, _jsonpath_fields(value))
+        if isinstance(value, str) and "{" in value and "item[" in value:
+            return (_TEMPLATE, key, value)
+        return (_CONSTANT, format_string(key, value, **self.format_args))
+
+    @staticmethod
+    def _find(
+        path: JSONPath, fields: Optional[Tuple[str, ...]], values: Dict[str, Any]
+    ) -> Any:
+        """Value at path, ``None`` if not found as with :func:`~eodag.utils.parse_jsonpath`"""
+        if fields is None:
+            match = path.find(values)
+            return match[0].value if len(match) == 1 else None
+        value: Any = values
+        for field in fields:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(field)
+        return value
+
+    def _render(
+        self,
+        node: Tuple[Any, ...],
+        values: Dict[str, Any],
+        templates: List[Tuple[Any, Any, Any, str]],
+    ) -> Any:
+        kind = node[0]
+        if kind == _CONSTANT:
+            return node[1]
+        if kind == _DICT:
+            rendered_dict: Dict[str, Any] = {}
+            for k, child in node[1]:
+                if child[0] == _TEMPLATE:
+                    # formatted once the whole item is built
+                    templates.append((rendered_dict, k, child[1], child[2]))
+                    rendered_dict[k] = None
+                else:
+                    rendered_dict[k] = self._render(child, values, templates)
+            return rendered_dict
+        if kind == _LIST:
+            rendered_list: List[Any] = []
+            for idx, child in enumerate(node[1]):
+                if child[0] == _TEMPLATE:
+                    templates.append((rendered_list, idx, child[1], child[2]))
+                    rendered_list.append(None)
+                else:
+                    rendered_list.append(self._render(child, values, templates))
+            return rendered_list
+        key, path, fields = node[1:4]
+        value = self._find(path, fields, values)
+        if kind == _PATH:
+            return _format_item_value(key, value, self.format_args)
+        # _CONVERTED_PATH
+        conv_func, conv_args, converter = node[4:]
+        if converter is None:
+            # colon `:` in key breaks format() method, hide it
+            formatable_key = key.replace(":", "")
+            conversion = (
+                f"{conv_func}({conv_args})" if conv_args is not None else conv_func
+            )
+            formatted = format_metadata(
+                "{%s%s%s}" % (formatable_key, SEP, conversion),
+                **{formatable_key: value},
+            )
+        elif value is None:
+            formatted = ""
+        else:
+            converted = (
+                converter(value, conv_args)
+                if conv_args is not None
+                else converter(value)
+            )
+            # same output as format_metadata, which only returns strings
+            formatted = format(converted, "")
+        return _format_item_value(key, formatted, self.format_args)
+
+    def render(
+        self,
+        product: EOProduct,
+        providers: List[Dict[str, Any]],
+        extra_properties: Dict[str, Any],
+        assets: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Build the STAC item of a product
+
+        :param product: EODAG product
+        :param providers: STAC providers of the product
+        :param extra_properties: Additional item properties
+        :param assets: STAC assets of the product
+        :returns: The STAC item, with its geometry still as a shapely geometry
+        """
+        templates: List[Tuple[Any, Any, Any, str]] = []
+        item = self._render(
+            self.node, {"product": product.__dict__, "providers": providers}, templates
+        )
+        for key, value in extra_properties.items():
+            item["properties"][key] = _format_item_value(key, value, self.format_args)
+        item["assets"] = _format_item_value("assets", assets, self.format_args)
+
+        if templates:
+            item_format_args = dict(self.format_args, item=item)
+            for container, container_key, key, template in templates:
+                container[container_key] = format_string(
+                    key, template, **item_format_args
+                )
+        return item
+
+
 class StacCommon:
     """Stac common object
 
@@ -147,17 +373,12 @@ class StacCommon:
             for i, bbox in enumerate(self.data["extent"]["spatial"]["bbox"]):
                 self.data["extent"]["spatial"]["bbox"][i] = [float(x) for x in bbox]
 
-        def apply_method_none(_: str, v: str) -> Optional[str]:
-            """ "None" values to None"""
-            return None if v == "None" else v
-
-        self.data = dict_items_recursive_apply(self.data, apply_method_none)
-
-        def apply_method_ids(k, v):
-            """ids and titles as str"""
+        def apply_method(k: Any, v: Any) -> Any:
+            """ "None" values to None, then ids and titles as str"""
+            v = None if v == "None" else v
             return str(v) if k in ["title", "id"] else v
 
-        self.data = dict_items_recursive_apply(self.data, apply_method_ids)
+        self.data = dict_items_recursive_apply(self.data, apply_method)
 
         # empty stac_extensions: "" to []
         if not self.data.get("stac_extensions", True):
@@ -226,6 +447,8 @@ class StacItem(StacCommon):
             eodag_api=eodag_api,
             root=root,
         )
+        # extensions urls per prefix, built on first use
+        self._all_extensions_dict: Optional[Dict[str, str]] = None
 
     def __get_item_list(
         self, search_results: SearchResult, catalog: Dict[str, Any]
@@ -262,29 +485,30 @@ class StacItem(StacCommon):
             for p in item_model["properties"].values()
             if isinstance(p, Child)
         ]
-        ignored_props = COLLECTION_PROPERTIES + item_props + IGNORED_ITEM_PROPERTIES
+        ignored_props = set(
+            COLLECTION_PROPERTIES + item_props + IGNORED_ITEM_PROPERTIES
+        )
+
+        # compile the item model once for the whole page
+        format_args = dict(self.stac_config, catalog=catalog)
+        compiled_item = CompiledStacItem(item_model, need_conversion, format_args)
+        providers_dicts: Dict[str, List[Dict[str, Any]]] = {}
 
         item_list: List[Dict[str, Any]] = []
         for product in search_results:
-            product_dict = deepcopy(product.__dict__)
-
-            product_item: Dict[str, Any] = jsonpath_parse_dict_items(
-                item_model,
-                {
-                    "product": product_dict,
-                    "providers": [self.get_provider_dict(product.provider)],
-                },
-            )
+            p_config = self.eodag_api.providers_config[product.provider]
+            prefix = getattr(p_config, "group", product.provider)
+            if product.provider not in providers_dicts:
+                providers_dicts[product.provider] = [
+                    self.get_provider_dict(product.provider)
+                ]
 
-            # add additional item props
-            for p in set(product.properties) - set(ignored_props):
-                prefix = getattr(
-                    self.eodag_api.providers_config[product.provider],
-                    "group",
-                    product.provider,
-                )
-                key = p if ":" in p else f"{prefix}:{p}"
-                product_item["properties"][key] = product.properties[p]
+            # additional item props
+            extra_properties = {
+                (p if ":" in p else f"{prefix}:{p}"): v
+                for p, v in product.properties.items()
+                if p not in ignored_props
+            }
 
             # parse download link
             downloadlink_href = (
@@ -299,7 +523,6 @@ class StacItem(StacCommon):
                 else f"{url_parts.netloc}{url_parts.path}"
             )
             # add provider to query-args
-            p_config = self.eodag_api.providers_config[product.provider]
             query_dict.update(provider=[getattr(p_config, "group", p_config.name)])
             # add datacube query-string to query-args
             if _dc_qs:
@@ -310,37 +533,17 @@ class StacItem(StacCommon):
                 )
 
             # generate STAC assets
-            product_item["assets"] = self._get_assets(
+            assets = self._get_assets(
                 product, downloadlink_href, without_arg_url, query_dict, _dc_qs
             )
 
-            # apply conversion if needed
-            for prop_key, prop_val in need_conversion.items():
-                conv_func, conv_args = prop_val
-                # colon `:` in key breaks format() method, hide it
-                formatable_prop_key = prop_key.replace(":", "")
-                if conv_args is not None:
-                    product_item["properties"][prop_key] = format_metadata(
-                        "{%s#%s(%s)}" % (formatable_prop_key, conv_func, conv_args),
-                        **{formatable_prop_key: product_item["properties"][prop_key]},
-                    )
-                else:
-                    product_item["properties"][prop_key] = format_metadata(
-                        "{%s#%s}" % (formatable_prop_key, conv_func),
-                        **{formatable_prop_key: product_item["properties"][prop_key]},
-                    )
-
-            # parse f-strings
-            format_args = deepcopy(self.stac_config)
-            format_args["catalog"] = catalog
-            format_args["item"] = product_item
-            product_item = format_dict_items(product_item, **format_args)
+            product_item = compiled_item.render(
+                product, providers_dicts[product.provider], extra_properties, assets
+            )
             product_item["bbox"] = [float(i) for i in product_item["bbox"]]
 
             # transform shapely geometry to geojson
-            product_item["geometry"] = geojson.loads(
-                geojson.dumps(product_item["geometry"])
-            )
+            product_item["geometry"] = _geometry_to_geojson(product_item["geometry"])
 
             # remove empty properties
             product_item = self.__filter_item_properties_values(product_item)
@@ -574,13 +777,12 @@ class StacItem(StacCommon):
         :param item: STAC item data
         :returns: Filtered item model
         """
-        all_extensions_dict: Dict[str, str] = deepcopy(
-            self.stac_config["stac_extensions"]
-        )
-        # parse f-strings with root
-        all_extensions_dict = format_dict_items(
-            all_extensions_dict, **{"catalog": {"root": self.root}}
-        )
+        if self._all_extensions_dict is None:
+            # parse f-strings with root
+            self._all_extensions_dict = format_dict_items(
+                self.stac_config["stac_extensions"], **{"catalog": {"root": self.root}}
+            )
+        all_extensions_dict = self._all_extensions_dict
 
         item["stac_extensions"] = []
         # dict to list of keys to permit pop() while iterating
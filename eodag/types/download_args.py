@@ -29,6 +29,8 @@ class DownloadConf(TypedDict, total=False):
     :cvar extract: whether to extract the downloaded products, only applies to archived products
     :cvar dl_url_params: additional parameters to pass over to the download url as an url parameter
     :cvar delete_archive: whether to delete the downloaded archives
+    :cvar stream_extract: whether to extract the downloaded archives while they are downloaded,
+                          without writing them to disk
     :cvar asset: regex filter to identify assets to download
     """
 
@@ -37,4 +39,5 @@ class DownloadConf(TypedDict, total=False):
     extract: bool
     dl_url_params: Dict[str, str]
     delete_archive: bool
+    stream_extract: bool
     asset: Optional[str]
@@ -28,20 +28,23 @@ import datetime
 import errno
 import functools
 import hashlib
+import importlib.resources
 import inspect
 import logging as py_logging
 import mimetypes
 import os
+import pickle
 import re
 import shutil
 import ssl
 import string
 import sys
+import threading
 import types
 import unicodedata
 import warnings
 from collections import defaultdict
-from copy import deepcopy as copy_deepcopy
+from copy import deepcopy as copy_deepcopy  # noqa: F401
 from dataclasses import dataclass
 from datetime import datetime as dt
 from email.message import Message
@@ -49,12 +52,15 @@ from glob import glob
 from importlib.metadata import metadata
 from itertools import repeat, starmap
 from pathlib import Path
+from queue import Empty, Full, Queue
 from tempfile import mkdtemp
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterable,
     Callable,
     Dict,
+    Generator,
     Iterable,
     Iterator,
     List,
@@ -87,7 +93,6 @@ else:
 
 import click
 import orjson
-import shapefile
 import shapely.wkt
 import yaml
 from dateutil.parser import isoparse
@@ -102,6 +107,8 @@ from tqdm.auto import tqdm
 
 from eodag.utils import logging as eodag_logging
 from eodag.utils.exceptions import MisconfiguredError
+from eodag.utils.locations import get_location_index
+from eodag.utils.snapshot import load_snapshot
 
 if TYPE_CHECKING:
     from jsonpath_ng import JSONPath
@@ -125,6 +132,10 @@ REQ_RETRY_TOTAL = 3
 REQ_RETRY_BACKOFF_FACTOR = 2
 REQ_RETRY_STATUS_FORCELIST = [401, 429, 500, 502, 503, 504]
 
+# pooled connections defaults
+REQ_POOL_CONNECTIONS = 10
+REQ_POOL_MAXSIZE = 10
+
 # default wait times in minutes
 DEFAULT_DOWNLOAD_WAIT = 0.2  # in minutes
 DEFAULT_DOWNLOAD_TIMEOUT = 10  # in minutes
@@ -417,6 +428,70 @@ def maybe_generator(obj: Any) -> Iterator[Any]:
         yield obj
 
 
+def prefetch_iter(
+    iterable: Iterable[Any], depth: int = 1, wait_on_close: bool = False
+) -> Generator[Any, None, None]:
+    """Iterate over ``iterable`` in a background thread, consuming up to ``depth``
+    elements ahead of the caller.
+
+    Elements and exceptions are yielded in order. When the returned generator is closed,
+    the background iteration stops after the element being consumed. By default, the
+    generator returns without waiting for it.
+
+    :param iterable: The iterable to consume in background
+    :param depth: (optional) Maximum number of elements consumed ahead of the caller
+    :param wait_on_close: (optional) Whether closing the generator waits for the end of
+                          the background iteration or not
+    :returns: An iterator over the elements of ``iterable``
+    """
+    buffer: Queue[Tuple[bool, Any]] = Queue(maxsize=max(1, depth))
+    stop = threading.Event()
+    done = object()
+
+    def put(element: Tuple[bool, Any]) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(element, timeout=0.1)
+                return True
+            except Full:
+                pass
+        return False
+
+    def produce() -> None:
+        iterator = iter(iterable)
+        try:
+            for element in iterator:
+                if not put((True, element)):
+                    return
+        except BaseException as e:
+            put((False, e))
+            return
+        finally:
+            if close := getattr(iterator, "close", None):
+                close()
+        put((True, done))
+
+    producer = threading.Thread(target=produce, name="eodag-prefetch", daemon=True)
+    producer.start()
+    try:
+        while True:
+            try:
+                ok, element = buffer.get(timeout=0.1)
+            except Empty:
+                if not producer.is_alive() and buffer.empty():
+                    return
+                continue
+            if not ok:
+                raise element
+            if element is done:
+                return
+            yield element
+    finally:
+        stop.set()
+        if wait_on_close:
+            producer.join()
+
+
 def get_timestamp(date_time: str) -> float:
     """Return the Unix timestamp of an ISO8601 date/datetime in seconds.
 
@@ -786,22 +861,9 @@ def dict_items_recursive_apply(
     :param apply_method_parameters: Optional parameters passed to the method
     :returns: Updated dict
     """
-    result_dict: Dict[Any, Any] = deepcopy(config_dict)
-    for dict_k, dict_v in result_dict.items():
-        if isinstance(dict_v, dict):
-            result_dict[dict_k] = dict_items_recursive_apply(
-                dict_v, apply_method, **apply_method_parameters
-            )
-        elif any(isinstance(dict_v, t) for t in (list, tuple)):
-            result_dict[dict_k] = list_items_recursive_apply(
-                dict_v, apply_method, **apply_method_parameters
-            )
-        else:
-            result_dict[dict_k] = apply_method(
-                dict_k, dict_v, **apply_method_parameters
-            )
-
-    return result_dict
+    return _dict_items_recursive_apply(
+        config_dict, False, apply_method, apply_method_parameters
+    )
 
 
 def list_items_recursive_apply(
@@ -822,15 +884,70 @@ def list_items_recursive_apply(
     :param apply_method_parameters: Optional parameters passed to the method
     :returns: Updated list
     """
-    result_list = deepcopy(config_list)
+    return _list_items_recursive_apply(
+        config_list, False, apply_method, apply_method_parameters
+    )
+
+
+def _dict_items_recursive_apply(
+    config_dict: Dict[Any, Any],
+    copied: bool,
+    apply_method: Callable[..., Any],
+    apply_method_parameters: Dict[str, Any],
+) -> Dict[Any, Any]:
+    """:func:`dict_items_recursive_apply` copying ``config_dict`` only if not already
+    ``copied`` by a parent call, instead of copying it again at each level"""
+    result_dict: Dict[Any, Any] = config_dict if copied else deepcopy(config_dict)
+    # deepcopy only copies dict and list instances
+    children_copied = type(result_dict) is dict
+    for dict_k, dict_v in result_dict.items():
+        if isinstance(dict_v, dict):
+            result_dict[dict_k] = _dict_items_recursive_apply(
+                dict_v,
+                children_copied and type(dict_v) is dict,
+                apply_method,
+                apply_method_parameters,
+            )
+        elif isinstance(dict_v, (list, tuple)):
+            result_dict[dict_k] = _list_items_recursive_apply(
+                dict_v,
+                children_copied and type(dict_v) is list,
+                apply_method,
+                apply_method_parameters,
+            )
+        else:
+            result_dict[dict_k] = apply_method(
+                dict_k, dict_v, **apply_method_parameters
+            )
+
+    return result_dict
+
+
+def _list_items_recursive_apply(
+    config_list: Union[List[Any], Tuple[Any, ...]],
+    copied: bool,
+    apply_method: Callable[..., Any],
+    apply_method_parameters: Dict[str, Any],
+) -> List[Any]:
+    """:func:`list_items_recursive_apply` copying ``config_list`` only if not already
+    ``copied`` by a parent call, instead of copying it again at each level"""
+    result_list: Any = config_list if copied else deepcopy(config_list)
+    # deepcopy only copies dict and list instances
+    children_copied = type(result_list) is list
     for list_idx, list_v in enumerate(result_list):
         if isinstance(list_v, dict):
-            result_list[list_idx] = dict_items_recursive_apply(
-                list_v, apply_method, **apply_method_parameters
+            result_list[list_idx] = _dict_items_recursive_apply(
+                list_v,
+                children_copied and type(list_v) is dict,
+                apply_method,
+                apply_method_parameters,
             )
-        elif any(isinstance(list_v, t) for t in (list, tuple)):
-            result_list[list_idx] = list_items_recursive_apply(
-                list_v, apply_method, **apply_method_parameters
+        elif isinstance(list_v, (list, tuple)):
+            result_list[list_idx] = _list_items_recursive_apply(
+                list_v,
+                children_copied and type(list_v) is list,
+                apply_method,
+                apply_method_parameters,
             )
         else:
             result_list[list_idx] = apply_method(
@@ -1133,21 +1250,18 @@ def get_geometry_from_various(
     query_locations = {**query_args, **locations}
     for arg in query_locations.keys():
         if arg in locations_dict.keys():
-            found = False
             pattern = rf"{query_locations[arg]}"
             attr = locations_dict[arg]["attr"]
-            with shapefile.Reader(locations_dict[arg]["path"]) as shp:
-                for shaperec in shp.shapeRecords():
-                    if re.search(pattern, str(shaperec.record[attr])):
-                        found = True
-                        new_geom = shape(shaperec.shape)
-                        # get geoms union
-                        geom = new_geom.union(geom) if geom else new_geom
-            if not found:
+            # matching geometries union, cached by the shapefile index
+            location_geom = get_location_index(
+                locations_dict[arg]["path"]
+            ).get_geometry(attr, pattern)
+            if location_geom is None:
                 raise ValueError(
                     f"No match found for the search location '{arg}' "
                     f"with the pattern '{pattern}'."
                 )
+            geom = location_geom.union(geom) if geom else location_geom
 
     return geom
 
@@ -1234,38 +1348,66 @@ def cached_parse(str_to_parse: str) -> JSONPath:
     return parse(str_to_parse)
 
 
-@functools.lru_cache()
-def _mutable_cached_yaml_load(config_path: str) -> Any:
-    with open(
-        os.path.abspath(os.path.realpath(config_path)), mode="r", encoding="utf-8"
-    ) as fh:
-        return yaml.load(fh, Loader=yaml.SafeLoader)
+def resource_filename(package: str, resource: str) -> str:
+    """Path to a resource file of a package, without importing ``pkg_resources``
+
+    :param package: Name of the package containing the resource
+    :param resource: Path of the resource, relative to the package directory
+    :returns: The path to the resource file
+    """
+    return str(importlib.resources.files(package).joinpath(resource))
+
+
+#: Configurations loaded by :func:`_cached_snapshot_load`, pickled
+_pickled_configs: Dict[Tuple[str, str], bytes] = {}
+
+
+def _cached_snapshot_load(
+    config_path: str, loader: Callable[[bytes], Any], kind: str
+) -> Any:
+    """Load a configuration file from its snapshot once: the next calls get a copy of
+    the loaded configuration, unpickled from memory"""
+    pickled = _pickled_configs.get((kind, config_path))
+    if pickled is not None:
+        return pickle.loads(pickled)
+    loaded = load_snapshot(config_path, loader, kind=kind)
+    _pickled_configs[(kind, config_path)] = pickle.dumps(
+        loaded, protocol=pickle.HIGHEST_PROTOCOL
+    )
+    return loaded
 
 
 def cached_yaml_load(config_path: str) -> Dict[str, Any]:
     """Cached :func:`yaml.load`
 
+    The parsed file is cached in memory, and in a snapshot on disk (see
+    :func:`~eodag.utils.snapshot.load_snapshot`).
+
     :param config_path: path to the yaml configuration file
     :returns: loaded yaml configuration
     """
-    return copy_deepcopy(_mutable_cached_yaml_load(config_path))
-
-
-@functools.lru_cache()
-def _mutable_cached_yaml_load_all(config_path: str) -> List[Any]:
-    with open(config_path, "r") as fh:
-        return list(yaml.load_all(fh, Loader=yaml.Loader))
+    return _cached_snapshot_load(
+        os.path.abspath(os.path.realpath(config_path)),
+        lambda content: yaml.load(content.decode("utf-8"), Loader=yaml.SafeLoader),
+        "yaml_load",
+    )
 
 
 def cached_yaml_load_all(config_path: str) -> List[Any]:
     """Cached :func:`yaml.load_all`
 
-    Load all configurations stored in the configuration file as separated yaml documents
+    Load all configurations stored in the configuration file as separated yaml documents.
+    The parsed file is cached in memory, and in a snapshot on disk (see
+    :func:`~eodag.utils.snapshot.load_snapshot`).
 
     :param config_path: path to the yaml configuration file
     :returns: list of configurations
     """
-    return copy_deepcopy(_mutable_cached_yaml_load_all(config_path))
+    return _cached_snapshot_load(
+        config_path,
+        lambda content: list(yaml.load_all(content.decode(), Loader=yaml.Loader)),
+        "yaml_load_all",
+    )
 
 
 def get_bucket_name_and_prefix(
@@ -1412,7 +1554,7 @@ def cast_scalar_value(value: Any, new_type: Any) -> Any:
 class StreamResponse:
     """Represents a streaming response"""
 
-    content: Iterable[bytes]
+    content: Union[Iterable[bytes], AsyncIterable[bytes]]
     headers: Optional[Mapping[str, str]] = None
     media_type: Optional[str] = None
     status_code: Optional[int] = None
@@ -0,0 +1,314 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024, CS GROUP - France, https://www.csgroup.eu/
+#
+# This file is part of EODAG project
+#     https://www.github.com/CS-SI/EODAG
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Extraction of zip and tar archives from a stream of bytes, while it is received"""
+from __future__ import annotations
+
+import bz2
+import logging
+import os
+import struct
+import tarfile
+import zlib
+from itertools import chain
+from typing import Any, BinaryIO, Iterable, Iterator, Optional, Tuple
+
+from eodag.utils.exceptions import DownloadError
+
+logger = logging.getLogger("eodag.utils.archive")
+
+ZIP_LOCAL_FILE_HEADER = b"PK\x03\x04"
+ZIP_DATA_DESCRIPTOR = b"PK\x07\x08"
+#: Signatures of the zip records following the members: central directory, end of
+#: central directory (of an empty archive), digital signature
+ZIP_END_SIGNATURES = (b"PK\x01\x02", b"PK\x05\x06", b"PK\x05\x05")
+#: Signatures of the compressed streams which may hold a tar archive: gzip, bzip2, xz
+TAR_COMPRESSED_SIGNATURES = (b"\x1f\x8b", b"BZh", b"\xfd7zXZ\x00")
+#: Magic of the uncompressed (ustar or gnu) tar archives, and its offset
+TAR_MAGIC = b"ustar"
+TAR_MAGIC_OFFSET = 257
+
+_LOCAL_FILE_HEADER = struct.Struct("<4sHHHHHIIIHH")
+_ZIP64_EXTRA_ID = 0x0001
+_ZIP_STORED = 0
+_ZIP_DEFLATED = 8
+_ZIP_BZIP2 = 12
+_FLAG_ENCRYPTED = 0x1
+_FLAG_DATA_DESCRIPTOR = 0x8
+_FLAG_UTF8 = 0x800
+
+
+class UnsupportedArchiveError(DownloadError):
+    """The received payload is not an archive which can be extracted while it is received"""
+
+
+class _ChunksReader:
+    """Binary file-like reader of an iterator of chunks of bytes"""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._buffer = b""
+
+    def _fill(self, size: int) -> None:
+        buffers = [self._buffer]
+        buffered = len(self._buffer)
+        while buffered < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            buffers.append(chunk)
+            buffered += len(chunk)
+        self._buffer = b"".join(buffers)
+
+    def peek(self, size: int) -> bytes:
+        """Get the next ``size`` bytes, without consuming them"""
+        self._fill(size)
+        return self._buffer[:size]
+
+    def read(self, size: int = -1) -> bytes:
+        """Read at most ``size`` bytes, all remaining bytes if ``size`` is negative"""
+        if size < 0:
+            data = self._buffer + b"".join(self._chunks)
+            self._buffer = b""
+            return data
+        self._fill(size)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def read_exactly(self, size: int) -> bytes:
+        """Read ``size`` bytes, raising an error if the stream ends before"""
+        data = self.read(size)
+        if len(data) < size:
+            raise DownloadError("Unexpected end of archive")
+        return data
+
+    def read_chunk(self, max_size: int) -> bytes:
+        """Read the buffered bytes or the next chunk, at most ``max_size`` bytes"""
+        if not self._buffer:
+            self._buffer = next(self._chunks, b"")
+        return self.read(max_size)
+
+    def unread(self, data: bytes) -> None:
+        """Push back bytes read in excess"""
+        self._buffer = data + self._buffer
+
+    def chunks(self) -> Iterator[bytes]:
+        """Remaining chunks, starting with the buffered bytes"""
+        return chain((self._buffer,) if self._buffer else (), self._chunks)
+
+
+def _member_path(extraction_dir: str, name: str) -> str:
+    """Destination path of an archive member, which must be in ``extraction_dir``"""
+    parts = [
+        part for part in name.replace("\\", "/").split("/") if part not in ("", ".")
+    ]
+    if not parts or ".." in parts:
+        raise DownloadError(f"Invalid archive member name: {name}")
+    return os.path.join(extraction_dir, *parts)
+
+
+def _zip64_sizes(
+    extra: bytes, compressed_size: int, uncompressed_size: int
+) -> Tuple[int, int, bool]:
+    """Sizes of a zip member, from its zip64 extra field if it has one"""
+    offset = 0
+    while offset + 4 <= len(extra):
+        header_id, data_size = struct.unpack_from("<HH", extra, offset)
+        data = extra[offset + 4 : offset + 4 + data_size]
+        if header_id == _ZIP64_EXTRA_ID:
+            # only the sizes saturated in the header are present
+            values = iter(struct.unpack_from(f"<{len(data) // 8}Q", data))
+            if uncompressed_size == 0xFFFFFFFF:
+                uncompressed_size = next(values, uncompressed_size)
+            if compressed_size == 0xFFFFFFFF:
+                compressed_size = next(values, compressed_size)
+            return compressed_size, uncompressed_size, True
+        offset += 4 + data_size
+    return compressed_size, uncompressed_size, False
+
+
+def _zip_member_data(
+    reader: _ChunksReader, method: int, flags: int, compressed_size: int
+) -> Iterator[bytes]:
+    """Decompressed data of a zip member, read from the stream"""
+    if method == _ZIP_STORED:
+        if flags & _FLAG_DATA_DESCRIPTOR:
+            raise UnsupportedArchiveError(
+                "Stored zip members of unknown size cannot be streamed"
+            )
+        remaining = compressed_size
+        while remaining:
+            data = reader.read_chunk(remaining)
+            if not data:
+                raise DownloadError("Unexpected end of archive")
+            remaining -= len(data)
+            yield data
+        return
+
+    decompressor: Any
+    if method == _ZIP_DEFLATED:
+        decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+    elif method == _ZIP_BZIP2:
+        decompressor = bz2.BZ2Decompressor()
+    else:
+        raise DownloadError(f"Unsupported zip compression method: {method}")
+    # compressed data ends with the compressed stream
+    while not decompressor.eof:
+        data = reader.read_chunk(1 << 20)
+        if not data:
+            raise DownloadError("Unexpected end of archive")
+        yield decompressor.decompress(data)
+    reader.unread(decompressor.unused_data)
+
+
+def _extract_zip(reader: _ChunksReader, extraction_dir: str) -> int:
+    """Extract the members of a zip archive from the stream, as they are received"""
+    members_count = 0
+    while True:
+        signature = reader.peek(4)
+        if signature in ZIP_END_SIGNATURES:
+            # ignore the central directory, members were all received
+            for _ in iter(lambda: reader.read_chunk(1 << 20), b""):
+                pass
+            return members_count
+        if signature != ZIP_LOCAL_FILE_HEADER:
+            raise DownloadError("Invalid zip member header")
+        (
+            _,
+            _,
+            flags,
+            method,
+            _,
+            _,
+            crc,
+            compressed_size,
+            uncompressed_size,
+            name_length,
+            extra_length,
+        ) = _LOCAL_FILE_HEADER.unpack(reader.read_exactly(_LOCAL_FILE_HEADER.size))
+        raw_name = reader.read_exactly(name_length)
+        extra = reader.read_exactly(extra_length)
+        name = raw_name.decode("utf-8" if flags & _FLAG_UTF8 else "cp437")
+        if flags & _FLAG_ENCRYPTED:
+            raise DownloadError(f"Encrypted zip member: {name}")
+        compressed_size, uncompressed_size, zip64 = _zip64_sizes(
+            extra, compressed_size, uncompressed_size
+        )
+
+        member_path = _member_path(extraction_dir, name)
+        data_crc = 0
+        if name.endswith("/"):
+            os.makedirs(member_path, exist_ok=True)
+            fhandle: Optional[BinaryIO] = None
+        else:
+            os.makedirs(os.path.dirname(member_path), exist_ok=True)
+            fhandle = open(member_path, "wb")
+        try:
+            for data in _zip_member_data(reader, method, flags, compressed_size):
+                data_crc = zlib.crc32(data, data_crc)
+                if fhandle is not None:
+                    fhandle.write(data)
+        finally:
+            if fhandle is not None:
+                fhandle.close()
+
+        if flags & _FLAG_DATA_DESCRIPTOR:
+            # crc and sizes follow the member data, with an optional signature
+            if reader.peek(4) == ZIP_DATA_DESCRIPTOR:
+                reader.read_exactly(4)
+            crc = struct.unpack("<I", reader.read_exactly(4))[0]
+            reader.read_exactly(16 if zip64 else 8)
+        if data_crc != crc:
+            raise DownloadError(f"Bad CRC-32 for zip member: {name}")
+        members_count += 1
+
+
+def _extract_tar(reader: _ChunksReader, extraction_dir: str) -> int:
+    """Extract the members of a (compressed) tar archive from the stream, as they are
+    received"""
+    members_count = 0
+    try:
+        with tarfile.open(fileobj=reader, mode="r|*") as tar:  # type: ignore[call-overload]
+            for member in tar:
+                _member_path(extraction_dir, member.name)
+                if hasattr(tarfile, "data_filter"):
+                    tar.extract(member, path=extraction_dir, filter="data")
+                else:
+                    tar.extract(member, path=extraction_dir)
+                members_count += 1
+    except tarfile.TarError as e:
+        if not members_count:
+            # for instance a compressed file which is not a tar archive
+            raise UnsupportedArchiveError(f"Invalid tar archive: {e}") from e
+        raise DownloadError(f"Invalid tar archive: {e}") from e
+    return members_count
+
+
+def _is_stream_extractable(header: bytes) -> bool:
+    """Whether the first bytes of a payload are those of a supported archive"""
+    signature = header[:4]
+    if signature in ZIP_END_SIGNATURES:
+        return True
+    if signature == ZIP_LOCAL_FILE_HEADER:
+        if len(header) < _LOCAL_FILE_HEADER.size:
+            return False
+        flags, method = _LOCAL_FILE_HEADER.unpack_from(header)[2:4]
+        return not (method == _ZIP_STORED and flags & _FLAG_DATA_DESCRIPTOR)
+    return (
+        header.startswith(TAR_COMPRESSED_SIGNATURES)
+        or header[TAR_MAGIC_OFFSET : TAR_MAGIC_OFFSET + len(TAR_MAGIC)] == TAR_MAGIC
+    )
+
+
+def check_stream_extractable(chunks: Iterable[bytes]) -> Tuple[bool, Iterator[bytes]]:
+    """Check from its first bytes whether a payload is a zip or tar archive which can be
+    extracted while it is received by :func:`stream_extract`.
+
+    Archives whose first zip member is stored with a data descriptor are not supported.
+
+    :param chunks: Chunks of bytes of the payload, in order
+    :returns: Whether the payload can be extracted while received, and all its chunks
+    """
+    reader = _ChunksReader(chunks)
+    header = reader.peek(TAR_MAGIC_OFFSET + len(TAR_MAGIC))
+    return _is_stream_extractable(header), reader.chunks()
+
+
+def stream_extract(chunks: Iterable[bytes], extraction_dir: str) -> int:
+    """Extract a zip or tar archive from its chunks of bytes, writing each member to
+    ``extraction_dir`` as soon as it is received.
+
+    The archive is never written to disk. Zip members are decoded from their local
+    file headers, so their stored size or compressed stream end must be known.
+
+    :param chunks: Chunks of bytes of the archive, in order
+    :param extraction_dir: Directory where the archive members are extracted
+    :returns: The number of extracted members
+    :raises: :class:`UnsupportedArchiveError` if the archive cannot be extracted while it is
+             received
+    :raises: :class:`~eodag.utils.exceptions.DownloadError`
+    """
+    reader = _ChunksReader(chunks)
+    if not reader.peek(1):
+        raise DownloadError("Empty archive")
+    os.makedirs(extraction_dir, exist_ok=True)
+    if reader.peek(4) in (ZIP_LOCAL_FILE_HEADER,) + ZIP_END_SIGNATURES:
+        members_count = _extract_zip(reader, extraction_dir)
+    else:
+        members_count = _extract_tar(reader, extraction_dir)
+    logger.debug("%s members extracted to %s", members_count, extraction_dir)
+    return members_count
@@ -67,7 +67,13 @@ class AuthenticationError(EodagError):
 
 
 class NotAvailableError(EodagError):
-    """An error indicating that the product is not available for download"""
+    """An error indicating that the product is not available for download
+
+    :ivar retry_after: (optional) Delay in seconds before trying again, advised by the
+                       provider
+    """
+
+    retry_after: Optional[float] = None
 
 
 class NoMatchingProductType(EodagError):
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024, CS GROUP - France, https://www.csgroup.eu/
+#
+# This file is part of EODAG project
+#     https://www.github.com/CS-SI/EODAG
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Index of the locations shapefiles, loaded once and cached"""
+from __future__ import annotations
+
+import logging
+import os
+import re
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import shapefile
+from shapely import unary_union
+from shapely.geometry import shape
+from shapely.geometry.base import BaseGeometry
+
+logger = logging.getLogger("eodag.utils.locations")
+
+#: Maximum number of resolved geometries cached per location index
+LOCATION_GEOMETRIES_CACHE_SIZE = 1024
+
+
+def _shapefile_mtime(path: str) -> Optional[int]:
+    """Latest modification time of the files of a shapefile, ``None`` if it is missing"""
+    base = os.path.splitext(path)[0]
+    mtimes = []
+    for file_path in (path, f"{base}.shp", f"{base}.dbf"):
+        try:
+            mtimes.append(os.stat(file_path).st_mtime_ns)
+        except OSError:
+            pass
+    return max(mtimes) if mtimes else None
+
+
+class LocationIndex:
+    """Geometries and attributes of the records of a locations shapefile.
+
+    The shapefile is read once: records geometries are built as shapely geometries, and
+    records are indexed by their attribute values. Geometries matching an attribute
+    pattern are cached.
+
+    :param path: Path to the shapefile
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.mtime = _shapefile_mtime(path)
+        with shapefile.Reader(path) as shp:
+            shape_records = shp.shapeRecords()
+        self.geometries: List[BaseGeometry] = [
+            shape(shape_record.shape) for shape_record in shape_records
+        ]
+        self.records: List[Dict[str, object]] = [
+            shape_record.record.as_dict() for shape_record in shape_records
+        ]
+        self._lock = threading.Lock()
+        self._lookups: Dict[str, Dict[str, List[int]]] = {}
+        self._cache: Dict[Tuple[str, str], Optional[BaseGeometry]] = {}
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def lookup(self, attr: str) -> Dict[str, List[int]]:
+        """Records indices by value of an attribute
+
+        :param attr: Name of the attribute
+        :returns: The indices of the records having each value of the attribute
+        :raises: :class:`KeyError` if the records do not have this attribute
+        """
+        with self._lock:
+            if attr not in self._lookups:
+                lookup: Dict[str, List[int]] = {}
+                for i, record in enumerate(self.records):
+                    lookup.setdefault(str(record[attr]), []).append(i)
+                self._lookups[attr] = lookup
+            return self._lookups[attr]
+
+    def get_geometry(self, attr: str, pattern: str) -> Optional[BaseGeometry]:
+        """Union of the geometries of the records whose attribute matches a pattern
+
+        :param attr: Name of the attribute
+        :param pattern: Regular expression searched in the attribute values
+        :returns: The union of the matching geometries, ``None`` if none matches
+        :raises: :class:`KeyError` if the records do not have this attribute
+        """
+        key = (attr, pattern)
+        with self._lock:
+            if key in self._cache:
+                return self._cache[key]
+        regex = re.compile(pattern)
+        indices = [
+            i
+            for value, value_indices in self.lookup(attr).items()
+            if regex.search(value)
+            for i in value_indices
+        ]
+        geometry: Optional[BaseGeometry]
+        if not indices:
+            geometry = None
+        elif len(indices) == 1:
+            geometry = self.geometries[indices[0]]
+        else:
+            geometry = unary_union([self.geometries[i] for i in sorted(indices)])
+        with self._lock:
+            if len(self._cache) >= LOCATION_GEOMETRIES_CACHE_SIZE:
+                # forget the oldest entry
+                del self._cache[next(iter(self._cache))]
+            self._cache[key] = geometry
+        return geometry
+
+
+_location_indexes: Dict[str, LocationIndex] = {}
+_location_indexes_lock = threading.Lock()
+
+
+def get_location_index(path: str) -> LocationIndex:
+    """Get the index of a locations shapefile, loaded again when the file was modified
+
+    :param path: Path to the shapefile
+    :returns: The shapefile index
+    """
+    with _location_indexes_lock:
+        index = _location_indexes.get(path)
+        if index is None or index.mtime != _shapefile_mtime(path):
+            logger.debug("Loading locations shapefile %s", path)
+            index = _location_indexes[path] = LocationIndex(path)
+        return index
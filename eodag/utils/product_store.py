@@ -0,0 +1,387 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024, CS GROUP - France, https://www.csgroup.eu/
+#
+# This file is part of EODAG project
+#     https://www.github.com/CS-SI/EODAG
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Local store of downloaded products, shared by output directories"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import shutil
+import sqlite3
+import stat
+import tempfile
+import threading
+import time
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger("eodag.utils.product_store")
+
+#: Default maximum size of the stored products files, in bytes
+DEFAULT_PRODUCT_STORE_MAX_SIZE = 100 * 1024 * 1024 * 1024
+
+#: ``ioctl`` request cloning a file on copy-on-write filesystems (Linux ``FICLONE``)
+FICLONE = 0x40049409
+
+
+def _file_digest(path: str) -> str:
+    """SHA-256 checksum of a file"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def reflink_file(src: str, dst: str) -> bool:
+    """Create ``dst`` as a reflink of ``src``, sharing its content until one of them is
+    modified, on copy-on-write filesystems
+
+    :param src: Path of the existing file
+    :param dst: Path of the file to create
+    :returns: ``False`` if the filesystem does not support reflinks
+    """
+    try:
+        import fcntl
+
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+        return True
+    except (ImportError, OSError):
+        try:
+            os.remove(dst)
+        except OSError:
+            pass
+        return False
+
+
+def clone_file(src: str, dst: str, link: bool = True) -> None:
+    """Create ``dst`` with the content of ``src`` without copying it if possible: as a hard
+    link if ``link`` is set, else as a reflink on copy-on-write filesystems, else as a copy
+
+    :param src: Path of the existing file
+    :param dst: Path of the file to create
+    :param link: (optional) Whether ``dst`` can be a hard link of ``src``
+    """
+    if link:
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass
+    if not reflink_file(src, dst):
+        shutil.copyfile(src, dst)
+
+
+class ProductStore:
+    """Downloaded products, stored once whatever their output directory.
+
+    Products files are stored once per SHA-256 checksum in ``<store_dir>/objects``, and
+    products are indexed by key (see :meth:`make_key`) in a local SQLite database. Keys do
+    not depend on the provider, for a product downloaded from a provider to be
+    materialized instead of downloaded again from another one. The provider is only kept
+    as metadata.
+    Downloaded files are copied to the store, as reflinks on copy-on-write filesystems.
+    Stored files are read-only, and their checksum is verified before they are used.
+    Stored products are materialized in output directories as hard links to the stored
+    files, read-only too, or as reflinks or copies when hard links are not possible.
+
+    When the size of the stored files exceeds ``max_size``, least recently used products
+    are evicted.
+
+    :param store_dir: Directory where products files and index are stored
+    :param max_size: (optional) Maximum size of the stored files, in bytes
+    """
+
+    def __init__(
+        self, store_dir: str, max_size: int = DEFAULT_PRODUCT_STORE_MAX_SIZE
+    ) -> None:
+        self.store_dir = store_dir
+        self.objects_dir = os.path.join(store_dir, "objects")
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        os.makedirs(self.objects_dir, exist_ok=True)
+        self._connection = sqlite3.connect(
+            os.path.join(store_dir, "products.sqlite"),
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        with self._lock:
+            self._connection.executescript(
+                "CREATE TABLE IF NOT EXISTS products ("
+                "key TEXT PRIMARY KEY, name TEXT, is_dir INTEGER, accessed REAL, "
+                "provider TEXT);"
+                "CREATE INDEX IF NOT EXISTS products_accessed ON products (accessed);"
+                "CREATE TABLE IF NOT EXISTS product_files ("
+                "key TEXT, path TEXT, digest TEXT);"
+                "CREATE INDEX IF NOT EXISTS product_files_key ON product_files (key);"
+                "CREATE INDEX IF NOT EXISTS product_files_digest "
+                "ON product_files (digest);"
+                "CREATE TABLE IF NOT EXISTS objects (digest TEXT PRIMARY KEY, size INTEGER);"
+            )
+
+    @staticmethod
+    def make_key(
+        product_type: Optional[str],
+        title: str,
+        extract: bool,
+        layout: str = "",
+    ) -> str:
+        """Key of a downloaded product, whatever the provider it was downloaded from
+
+        :param product_type: Product type of the product
+        :param title: Title of the product
+        :param extract: Whether the product is extracted or kept as an archive
+        :param layout: (optional) Description of the options changing the files of the
+                       product on disk, like the way it is packaged, its archive depth or
+                       its extension
+        :returns: The product key
+        """
+        key = f"{product_type}/{title}/{'extracted' if extract else 'archive'}"
+        return f"{key}/{layout}" if layout else key
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.objects_dir, digest[:2], digest)
+
+    def _store_file(self, path: str) -> Tuple[str, int]:
+        """Store a read-only copy of a file, replacing the file with a reflink to the
+        stored content if it was already stored"""
+        digest = _file_digest(path)
+        object_path = self._object_path(digest)
+        os.makedirs(os.path.dirname(object_path), exist_ok=True)
+        tmp_path = f"{object_path}.{threading.get_ident()}~"
+        if os.path.isfile(object_path):
+            # deduplicate the downloaded file
+            if reflink_file(object_path, tmp_path):
+                os.chmod(tmp_path, stat.S_IMODE(os.stat(path).st_mode))
+                os.replace(tmp_path, path)
+        else:
+            clone_file(path, tmp_path, link=False)
+            os.chmod(tmp_path, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+            os.replace(tmp_path, object_path)
+        return digest, os.path.getsize(object_path)
+
+    def add(self, key: str, path: str, provider: Optional[str] = None) -> None:
+        """Store a downloaded product, evicting least recently used ones if needed
+
+        :param key: Product key
+        :param path: Path to the downloaded product, a file or a directory
+        :param provider: (optional) Provider the product was downloaded from
+        """
+        with self._lock:
+            if self._touch(key):
+                return
+        if os.path.isdir(path):
+            files: List[Tuple[str, Optional[str]]] = []
+            for dirpath, dirnames, filenames in os.walk(path):
+                rel_dir = os.path.relpath(dirpath, path)
+                if not dirnames and not filenames:
+                    # empty directory
+                    files.append((rel_dir, None))
+                files.extend(
+                    (
+                        os.path.normpath(os.path.join(rel_dir, filename)),
+                        os.path.join(dirpath, filename),
+                    )
+                    for filename in filenames
+                )
+        else:
+            files = [(os.path.basename(path), path)]
+        if (
+            sum(os.path.getsize(file_path) for _, file_path in files if file_path)
+            > self.max_size
+        ):
+            return
+
+        rows: List[Tuple[str, str, Optional[str]]] = []
+        objects = {}
+        for rel_path, file_path in files:
+            if file_path is None:
+                rows.append((key, rel_path, None))
+                continue
+            digest, size = self._store_file(file_path)
+            rows.append((key, rel_path, digest))
+            objects[digest] = size
+
+        with self._lock:
+            self._connection.execute("BEGIN")
+            self._connection.execute(
+                "INSERT OR REPLACE INTO products VALUES (?, ?, ?, ?, ?)",
+                (
+                    key,
+                    os.path.basename(path),
+                    os.path.isdir(path),
+                    time.time(),
+                    provider,
+                ),
+            )
+            self._connection.execute("DELETE FROM product_files WHERE key = ?", (key,))
+            self._connection.executemany(
+                "INSERT INTO product_files VALUES (?, ?, ?)", rows
+            )
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO objects VALUES (?, ?)", objects.items()
+            )
+            self._connection.execute("COMMIT")
+            self._evict(key)
+        logger.debug("Product %s stored", key)
+
+    def get(self, key: str, output_dir: str) -> Optional[str]:
+        """Materialize a stored product in ``output_dir``
+
+        :param key: Product key
+        :param output_dir: Directory where the product is materialized
+        :returns: The path to the materialized product, or ``None`` if it is not stored
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT name, is_dir, provider FROM products WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            files = self._connection.execute(
+                "SELECT path, digest FROM product_files WHERE key = ?", (key,)
+            ).fetchall()
+            self._touch(key)
+        name, is_dir, provider = row
+        product_path = os.path.join(output_dir, name)
+        if os.path.exists(product_path):
+            return product_path
+
+        os.makedirs(output_dir, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=output_dir, prefix=".store-") as tmp_dir:
+            tmp_path = os.path.join(tmp_dir, name)
+            try:
+                for rel_path, digest in files:
+                    file_path = os.path.join(tmp_path, rel_path) if is_dir else tmp_path
+                    if digest is None:
+                        os.makedirs(file_path, exist_ok=True)
+                        continue
+                    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+                    object_path = self._object_path(digest)
+                    if _file_digest(object_path) != digest:
+                        raise ValueError(f"Bad checksum of {object_path}")
+                    clone_file(object_path, file_path)
+            except (FileNotFoundError, ValueError) as e:
+                logger.warning(f"Stored files of {key} are invalid, removing it: {e}")
+                self.remove(key)
+                return None
+            os.replace(tmp_path, product_path)
+        logger.debug(
+            "Product %s downloaded from %s materialized in %s",
+            key,
+            provider,
+            product_path,
+        )
+        return product_path
+
+    def _touch(self, key: str) -> bool:
+        return (
+            self._connection.execute(
+                "UPDATE products SET accessed = ? WHERE key = ?", (time.time(), key)
+            ).rowcount
+            > 0
+        )
+
+    def _remove(self, key: str) -> None:
+        self._connection.execute("DELETE FROM products WHERE key = ?", (key,))
+        self._connection.execute("DELETE FROM product_files WHERE key = ?", (key,))
+        orphans = self._connection.execute(
+            "SELECT digest FROM objects WHERE digest NOT IN "
+            "(SELECT digest FROM product_files WHERE digest IS NOT NULL)"
+        ).fetchall()
+        for (digest,) in orphans:
+            object_path = self._object_path(digest)
+            try:
+                # stored files are read-only
+                os.chmod(object_path, stat.S_IWUSR | stat.S_IRUSR)
+                os.remove(object_path)
+            except FileNotFoundError:
+                pass
+        self._connection.executemany("DELETE FROM objects WHERE digest = ?", orphans)
+
+    def _evict(self, key: str) -> None:
+        """Evict least recently used products, except ``key``"""
+        for (evicted_key,) in self._connection.execute(
+            "SELECT key FROM products WHERE key != ? ORDER BY accessed", (key,)
+        ).fetchall():
+            if self.size() <= self.max_size:
+                break
+            logger.debug("Product %s evicted from the store", evicted_key)
+            self._remove(evicted_key)
+
+    def remove(self, key: str) -> None:
+        """Remove a stored product, and its files not used by other products
+
+        :param key: Product key
+        """
+        with self._lock:
+            self._remove(key)
+
+    def size(self) -> int:
+        """Size of the stored files, in bytes
+
+        :returns: The size of the stored files
+        """
+        return self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM objects"
+        ).fetchone()[0]
+
+    def clear(self) -> None:
+        """Remove all stored products"""
+        with self._lock:
+            self._connection.executescript(
+                "DELETE FROM products; DELETE FROM product_files; DELETE FROM objects;"
+            )
+            shutil.rmtree(self.objects_dir, ignore_errors=True)
+            os.makedirs(self.objects_dir, exist_ok=True)
+
+
+_product_store: Optional[ProductStore] = None
+_product_store_lock = threading.Lock()
+
+
+def get_product_store() -> Optional[ProductStore]:
+    """Get the local products store shared by all download plugins.
+
+    It is a :class:`ProductStore` stored in ``$EODAG_PRODUCT_STORE_DIR``, limited to
+    ``$EODAG_PRODUCT_STORE_MAX_SIZE`` bytes, and is disabled if this directory is not set.
+
+    :returns: The shared products store, if enabled
+    """
+    global _product_store
+    with _product_store_lock:
+        if _product_store is None and os.getenv("EODAG_PRODUCT_STORE_DIR"):
+            _product_store = ProductStore(
+                os.environ["EODAG_PRODUCT_STORE_DIR"],
+                int(
+                    os.getenv(
+                        "EODAG_PRODUCT_STORE_MAX_SIZE", DEFAULT_PRODUCT_STORE_MAX_SIZE
+                    )
+                ),
+            )
+        return _product_store
+
+
+def set_product_store(store: Optional[ProductStore]) -> None:
+    """Replace the local products store shared by all download plugins
+
+    :param store: A :class:`ProductStore`, or ``None`` to use the default one
+    """
+    global _product_store
+    with _product_store_lock:
+        _product_store = store
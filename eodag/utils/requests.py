@@ -17,17 +17,82 @@
 # limitations under the License.
 from __future__ import annotations
 
+import asyncio
+import importlib.util
 import logging
 import os
-from typing import Any, Optional, Tuple
+import threading
+import weakref
+from contextvars import ContextVar, copy_context
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, TypeVar, Union
 
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3 import Retry
+from urllib3.exceptions import MaxRetryError
+from urllib3.response import HTTPResponse
 
-from eodag.utils import HTTP_REQ_TIMEOUT, USER_AGENT, path_to_uri, uri_to_path
+from eodag.utils import (
+    HTTP_REQ_TIMEOUT,
+    REQ_POOL_CONNECTIONS,
+    REQ_POOL_MAXSIZE,
+    REQ_RETRY_BACKOFF_FACTOR,
+    REQ_RETRY_STATUS_FORCELIST,
+    REQ_RETRY_TOTAL,
+    USER_AGENT,
+    get_ssl_context,
+    path_to_uri,
+    uri_to_path,
+)
 from eodag.utils.exceptions import RequestError, TimeOutError
 
+if TYPE_CHECKING:
+    import httpx
+
+    from eodag.config import PluginConfig
+
 logger = logging.getLogger("eodag.utils.requests")
 
+T = TypeVar("T")
+
+#: Event loop sending the requests of the functions run by :func:`run_with_async_requests`
+_async_loop: ContextVar[Optional[asyncio.AbstractEventLoop]] = ContextVar(
+    "async_loop", default=None
+)
+
+#: Default number of worker threads of :func:`get_async_executor`
+DEFAULT_ASYNC_WORKERS = 128
+
+_async_executor: Optional[ThreadPoolExecutor] = None
+_async_executor_lock = threading.Lock()
+
+
+def get_async_executor() -> ThreadPoolExecutor:
+    """Executor running the synchronous parts of the asynchronous searches.
+
+    It is shared by all the event loops, and its size is ``$EODAG_ASYNC_WORKERS``,
+    defaulting to :data:`DEFAULT_ASYNC_WORKERS`. It bounds the number of searches run
+    concurrently, independently of the default executor of the event loop.
+
+    :returns: The shared executor
+    """
+    global _async_executor
+    with _async_executor_lock:
+        if _async_executor is None:
+            _async_executor = ThreadPoolExecutor(
+                max_workers=int(
+                    os.getenv("EODAG_ASYNC_WORKERS") or DEFAULT_ASYNC_WORKERS
+                ),
+                thread_name_prefix="eodag-async",
+            )
+        return _async_executor
+
 
 def fetch_json(
     url: str,
@@ -68,6 +133,465 @@ def fetch_json(
         return res.json()
 
 
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Delay advised by a ``Retry-After`` HTTP header
+
+    :param value: The header value, a number of seconds or an HTTP date
+    :returns: The delay in seconds, or ``None`` if the header is missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max((date - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """:class:`requests.adapters.HTTPAdapter` keeping track of the usage of its connection pools.
+
+    Within :func:`run_with_async_requests`, requests are not sent by this adapter but
+    asynchronously by the event loop, using :meth:`send_async`.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = REQ_POOL_CONNECTIONS,
+        pool_maxsize: int = REQ_POOL_MAXSIZE,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        super(PooledHTTPAdapter, self).__init__(
+            pool_connections, pool_maxsize, *args, **kwargs
+        )
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self._stats_lock = threading.Lock()
+        self.requests_count = 0
+        # asynchronous clients, per event loop and ssl verification
+        self._async_clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, Dict[Union[bool, str], httpx.AsyncClient]
+        ] = weakref.WeakKeyDictionary()
+
+    def send(
+        self, request: requests.PreparedRequest, *args: Any, **kwargs: Any
+    ) -> requests.Response:
+        """Sends PreparedRequest object and counts it.
+
+        :param request: The PreparedRequest being sent.
+        :param args: positional arguments passed to :meth:`requests.adapters.HTTPAdapter.send`
+        :param kwargs: keyword arguments passed to :meth:`requests.adapters.HTTPAdapter.send`
+        :returns: The response of the request
+        """
+        loop = _async_loop.get()
+        if (
+            loop is not None
+            and not kwargs.get("stream")
+            and (request.body is None or isinstance(request.body, (bytes, str)))
+        ):
+            return asyncio.run_coroutine_threadsafe(
+                self.send_async(
+                    request,
+                    timeout=kwargs.get("timeout"),
+                    verify=kwargs.get("verify", True),
+                ),
+                loop,
+            ).result()
+
+        with self._stats_lock:
+            self.requests_count += 1
+        return super(PooledHTTPAdapter, self).send(request, *args, **kwargs)
+
+    def _get_async_client(self, verify: Union[bool, str]) -> httpx.AsyncClient:
+        """Asynchronous client of the running event loop, sharing the connection settings
+        of this adapter"""
+        import httpx
+
+        loop = asyncio.get_running_loop()
+        clients = self._async_clients.setdefault(loop, {})
+        if verify not in clients:
+            retries = self.max_retries.total
+            clients[verify] = httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(
+                    verify=(
+                        get_ssl_context(verify) if isinstance(verify, bool) else verify
+                    ),
+                    limits=httpx.Limits(
+                        max_connections=self.pool_connections * self.pool_maxsize,
+                        max_keepalive_connections=self.pool_maxsize,
+                    ),
+                    retries=retries if isinstance(retries, int) else 0,
+                ),
+                follow_redirects=True,
+            )
+        return clients[verify]
+
+    async def send_async(
+        self,
+        request: requests.PreparedRequest,
+        timeout: Optional[Union[float, Tuple[float, float]]] = None,
+        verify: Union[bool, str] = True,
+    ) -> requests.Response:
+        """Sends PreparedRequest object asynchronously, following the retry policy of this
+        adapter.
+
+        :param request: The PreparedRequest being sent.
+        :param timeout: (optional) timeout of the request, in seconds
+        :param verify: (optional) whether to verify SSL certificates or not
+        :returns: The response of the request
+        """
+        import httpx
+
+        if request.method is None or request.url is None:
+            raise RequestError("Method or url of the request is missing")
+        with self._stats_lock:
+            self.requests_count += 1
+        client = self._get_async_client(verify)
+        retries = self.max_retries
+        while True:
+            try:
+                async_response = await client.request(
+                    request.method,
+                    request.url,
+                    headers=dict(request.headers),
+                    content=request.body,
+                    timeout=(
+                        httpx.Timeout(timeout[1], connect=timeout[0])
+                        if isinstance(timeout, tuple)
+                        else timeout
+                    ),
+                )
+            except httpx.TimeoutException as e:
+                raise requests.exceptions.Timeout(e, request=request) from e
+            except httpx.HTTPError as e:
+                raise requests.exceptions.ConnectionError(e, request=request) from e
+            if not retries.is_retry(
+                request.method,
+                async_response.status_code,
+                "Retry-After" in async_response.headers,
+            ):
+                break
+            try:
+                retries = retries.increment(
+                    request.method,
+                    request.url,
+                    response=HTTPResponse(
+                        status=async_response.status_code,
+                        headers=dict(async_response.headers),
+                    ),
+                )
+            except MaxRetryError:
+                break
+            await asyncio.sleep(retries.get_backoff_time())
+
+        response = self._build_async_response(request, async_response)
+        response._content = async_response.content
+        return response
+
+    async def send_stream_async(
+        self,
+        request: requests.PreparedRequest,
+        timeout: Optional[float] = None,
+        verify: Union[bool, str] = True,
+    ) -> requests.Response:
+        """Sends PreparedRequest object asynchronously, without reading its content.
+
+        The returned response has no content: it must be read from its ``raw`` attribute,
+        an :class:`httpx.Response` that must be closed using its ``aclose()`` method.
+
+        :param request: The PreparedRequest being sent.
+        :param timeout: (optional) timeout of the request, in seconds
+        :param verify: (optional) whether to verify SSL certificates or not
+        :returns: The response of the request
+        """
+        import httpx
+
+        if request.method is None or request.url is None:
+            raise RequestError("Method or url of the request is missing")
+        with self._stats_lock:
+            self.requests_count += 1
+        client = self._get_async_client(verify)
+        try:
+            async_response = await client.send(
+                client.build_request(
+                    request.method,
+                    request.url,
+                    headers=dict(request.headers),
+                    content=request.body,
+                    timeout=timeout,
+                ),
+                stream=True,
+            )
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(e, request=request) from e
+        except httpx.HTTPError as e:
+            raise requests.exceptions.ConnectionError(e, request=request) from e
+        return self._build_async_response(request, async_response)
+
+    @staticmethod
+    def _build_async_response(
+        request: requests.PreparedRequest, async_response: httpx.Response
+    ) -> requests.Response:
+        """:class:`requests.Response` built from a response received asynchronously"""
+        response = requests.Response()
+        response.status_code = async_response.status_code
+        response.headers = CaseInsensitiveDict(async_response.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.reason = async_response.reason_phrase
+        response.url = str(async_response.url)
+        response.request = request
+        response.raw = async_response
+        return response
+
+    async def aclose(self) -> None:
+        """Close the asynchronous clients of the running event loop"""
+        clients = self._async_clients.pop(asyncio.get_running_loop(), {})
+        for client in clients.values():
+            await client.aclose()
+
+    def stats(self) -> Dict[str, int]:
+        """Usage statistics of the connection pools of this adapter
+
+        :returns: sent requests, opened connections, reused connections, currently open
+                  connections and number of pools (one per host)
+        """
+        pools = self.poolmanager.pools
+        new_connections = 0
+        pool_requests = 0
+        open_connections = 0
+        pools_count = 0
+        for key in pools.keys():
+            try:
+                pool = pools[key]
+            except KeyError:
+                # pool evicted meanwhile
+                continue
+            pools_count += 1
+            new_connections += getattr(pool, "num_connections", 0)
+            pool_requests += getattr(pool, "num_requests", 0)
+            conn_queue = getattr(pool, "pool", None)
+            if conn_queue is None:
+                continue
+            # connections currently in use are not in the queue
+            idle_connections = list(conn_queue.queue)
+            open_connections += (pool.pool.maxsize - len(idle_connections)) + len(
+                [c for c in idle_connections if c is not None and c.sock is not None]
+            )
+        return {
+            "requests": self.requests_count,
+            "new_connections": new_connections,
+            "reused_connections": max(pool_requests - new_connections, 0),
+            "open_connections": open_connections,
+            "pools": pools_count,
+        }
+
+
+class SessionsRegistry:
+    """Registry of the connection pools shared by the plugins of a provider.
+
+    :class:`PooledHTTPAdapter` objects are pooled per provider and per connection settings,
+    so that consecutive requests sent to a provider (search pages, authentication,
+    downloads) reuse already opened connections instead of paying a new TCP and TLS
+    handshake each time. Each :meth:`get_session` call returns a new
+    :class:`requests.Session` mounting the shared adapter: cookies and session state are
+    never shared between plugins, flows or users.
+
+    Connection settings are read from the plugin configuration:
+
+    * :attr:`~eodag.config.PluginConfig.pool_connections` (``int``): number of hosts for which
+      connections are kept; default: ``10``
+    * :attr:`~eodag.config.PluginConfig.pool_maxsize` (``int``): maximum number of connections
+      kept per host; default: ``10``
+    * :attr:`~eodag.config.PluginConfig.pool_block` (``bool``): whether to wait for a free
+      connection when the pool is full instead of opening a new one; default: ``False``
+    * :attr:`~eodag.config.PluginConfig.keep_alive` (``bool``): whether to keep connections
+      open between requests; default: ``True``
+    * :attr:`~eodag.config.PluginConfig.retry_total`,
+      :attr:`~eodag.config.PluginConfig.retry_backoff_factor`,
+      :attr:`~eodag.config.PluginConfig.retry_status_forcelist`: retry policy
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._adapters: Dict[Tuple[Any, ...], PooledHTTPAdapter] = {}
+
+    @staticmethod
+    def _session_key(
+        provider: str, config: Optional[PluginConfig], retries: bool
+    ) -> Tuple[Any, ...]:
+        retry_key: Tuple[Any, ...] = (
+            (
+                getattr(config, "retry_total", REQ_RETRY_TOTAL),
+                getattr(config, "retry_backoff_factor", REQ_RETRY_BACKOFF_FACTOR),
+                tuple(
+                    getattr(
+                        config, "retry_status_forcelist", REQ_RETRY_STATUS_FORCELIST
+                    )
+                ),
+            )
+            if retries
+            else ()
+        )
+        return (
+            provider,
+            getattr(config, "pool_connections", REQ_POOL_CONNECTIONS),
+            getattr(config, "pool_maxsize", REQ_POOL_MAXSIZE),
+            getattr(config, "pool_block", False),
+            getattr(config, "keep_alive", True),
+            retry_key,
+        )
+
+    def get_session(
+        self,
+        provider: str,
+        config: Optional[PluginConfig] = None,
+        retries: bool = True,
+    ) -> requests.Session:
+        """Get a new session using the connection pool matching the given provider and
+        plugin configuration
+
+        :param provider: provider name
+        :param config: (optional) plugin configuration holding connection settings
+        :param retries: (optional) whether requests must be retried following the configured
+                        retry policy or not
+        :returns: a :class:`requests.Session` with a shared connection pool
+        """
+        key = self._session_key(provider, config, retries)
+        with self._lock:
+            if key not in self._adapters:
+                _, pool_connections, pool_maxsize, pool_block, _, retry = key
+                adapter = PooledHTTPAdapter(
+                    pool_connections=pool_connections,
+                    pool_maxsize=pool_maxsize,
+                    pool_block=pool_block,
+                    max_retries=(
+                        Retry(
+                            total=retry[0],
+                            backoff_factor=retry[1],
+                            status_forcelist=list(retry[2]),
+                        )
+                        if retry
+                        else 0
+                    ),
+                )
+                logger.debug(
+                    "New connection pool for %s (maxsize=%s, retries=%s)",
+                    provider,
+                    pool_maxsize,
+                    bool(retry),
+                )
+                self._adapters[key] = adapter
+            adapter = self._adapters[key]
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        if not key[4]:
+            # keep-alive disabled
+            session.headers["Connection"] = "close"
+        return session
+
+    def stats(self, provider: Optional[str] = None) -> Dict[str, Dict[str, int]]:
+        """Connection pools usage statistics, aggregated per provider
+
+        :param provider: (optional) only return statistics of this provider
+        :returns: statistics as returned by :meth:`PooledHTTPAdapter.stats` per provider
+        """
+        with self._lock:
+            adapters = list(self._adapters.items())
+        stats: Dict[str, Dict[str, int]] = {}
+        for key, adapter in adapters:
+            if provider is not None and key[0] != provider:
+                continue
+            provider_stats = stats.setdefault(key[0], {})
+            for stat_name, value in adapter.stats().items():
+                provider_stats[stat_name] = provider_stats.get(stat_name, 0) + value
+        return stats
+
+    def close(self, provider: Optional[str] = None) -> None:
+        """Close connection pools and their connections
+
+        :param provider: (optional) only close sessions of this provider
+        """
+        with self._lock:
+            for key in list(self._adapters.keys()):
+                if provider is not None and key[0] != provider:
+                    continue
+                self._adapters.pop(key).close()
+
+    async def aclose(self, provider: Optional[str] = None) -> None:
+        """Close the asynchronous clients opened in the running event loop
+
+        :param provider: (optional) only close clients of this provider
+        """
+        with self._lock:
+            adapters = [
+                adapter
+                for key, adapter in self._adapters.items()
+                if provider is None or key[0] == provider
+            ]
+        for adapter in adapters:
+            await adapter.aclose()
+
+
+#: Sessions registry shared by all plugins
+sessions_registry = SessionsRegistry()
+
+
+def get_provider_session(
+    provider: str, config: Optional[PluginConfig] = None, retries: bool = True
+) -> requests.Session:
+    """Get a new session using the connection pool of a provider from the shared
+    :class:`SessionsRegistry`
+
+    :param provider: provider name
+    :param config: (optional) plugin configuration holding connection settings
+    :param retries: (optional) whether requests must be retried following the configured
+                    retry policy or not
+    :returns: a :class:`requests.Session` with a shared connection pool
+    """
+    return sessions_registry.get_session(provider, config, retries)
+
+
+def async_requests_available() -> bool:
+    """Whether requests can be sent asynchronously, which needs ``httpx`` (installed with
+    ``eodag[server]``)"""
+    return importlib.util.find_spec("httpx") is not None
+
+
+async def run_with_async_requests(
+    func: Callable[..., T], *args: Any, **kwargs: Any
+) -> T:
+    """Run a synchronous function in a worker thread, sending its requests asynchronously.
+
+    Requests sent by ``func`` through the sessions of :func:`get_provider_session` are
+    sent by the running event loop, sharing its asynchronous connection pools, and ``func``
+    waits for their responses. Streamed requests and requests with a streamed body are
+    still sent by the worker thread.
+
+    The worker thread, taken from :func:`get_async_executor`, is held until ``func``
+    returns, including while it waits for its responses: the number of concurrent runs is
+    bounded by the size of this executor.
+
+    :param func: the function to run
+    :param args: positional arguments of ``func``
+    :param kwargs: keyword arguments of ``func``
+    :returns: the result of ``func``
+    """
+    loop = asyncio.get_running_loop()
+    context = copy_context()
+    context.run(_async_loop.set, loop)
+    return await loop.run_in_executor(
+        get_async_executor(), partial(context.run, func, *args, **kwargs)
+    )
+
+
 class LocalFileAdapter(requests.adapters.BaseAdapter):
     """Protocol Adapter to allow Requests to GET file:// URLs inspired
     by https://stackoverflow.com/questions/10123929/fetch-a-file-from-a-local-url-with-python-requests/27786580
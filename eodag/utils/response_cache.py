@@ -0,0 +1,412 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024, CS GROUP - France, https://www.csgroup.eu/
+#
+# This file is part of EODAG project
+#     https://www.github.com/CS-SI/EODAG
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Persistent cache of search responses, revalidated using HTTP conditional requests"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import orjson
+import requests
+from requests.auth import AuthBase, HTTPBasicAuth
+from requests.structures import CaseInsensitiveDict
+
+if TYPE_CHECKING:
+    from eodag.config import PluginConfig
+
+logger = logging.getLogger("eodag.utils.response_cache")
+
+#: Default maximum size of the cached responses, in bytes
+DEFAULT_RESPONSE_CACHE_MAX_SIZE = 200 * 1024 * 1024
+
+
+class ResponseCache:
+    """Base class of search responses caches.
+
+    Responses are stored per key (see :meth:`make_key`) with their validators, so that
+    stale responses can be revalidated by the provider. Implementations only have to
+    provide the storage methods :meth:`get`, :meth:`set`, :meth:`touch` and :meth:`clear`.
+    Hits, misses and revalidations are counted per provider.
+    """
+
+    def __init__(self) -> None:
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        method: str,
+        url: str,
+        body: Optional[Any] = None,
+        credentials: str = "",
+    ) -> str:
+        """Cache key of a request, insensitive to the order of query-string and json body parameters
+
+        :param provider: provider name
+        :param method: HTTP method of the request
+        :param url: requested url
+        :param body: (optional) json body of the request
+        :param credentials: (optional) identity of the user sending the request, see
+                            :func:`get_credentials_hash`
+        :returns: the request key
+        """
+        parts = urlsplit(url)
+        query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+        normalized_url = urlunsplit(parts._replace(query=query, fragment=""))
+        key = orjson.dumps(
+            [provider, method.upper(), normalized_url, body, credentials],
+            option=orjson.OPT_SORT_KEYS,
+            default=str,
+        )
+        return hashlib.sha256(key).hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[requests.Response, float]]:
+        """Get a cached response
+
+        :param key: request key
+        :returns: the cached response and the time it was stored or last revalidated at,
+                  or ``None`` if not cached
+        """
+        raise NotImplementedError
+
+    def set(self, key: str, provider: str, response: requests.Response) -> None:
+        """Store a response
+
+        :param key: request key
+        :param provider: provider name
+        :param response: response to store
+        """
+        raise NotImplementedError
+
+    def touch(self, key: str) -> None:
+        """Mark a cached response as fresh again, after it has been revalidated
+
+        :param key: request key
+        """
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Remove all cached responses"""
+        raise NotImplementedError
+
+    def count(self, provider: str, event: str) -> None:
+        """Increment a counter of the provider
+
+        :param provider: provider name
+        :param event: ``hits``, ``misses`` or ``revalidations``
+        """
+        with self._stats_lock:
+            provider_stats = self._stats.setdefault(
+                provider, {"hits": 0, "misses": 0, "revalidations": 0}
+            )
+            provider_stats[event] += 1
+
+    def stats(self, provider: Optional[str] = None) -> Dict[str, Dict[str, int]]:
+        """Cache usage statistics per provider
+
+        :param provider: (optional) only return statistics of this provider
+        :returns: ``hits`` (fresh cached responses), ``misses`` (requests sent to the provider)
+                  and ``revalidations`` (stale cached responses confirmed by the provider)
+                  counters per provider
+        """
+        with self._stats_lock:
+            return {
+                p: dict(s)
+                for p, s in self._stats.items()
+                if provider is None or p == provider
+            }
+
+
+class DiskResponseCache(ResponseCache):
+    """:class:`ResponseCache` stored in a local SQLite database, with a size limit.
+
+    When the size of the stored responses exceeds ``max_size``, least recently used
+    responses are evicted.
+
+    :param cache_dir: directory where the database is stored
+    :param max_size: (optional) maximum size of the stored responses, in bytes
+    """
+
+    def __init__(
+        self, cache_dir: str, max_size: int = DEFAULT_RESPONSE_CACHE_MAX_SIZE
+    ) -> None:
+        super(DiskResponseCache, self).__init__()
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+        self._connection = sqlite3.connect(
+            os.path.join(cache_dir, "responses.sqlite"),
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        with self._lock:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, provider TEXT, status INTEGER, url TEXT, "
+                "headers BLOB, content BLOB, size INTEGER, stored REAL, accessed REAL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)"
+            )
+
+    def get(self, key: str) -> Optional[Tuple[requests.Response, float]]:
+        """Get a cached response
+
+        :param key: request key
+        :returns: the cached response and the time it was stored or last revalidated at,
+                  or ``None`` if not cached
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT status, url, headers, content, stored FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE responses SET accessed = ? WHERE key = ?", (time.time(), key)
+            )
+        status, url, headers, content, stored = row
+        response = requests.Response()
+        response.status_code = status
+        response.url = url
+        response.headers = CaseInsensitiveDict(orjson.loads(headers))
+        response._content = content
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        return response, stored
+
+    def set(self, key: str, provider: str, response: requests.Response) -> None:
+        """Store a response, evicting least recently used ones if needed
+
+        :param key: request key
+        :param provider: provider name
+        :param response: response to store
+        """
+        content = response.content
+        if len(content) > self.max_size:
+            return
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    provider,
+                    response.status_code,
+                    response.url,
+                    orjson.dumps(dict(response.headers)),
+                    content,
+                    len(content),
+                    now,
+                    now,
+                ),
+            )
+            total_size = self._connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()[0]
+            if total_size <= self.max_size:
+                return
+            # evict least recently used responses
+            for evicted_key, size in self._connection.execute(
+                "SELECT key, size FROM responses WHERE key != ? ORDER BY accessed",
+                (key,),
+            ).fetchall():
+                self._connection.execute(
+                    "DELETE FROM responses WHERE key = ?", (evicted_key,)
+                )
+                total_size -= size
+                if total_size <= self.max_size:
+                    break
+
+    def touch(self, key: str) -> None:
+        """Mark a cached response as fresh again, after it has been revalidated
+
+        :param key: request key
+        """
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "UPDATE responses SET stored = ?, accessed = ? WHERE key = ?",
+                (now, now, key),
+            )
+
+    def clear(self) -> None:
+        """Remove all cached responses"""
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+
+
+_response_cache: Optional[ResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Get the search responses cache shared by all plugins.
+
+    It defaults to a :class:`DiskResponseCache` stored in ``$EODAG_RESPONSE_CACHE_DIR``
+    (``<eodag config dir>/.response_cache`` if not set), limited to
+    ``$EODAG_RESPONSE_CACHE_MAX_SIZE`` bytes.
+
+    :returns: the shared response cache
+    """
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is None:
+            cache_dir = os.getenv(
+                "EODAG_RESPONSE_CACHE_DIR",
+                os.path.join(
+                    os.getenv(
+                        "EODAG_CFG_DIR",
+                        os.path.join(os.path.expanduser("~"), ".config", "eodag"),
+                    ),
+                    ".response_cache",
+                ),
+            )
+            _response_cache = DiskResponseCache(
+                cache_dir,
+                int(
+                    os.getenv(
+                        "EODAG_RESPONSE_CACHE_MAX_SIZE",
+                        DEFAULT_RESPONSE_CACHE_MAX_SIZE,
+                    )
+                ),
+            )
+        return _response_cache
+
+
+def set_response_cache(cache: Optional[ResponseCache]) -> None:
+    """Replace the search responses cache shared by all plugins
+
+    :param cache: a :class:`ResponseCache` implementation, or ``None`` to use the default one
+    """
+    global _response_cache
+    with _response_cache_lock:
+        _response_cache = cache
+
+
+def get_response_cache_ttl(config: Optional[PluginConfig] = None) -> int:
+    """Time to live of the cached responses of a provider
+
+    :param config: (optional) search plugin configuration
+    :returns: :attr:`~eodag.config.PluginConfig.response_cache_ttl` if configured, else
+              ``$EODAG_RESPONSE_CACHE_TTL``, in seconds; ``0`` when cache is disabled
+    """
+    ttl = getattr(config, "response_cache_ttl", None)
+    if ttl is None:
+        return int(os.getenv("EODAG_RESPONSE_CACHE_TTL", "0"))
+    return int(ttl)
+
+
+def get_credentials_hash(method: str, url: str, auth: Optional[AuthBase]) -> str:
+    """Identity of the user sending a request: hash of the url and headers set by its
+    authentication, e.g. ``Authorization`` header or token in the query-string
+
+    :param method: HTTP method of the request
+    :param url: requested url
+    :param auth: authentication of the request
+    :returns: the credentials hash, empty if the request is not authenticated
+    :raises: :class:`ValueError` if the credentials cannot be determined
+    """
+    if auth is None:
+        return ""
+    if isinstance(auth, tuple):
+        auth = HTTPBasicAuth(*auth)
+    try:
+        request = auth(requests.Request(method, url).prepare())
+    except Exception as e:
+        raise ValueError(f"Could not get the credentials of {url}: {e}") from e
+    return hashlib.sha256(
+        orjson.dumps([request.url, sorted(request.headers.items())])
+    ).hexdigest()
+
+
+def cached_request(
+    provider: str,
+    config: Optional[PluginConfig],
+    method: str,
+    url: str,
+    send: Callable[[Dict[str, str]], requests.Response],
+    body: Optional[Any] = None,
+    auth: Optional[AuthBase] = None,
+) -> requests.Response:
+    """Send a search request through the responses cache.
+
+    Fresh cached responses are returned without sending the request. Stale ones are
+    revalidated with ``If-None-Match`` / ``If-Modified-Since`` headers when the provider
+    gave validators, and returned again if the provider answers ``304 Not Modified``.
+    Requests are directly sent when the cache is disabled for the provider. Responses of
+    authenticated requests are only served to requests having the same credentials.
+
+    :param provider: provider name
+    :param config: search plugin configuration
+    :param method: HTTP method of the request
+    :param url: requested url
+    :param send: function sending the request with the given additional headers, and
+                 raising an error for unsuccessful responses
+    :param body: (optional) json body of the request
+    :param auth: (optional) authentication of the request
+    :returns: the provider or cached response
+    """
+    ttl = get_response_cache_ttl(config)
+    if ttl <= 0:
+        return send({})
+    try:
+        cache = get_response_cache()
+        key = cache.make_key(
+            provider, method, url, body, get_credentials_hash(method, url, auth)
+        )
+        cached = cache.get(key)
+    except (sqlite3.Error, OSError, ValueError) as e:
+        logger.debug("Search responses cache unavailable: %s", e)
+        return send({})
+
+    headers: Dict[str, str] = {}
+    if cached is not None:
+        cached_response, stored = cached
+        if time.time() - stored < ttl:
+            logger.debug("Using cached response for %s", url)
+            cache.count(provider, "hits")
+            return cached_response
+        if "ETag" in cached_response.headers:
+            headers["If-None-Match"] = cached_response.headers["ETag"]
+        if "Last-Modified" in cached_response.headers:
+            headers["If-Modified-Since"] = cached_response.headers["Last-Modified"]
+
+    response = send(headers)
+    try:
+        if cached is not None and response.status_code == 304:
+            logger.debug("Cached response revalidated for %s", url)
+            cache.count(provider, "revalidations")
+            cache.touch(key)
+            return cached[0]
+        cache.count(provider, "misses")
+        if response.status_code == 200 and "no-store" not in response.headers.get(
+            "Cache-Control", ""
+        ):
+            cache.set(key, provider, response)
+    except (sqlite3.Error, OSError) as e:
+        logger.debug("Could not cache response of %s: %s", url, e)
+    return response
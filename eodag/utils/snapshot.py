@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024, CS GROUP - France, https://www.csgroup.eu/
+#
+# This file is part of EODAG project
+#     https://www.github.com/CS-SI/EODAG
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Binary snapshots of parsed configuration files, not to parse them at each start"""
+from __future__ import annotations
+
+import functools
+import glob
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import tempfile
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger("eodag.utils.snapshot")
+
+#: Version of the snapshots format, to increment when pickled configuration classes
+#: change in an incompatible way
+SNAPSHOT_FORMAT_VERSION = 1
+
+
+@functools.lru_cache(maxsize=1)
+def _snapshot_salt() -> bytes:
+    """Versions on which snapshots depend, mixed into their content hash"""
+    try:
+        eodag_version = version("eodag")
+    except PackageNotFoundError:  # pragma: no cover
+        eodag_version = "0.0.0"
+    return (
+        f"{SNAPSHOT_FORMAT_VERSION}|{eodag_version}|"
+        f"{sys.version_info.major}.{sys.version_info.minor}|"
+        f"{pickle.HIGHEST_PROTOCOL}|"
+    ).encode()
+
+
+def get_snapshot_dir() -> Optional[str]:
+    """Directory where configuration snapshots are stored.
+
+    It is ``$EODAG_CFG_SNAPSHOT_DIR``, defaulting to the ``.snapshots`` directory of the
+    eodag configuration directory. Snapshots are disabled if ``$EODAG_CFG_SNAPSHOT_DIR``
+    is set to an empty value.
+
+    :returns: The snapshots directory, ``None`` if snapshots are disabled
+    """
+    snapshot_dir = os.getenv("EODAG_CFG_SNAPSHOT_DIR")
+    if snapshot_dir is not None:
+        return snapshot_dir or None
+    conf_dir = os.getenv(
+        "EODAG_CFG_DIR",
+        default=os.path.join(os.path.expanduser("~"), ".config", "eodag"),
+    )
+    return os.path.join(conf_dir, ".snapshots")
+
+
+def _owned_by_current_user(fd: int) -> bool:
+    """Whether an open file is owned by the current user, always ``True`` on systems
+    without file owners"""
+    if not hasattr(os, "getuid"):
+        return True
+    return os.fstat(fd).st_uid == os.getuid()
+
+
+def load_snapshot(path: str, loader: Callable[[bytes], Any], kind: str = "yaml") -> Any:
+    """Load a configuration file, from its snapshot if it is up to date.
+
+    Snapshots are named after the hash of the file content, of the way it is loaded and
+    of the eodag and python versions: a modified file, or a new eodag version, makes
+    the file loaded again with ``loader`` and its snapshot replaced.
+
+    :param path: Path to the configuration file
+    :param loader: Function parsing the file content
+    :param kind: (optional) Name of the way the file is parsed by ``loader``
+    :returns: The parsed configuration
+    """
+    with open(path, "rb") as fh:
+        content = fh.read()
+    return load_content_snapshot(f"{kind}|{os.path.realpath(path)}", content, loader)
+
+
+def load_content_snapshot(
+    name: str, content: bytes, loader: Callable[[bytes], Any]
+) -> Any:
+    """Load an object built from some content, from its snapshot if the content did
+    not change.
+
+    A snapshot which cannot be unpickled, or whose object is ``None``, is ignored and
+    replaced. As unpickling a file can run arbitrary code, the snapshots directory is
+    created readable by the current user only, and snapshots owned by other users are
+    ignored and replaced too.
+
+    :param name: Name of the snapshot, only its latest version being kept
+    :param content: Content from which the object is built
+    :param loader: Function building the object from the content
+    :returns: The built object
+    """
+    snapshot_dir = get_snapshot_dir()
+    if snapshot_dir is None:
+        return loader(content)
+
+    name_key = hashlib.sha256(name.encode()).hexdigest()[:16]
+    content_key = hashlib.sha256(_snapshot_salt() + content).hexdigest()
+    snapshot_path = os.path.join(snapshot_dir, f"{name_key}-{content_key}.pickle")
+    try:
+        with open(snapshot_path, "rb") as snapshot_fh:
+            if not _owned_by_current_user(snapshot_fh.fileno()):
+                raise PermissionError("not owned by the current user")
+            loaded = pickle.load(snapshot_fh)
+        if loaded is not None:
+            return loaded
+        logger.debug("Ignoring empty snapshot %s", snapshot_path)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug("Ignoring invalid snapshot %s: %s", snapshot_path, e)
+
+    loaded = loader(content)
+    snapshot = pickle.dumps(loaded, protocol=pickle.HIGHEST_PROTOCOL)
+    try:
+        os.makedirs(snapshot_dir, mode=0o700, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=snapshot_dir, prefix=".", suffix=".tmp", delete=False
+        ) as tmp_fh:
+            tmp_fh.write(snapshot)
+        os.replace(tmp_fh.name, snapshot_path)
+        # remove the outdated snapshots
+        for outdated_path in glob.glob(os.path.join(snapshot_dir, f"{name_key}-*")):
+            if outdated_path != snapshot_path:
+                os.remove(outdated_path)
+        logger.debug("Snapshot of %s saved to %s", name, snapshot_path)
+    except OSError as e:
+        logger.debug("Cannot save the snapshot of %s: %s", name, e)
+    return loaded
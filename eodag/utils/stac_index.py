@@ -0,0 +1,516 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024, CS GROUP - France, https://www.csgroup.eu/
+#
+# This file is part of EODAG project
+#     https://www.github.com/CS-SI/EODAG
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from urllib.error import HTTPError
+from urllib.parse import urljoin
+from urllib.request import Request, urlopen
+
+import concurrent.futures
+import dateutil.parser
+import numpy as np
+import orjson
+import shapely
+from dateutil import tz
+from shapely.geometry import shape
+
+from eodag.utils import HTTP_REQ_TIMEOUT, USER_AGENT, get_ssl_context, makedirs
+from eodag.utils.exceptions import STACOpenerError
+from eodag.utils.stac_reader import _TextOpener
+
+if TYPE_CHECKING:
+    from shapely.geometry.base import BaseGeometry
+
+logger = logging.getLogger("eodag.utils.stac_index")
+
+#: Version of the on-disk index format, indexes using another version are rebuilt
+STAC_INDEX_VERSION = 2
+
+#: HTTP status codes for which a STAC object is considered removed from the catalog, it
+#: is kept in the index for other errors
+GONE_HTTP_CODES = (404, 410)
+
+
+def _to_timestamp(date_str: Optional[str]) -> Optional[float]:
+    """Convert an ISO 8601 date string to a UTC timestamp"""
+    if not date_str:
+        return None
+    try:
+        date = dateutil.parser.parse(date_str)
+    except (ValueError, OverflowError):
+        return None
+    if not date.tzinfo:
+        date = date.replace(tzinfo=tz.UTC)
+    return date.timestamp()
+
+
+class StacItemsIndex:
+    """Persistent local index of the items of a static STAC catalog.
+
+    Items are stored with their bounding box and time extent, and indexed in memory
+    using a spatial R-tree and sorted time arrays. The index is refreshed incrementally:
+    only items whose file modification time, ``ETag``, ``Last-Modified`` header or
+    ``updated`` property changed are indexed again, and remote catalogs answering
+    ``304 Not Modified`` are not browsed again: their indexed children and items are kept.
+    Items that could temporarily not be fetched are kept, only removed items are dropped.
+
+    :param stac_path: A STAC catalog or item path or url
+    :param index_dir: (optional) Directory where the index is persisted, kept in memory only if not set
+    :param ttl: (optional) Duration in seconds during which the index is used without being refreshed
+    :param recursive: (optional) Browse recursively in child nodes if True
+    :param max_connections: (optional) Maximum number of connections for concurrent HTTP requests
+    :param timeout: (optional) Timeout in seconds for each internal HTTP request
+    :param ssl_verify: (optional) SSL Verification for HTTP request
+    """
+
+    def __init__(
+        self,
+        stac_path: str,
+        index_dir: Optional[str] = None,
+        ttl: float = 600,
+        recursive: bool = True,
+        max_connections: int = 100,
+        timeout: int = HTTP_REQ_TIMEOUT,
+        ssl_verify: bool = True,
+    ) -> None:
+        self.stac_path = stac_path
+        self.ttl = ttl
+        self.recursive = recursive
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.ssl_verify = ssl_verify
+        self.path = (
+            os.path.join(
+                index_dir,
+                hashlib.sha1(f"{stac_path}#{recursive}".encode("utf-8")).hexdigest()
+                + ".json",
+            )
+            if index_dir
+            else None
+        )
+        self.refreshed: Optional[float] = None
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        # validators, item and child links of the catalogs
+        self.catalogs: Dict[str, Dict[str, Any]] = {}
+        self._items: List[Dict[str, Any]] = []
+        self._starts = np.empty(0)
+        self._ends = np.empty(0)
+        self._starts_order = np.empty(0, dtype=int)
+        self._ends_order = np.empty(0, dtype=int)
+        self._tree: Optional[shapely.STRtree] = None
+        self._tree_idx = np.empty(0, dtype=int)
+        self._no_bbox_idx = np.empty(0, dtype=int)
+        self.load()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def load(self) -> bool:
+        """Load the index persisted on disk
+
+        :returns: ``True`` if the index was loaded
+        """
+        if not self.path or not os.path.isfile(self.path):
+            return False
+        try:
+            with open(self.path, "rb") as f:
+                content = orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.warning("Could not load STAC index %s: %s", self.path, e)
+            return False
+        if (
+            content.get("version") != STAC_INDEX_VERSION
+            or content.get("stac_path") != self.stac_path
+        ):
+            logger.debug("Out-of-date STAC index %s will be rebuilt", self.path)
+            return False
+        self.refreshed = content["refreshed"]
+        self.catalogs = content["catalogs"]
+        self._set_entries(content["entries"])
+        logger.debug("STAC index loaded from %s (%s items)", self.path, len(self))
+        return True
+
+    def save(self) -> None:
+        """Persist the index on disk"""
+        if not self.path:
+            return
+        content = {
+            "version": STAC_INDEX_VERSION,
+            "stac_path": self.stac_path,
+            "refreshed": self.refreshed,
+            "catalogs": self.catalogs,
+            "entries": self.entries,
+        }
+        try:
+            makedirs(os.path.dirname(self.path))
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(orjson.dumps(content))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning("Could not save STAC index to %s: %s", self.path, e)
+
+    def refresh(self, force: bool = False) -> None:
+        """Update the index from the catalog if it is older than its ``ttl``
+
+        :param force: (optional) Refresh the index even if it is not out-of-date
+        """
+        if (
+            not force
+            and self.refreshed is not None
+            and time.time() - self.refreshed < self.ttl
+        ):
+            return
+
+        refreshed = time.time()
+        catalogs: Dict[str, Dict[str, Any]] = {}
+        # items in catalog order, with their entry if it is not fetched again
+        items: Dict[str, Optional[Dict[str, Any]]] = {}
+
+        def keep_subtree(href: str) -> None:
+            """Keep the indexed children and items of an unchanged catalog"""
+            stack = [href]
+            while stack:
+                node_href = stack.pop()
+                node = self.catalogs.get(node_href)
+                if node is None or node_href in catalogs:
+                    continue
+                catalogs[node_href] = node
+                for item_href in node["items"]:
+                    items[item_href] = self.entries.get(item_href)
+                stack.extend(reversed(node["children"]))
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_connections
+        ) as executor:
+            level = [self.stac_path]
+            while level:
+                next_level: List[str] = []
+                fetched = executor.map(self._fetch_catalog, level)
+                for href, (obj, validators) in zip(level, fetched):
+                    if href in catalogs:
+                        continue
+                    if obj is None:
+                        # removed, or not modified remote catalog
+                        if validators is not None:
+                            keep_subtree(href)
+                        continue
+                    validators = validators or {}
+                    if href == self.stac_path and obj.get("type") not in (
+                        "Catalog",
+                        "Collection",
+                        "Feature",
+                    ):
+                        raise STACOpenerError(
+                            f"{self.stac_path} must be a STAC catalog or a STAC item"
+                        )
+                    if obj.get("type") == "Feature":
+                        catalogs[href] = dict(validators, items=[href], children=[])
+                        items[href] = self._build_entry(obj, **validators)
+                        continue
+                    links = obj.get("links", [])
+                    node = dict(
+                        validators,
+                        items=self._links_hrefs(href, links, "item"),
+                        children=(
+                            self._links_hrefs(href, links, "child")
+                            if self.recursive
+                            else []
+                        ),
+                    )
+                    catalogs[href] = node
+                    for item_href in node["items"]:
+                        items[item_href] = None
+                    next_level.extend(node["children"])
+                level = next_level
+
+            logger.debug(
+                "Refreshing STAC index of %s (%s items)", self.stac_path, len(items)
+            )
+            hrefs = [href for href, entry in items.items() if entry is None]
+            new_entries = dict(
+                zip(
+                    hrefs,
+                    executor.map(
+                        lambda href: self._fetch_entry(href, self.entries.get(href)),
+                        hrefs,
+                    ),
+                )
+            )
+        entries = {
+            href: entry
+            for href, known_entry in items.items()
+            if (entry := known_entry or new_entries.get(href))
+        }
+
+        nb_updated = sum(
+            1 for href, entry in entries.items() if self.entries.get(href) is not entry
+        )
+        nb_removed = len(set(self.entries) - set(entries))
+        logger.debug(
+            "STAC index refreshed: %s items, %s updated, %s removed",
+            len(entries),
+            nb_updated,
+            nb_removed,
+        )
+        self.refreshed = refreshed
+        self.catalogs = catalogs
+        self._set_entries(entries)
+        self.save()
+
+    def search(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        geometry: Optional[BaseGeometry] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get the items that may match the given time and space extents.
+
+        Returned items are candidates: items ending before ``start``, starting after ``end``
+        or whose bounding box does not intersect ``geometry`` are excluded, items without
+        date or geometry are kept.
+
+        :param start: (optional) Start of the time extent, in ISO 8601 format
+        :param end: (optional) End of the time extent, in ISO 8601 format
+        :param geometry: (optional) Geometry the items must intersect
+        :returns: The candidate items, in catalog order
+        """
+        mask = np.ones(len(self._items), dtype=bool)
+
+        start_ts = _to_timestamp(start)
+        if start_ts is not None:
+            # items whose time extent ends before start (nan values are sorted last)
+            nb_before = np.searchsorted(
+                self._ends[self._ends_order], start_ts, side="left"
+            )
+            mask[self._ends_order[:nb_before]] = False
+
+        end_ts = _to_timestamp(end)
+        if end_ts is not None:
+            # items whose time extent starts after end
+            sorted_starts = self._starts[self._starts_order]
+            nb_not_after = np.searchsorted(sorted_starts, end_ts, side="right")
+            after_idx = self._starts_order[nb_not_after:]
+            mask[after_idx[~np.isnan(self._starts[after_idx])]] = False
+
+        if geometry is not None and self._tree is not None:
+            spatial_mask = np.zeros(len(self._items), dtype=bool)
+            spatial_mask[
+                self._tree_idx[self._tree.query(geometry, predicate="intersects")]
+            ] = True
+            spatial_mask[self._no_bbox_idx] = True
+            mask &= spatial_mask
+
+        return [self._items[i] for i in np.flatnonzero(mask)]
+
+    def _set_entries(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Set index entries and build in-memory indexes"""
+        self.entries = entries
+        values = list(entries.values())
+        self._items = [entry["item"] for entry in values]
+        self._starts = np.array(
+            [np.nan if e["start"] is None else e["start"] for e in values], dtype=float
+        )
+        self._ends = np.array(
+            [np.nan if e["end"] is None else e["end"] for e in values], dtype=float
+        )
+        self._starts_order = np.argsort(self._starts, kind="stable")
+        self._ends_order = np.argsort(self._ends, kind="stable")
+
+        with_bbox = [i for i, e in enumerate(values) if e["bbox"]]
+        self._tree_idx = np.array(with_bbox, dtype=int)
+        self._no_bbox_idx = np.array(
+            [i for i, e in enumerate(values) if not e["bbox"]], dtype=int
+        )
+        self._tree = (
+            shapely.STRtree(
+                shapely.box(*np.array([values[i]["bbox"] for i in with_bbox]).T)
+            )
+            if with_bbox
+            else None
+        )
+
+    @staticmethod
+    def _links_hrefs(
+        base_href: str, links: List[Dict[str, Any]], rel: str
+    ) -> List[str]:
+        """Absolute hrefs of the links of a catalog having the given relation"""
+        hrefs = []
+        for link in links:
+            href = link.get("href")
+            if link.get("rel") != rel or not href:
+                continue
+            if href.startswith(("http://", "https://", "file://")) or os.path.isabs(
+                href
+            ):
+                hrefs.append(href)
+            elif base_href.startswith(("http://", "https://")):
+                hrefs.append(urljoin(base_href, href))
+            else:
+                if base_href.startswith("file://"):
+                    base_href = base_href[len("file://") :]
+                hrefs.append(
+                    os.path.normpath(os.path.join(os.path.dirname(base_href), href))
+                )
+        return hrefs
+
+    def _fetch_json(
+        self, href: str, previous: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Optional[Dict[str, Any]], Dict[str, Any]]:
+        """Fetch a local or remote STAC object, unless it did not change since it was indexed
+
+        :param href: Path or url of the object
+        :param previous: (optional) Index entry of the object, holding its validators
+        :returns: The object, ``None`` if it did not change, and its validators
+        :raises: :class:`FileNotFoundError` if the object was removed
+        :raises: :class:`OSError` if the object could temporarily not be fetched
+        """
+        if href.startswith("file://"):
+            href = href[len("file://") :]
+        if not href.startswith(("http://", "https://")):
+            mtime = os.stat(href).st_mtime
+            if previous and previous.get("mtime") == mtime:
+                return None, {"mtime": mtime}
+            try:
+                return _TextOpener.read_local_json(href, as_json=True), {"mtime": mtime}
+            except STACOpenerError as e:
+                raise OSError(e) from e
+
+        headers = dict(USER_AGENT)
+        if previous and previous.get("etag"):
+            headers["If-None-Match"] = previous["etag"]
+        if previous and previous.get("last_modified"):
+            headers["If-Modified-Since"] = previous["last_modified"]
+        try:
+            res = urlopen(
+                Request(href, headers=headers),
+                timeout=self.timeout,
+                context=get_ssl_context(self.ssl_verify),
+            )
+        except HTTPError as e:
+            if e.code == 304 and previous:
+                return None, {
+                    k: previous[k] for k in ("etag", "last_modified") if k in previous
+                }
+            if e.code in GONE_HTTP_CODES:
+                raise FileNotFoundError(f"{href}: {e}") from e
+            raise
+        validators = {
+            "etag": res.getheader("ETag"),
+            "last_modified": res.getheader("Last-Modified"),
+        }
+        return orjson.loads(res.read()), {
+            k: v for k, v in validators.items() if v is not None
+        }
+
+    def _fetch_catalog(
+        self, href: str
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """Fetch a catalog of the index
+
+        :param href: Path or url of the catalog
+        :returns: The catalog and its validators. The catalog is ``None`` if it did not
+                  change, or could temporarily not be fetched and is kept with its
+                  children, and its validators are also ``None`` if it was removed. Local
+                  catalogs that did not change are returned from their indexed links,
+                  their children and items being checked again.
+        """
+        previous = self.catalogs.get(href)
+        try:
+            catalog, validators = self._fetch_json(href, previous)
+        except FileNotFoundError as e:
+            if href == self.stac_path:
+                raise STACOpenerError(f"Could not find STAC catalog {href}") from e
+            logger.warning("Could not find STAC catalog %s: %s", href, e)
+            return None, None
+        except OSError as e:
+            if previous is None:
+                if href == self.stac_path:
+                    raise STACOpenerError(f"Could not fetch STAC catalog {href}") from e
+                logger.warning("Could not fetch STAC catalog %s: %s", href, e)
+                return None, None
+            logger.warning(
+                "Could not fetch STAC catalog %s, its indexed items are kept: %s",
+                href,
+                e,
+            )
+            return None, previous
+        if catalog is None and previous is not None and "mtime" in validators:
+            # unchanged local catalog, cheap to browse again from its indexed links
+            return {
+                "type": "Feature" if previous["items"] == [href] else "Catalog",
+                "links": [{"rel": "item", "href": h} for h in previous["items"]]
+                + [{"rel": "child", "href": h} for h in previous["children"]],
+            }, validators
+        return catalog, validators
+
+    def _fetch_entry(
+        self, href: str, entry: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch an item and build its index entry, ``entry`` is returned if the item did
+        not change or could temporarily not be fetched, ``None`` if it was removed"""
+        try:
+            item, validators = self._fetch_json(href, entry)
+        except FileNotFoundError as e:
+            logger.warning("Could not find STAC item %s: %s", href, e)
+            return None
+        except OSError as e:
+            logger.warning("Could not fetch STAC item %s: %s", href, e)
+            return entry
+        if item is None:
+            return entry
+        updated = item.get("properties", {}).get("updated")
+        if (
+            entry
+            and not validators
+            and updated
+            and entry["item"].get("properties", {}).get("updated") == updated
+        ):
+            return entry
+        return self._build_entry(item, **validators)
+
+    @staticmethod
+    def _build_entry(item: Dict[str, Any], **validators: Any) -> Dict[str, Any]:
+        """Build the index entry of an item"""
+        bbox = item.get("bbox")
+        if bbox and len(bbox) == 6:
+            bbox = [bbox[0], bbox[1], bbox[3], bbox[4]]
+        elif not bbox and item.get("geometry"):
+            bbox = list(shape(item["geometry"]).bounds)
+
+        properties = item.get("properties", {})
+        timestamps = [
+            ts
+            for ts in (
+                _to_timestamp(properties.get(key))
+                for key in ("datetime", "start_datetime", "end_datetime")
+            )
+            if ts is not None
+        ]
+        return dict(
+            item=item,
+            bbox=bbox or None,
+            start=min(timestamps) if timestamps else None,
+            end=max(timestamps) if timestamps else None,
+            **{k: v for k, v in validators.items() if v is not None},
+        )
@@ -30,6 +30,7 @@ from eodag.api.product import EOProduct
 from eodag.api.product.drivers import DRIVERS
 from eodag.api.product.drivers.base import DatasetDriver
 from eodag.api.product.metadata_mapping import (
+    CompiledJsonMapping,
     format_metadata,
     OFFLINE_STATUS,
     ONLINE_STATUS,
@@ -37,7 +38,8 @@ from eodag.api.product.metadata_mapping import (
     properties_from_json,
     NOT_AVAILABLE,
 )
-from eodag.api.search_result import SearchResult
+from eodag.api.product_types_index import ProductTypesIndex
+from eodag.api.search_result import RawSearchResult, SearchResult
 from eodag.cli import download, eodag, list_pt, search_crunch
 from eodag.config import (
     load_default_config,
@@ -52,20 +54,29 @@ from eodag.config import (
 from eodag.plugins.apis.ecmwf import EcmwfApi
 from eodag.plugins.authentication.base import Authentication
 from eodag.plugins.authentication.header import HeaderAuth
+from eodag.plugins.authentication.sas_auth import RequestsSASAuth
 from eodag.plugins.base import PluginTopic
 from eodag.plugins.crunch.filter_date import FilterDate
+from eodag.plugins.crunch.filter_latest_intersect import FilterLatestIntersect
 from eodag.plugins.crunch.filter_latest_tpl_name import FilterLatestByName
 from eodag.plugins.crunch.filter_property import FilterProperty
 from eodag.plugins.crunch.filter_overlap import FilterOverlap
-from eodag.plugins.download.aws import AwsDownload
+from eodag.plugins.download.aws import AwsDownload, S3ObjectRanges
 from eodag.plugins.download.base import (
     Download,
     DEFAULT_DOWNLOAD_WAIT,
 )
-from eodag.plugins.download.http import HTTPDownload
+from eodag.plugins.download.http import (
+    BufferBudget,
+    BufferedAssetStream,
+    HTTPDownload,
+)
+from eodag.plugins.download.staging import StagingManager
 from eodag.plugins.manager import PluginManager
 from eodag.plugins.search import PreparedSearch
 from eodag.plugins.search.base import Search
+from eodag.plugins.search.qssearch import StacSearch
+from eodag.rest.stac import CompiledStacItem
 from eodag.types import model_fields_to_annotated
 from eodag.types.queryables import CommonQueryables, Queryables
 from eodag.utils import (
@@ -91,12 +102,37 @@ from eodag.utils import (
     sanitize,
     parse_header,
     get_ssl_context,
+    prefetch_iter,
+    format_dict_items,
+    jsonpath_parse_dict_items,
+    string_to_jsonpath,
+)
+from eodag.utils.archive import (
+    UnsupportedArchiveError,
+    check_stream_extractable,
+    stream_extract,
+)
+from eodag.utils.locations import get_location_index
+from eodag.utils.snapshot import load_content_snapshot, load_snapshot
+from eodag.utils.requests import (
+    fetch_json,
+    get_async_executor,
+    parse_retry_after,
+    PooledHTTPAdapter,
+    SessionsRegistry,
+    run_with_async_requests,
+)
+from eodag.utils.product_store import ProductStore, set_product_store
+from eodag.utils.response_cache import (
+    DiskResponseCache,
+    cached_request,
+    set_response_cache,
 )
-from eodag.utils.requests import fetch_json
 from eodag.utils.exceptions import (
     AddressNotFound,
     AuthenticationError,
     DownloadError,
+    EodagError,
     MisconfiguredError,
     NoMatchingProductType,
     NotAvailableError,
@@ -109,6 +145,7 @@ from eodag.utils.exceptions import (
     UnsupportedProvider,
     ValidationError,
 )
+from eodag.utils.stac_index import StacItemsIndex
 from eodag.utils.stac_reader import fetch_stac_items, _TextOpener
 from tests import TEST_RESOURCES_PATH
 from usgs.api import USGSAuthExpiredError, USGSError
@@ -16,11 +16,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
+import shutil
+import sys
 import unittest
 from tempfile import TemporaryDirectory
 
-import pkg_resources
-
 from tests import TEST_RESOURCES_PATH
 from tests.context import EODataAccessGateway
 from tests.utils import mock
@@ -37,16 +37,17 @@ class TestExternalPluginConfig(unittest.TestCase):
         self.expanduser_mock.start()
 
         self.dag = EODataAccessGateway()
+        self.tmp_dist_dir = TemporaryDirectory()
 
     def tearDown(self):
         super(TestExternalPluginConfig, self).tearDown()
 
         self.dag.providers_config.pop("fakeplugin_provider", None)
 
-        # remove entry point manually, see https://github.com/pypa/setuptools/issues/1759
-        distpath = pkg_resources.working_set.by_key.pop("eodag-fakeplugin").location
-        pkg_resources.working_set.entry_keys.pop(distpath)
-        pkg_resources.working_set.entries.remove(distpath)
+        # remove the fake distribution
+        if self.tmp_dist_dir.name in sys.path:
+            sys.path.remove(self.tmp_dist_dir.name)
+        self.tmp_dist_dir.cleanup()
 
         # stop Mock and remove tmp config dir
         self.expanduser_mock.stop()
@@ -57,23 +58,23 @@ class TestExternalPluginConfig(unittest.TestCase):
 
         default_providers_count = len(self.dag.providers_config)
 
-        fakeplugin_location = os.path.join(TEST_RESOURCES_PATH, "fake_ext_plugin")
-
-        # Create the fake entry point definition
-        ep = pkg_resources.EntryPoint.parse(
-            "FakePluginAPI = eodag_fakeplugin:FakePluginAPI"
+        # Create a fake distribution declaring the fake plugin entry point
+        shutil.copytree(
+            os.path.join(TEST_RESOURCES_PATH, "fake_ext_plugin", "eodag_fakeplugin"),
+            os.path.join(self.tmp_dist_dir.name, "eodag_fakeplugin"),
         )
-        # Create a fake distribution to insert into the global working_set
-        d = pkg_resources.Distribution(
-            location=fakeplugin_location,
-            project_name="eodag_fakeplugin",
-            version="0.1",
+        dist_info_dir = os.path.join(
+            self.tmp_dist_dir.name, "eodag_fakeplugin-0.1.dist-info"
         )
-        ep.dist = d
-        # Add the mapping to the fake EntryPoint
-        d._ep_map = {"eodag.plugins.api": {"FakePluginAPI": ep}}
-        # Add the fake distribution to the global working_set
-        pkg_resources.working_set.add(d, fakeplugin_location)
+        os.makedirs(dist_info_dir)
+        with open(os.path.join(dist_info_dir, "METADATA"), "w") as fh:
+            fh.write("Metadata-Version: 2.1\nName: eodag-fakeplugin\nVersion: 0.1\n")
+        with open(os.path.join(dist_info_dir, "entry_points.txt"), "w") as fh:
+            fh.write(
+                "[eodag.plugins.api]\nFakePluginAPI = eodag_fakeplugin:FakePluginAPI\n"
+            )
+        # Make the fake distribution discoverable
+        sys.path.insert(0, self.tmp_dist_dir.name)
 
         # New EODataAccessGateway instance, check if new conf has been loaded
         self.dag = EODataAccessGateway()
@@ -86,7 +86,7 @@ class TestCoreSearch(unittest.TestCase):
         )
 
     @mock.patch(
-        "eodag.plugins.search.qssearch.requests.post",
+        "eodag.plugins.search.qssearch.requests.Session.post",
         autospec=True,
         side_effect=RequestException,
     )
@@ -108,7 +108,7 @@ class TestCoreSearch(unittest.TestCase):
         self.assertRaises(RequestError, next, self.dag.search_iter_page())
 
     @mock.patch(
-        "eodag.plugins.search.qssearch.requests.post",
+        "eodag.plugins.search.qssearch.requests.Session.post",
         autospec=True,
         side_effect=RequestException,
     )
@@ -185,7 +185,7 @@ class TestCoreSearch(unittest.TestCase):
         autospec=True,
     )
     @mock.patch(
-        "eodag.plugins.search.qssearch.requests.post",
+        "eodag.plugins.search.qssearch.requests.Session.post",
         autospec=True,
         side_effect=RequestException,
     )
@@ -220,7 +220,7 @@ class TestCoreSearch(unittest.TestCase):
         side_effect=RequestException,
     )
     @mock.patch(
-        "eodag.plugins.search.qssearch.requests.post",
+        "eodag.plugins.search.qssearch.requests.Session.post",
         autospec=True,
         side_effect=RequestException,
     )
@@ -16,15 +16,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
 import json
 import os
 import shutil
 import tempfile
 
+import geojson
 from shapely import geometry
 
 from tests import TEST_RESOURCES_PATH, EODagTestCase
-from tests.context import EODataAccessGateway, EOProduct, PluginTopic, SearchResult
+from tests.context import (
+    EODataAccessGateway,
+    EOProduct,
+    PluginTopic,
+    SearchResult,
+    ValidationError,
+)
 from tests.utils import mock
 
 
@@ -146,6 +154,60 @@ class TestCoreSearchResults(EODagTestCase):
         with open(search_results_geojson_path, "r") as f:
             self.make_assertions(f)
 
+    def test_core_serialize_deserialize_stream(self):
+        """The core api must write and lazily read products one by one"""
+        products = self.search_result.data * 3
+        for output_format in ("ndjson", "geojson-seq"):
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                path = os.path.join(tmp_dir, "search_results.ndjson")
+                self.assertEqual(
+                    self.dag.serialize_stream(
+                        iter(products), filename=path, output_format=output_format
+                    ),
+                    3,
+                )
+                with open(path, "r") as f:
+                    lines = f.readlines()
+                self.assertEqual(len(lines), 3)
+                if output_format == "geojson-seq":
+                    self.assertTrue(all(line.startswith("\x1e") for line in lines))
+                    lines = [line[1:] for line in lines]
+                self.assertEqual(
+                    json.loads(lines[0])["id"], products[0].properties["id"]
+                )
+
+                deserialized = self.dag.deserialize_stream(path)
+                self.assertNotIsInstance(deserialized, (list, SearchResult))
+                deserialized = list(deserialized)
+                self.assertEqual(len(deserialized), 3)
+                self.assertIsInstance(deserialized[0], EOProduct)
+                self.assertEqual(
+                    deserialized[0].properties["id"], products[0].properties["id"]
+                )
+                self.assertEqual(deserialized[0].geometry, products[0].geometry)
+
+        # feature collections are also accepted
+        search_results_geojson_path = os.path.join(
+            TEST_RESOURCES_PATH, "eodag_search_result.geojson"
+        )
+        self.assertEqual(
+            [
+                p.properties["id"]
+                for p in self.dag.deserialize_stream(search_results_geojson_path)
+            ],
+            [
+                p.properties["id"]
+                for p in self.dag.deserialize(search_results_geojson_path)
+            ],
+        )
+
+        # malformed lines are reported without reading the rest of the file
+        stream = io.StringIO(geojson.dumps(products[0]) + "\n{not json\n")
+        deserialized = self.dag.deserialize_stream(stream)
+        self.assertIsInstance(next(deserialized), EOProduct)
+        with self.assertRaisesRegex(ValidationError, "line 2"):
+            next(deserialized)
+
     def make_assertions(self, f):
         d = json.load(f)
         self.assertEqual(d["type"], self.geojson_repr["type"])
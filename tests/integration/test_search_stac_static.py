@@ -29,6 +29,7 @@ from tests.context import (
     FilterOverlap,
     FilterProperty,
     SearchResult,
+    StacSearch,
 )
 from tests.utils import mock
 
@@ -346,6 +347,32 @@ class TestSearchStacStatic(unittest.TestCase):
         )
         self.assertEqual(len(filtered_items), 1)
 
+    @mock.patch(
+        "eodag.api.core.EODataAccessGateway.fetch_product_types_list", autospec=True
+    )
+    def test_search_stac_static_pagination(self, mock_fetch_product_types_list):
+        """Use StaticStacSearch plugin to search items page per page"""
+        all_ids = [p.properties["id"] for p in self.dag.search(count=True)]
+        pages = [
+            self.dag.search(page=page, items_per_page=2, count=True)
+            for page in (1, 2, 3)
+        ]
+        self.assertListEqual([len(p) for p in pages], [2, 2, 1])
+        self.assertListEqual([p.number_matched for p in pages], [5, 5, 5])
+        self.assertListEqual(
+            [p.properties["id"] for page in pages for p in page], all_ids
+        )
+
+        # without count, only the items needed for the requested page are converted
+        with mock.patch(
+            "eodag.plugins.search.qssearch.StacSearch.normalize_results",
+            autospec=True,
+            side_effect=StacSearch.normalize_results,
+        ) as mock_normalize_results:
+            search_result = self.dag.search(page=1, items_per_page=2)
+        self.assertListEqual([p.properties["id"] for p in search_result], all_ids[:2])
+        self.assertEqual(mock_normalize_results.call_count, 1)
+
     @mock.patch(
         "eodag.api.core.EODataAccessGateway.fetch_product_types_list", autospec=True
     )
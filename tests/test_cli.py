@@ -407,6 +407,42 @@ class TestEodagCli(unittest.TestCase):
                 locations=None,
             )
 
+    @mock.patch("eodag.cli.EODataAccessGateway", autospec=True)
+    def test_eodag_search_stream(self, dag):
+        """Calling eodag search with --stream must write products one by one"""
+        with self.user_conf() as conf_file:
+            api_obj = dag.return_value
+            api_obj.serialize_stream.return_value = 3
+            result = self.runner.invoke(
+                eodag,
+                ["search", "--conf", conf_file, "-p", "whatever", "--stream"],
+            )
+            api_obj.search_stream.assert_called_once()
+            self.assertEqual(
+                api_obj.search_stream.call_args[1]["productType"], "whatever"
+            )
+            api_obj.serialize_stream.assert_called_once_with(
+                api_obj.search_stream.return_value, filename="search_results.ndjson"
+            )
+            api_obj.search_all.assert_not_called()
+            api_obj.serialize.assert_not_called()
+            self.assertIn("Returned 3 products", result.output)
+
+            # options that cannot be honored when streaming
+            for options in (
+                ["--cruncher", "FilterLatestByName"],
+                ["--cruncher-args", "FilterOverlap", "minimum_overlap", "1"],
+                ["--page", "2"],
+                ["--count"],
+            ):
+                result = self.runner.invoke(
+                    eodag,
+                    ["search", "--conf", conf_file, "-p", "whatever", "--stream"]
+                    + options,
+                )
+                self.assertIn("Illegal usage", result.output)
+                self.assertNotEqual(result.exit_code, 0)
+
     @mock.patch("eodag.cli.EODataAccessGateway", autospec=True)
     def test_eodag_search_query(self, dag):
         """Calling eodag search with --query argument"""
@@ -776,9 +812,29 @@ class TestEodagCli(unittest.TestCase):
         )
         dag.assert_called_once_with(user_conf_file_path=config_path)
         dag.return_value.deserialize.assert_called_once_with(search_results_path)
-        self.assertEqual(dag.return_value.download_all.call_count, 1)
+        dag.return_value.download_all.assert_called_once_with(
+            dag.return_value.deserialize.return_value, max_workers=1
+        )
         self.assertEqual("Downloaded /fake_path\n", result.output)
 
+        # concurrent download
+        dag.return_value.download_all.reset_mock()
+        result = self.runner.invoke(
+            eodag,
+            [
+                "download",
+                "--search-results",
+                search_results_path,
+                "-f",
+                config_path,
+                "--max-workers",
+                "4",
+            ],
+        )
+        dag.return_value.download_all.assert_called_once_with(
+            dag.return_value.deserialize.return_value, max_workers=4
+        )
+
         # Testing the case when no downloaded path is returned
         dag.return_value.download_all.return_value = [None]
         result = self.runner.invoke(
@@ -17,6 +17,8 @@
 # limitations under the License.
 
 import os
+import pickle
+import stat
 import tempfile
 import unittest
 from io import StringIO
@@ -34,6 +36,7 @@ from tests.context import (
     ValidationError,
     config,
     get_ext_product_types_conf,
+    load_snapshot,
     load_stac_provider_config,
     merge_configs,
 )
@@ -489,6 +492,85 @@ class TestConfigFunctions(unittest.TestCase):
         self.assertIsInstance(ext_product_types_conf, dict)
         self.assertIn("foo", ext_product_types_conf["earth_search"]["providers_config"])
 
+    def test_load_snapshot(self):
+        """Parsed configuration files must be snapshotted until they are modified"""
+        with TemporaryDirectory() as tmp_dir:
+            conf_path = os.path.join(tmp_dir, "providers.yml")
+            snapshot_dir = os.path.join(tmp_dir, "snapshots")
+            with open(conf_path, "w") as fh:
+                fh.write("!provider\nname: foo\nsearch: !plugin\n  type: Bar\n")
+
+            def yaml_loader(content):
+                return list(yaml.load_all(content.decode(), Loader=yaml.Loader))
+
+            loader = mock.Mock(side_effect=yaml_loader)
+            with mock.patch.dict(os.environ, {"EODAG_CFG_SNAPSHOT_DIR": snapshot_dir}):
+                load_snapshot(conf_path, loader)
+                provider_config = load_snapshot(conf_path, loader)[0]
+                loader.assert_called_once()
+                self.assertEqual(len(os.listdir(snapshot_dir)), 1)
+                self.assertIsInstance(provider_config, config.ProviderConfig)
+                self.assertEqual(provider_config.search.type, "Bar")
+
+                # the snapshot is unpickled only once
+                with mock.patch(
+                    "eodag.utils.snapshot.pickle.load", wraps=pickle.load
+                ) as mock_load, mock.patch(
+                    "eodag.utils.snapshot.pickle.loads", wraps=pickle.loads
+                ) as mock_loads:
+                    load_snapshot(conf_path, loader)
+                self.assertEqual(mock_load.call_count + mock_loads.call_count, 1)
+
+                # modified file: loaded again, and its outdated snapshot removed
+                with open(conf_path, "a") as fh:
+                    fh.write("priority: 2\n")
+                self.assertEqual(load_snapshot(conf_path, loader)[0].priority, 2)
+                self.assertEqual(loader.call_count, 2)
+                self.assertEqual(len(os.listdir(snapshot_dir)), 1)
+
+                # invalid snapshot: loaded again
+                snapshot_path = os.path.join(snapshot_dir, os.listdir(snapshot_dir)[0])
+                with open(snapshot_path, "wb") as fh:
+                    fh.write(b"invalid")
+                self.assertEqual(load_snapshot(conf_path, loader)[0].priority, 2)
+                self.assertEqual(loader.call_count, 3)
+
+            # disabled snapshots
+            with mock.patch.dict(os.environ, {"EODAG_CFG_SNAPSHOT_DIR": ""}):
+                load_snapshot(conf_path, loader)
+                load_snapshot(conf_path, loader)
+                self.assertEqual(loader.call_count, 5)
+
+    @unittest.skipIf(not hasattr(os, "getuid"), "files have no owner")
+    def test_load_snapshot_other_user(self):
+        """Snapshots must only be readable by the current user, and snapshots owned by
+        other users must not be trusted"""
+        with TemporaryDirectory() as tmp_dir:
+            conf_path = os.path.join(tmp_dir, "providers.yml")
+            snapshot_dir = os.path.join(tmp_dir, "snapshots")
+            with open(conf_path, "w") as fh:
+                fh.write("!provider\nname: foo\nsearch: !plugin\n  type: Bar\n")
+            loader = mock.Mock(
+                side_effect=lambda content: list(
+                    yaml.load_all(content.decode(), Loader=yaml.Loader)
+                )
+            )
+            with mock.patch.dict(os.environ, {"EODAG_CFG_SNAPSHOT_DIR": snapshot_dir}):
+                load_snapshot(conf_path, loader)
+                self.assertEqual(stat.S_IMODE(os.stat(snapshot_dir).st_mode), 0o700)
+                load_snapshot(conf_path, loader)
+                self.assertEqual(loader.call_count, 1)
+
+                with mock.patch(
+                    "eodag.utils.snapshot.os.getuid", return_value=os.getuid() + 1
+                ), mock.patch(
+                    "eodag.utils.snapshot.pickle.load", wraps=pickle.load
+                ) as mock_load:
+                    provider_config = load_snapshot(conf_path, loader)[0]
+                mock_load.assert_not_called()
+                self.assertEqual(loader.call_count, 2)
+                self.assertEqual(provider_config.search.type, "Bar")
+
 
 class TestStacProviderConfig(unittest.TestCase):
     def setUp(self):
@@ -574,7 +574,9 @@ class TestAuthPluginSASAuth(BaseAuthPluginTest):
         auth_plugin.config.credentials = {"apikey": "foo"}
         auth_plugin.validate_config_credentials()
 
-    @mock.patch("eodag.plugins.authentication.sas_auth.requests.get", autospec=True)
+    @mock.patch(
+        "eodag.plugins.authentication.sas_auth.requests.Session.get", autospec=True
+    )
     def test_plugins_auth_sasauth_text_token_authenticate_with_credentials(
         self, mock_requests_get
     ):
@@ -605,11 +607,13 @@ class TestAuthPluginSASAuth(BaseAuthPluginTest):
 
         # check SAS get request call arguments
         args, kwargs = mock_requests_get.call_args
-        assert args[0] == auth_plugin.config.auth_uri.format(url=url)
+        assert args[1] == auth_plugin.config.auth_uri.format(url=url)
         auth_plugin_headers = {"Ocp-Apim-Subscription-Key": "foo"}
         self.assertDictEqual(kwargs["headers"], dict(auth_plugin_headers, **USER_AGENT))
 
-    @mock.patch("eodag.plugins.authentication.sas_auth.requests.get", autospec=True)
+    @mock.patch(
+        "eodag.plugins.authentication.sas_auth.requests.Session.get", autospec=True
+    )
     def test_plugins_auth_sasauth_text_token_authenticate_without_credentials(
         self, mock_requests_get
     ):
@@ -639,11 +643,13 @@ class TestAuthPluginSASAuth(BaseAuthPluginTest):
 
         # check SAS get request call arguments
         args, kwargs = mock_requests_get.call_args
-        assert args[0] == auth_plugin.config.auth_uri.format(url=url)
+        assert args[1] == auth_plugin.config.auth_uri.format(url=url)
         # check if headers only has the user agent as a request call argument
         assert kwargs["headers"] == USER_AGENT
 
-    @mock.patch("eodag.plugins.authentication.sas_auth.requests.get", autospec=True)
+    @mock.patch(
+        "eodag.plugins.authentication.sas_auth.requests.Session.get", autospec=True
+    )
     def test_plugins_auth_sasauth_request_error(self, mock_requests_get):
         """SASAuth.authenticate must raise an AuthenticationError if an error occurs"""
         auth_plugin = self.get_auth_plugin("foo_provider")
@@ -661,6 +667,84 @@ class TestAuthPluginSASAuth(BaseAuthPluginTest):
         with self.assertRaises(AuthenticationError):
             auth(req)
 
+    @mock.patch(
+        "eodag.plugins.authentication.sas_auth.requests.Session.get", autospec=True
+    )
+    def test_plugins_auth_sasauth_missing_signed_url(self, mock_requests_get):
+        """RequestsSASAuth must raise an AuthenticationError and not cache a missing signed url"""
+        auth_plugin = self.get_auth_plugin("foo_provider")
+        auth_plugin.config.credentials = {}
+
+        mock_requests_get.return_value.json.return_value = {"not-href": "foo"}
+        auth = auth_plugin.authenticate()
+
+        for _ in range(2):
+            with self.assertRaises(AuthenticationError):
+                auth(mock.Mock(headers={}, url="url"))
+        self.assertEqual(mock_requests_get.call_count, 2)
+        self.assertEqual(len(auth.signed_urls), 0)
+
+    @mock.patch(
+        "eodag.plugins.authentication.sas_auth.requests.Session.get", autospec=True
+    )
+    def test_plugins_auth_sasauth_signed_urls_cache(self, mock_requests_get):
+        """RequestsSASAuth must cache signed urls until they expire, in a bounded cache"""
+        auth_plugin = self.get_auth_plugin("foo_provider")
+        auth_plugin.config.credentials = {}
+        auth_plugin.config.max_signed_urls = 2
+
+        def signed_url_response(session, url, **kwargs):
+            response = mock.Mock()
+            response.json.return_value = {
+                "href": f"{url}&se=2100-01-01T00%3A00%3A00Z&sig=foo"
+            }
+            return response
+
+        mock_requests_get.side_effect = signed_url_response
+        auth = auth_plugin.authenticate()
+
+        for url in ("url1", "url1", "url2", "url3", "url1"):
+            auth(mock.Mock(headers={}, url=url))
+        # url1 was evicted when url3 was signed
+        self.assertEqual(mock_requests_get.call_count, 4)
+        self.assertEqual(len(auth.signed_urls), 2)
+
+        # expired signed urls are signed again
+        with mock.patch(
+            "eodag.plugins.authentication.sas_auth.time.time", return_value=4102444750
+        ):
+            req = mock.Mock(headers={}, url="url1")
+            auth(req)
+        self.assertEqual(mock_requests_get.call_count, 5)
+        self.assertIn("se=2100-01-01", req.url)
+
+    @mock.patch(
+        "eodag.plugins.authentication.sas_auth.requests.Session.get", autospec=True
+    )
+    def test_plugins_auth_sasauth_sign_urls(self, mock_requests_get):
+        """RequestsSASAuth.sign_urls must sign all not yet signed urls"""
+        auth_plugin = self.get_auth_plugin("foo_provider")
+        auth_plugin.config.credentials = {}
+
+        def signed_url_response(session, url, **kwargs):
+            if url.endswith("error"):
+                raise RequestException()
+            response = mock.Mock()
+            response.json.return_value = {"href": f"{url}&sig=foo"}
+            return response
+
+        mock_requests_get.side_effect = signed_url_response
+        auth = auth_plugin.authenticate()
+
+        auth(mock.Mock(headers={}, url="url1"))
+        signed_urls = auth.sign_urls(["url1", "url2", "url3", "url2", "error"])
+        self.assertDictEqual(
+            signed_urls,
+            {f"url{i}": f"http://foo.bar?href=url{i}&sig=foo" for i in range(1, 4)},
+        )
+        # url1 was already signed and url2 is only signed once
+        self.assertEqual(mock_requests_get.call_count, 4)
+
 
 class TestAuthPluginKeycloakOIDCPasswordAuth(BaseAuthPluginTest):
     @classmethod
@@ -23,14 +23,14 @@ import logging
 import os
 import shutil
 import tempfile
+import threading
+import time
 import unittest
-import uuid
-from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest.mock import Mock
 
 from lxml import html
-from pkg_resources import DistributionNotFound, resource_filename
+from pkg_resources import resource_filename
 from pydantic import ValidationError
 from shapely import wkt
 from shapely.geometry import LineString, MultiPolygon, Polygon
@@ -38,18 +38,25 @@ from shapely.geometry import LineString, MultiPolygon, Polygon
 from eodag import __version__ as eodag_version
 from eodag.types.queryables import QueryablesDict
 from eodag.utils import GENERIC_PRODUCT_TYPE
+from eodag.utils.exceptions import ValidationError as EodagValidationError
 from tests import TEST_RESOURCES_PATH
 from tests.context import (
     DEFAULT_MAX_ITEMS_PER_PAGE,
+    Authentication,
     CommonQueryables,
+    EodagError,
     EODataAccessGateway,
     EOProduct,
     NoMatchingProductType,
     PluginImplementationError,
+    PluginManager,
+    ProductTypesIndex,
     ProviderConfig,
     Queryables,
+    RawSearchResult,
     RequestError,
     SearchResult,
+    TimeOutError,
     UnsupportedProductType,
     UnsupportedProvider,
     get_geometry_from_various,
@@ -921,6 +928,46 @@ class TestCore(TestCoreBase):
             "Foo collection",
         )
 
+    @mock.patch(
+        "eodag.plugins.search.qssearch.QueryStringSearch.discover_product_types",
+        autospec=True,
+    )
+    def test_discover_product_types_timeout(self, mock_plugin_discover_product_types):
+        """Core api must fetch providers concurrently and skip the late ones"""
+        self.dag.update_providers_config(
+            """
+            earth_search:
+                group: foo_group
+            planetary_computer:
+                group: foo_group
+            """
+        )
+        released = threading.Event()
+        stop_events = []
+
+        def discover_product_types(search_plugin, **kwargs):
+            stop_events.append(kwargs["stop_event"])
+            if search_plugin.provider == "planetary_computer":
+                released.wait(5)
+            return {
+                "providers_config": {"foo": {"productType": "foo"}},
+                "product_types_config": {"foo": {"title": "Foo collection"}},
+            }
+
+        mock_plugin_discover_product_types.side_effect = discover_product_types
+        try:
+            ext_product_types_conf = self.dag.discover_product_types(
+                provider="foo_group", timeout=0.5
+            )
+        finally:
+            released.set()
+        self.assertEqual(mock_plugin_discover_product_types.call_count, 2)
+        self.assertIn("earth_search", ext_product_types_conf)
+        # late provider is not marked as fetched, and asked to stop
+        self.assertNotIn("planetary_computer", ext_product_types_conf)
+        self.assertEqual(len(stop_events), 2)
+        self.assertTrue(all(stop_event.is_set() for stop_event in stop_events))
+
     @mock.patch(
         "eodag.plugins.apis.ecmwf.EcmwfApi.discover_product_types",
         autospec=True,
@@ -965,7 +1012,7 @@ class TestCore(TestCoreBase):
 
     @mock.patch("eodag.api.core.get_ext_product_types_conf", autospec=True)
     @mock.patch(
-        "eodag.api.core.EODataAccessGateway.discover_product_types", autospec=True
+        "eodag.api.core.EODataAccessGateway._discover_product_types", autospec=True
     )
     def test_fetch_product_types_list(
         self, mock_discover_product_types, mock_get_ext_product_types_conf
@@ -1030,9 +1077,7 @@ class TestCore(TestCoreBase):
             """
         )
         self.dag.fetch_product_types_list()
-        mock_discover_product_types.assert_called_once_with(
-            self.dag, provider="earth_search"
-        )
+        mock_discover_product_types.assert_called_once_with(self.dag, ["earth_search"])
 
         # add new provider conf and check that discover_product_types() is launched for it
         self.assertEqual(mock_discover_product_types.call_count, 1)
@@ -1048,19 +1093,17 @@ class TestCore(TestCoreBase):
             """
         )
         self.dag.fetch_product_types_list()
-        mock_discover_product_types.assert_called_with(
-            self.dag, provider="foo_provider"
+        # dynamically configured providers are discovered together
+        self.assertCountEqual(
+            mock_discover_product_types.call_args[0][1],
+            ["earth_search", "foo_provider"],
         )
-        # discover_product_types() should have been called 2 more times
-        # (once per dynamically configured provider)
-        self.assertEqual(mock_discover_product_types.call_count, 3)
+        self.assertEqual(mock_discover_product_types.call_count, 2)
 
         # now check that if provider is specified, only this one is fetched
         mock_discover_product_types.reset_mock()
         self.dag.fetch_product_types_list(provider="foo_provider")
-        mock_discover_product_types.assert_called_once_with(
-            self.dag, provider="foo_provider"
-        )
+        mock_discover_product_types.assert_called_once_with(self.dag, ["foo_provider"])
 
     @mock.patch("eodag.api.core.get_ext_product_types_conf", autospec=True)
     @mock.patch(
@@ -1085,7 +1128,7 @@ class TestCore(TestCoreBase):
 
     @mock.patch("eodag.api.core.get_ext_product_types_conf", autospec=True)
     @mock.patch(
-        "eodag.api.core.EODataAccessGateway.discover_product_types", autospec=True
+        "eodag.api.core.EODataAccessGateway._discover_product_types", autospec=True
     )
     def test_fetch_product_types_list_updated_system_conf(
         self, mock_discover_product_types, mock_get_ext_product_types_conf
@@ -1127,11 +1170,11 @@ class TestCore(TestCoreBase):
 
             self.dag.fetch_product_types_list()
             mock_discover_product_types.assert_called_once_with(
-                self.dag, provider="new_provider"
+                self.dag, ["new_provider"]
             )
 
     @mock.patch(
-        "eodag.api.core.EODataAccessGateway.discover_product_types", autospec=True
+        "eodag.api.core.EODataAccessGateway._discover_product_types", autospec=True
     )
     def test_fetch_product_types_list_disabled(self, mock_discover_product_types):
         """fetch_product_types_list must not launch product types discovery if disabled"""
@@ -1160,7 +1203,11 @@ class TestCore(TestCoreBase):
             """
         )
         self.dag.fetch_product_types_list()
-        self.assertEqual(mock_discover_product_types.call_count, 2)
+        mock_discover_product_types.assert_called_once()
+        self.assertCountEqual(
+            mock_discover_product_types.call_args[0][1],
+            ["earth_search", "foo_provider"],
+        )
 
     def assertListProductTypesRightStructure(self, structure):
         """Helper method to verify that the structure given is a good result of
@@ -1179,15 +1226,11 @@ class TestCore(TestCoreBase):
             or structure["_id"] in self.SUPPORTED_PRODUCT_TYPES
         )
 
-    @mock.patch("eodag.api.core.open_dir", autospec=True)
-    @mock.patch("eodag.api.core.exists_in", autospec=True, return_value=True)
-    def test_core_object_open_index_if_exists(self, exists_in_mock, open_dir_mock):
-        """The core object must use the existing index dir if any"""
-        index_dir = os.path.join(self.conf_dir, ".index")
-        if not os.path.exists(index_dir):
-            makedirs(index_dir)
-        EODataAccessGateway()
-        open_dir_mock.assert_called_with(index_dir)
+    def test_core_object_builds_index(self):
+        """The core object must build the product types index on instantiation"""
+        dag = EODataAccessGateway()
+        self.assertIsInstance(dag._product_types_index, ProductTypesIndex)
+        self.assertIn("S2_MSI_L1C", dag._product_types_index)
 
     def test_core_object_set_default_locations_config(self):
         """The core object must set the default locations config on instantiation"""
@@ -1232,27 +1275,88 @@ class TestCore(TestCoreBase):
             os.environ.pop("EODAG__PEPS__SEARCH__NEED_AUTH", None)
             os.environ.pop("EODAG__PEPS__AUTH__CREDENTIALS__USERNAME", None)
 
-    @mock.patch("eodag.plugins.manager.pkg_resources.iter_entry_points", autospec=True)
-    def test_prune_providers_list_skipped_plugin(self, mock_iter_ep):
+    @mock.patch("eodag.plugins.manager.entry_points", autospec=True)
+    def test_prune_providers_list_skipped_plugin(self, mock_entry_points):
         """Providers needing skipped plugin must be pruned on init"""
         empty_conf_file = resource_filename(
             "eodag", os.path.join("resources", "user_conf_template.yml")
         )
 
-        def skip_qssearch(topic):
+        def skip_qssearch(group):
+            if group != "eodag.plugins.search":
+                return []
             ep = mock.MagicMock()
-            if topic == "eodag.plugins.search":
-                ep.name = "QueryStringSearch"
-                ep.load = mock.MagicMock(side_effect=DistributionNotFound())
+            ep.name = "QueryStringSearch"
+            ep.extras = ["foo"]
+            ep.dist.name = "eodag"
+            ep.dist.requires = ['not-installed-package; extra == "foo"']
             return [ep]
 
-        mock_iter_ep.side_effect = skip_qssearch
+        mock_entry_points.side_effect = skip_qssearch
 
         dag = EODataAccessGateway(user_conf_file_path=empty_conf_file)
         self.assertNotIn("peps", dag.available_providers())
         self.assertEqual(dag._plugins_manager.skipped_plugins, ["QueryStringSearch"])
         dag._plugins_manager.skipped_plugins = []
 
+    @mock.patch("eodag.plugins.manager.entry_points", autospec=True)
+    def test_plugins_loaded_on_first_use(self, mock_entry_points):
+        """Plugins modules must be imported when their plugins are first built"""
+
+        def load_fake_auth():
+            class FakeLazyAuth(Authentication):
+                pass
+
+            return FakeLazyAuth
+
+        ep = mock.MagicMock()
+        ep.name = "FakeLazyAuth"
+        ep.extras = []
+        ep.dist.name = "eodag"
+        ep.load.side_effect = load_fake_auth
+        mock_entry_points.side_effect = lambda group: (
+            [ep] if group == "eodag.plugins.auth" else []
+        )
+
+        provider_config = ProviderConfig.from_mapping(
+            {
+                "name": "fake_provider",
+                "products": {GENERIC_PRODUCT_TYPE: {}},
+                "auth": {"type": "FakeLazyAuth"},
+            }
+        )
+        plugins_manager = PluginManager({"fake_provider": provider_config})
+        ep.load.assert_not_called()
+
+        auth_plugin = next(plugins_manager.get_auth_plugins("fake_provider"))
+        self.assertEqual(type(auth_plugin).__name__, "FakeLazyAuth")
+        next(plugins_manager.get_auth_plugins("fake_provider"))
+        ep.load.assert_called_once()
+
+    @mock.patch("eodag.plugins.manager.sys")
+    @mock.patch("eodag.plugins.manager.entry_points", autospec=True)
+    def test_plugins_entry_points_python39(self, mock_entry_points, mock_sys):
+        """Plugins entry points must be found with the python 3.9 entry points API"""
+        mock_sys.version_info = (3, 9, 0)
+        ep = mock.MagicMock(spec=["name", "extras", "load"])
+        ep.name = "FakeLazyAuth"
+        ep.extras = []
+        mock_entry_points.side_effect = lambda: {"eodag.plugins.auth": (ep,)}
+
+        plugins_manager = PluginManager(
+            {
+                "fake_provider": ProviderConfig.from_mapping(
+                    {
+                        "name": "fake_provider",
+                        "products": {GENERIC_PRODUCT_TYPE: {}},
+                        "auth": {"type": "FakeLazyAuth"},
+                    }
+                )
+            }
+        )
+        mock_entry_points.assert_called_with()
+        self.assertIs(plugins_manager._plugins_entry_points["FakeLazyAuth"], ep)
+
     def test_prune_providers_list_for_search_without_auth(self):
         """Providers needing auth for search but without auth plugin must be pruned on init"""
         empty_conf_file = resource_filename(
@@ -1302,54 +1406,50 @@ class TestCore(TestCoreBase):
                 str(cm.output),
             )
 
-    def test_rebuild_index(self):
-        """Change product_types_config_md5 and check that whoosh index is rebuilt"""
-        index_dir = os.path.join(self.dag.conf_dir, ".index")
-        index_dir_mtime = os.path.getmtime(index_dir)
-        random_md5 = uuid.uuid4().hex
-
-        self.assertNotEqual(self.dag.product_types_config_md5, random_md5)
-
-        self.dag.product_types_config_md5 = random_md5
-        self.dag.build_index()
+    def test_build_index(self):
+        """build_index must load the product types index from its snapshot when possible"""
+        with TemporaryDirectory() as snapshot_dir, mock.patch.dict(
+            os.environ, {"EODAG_CFG_SNAPSHOT_DIR": snapshot_dir}
+        ), mock.patch(
+            "eodag.api.core.ProductTypesIndex", wraps=ProductTypesIndex
+        ) as mock_index:
+            self.dag.build_index()
+            mock_index.assert_called_once()
+            # product types did not change: the index is loaded from its snapshot
+            self.dag.build_index()
+            mock_index.assert_called_once()
 
-        # check that index_dir has beeh re-created
-        self.assertNotEqual(os.path.getmtime(index_dir), index_dir_mtime)
+        product_types = self.dag.list_product_types(fetch_providers=False)
+        self.assertEqual(len(self.dag._product_types_index), len(product_types))
+        for product_type in product_types:
+            self.assertIn(product_type["ID"], self.dag._product_types_index)
 
     def test_get_version(self):
         """Test if the version we get is the current one"""
         version_str = self.dag.get_version()
         self.assertEqual(eodag_version, version_str)
 
-    @mock.patch("eodag.api.core.exists_in", autospec=True)
-    def test_build_index_ko(self, exists_in_mock):
-        """
-        Trying to build index with unsupported pickle version or other reason leads to ValueError
-        and may delete the current index to rebuild it
-        """
-        exists_in_mock.side_effect = ValueError("unsupported pickle protocol")
-        index_dir = os.path.join(self.conf_dir, ".index")
-        path = Path(index_dir)
-        self.assertTrue(path.is_dir())
-        last_index_modif_date = os.stat(index_dir).st_atime_ns
-        with self.assertLogs(level="DEBUG") as cm:
-            self.dag.build_index()
-            new_index_modif_date = os.stat(index_dir).st_atime_ns
-            self.assertIn(
-                f"Need to recreate whoosh .index: '{exists_in_mock.side_effect}'",
-                str(cm.output),
-            )
-            self.assertNotEqual(last_index_modif_date, new_index_modif_date)
+    def test_update_product_types_list_index(self):
+        """update_product_types_list must add new product types to the index, without
+        building it again"""
+        with open(
+            os.path.join(TEST_RESOURCES_PATH, "ext_product_types_free_text_search.json")
+        ) as f:
+            ext_product_types_conf = json.load(f)
+        self.assertNotIn("foo", self.dag._product_types_index)
 
-        exists_in_mock.side_effect = ValueError("dummy error")
-        with self.assertLogs(level="ERROR") as cm_logs:
-            with self.assertRaisesRegex(ValueError, "dummy error"):
-                self.dag.build_index()
-            self.assertIn(
-                "Error while opening .index using whoosh, "
-                "please report this issue and try to delete",
-                str(cm_logs.output),
-            )
+        with mock.patch.object(self.dag, "build_index") as mock_build_index:
+            self.dag.update_product_types_list(ext_product_types_conf)
+        mock_build_index.assert_not_called()
+
+        self.assertIn("foo", self.dag._product_types_index)
+        self.assertListEqual(self.dag.guess_product_type("ABSTRACTFOO"), ["foo"])
+
+    def test_guess_product_type_without_index(self):
+        """guess_product_type must raise an error if the index has not been built"""
+        self.dag._product_types_index = None
+        with self.assertRaises(EodagError):
+            self.dag.guess_product_type("foo")
 
     def test_set_preferred_provider(self):
         """set_preferred_provider must set the preferred provider with increasing priority"""
@@ -1866,9 +1966,9 @@ class TestCoreInvolvingConfDir(unittest.TestCase):
         """The core object must create a user config file in standard user config location on instantiation"""
         self.execution_involving_conf_dir(inspect="eodag.yml")
 
-    def test_core_object_creates_index_if_not_exist(self):
-        """The core object must create an index in user config directory"""
-        self.execution_involving_conf_dir(inspect=".index")
+    def test_core_object_creates_snapshots_if_not_exist(self):
+        """The core object must create a snapshots directory in user config directory"""
+        self.execution_involving_conf_dir(inspect=".snapshots")
 
     def test_core_object_creates_locations_standard_location(self):
         """The core object must create a locations config file and a shp dir in standard user config location on instantiation"""  # noqa
@@ -2128,7 +2228,7 @@ class TestCoreSearch(TestCoreBase):
             self.dag.guess_product_type()
 
     def test_guess_product_type_has_no_limit(self):
-        """guess_product_type must run a whoosh search without any limit"""
+        """guess_product_type must search the index without any limit"""
         # Filter that should give more than 10 products referenced in the catalog.
         opt_prods = [
             p
@@ -2675,6 +2775,103 @@ class TestCoreSearch(TestCoreBase):
         self.assertEqual(len(all_page_results), 2)
         self.assertIsInstance(all_page_results[0], SearchResult)
 
+    @mock.patch("eodag.api.core.EODataAccessGateway._prepare_search", autospec=True)
+    @mock.patch("eodag.plugins.search.qssearch.QueryStringSearch", autospec=True)
+    def test_search_iter_page_prefetch(self, search_plugin, prepare_seach):
+        """search_iter_page with prefetch must fetch next pages in background"""
+        search_plugin.provider = "peps"
+        fetched_pages = []
+
+        def query(prep, **kwargs):
+            fetched_pages.append(prep.page)
+            return [
+                (self.search_results.data, None),
+                (self.search_results_2.data, None),
+                ([self.search_results.data[0]], None),
+            ][prep.page - 1]
+
+        search_plugin.query.side_effect = query
+
+        class DummyConfig:
+            pagination = {}
+
+        search_plugin.config = DummyConfig()
+        prepare_seach.return_value = ([search_plugin], {})
+        page_iterator = self.dag.search_iter_page_plugin(
+            items_per_page=2, search_plugin=search_plugin, prefetch=2
+        )
+        first_page = next(page_iterator)
+        self.assertListEqual(first_page.data, self.search_results.data)
+        # next pages fetched while the first one is consumed
+        for _ in range(50):
+            if len(fetched_pages) == 3:
+                break
+            time.sleep(0.01)
+        self.assertListEqual(fetched_pages, [1, 2, 3])
+        # same stop conditions as without prefetch
+        all_page_results = [first_page] + list(page_iterator)
+        self.assertEqual(len(all_page_results), 3)
+        self.assertEqual(search_plugin.query.call_count, 3)
+
+        # errors are raised in order
+        search_plugin.query.side_effect = [
+            (self.search_results.data, None),
+            RequestError("boom"),
+        ]
+        page_iterator = self.dag.search_iter_page_plugin(
+            items_per_page=2, search_plugin=search_plugin, prefetch=1
+        )
+        self.assertListEqual(next(page_iterator).data, self.search_results.data)
+        self.assertRaises(RequestError, next, page_iterator)
+
+        # raw results fetched in background, normalized while next pages are fetched
+        normalizing_threads = []
+
+        def raw_query(prep, **kwargs):
+            self.assertFalse(prep.normalize)
+            return RawSearchResult([{}] * (2 if prep.page < 3 else 1)), None
+
+        def normalize_results(results, **kwargs):
+            normalizing_threads.append(threading.current_thread())
+            return [
+                self.search_results.data,
+                self.search_results_2.data,
+                [self.search_results.data[0]],
+            ][len(normalizing_threads) - 1]
+
+        search_plugin.query.side_effect = raw_query
+        search_plugin.normalize_results.side_effect = normalize_results
+        page_iterator = self.dag.search_iter_page_plugin(
+            items_per_page=2, search_plugin=search_plugin, prefetch=2
+        )
+        self.assertEqual(len(list(page_iterator)), 3)
+        self.assertListEqual(normalizing_threads, [threading.current_thread()] * 3)
+
+        # closing waits for the page being fetched, which restores the pagination
+        search_plugin.config.pagination = {"next_page_url_tpl": "{url}?page={page}"}
+        search_plugin.next_page_url = None
+        in_flight = threading.Timer(0.2, lambda: None)
+
+        def next_url_query(prep, **kwargs):
+            if prep.page > 1:
+                in_flight.join()
+            search_plugin.next_page_url = f"http://next/{prep.page}"
+            return RawSearchResult([{}] * 2), None
+
+        search_plugin.query.side_effect = next_url_query
+        search_plugin.normalize_results.side_effect = None
+        search_plugin.normalize_results.return_value = self.search_results.data
+        page_iterator = self.dag.search_iter_page_plugin(
+            items_per_page=2, search_plugin=search_plugin, prefetch=1
+        )
+        in_flight.start()
+        next(page_iterator)
+        page_iterator.close()
+        self.assertEqual(
+            search_plugin.config.pagination["next_page_url_tpl"], "{url}?page={page}"
+        )
+        self.assertIsNone(search_plugin.next_page_url)
+
     @mock.patch("eodag.api.core.EODataAccessGateway._prepare_search", autospec=True)
     @mock.patch("eodag.plugins.search.qssearch.QueryStringSearch", autospec=True)
     def test_search_iter_page_exhaust_get_all_pages_no_products_last_page(
@@ -3110,6 +3307,101 @@ class TestCoreSearch(TestCoreBase):
         mock_fetch_product_types_list.assert_called_with(self.dag)
         mock_search_iter_page_plugin.assert_called_once()
 
+    @mock.patch(
+        "eodag.api.core.EODataAccessGateway.search_iter_page_plugin", autospec=True
+    )
+    @mock.patch("eodag.api.core.EODataAccessGateway._prepare_search", autospec=True)
+    def test_search_stream(self, mock_prepare_search, mock_search_iter_page_plugin):
+        """search_stream must lazily yield the products page per page, trying next providers on error"""
+        plugins = [
+            mock.Mock(provider=p, config=mock.Mock(pagination={}))
+            for p in ("failing", "peps")
+        ]
+        mock_prepare_search.side_effect = lambda *x, **y: (plugins, {})
+        pages_count = 0
+
+        def search_iter_page_plugin(dag, items_per_page, search_plugin, **kwargs):
+            nonlocal pages_count
+            if search_plugin.provider == "failing":
+                raise RequestError("boom")
+            for page in (self.search_results, self.search_results_2):
+                pages_count += 1
+                yield page
+
+        mock_search_iter_page_plugin.side_effect = search_iter_page_plugin
+
+        products = self.dag.search_stream(productType="S2_MSI_L1C", items_per_page=2)
+        self.assertNotIsInstance(products, SearchResult)
+        self.assertEqual(next(products), self.search_results[0])
+        # second page not fetched yet
+        self.assertEqual(pages_count, 1)
+        self.assertListEqual(
+            list(products), self.search_results.data[1:] + self.search_results_2.data
+        )
+        self.assertEqual(pages_count, 2)
+        self.assertEqual(mock_search_iter_page_plugin.call_args[1]["items_per_page"], 2)
+
+        # error raised when no provider returned products
+        plugins.pop()
+        with self.assertRaises(RequestError):
+            list(self.dag.search_stream(productType="S2_MSI_L1C"))
+
+    @mock.patch("eodag.api.core.EODataAccessGateway._do_search", autospec=True)
+    @mock.patch("eodag.api.core.EODataAccessGateway._prepare_search", autospec=True)
+    def test_search_fan_out(self, mock_prepare_search, mock_do_search):
+        """search with fan_out must query providers concurrently and combine results"""
+        plugins = [mock.Mock(provider=p) for p in ("slow", "fast", "failing", "late")]
+        mock_prepare_search.side_effect = lambda *x, **y: (plugins, {})
+        release_late = threading.Event()
+
+        def do_search(dag, search_plugin, **kwargs):
+            # providers are searched on copies of the shared plugins
+            self.assertNotIn(search_plugin, plugins)
+            if search_plugin.provider == "slow":
+                time.sleep(0.2)
+                return SearchResult(self.search_results.data[:], 2, errors=[])
+            elif search_plugin.provider == "fast":
+                return SearchResult(self.search_results_2.data[:], 2, errors=[])
+            elif search_plugin.provider == "failing":
+                raise RequestError("boom")
+            release_late.wait(5)
+            return SearchResult([], 0, errors=[])
+
+        mock_do_search.side_effect = do_search
+
+        # first non-empty results win
+        results = self.dag.search(fan_out="first", fan_out_timeout=1)
+        self.assertListEqual(results.data, self.search_results_2.data)
+        self.assertIn("fast", results.latencies)
+
+        # all results merged following providers priorities, late provider skipped
+        results = self.dag.search(fan_out="merge", fan_out_timeout=1, count=True)
+        self.assertListEqual(
+            results.data, self.search_results.data + self.search_results_2.data
+        )
+        self.assertEqual(results.number_matched, 4)
+        self.assertEqual(
+            [(p, type(e)) for p, e in results.errors],
+            [("failing", RequestError), ("late", TimeOutError)],
+        )
+        self.assertCountEqual(results.latencies.keys(), ["slow", "fast", "failing"])
+        self.assertGreaterEqual(results.latencies["slow"], 0.2)
+
+        merged_results = results
+
+        # merged without duplicates (same titles)
+        results = self.dag.search(fan_out="dedup", fan_out_timeout=1)
+        self.assertListEqual(results.data, self.search_results.data)
+
+        # late providers answering after the results were returned do not update them
+        release_late.set()
+        time.sleep(0.1)
+        self.assertNotIn("late", merged_results.latencies)
+        self.assertNotIn("late", results.latencies)
+
+        with self.assertRaises(EodagValidationError):
+            self.dag.search(fan_out="unknown")
+
 
 class TestCoreDownload(TestCoreBase):
     @classmethod
@@ -3231,7 +3523,7 @@ class TestCoreProviderGroup(TestCoreBase):
 
     @mock.patch("eodag.api.core.get_ext_product_types_conf", autospec=True)
     @mock.patch(
-        "eodag.api.core.EODataAccessGateway.discover_product_types", autospec=True
+        "eodag.api.core.EODataAccessGateway._discover_product_types", autospec=True
     )
     def test_fetch_product_types_list_grouped_providers(
         self, mock_discover_product_types, mock_get_ext_product_types_conf
@@ -3306,9 +3598,7 @@ class TestCoreProviderGroup(TestCoreBase):
                     self.dag.providers_config[provider].products["foo"],
                     {"productType": "foo"},
                 )
-                mock_discover_product_types.assert_called_with(
-                    self.dag, provider=provider
-                )
+                self.assertIn(provider, mock_discover_product_types.call_args[0][1])
             else:
                 self.assertFalse(
                     getattr(
@@ -15,22 +15,29 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
 import hashlib
 import io
+import json
 import os
 import shutil
 import stat
 import tarfile
+import threading
+import time
 import unittest
 import zipfile
+from functools import partial
 from itertools import chain
 from pathlib import Path
 from tempfile import NamedTemporaryFile, TemporaryDirectory, gettempdir
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, List
 from unittest import mock
 
+import concurrent.futures
 import responses
 import yaml
+from concurrent.futures import ThreadPoolExecutor
 
 from eodag.api.product.metadata_mapping import DEFAULT_METADATA_MAPPING
 from eodag.utils import MockResponse, ProgressCallback
@@ -43,10 +50,16 @@ from tests.context import (
     OFFLINE_STATUS,
     ONLINE_STATUS,
     USER_AGENT,
+    BufferBudget,
+    BufferedAssetStream,
     EOProduct,
     HTTPDownload,
     NotAvailableError,
     PluginManager,
+    PooledHTTPAdapter,
+    RequestsSASAuth,
+    S3ObjectRanges,
+    StagingManager,
     config,
     load_default_config,
     override_config_from_mapping,
@@ -199,6 +212,105 @@ class TestDownloadPluginBase(BaseDownloadPluginTest):
             fs_path, _ = plugin._prepare_download(self.product, output_dir=outdir.name)
             self.assertIn("Unable to create records directory", str(cm.output))
 
+    def test_plugins_download_base_download_all_concurrently(self):
+        """Download.download_all must download products concurrently within providers limits"""
+        products = [
+            EOProduct(
+                "peps",
+                dict(
+                    geometry="POINT (0 0)", title=f"dummy_product_{i}", id=f"dummy{i}"
+                ),
+            )
+            for i in range(5)
+        ]
+        plugin = self.get_download_plugin(products[0])
+        for product in products:
+            product.register_downloader(plugin, None)
+
+        lock = threading.Lock()
+        running = {"now": 0, "max": 0}
+        calls: Dict[str, int] = {}
+
+        def download(product, **kwargs):
+            self.assertEqual(kwargs["timeout"], -1)
+            with lock:
+                calls[product.properties["id"]] = (
+                    calls.get(product.properties["id"], 0) + 1
+                )
+                running["now"] += 1
+                running["max"] = max(running["max"], running["now"])
+            time.sleep(0.05)
+            with lock:
+                running["now"] -= 1
+            # first product is not available at first try
+            if product.properties["id"] == "dummy0" and calls["dummy0"] == 1:
+                raise NotAvailableError("dummy0 ordered")
+            return os.path.join(self.output_dir, product.properties["title"])
+
+        downloaded_callback = mock.Mock()
+        plugin.config.max_workers = 2
+        try:
+            with mock.patch.object(
+                EOProduct, "download", autospec=True, side_effect=download
+            ):
+                paths = plugin.download_all(
+                    products,
+                    downloaded_callback=downloaded_callback,
+                    progress_callback=ProgressCallback(disable=True),
+                    wait=0.001,
+                    max_workers=4,
+                )
+        finally:
+            del plugin.config.max_workers
+
+        self.assertCountEqual(
+            paths,
+            [os.path.join(self.output_dir, p.properties["title"]) for p in products],
+        )
+        self.assertEqual(calls["dummy0"], 2)
+        self.assertEqual(downloaded_callback.call_count, 5)
+        # provider limit respected
+        self.assertEqual(running["max"], 2)
+
+    def test_plugins_download_base_download_all_concurrently_no_busy_wait(self):
+        """Download.download_all must block while pending products are held back by their provider quota"""
+        products = [
+            EOProduct(
+                "peps",
+                dict(
+                    geometry="POINT (0 0)", title=f"dummy_product_{i}", id=f"dummy{i}"
+                ),
+            )
+            for i in range(3)
+        ]
+        plugin = self.get_download_plugin(products[0])
+        for product in products:
+            product.register_downloader(plugin, None)
+
+        def download(product, **kwargs):
+            time.sleep(0.2)
+            return os.path.join(self.output_dir, product.properties["title"])
+
+        plugin.config.max_workers = 1
+        try:
+            with mock.patch.object(
+                EOProduct, "download", autospec=True, side_effect=download
+            ), mock.patch(
+                "concurrent.futures.wait", wraps=concurrent.futures.wait
+            ) as mock_wait:
+                paths = plugin.download_all(
+                    products,
+                    progress_callback=ProgressCallback(disable=True),
+                    wait=0.001,
+                    max_workers=4,
+                )
+        finally:
+            del plugin.config.max_workers
+
+        self.assertEqual(len(paths), 3)
+        # one wait per finished download, not a busy loop
+        self.assertLessEqual(mock_wait.call_count, 6)
+
 
 class TestDownloadPluginHttp(BaseDownloadPluginTest):
     def _download_response_archive(self, local_product_as_archive_path: str):
@@ -274,6 +386,57 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
         product.register_downloader(downloader, None)
         return product
 
+    def test_plugins_download_http_async_stream(self):
+        """HTTPDownload._async_stream_download_dict() must stream the product asynchronously"""
+        import httpx
+
+        def handler(request):
+            if request.url.path == "/missing":
+                return httpx.Response(404, text="not found")
+            return httpx.Response(
+                200,
+                content=b"a" * 100_000,
+                headers={"content-disposition": "attachment; filename=foo.zip"},
+            )
+
+        plugin = HTTPDownload(
+            "foo", config.PluginConfig.from_mapping({"base_uri": "https://foo.bar"})
+        )
+        product = self._dummy_product(
+            "foo",
+            {
+                "id": "dummy",
+                "geometry": "POINT (0 0)",
+                "downloadLink": "https://foo.bar/product",
+            },
+            "S2_MSI_L1C",
+        )
+
+        async def stream_content(product):
+            stream = await plugin._async_stream_download_dict(product)
+            return stream.headers, b"".join([chunk async for chunk in stream.content])
+
+        with mock.patch.object(
+            PooledHTTPAdapter,
+            "_get_async_client",
+            return_value=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        ), mock.patch(
+            "eodag.plugins.download.http.requests.Session.request", autospec=True
+        ) as mock_request:
+            headers, content = asyncio.run(stream_content(product))
+            self.assertEqual(content, b"a" * 100_000)
+            self.assertEqual(
+                headers["content-disposition"], "attachment; filename=foo.zip"
+            )
+            self.assertEqual(headers["Content-Type"], "application/zip")
+
+            product.remote_location = "https://foo.bar/missing"
+            with self.assertLogs(level="ERROR"), self.assertRaises(NotAvailableError):
+                asyncio.run(stream_content(product))
+
+        # no request sent synchronously
+        mock_request.assert_not_called()
+
     @mock.patch("eodag.plugins.download.http.requests.Session.request", autospec=True)
     def test_plugins_download_http_zip_file_ok(self, mock_requests_session):
         """HTTPDownload.download() must keep the output as it is when it is a zip file"""
@@ -486,6 +649,7 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
             self.product,
             None,
             progress_callback,
+            partial=mock.ANY,
             output_dir=self.output_dir,
             output_extension=output_extension,
         )
@@ -543,6 +707,7 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
             product,
             None,
             progress_callback,
+            partial=mock.ANY,
             output_dir=self.output_dir,
             output_extension=output_extension,
         )
@@ -550,8 +715,8 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
     @mock.patch(
         "eodag.plugins.download.http.HTTPDownload._stream_download", autospec=True
     )
-    @mock.patch("eodag.plugins.download.http.requests.head", autospec=True)
-    @mock.patch("eodag.plugins.download.http.requests.get", autospec=True)
+    @mock.patch("eodag.plugins.download.http.requests.Session.head", autospec=True)
+    @mock.patch("eodag.plugins.download.http.requests.Session.get", autospec=True)
     def test_plugins_download_http_ignore_assets(
         self, mock_requests_get, mock_requests_head, mock_stream_download
     ):
@@ -573,6 +738,7 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
         plugin.config.ignore_assets = False
         path = plugin.download(self.product, output_dir=self.output_dir)
         mock_requests_get.assert_called_once_with(
+            mock.ANY,
             self.product.assets["foo"]["href"],
             stream=True,
             auth=None,
@@ -603,6 +769,7 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
         del plugin.config.ignore_assets
         plugin.download(self.product, output_dir=self.output_dir)
         mock_requests_get.assert_called_once_with(
+            mock.ANY,
             self.product.assets["foo"]["href"],
             stream=True,
             auth=None,
@@ -613,8 +780,8 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
         )
         mock_stream_download.assert_not_called()
 
-    @mock.patch("eodag.plugins.download.http.requests.head", autospec=True)
-    @mock.patch("eodag.plugins.download.http.requests.get", autospec=True)
+    @mock.patch("eodag.plugins.download.http.requests.Session.head", autospec=True)
+    @mock.patch("eodag.plugins.download.http.requests.Session.get", autospec=True)
     def test_plugins_download_http_ignore_assets_without_ssl(
         self, mock_requests_get, mock_requests_head
     ):
@@ -635,6 +802,7 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
 
         plugin.download(self.product, output_dir=self.output_dir)
         mock_requests_head.assert_called_once_with(
+            mock.ANY,
             self.product.assets["foo"]["href"],
             auth=None,
             params=plugin.config.dl_url_params,
@@ -643,6 +811,7 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
             verify=False,
         )
         mock_requests_get.assert_called_once_with(
+            mock.ANY,
             self.product.assets["foo"]["href"],
             stream=True,
             auth=None,
@@ -653,8 +822,8 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
         )
         del plugin.config.ssl_verify
 
-    @mock.patch("eodag.plugins.download.http.requests.head", autospec=True)
-    @mock.patch("eodag.plugins.download.http.requests.get", autospec=True)
+    @mock.patch("eodag.plugins.download.http.requests.Session.head", autospec=True)
+    @mock.patch("eodag.plugins.download.http.requests.Session.get", autospec=True)
     def test_plugins_download_http_assets_filename_from_href(
         self, mock_requests_get, mock_requests_head
     ):
@@ -686,6 +855,7 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
         # Check if the GET request has been called for both size request and download request
         self.assertEqual(mock_requests_get.call_count, 2)
         mock_requests_get.assert_called_with(
+            mock.ANY,
             self.product.assets["foo"]["href"],
             stream=True,
             auth=None,
@@ -696,6 +866,7 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
         )
         # Check if the HEAD request has been called once for size & filename request
         mock_requests_head.assert_called_once_with(
+            mock.ANY,
             self.product.assets["foo"]["href"],
             auth=None,
             params=plugin.config.dl_url_params,
@@ -704,8 +875,8 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
             verify=True,
         )
 
-    @mock.patch("eodag.plugins.download.http.requests.head", autospec=True)
-    @mock.patch("eodag.plugins.download.http.requests.get", autospec=True)
+    @mock.patch("eodag.plugins.download.http.requests.Session.head", autospec=True)
+    @mock.patch("eodag.plugins.download.http.requests.Session.get", autospec=True)
     def test_plugins_download_http_assets_filename_from_get(
         self, mock_requests_get, mock_requests_head
     ):
@@ -735,8 +906,8 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
         )
 
     @mock.patch("eodag.plugins.download.http.HTTPDownload._get_asset_sizes")
-    @mock.patch("eodag.plugins.download.http.requests.head", autospec=True)
-    @mock.patch("eodag.plugins.download.http.requests.get", autospec=True)
+    @mock.patch("eodag.plugins.download.http.requests.Session.head", autospec=True)
+    @mock.patch("eodag.plugins.download.http.requests.Session.get", autospec=True)
     def test_plugins_download_http_assets_error(
         self, mock_requests_get, mock_requests_head, mock_asset_size
     ):
@@ -758,8 +929,8 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
         "eodag.plugins.download.http.ProgressCallback.__call__",
         autospec=True,
     )
-    @mock.patch("eodag.plugins.download.http.requests.head", autospec=True)
-    @mock.patch("eodag.plugins.download.http.requests.get", autospec=True)
+    @mock.patch("eodag.plugins.download.http.requests.Session.head", autospec=True)
+    @mock.patch("eodag.plugins.download.http.requests.Session.get", autospec=True)
     def test_plugins_download_http_assets_interrupt(
         self, mock_requests_get, mock_requests_head, mock_progress_callback
     ):
@@ -804,8 +975,8 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
             )
         )
 
-    @mock.patch("eodag.plugins.download.http.requests.head", autospec=True)
-    @mock.patch("eodag.plugins.download.http.requests.get", autospec=True)
+    @mock.patch("eodag.plugins.download.http.requests.Session.head", autospec=True)
+    @mock.patch("eodag.plugins.download.http.requests.Session.get", autospec=True)
     def test_plugins_download_http_assets_resume(
         self, mock_requests_get, mock_requests_head
     ):
@@ -847,8 +1018,8 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
             )
         )
 
-    @mock.patch("eodag.plugins.download.http.requests.head", autospec=True)
-    @mock.patch("eodag.plugins.download.http.requests.get", autospec=True)
+    @mock.patch("eodag.plugins.download.http.requests.Session.head", autospec=True)
+    @mock.patch("eodag.plugins.download.http.requests.Session.get", autospec=True)
     def test_plugins_download_http_asset_filter(
         self, mock_requests_get, mock_requests_head
     ):
@@ -886,8 +1057,8 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
         plugin.download(self.product, output_dir=self.output_dir)
         self.assertEqual(6, mock_requests_get.call_count)
 
-    @mock.patch("eodag.plugins.download.http.requests.head", autospec=True)
-    @mock.patch("eodag.plugins.download.http.requests.get", autospec=True)
+    @mock.patch("eodag.plugins.download.http.requests.Session.head", autospec=True)
+    @mock.patch("eodag.plugins.download.http.requests.Session.get", autospec=True)
     def test_plugins_download_http_assets_filename_from_head(
         self, mock_requests_get, mock_requests_head
     ):
@@ -918,9 +1089,45 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
             )
         )
 
+    @mock.patch("eodag.plugins.download.http.requests.Session.head", autospec=True)
+    @mock.patch("eodag.plugins.download.http.requests.Session.get", autospec=True)
+    def test_plugins_download_http_assets_sign_urls(
+        self, mock_requests_get, mock_requests_head
+    ):
+        """HTTPDownload.download() must sign all assets urls at once if auth allows it"""
+
+        plugin = self.get_download_plugin(self.product)
+        self.product.location = self.product.remote_location = "http://somewhere"
+        self.product.assets.clear()
+        self.product.assets.update(
+            {
+                "foo": {"href": "http://somewhere/a"},
+                "bar": {"href": "http://somewhere/b"},
+                "baz": {"href": "file:///somewhere/c"},
+            }
+        )
+        mock_requests_head.return_value.headers = {"Content-length": "1"}
+        mock_requests_get.return_value.__enter__.return_value.iter_content.return_value = io.BytesIO(
+            b"some content"
+        )
+        auth = mock.Mock(spec=RequestsSASAuth)
+
+        with TemporaryDirectory() as temp_dir:
+            plugin.download(
+                self.product,
+                auth=auth,
+                output_dir=temp_dir,
+                dl_url_params={"foo": "bar"},
+            )
+        auth.sign_urls.assert_called_once()
+        self.assertListEqual(
+            list(auth.sign_urls.call_args[0][0]),
+            ["http://somewhere/a?foo=bar", "http://somewhere/b?foo=bar"],
+        )
+
     @mock.patch("eodag.utils.ProgressCallback.reset", autospec=True)
-    @mock.patch("eodag.plugins.download.http.requests.head", autospec=True)
-    @mock.patch("eodag.plugins.download.http.requests.get", autospec=True)
+    @mock.patch("eodag.plugins.download.http.requests.Session.head", autospec=True)
+    @mock.patch("eodag.plugins.download.http.requests.Session.get", autospec=True)
     def test_plugins_download_http_assets_size(
         self, mock_requests_get, mock_requests_head, mock_progress_callback_reset
     ):
@@ -1045,6 +1252,197 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
         # empty product download directory should have been removed
         self.assertFalse(Path(os.path.join(self.output_dir, "dummy_product")).exists())
 
+    def test_plugins_download_http_assets_concurrently(self):
+        """HTTPDownload must download assets concurrently, keeping their order when streamed"""
+        plugin = self.get_download_plugin(self.product)
+        self.product.location = self.product.remote_location = "http://somewhere"
+        self.product.properties["id"] = "someproduct"
+        assets = {key: {"href": f"http://somewhere/{key}"} for key in "abc"}
+        # all assets requests must be in flight at the same time to be answered
+        head_barrier = threading.Barrier(len(assets))
+        get_barrier = threading.Barrier(len(assets))
+
+        def head_callback(request):
+            head_barrier.wait(timeout=5)
+            return (200, {"Content-length": "3"}, "")
+
+        def get_callback(request):
+            get_barrier.wait(timeout=5)
+            return (200, {}, request.path_url.split("?")[0][-1] * 3)
+
+        with responses.RequestsMock() as rsps:
+            for key in assets:
+                rsps.add_callback(responses.HEAD, assets[key]["href"], head_callback)
+                rsps.add_callback(responses.GET, assets[key]["href"], get_callback)
+
+            self.product.assets.clear()
+            self.product.assets.update(assets)
+            stream = plugin._stream_download_dict(self.product)
+            with zipfile.ZipFile(io.BytesIO(b"".join(stream.content))) as zip_file:
+                self.assertListEqual(zip_file.namelist(), ["a", "b", "c"])
+                self.assertEqual(zip_file.read("c"), b"ccc")
+
+            head_barrier.reset()
+            get_barrier.reset()
+            self.product.assets.clear()
+            self.product.assets.update(assets)
+            path = plugin.download(self.product, output_dir=self.output_dir)
+            self.assertListEqual(sorted(os.listdir(path)), ["a", "b", "c"])
+            with open(os.path.join(path, "b"), "rb") as f:
+                self.assertEqual(f.read(), b"bbb")
+
+    def test_plugins_download_http_assets_buffer_budget(self):
+        """Assets downloaded concurrently must share a bounded buffer, without blocking the read one"""
+
+        def open_stream(content):
+            stream = mock.MagicMock()
+            stream.__enter__.return_value.iter_content.return_value = [
+                content * 10
+            ] * 10
+            return stream
+
+        budget = BufferBudget(25)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            streams = [
+                BufferedAssetStream(partial(open_stream, c), executor, budget)
+                for c in (b"a", b"b")
+            ]
+            time.sleep(0.3)
+            # each asset can buffer a chunk more than the shared budget
+            self.assertLessEqual(budget.used, 25 + 2 * 10)
+            for stream, content in zip(streams, (b"a", b"b")):
+                stream.response()
+                self.assertEqual(b"".join(stream), content * 100)
+        self.assertEqual(budget.used, 0)
+
+    def test_plugins_download_http_assets_resume_range(self):
+        """HTTPDownload.download() must only request the missing bytes of interrupted assets"""
+        plugin = self.get_download_plugin(self.product)
+        self.product.location = self.product.remote_location = "http://somewhere"
+        self.product.properties["id"] = "someproduct"
+        self.product.assets.clear()
+        self.product.assets.update(
+            {key: {"href": f"http://somewhere/{key}"} for key in "ab"}
+        )
+        # "a" was interrupted after its 2 first bytes
+        product_path = os.path.join(self.output_dir, "dummy_product")
+        os.makedirs(product_path)
+        with open(os.path.join(product_path, "a~"), "wb") as fh:
+            fh.write(b"01")
+        with open(os.path.join(product_path, "a~.json"), "w") as fh:
+            json.dump(
+                {"url": "http://somewhere/a", "validator": '"etag-a"', "size": 4}, fh
+            )
+
+        def get_callback(request):
+            if "Range" in request.headers:
+                self.assertEqual(request.headers["Range"], "bytes=2-")
+                self.assertEqual(request.headers["If-Range"], '"etag-a"')
+                return (206, {"Content-Range": "bytes 2-3/4"}, b"23")
+            # whole content, also requested to get the assets sizes
+            if request.path_url.split("?")[0].endswith("a"):
+                return (200, {"ETag": '"etag-a"'}, b"abcd")
+            return (200, {"ETag": '"etag-b"'}, b"4567")
+
+        with responses.RequestsMock() as rsps:
+            for key in "ab":
+                rsps.add_callback(
+                    responses.HEAD,
+                    f"http://somewhere/{key}",
+                    lambda request: (200, {"Content-length": "4"}, ""),
+                )
+                rsps.add_callback(
+                    responses.GET, f"http://somewhere/{key}", get_callback
+                )
+            path = plugin.download(self.product, output_dir=self.output_dir)
+
+        self.assertListEqual(sorted(os.listdir(path)), ["a", "b"])
+        with open(os.path.join(path, "a"), "rb") as fh:
+            self.assertEqual(fh.read(), b"0123")
+        with open(os.path.join(path, "b"), "rb") as fh:
+            self.assertEqual(fh.read(), b"4567")
+
+    def test_plugins_download_http_stream_extract(self):
+        """HTTPDownload.download() must extract archives while downloading them if asked"""
+        plugin = self.get_download_plugin(self.product)
+        self.product.location = self.product.remote_location = "http://somewhere/dl"
+        self.product.properties["id"] = "someproduct"
+        self.product.assets.clear()
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w", compression=zipfile.ZIP_DEFLATED) as zfile:
+            zfile.writestr("dummy_product.SAFE/foo/bar.txt", b"bar" * 1000)
+            zfile.writestr("dummy_product.SAFE/baz.txt", b"baz")
+
+        def get_callback(request):
+            # the archive is never written to disk
+            self.assertFalse(
+                any(
+                    os.path.isfile(os.path.join(self.output_dir, f))
+                    for f in os.listdir(self.output_dir)
+                )
+            )
+            return (200, {}, archive.getvalue())
+
+        with responses.RequestsMock() as rsps:
+            rsps.add_callback(responses.GET, "http://somewhere/dl", get_callback)
+            path = plugin.download(
+                self.product, output_dir=self.output_dir, stream_extract=True
+            )
+
+        self.assertEqual(path, os.path.join(self.output_dir, "dummy_product"))
+        self.assertEqual(self.product.location, path_to_uri(path))
+        self.assertListEqual(
+            sorted(os.listdir(self.output_dir)), [".downloaded", "dummy_product"]
+        )
+        with open(os.path.join(path, "foo", "bar.txt"), "rb") as fh:
+            self.assertEqual(fh.read(), b"bar" * 1000)
+        with open(os.path.join(path, "baz.txt"), "rb") as fh:
+            self.assertEqual(fh.read(), b"baz")
+
+    def test_plugins_download_http_stream_extract_fallback(self):
+        """HTTPDownload.download() must write payloads which cannot be extracted while downloaded"""
+        plugin = self.get_download_plugin(self.product)
+        self.product.location = self.product.remote_location = "http://somewhere/dl"
+        self.product.properties["id"] = "someproduct"
+        self.product.assets.clear()
+
+        class UnseekableBytesIO(io.BytesIO):
+            def seek(self, *args):
+                raise OSError("unseekable")
+
+        # the stored member has a data descriptor, its size is only known after its data
+        archive = UnseekableBytesIO()
+        with zipfile.ZipFile(archive, "w", compression=zipfile.ZIP_DEFLATED) as zfile:
+            zfile.writestr("dummy_product.SAFE/foo.txt", b"foo" * 1000)
+            zfile.writestr(
+                "dummy_product.SAFE/bar.txt",
+                b"bar" * 1000,
+                compress_type=zipfile.ZIP_STORED,
+            )
+
+        with responses.RequestsMock() as rsps:
+            rsps.add(responses.GET, "http://somewhere/dl", body=archive.getvalue())
+            path = plugin.download(
+                self.product, output_dir=self.output_dir, stream_extract=True
+            )
+            # downloaded again to be written
+            self.assertEqual(len(rsps.calls), 2)
+        with open(os.path.join(path, "bar.txt"), "rb") as fh:
+            self.assertEqual(fh.read(), b"bar" * 1000)
+
+        # not an archive
+        shutil.rmtree(self.output_dir)
+        os.makedirs(self.output_dir)
+        with responses.RequestsMock() as rsps:
+            rsps.add(responses.GET, "http://somewhere/dl", body=b"CDF\x01" + b"0" * 100)
+            path = plugin.download(
+                self.product, output_dir=self.output_dir, stream_extract=True
+            )
+            self.assertEqual(len(rsps.calls), 1)
+        self.assertTrue(os.path.isdir(path))
+        with open(os.path.join(path, os.listdir(path)[0]), "rb") as fh:
+            self.assertEqual(fh.read(), b"CDF\x01" + b"0" * 100)
+
     def test_plugins_download_http_several_local_assets(
         self,
     ):
@@ -1493,6 +1891,252 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
 
         run()
 
+    def _offline_products(self, plugin, count):
+        products = [
+            EOProduct(
+                "peps",
+                dict(
+                    geometry="POINT (0 0)",
+                    title=f"dummy_product_{i}",
+                    id=f"dummy{i}",
+                    storageStatus=OFFLINE_STATUS,
+                    orderLink=f"http://somewhere/order/dummy{i}",
+                ),
+            )
+            for i in range(count)
+        ]
+        for product in products:
+            product.register_downloader(plugin, None)
+        return products
+
+    @mock.patch("eodag.plugins.download.staging.STAGING_FIRST_POLL_DELAY", 0)
+    def test_plugins_download_http_download_all_staging(self):
+        """HTTPDownload.download_all must order all products first and download them once online"""
+        plugin = self.get_download_plugin(self.product)
+        products = self._offline_products(plugin, 3)
+        state_path = os.path.join(self.output_dir, ".downloaded", "staging.json")
+        lock = threading.Lock()
+        ordered: List[str] = []
+        status_checks: Dict[str, int] = {}
+
+        def order(plugin, product, auth=None, **kwargs):
+            with lock:
+                ordered.append(product.properties["id"])
+            product.properties["storageStatus"] = "STAGING"
+            product.properties[
+                "orderStatusLink"
+            ] = f"http://somewhere/status/{product.properties['id']}"
+
+        def order_status(plugin, product, auth=None):
+            with lock:
+                # all products are ordered before their status is checked
+                self.assertEqual(len(ordered), 3)
+                status_checks[product.properties["id"]] = (
+                    status_checks.get(product.properties["id"], 0) + 1
+                )
+                checks = status_checks[product.properties["id"]]
+            if product.properties["id"] == "dummy0" and checks < 3:
+                # outstanding orders are persisted
+                with open(state_path) as fh:
+                    state = json.load(fh)
+                self.assertEqual(
+                    state[StagingManager.product_key(product)]["properties"][
+                        "orderStatusLink"
+                    ],
+                    "http://somewhere/status/dummy0",
+                )
+                error = NotAvailableError("still staging")
+                error.retry_after = 0
+                raise error
+            product.properties["storageStatus"] = ONLINE_STATUS
+
+        def download(product, **kwargs):
+            self.assertEqual(product.properties["storageStatus"], ONLINE_STATUS)
+            return os.path.join(self.output_dir, product.properties["title"])
+
+        with mock.patch.object(
+            HTTPDownload, "_order", autospec=True, side_effect=order
+        ), mock.patch.object(
+            HTTPDownload, "_order_status", autospec=True, side_effect=order_status
+        ), mock.patch.object(
+            EOProduct, "download", autospec=True, side_effect=download
+        ):
+            paths = plugin.download_all(
+                products,
+                progress_callback=ProgressCallback(disable=True),
+                output_dir=self.output_dir,
+                wait=0.001,
+            )
+
+        self.assertCountEqual(
+            paths,
+            [os.path.join(self.output_dir, p.properties["title"]) for p in products],
+        )
+        self.assertCountEqual(ordered, ["dummy0", "dummy1", "dummy2"])
+        self.assertDictEqual(status_checks, {"dummy0": 3, "dummy1": 1, "dummy2": 1})
+        # downloaded products orders are forgotten
+        self.assertFalse(os.path.exists(state_path))
+
+    @mock.patch("eodag.plugins.download.staging.STAGING_FIRST_POLL_DELAY", 0)
+    def test_plugins_download_http_download_all_staging_resume(self):
+        """HTTPDownload.download_all must resume persisted orders instead of ordering again"""
+        plugin = self.get_download_plugin(self.product)
+        products = self._offline_products(plugin, 2)
+        state_path = os.path.join(self.output_dir, ".downloaded", "staging.json")
+        os.makedirs(os.path.dirname(state_path))
+        with open(state_path, "w") as fh:
+            json.dump(
+                {
+                    StagingManager.product_key(products[0]): {
+                        "properties": {
+                            "storageStatus": "STAGING",
+                            "orderStatusLink": "http://somewhere/status/dummy0",
+                        },
+                        "remote_location": "http://somewhere/download/dummy0",
+                    }
+                },
+                fh,
+            )
+
+        def order(plugin, product, auth=None, **kwargs):
+            product.properties["storageStatus"] = "STAGING"
+            product.properties["orderStatusLink"] = "http://somewhere/status/dummy1"
+
+        def order_status(plugin, product, auth=None):
+            product.properties["storageStatus"] = ONLINE_STATUS
+
+        with mock.patch.object(
+            HTTPDownload, "_order", autospec=True, side_effect=order
+        ) as mock_order, mock.patch.object(
+            HTTPDownload, "_order_status", autospec=True, side_effect=order_status
+        ), mock.patch.object(
+            EOProduct, "download", autospec=True, return_value="/path"
+        ) as mock_download:
+            plugin.download_all(
+                products,
+                progress_callback=ProgressCallback(disable=True),
+                output_dir=self.output_dir,
+                wait=0.001,
+            )
+
+        # only the product not ordered yet is ordered
+        mock_order.assert_called_once_with(plugin, product=products[1], auth=None)
+        self.assertEqual(mock_download.call_count, 2)
+        self.assertEqual(
+            products[0].remote_location, "http://somewhere/download/dummy0"
+        )
+        self.assertEqual(
+            products[0].properties["orderStatusLink"], "http://somewhere/status/dummy0"
+        )
+        self.assertFalse(os.path.exists(state_path))
+
+    @mock.patch("eodag.plugins.download.staging.STAGING_FIRST_POLL_DELAY", 0)
+    def test_plugins_download_http_download_all_staging_auth_once(self):
+        """HTTPDownload.download_all must authenticate once per provider and plugin before ordering"""
+        plugin = self.get_download_plugin(self.product)
+        products = self._offline_products(plugin, 3)
+        auth_plugin = mock.Mock()
+        auth_plugin.authenticate.return_value = "auth"
+        for product in products:
+            product.register_downloader(plugin, auth_plugin)
+
+        def order(plugin, product, auth=None, **kwargs):
+            self.assertEqual(auth, "auth")
+            product.properties["storageStatus"] = ONLINE_STATUS
+
+        with mock.patch.object(
+            HTTPDownload, "_order", autospec=True, side_effect=order
+        ) as mock_order, mock.patch.object(
+            EOProduct, "download", autospec=True, return_value="/path"
+        ):
+            plugin.download_all(
+                products,
+                progress_callback=ProgressCallback(disable=True),
+                output_dir=self.output_dir,
+                wait=0.001,
+            )
+
+        self.assertEqual(mock_order.call_count, 3)
+        auth_plugin.authenticate.assert_called_once_with()
+
+    @mock.patch("eodag.plugins.download.staging.STAGING_FIRST_POLL_DELAY", 0)
+    def test_plugins_download_http_download_all_staging_timeout(self):
+        """HTTPDownload.download_all must not retry past the order deadline of a staged product"""
+        plugin = self.get_download_plugin(self.product)
+        products = self._offline_products(plugin, 1)
+
+        def order(plugin, product, auth=None, **kwargs):
+            product.properties["storageStatus"] = "STAGING"
+            product.properties["orderStatusLink"] = "http://somewhere/status/dummy0"
+
+        def order_status(plugin, product, auth=None):
+            raise NotAvailableError("still staging")
+
+        with mock.patch.object(
+            HTTPDownload, "_order", autospec=True, side_effect=order
+        ), mock.patch.object(
+            HTTPDownload, "_order_status", autospec=True, side_effect=order_status
+        ), mock.patch.object(
+            EOProduct,
+            "download",
+            autospec=True,
+            side_effect=NotAvailableError("not online"),
+        ) as mock_download:
+            start = time.monotonic()
+            paths = plugin.download_all(
+                products,
+                progress_callback=ProgressCallback(disable=True),
+                output_dir=self.output_dir,
+                wait=0.001,
+                timeout=0.01,
+            )
+            elapsed = time.monotonic() - start
+
+        self.assertListEqual(paths, [])
+        # tried once when handed over, without a new full timeout
+        mock_download.assert_called_once()
+        self.assertLess(elapsed, 0.01 * 60 * 2)
+
+    @mock.patch("eodag.plugins.download.staging.STAGING_FIRST_POLL_DELAY", 0)
+    def test_plugins_download_http_download_all_staging_errors(self):
+        """HTTPDownload.download_all must not hang when the staging thread fails"""
+        plugin = self.get_download_plugin(self.product)
+        products = self._offline_products(plugin, 2)
+        # unwritable staging state
+        with open(os.path.join(self.output_dir, ".downloaded"), "w") as fh:
+            fh.write("not a directory")
+
+        def order(plugin, product, auth=None, **kwargs):
+            product.properties["storageStatus"] = "STAGING"
+            product.properties[
+                "orderStatusLink"
+            ] = f"http://somewhere/status/{product.properties['id']}"
+
+        with mock.patch.object(
+            HTTPDownload, "_order", autospec=True, side_effect=order
+        ), mock.patch.object(
+            StagingManager,
+            "_check_status",
+            autospec=True,
+            side_effect=RuntimeError("unexpected"),
+        ), mock.patch.object(
+            EOProduct, "download", autospec=True, return_value="/path"
+        ) as mock_download, self.assertLogs(
+            "eodag.download.staging", level="WARNING"
+        ) as cm:
+            paths = plugin.download_all(
+                products,
+                progress_callback=ProgressCallback(disable=True),
+                output_dir=self.output_dir,
+                wait=0.001,
+            )
+
+        # products still staged are handed over when the thread stops
+        self.assertEqual(paths, ["/path", "/path"])
+        self.assertEqual(mock_download.call_count, 2)
+        self.assertIn("Cannot save the staging state", str(cm.output))
+        self.assertIn("Orders status checks stopped", str(cm.output))
+
 
 class TestDownloadPluginHttpRetry(BaseDownloadPluginTest):
     def setUp(self):
@@ -1961,6 +2605,178 @@ class TestDownloadPluginAws(BaseDownloadPluginTest):
         with self.assertRaises(NoMatchingProductType):
             plugin.download(self.product, outputs_prefix=self.output_dir)
 
+    def test_plugins_download_aws_s3_object_ranges(self):
+        """S3ObjectRanges must fetch ranges concurrently and yield them in order"""
+
+        data = bytes(range(256)) * 4
+        lock = threading.Lock()
+        in_flight = [0, 0]
+
+        def get_range(Bucket, Key, Range, **kwargs):
+            start, end = (int(x) for x in Range[len("bytes=") :].split("-"))
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+            # first ranges are the slowest to complete
+            time.sleep(0.01 * (len(data) - start) / len(data))
+            with lock:
+                in_flight[0] -= 1
+            return {"Body": io.BytesIO(data[start : end + 1])}
+
+        s3_object = mock.Mock(size=len(data), bucket_name="somebucket", key="some/key")
+        get_object = s3_object.meta.client.get_object
+        get_object.side_effect = get_range
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            parts = list(
+                S3ObjectRanges(
+                    s3_object,
+                    executor,
+                    range_size=100,
+                    ranges_in_flight=3,
+                    get_kwargs={"RequestPayer": "requester"},
+                )
+            )
+
+        self.assertEqual(b"".join(parts), data)
+        self.assertEqual(len(parts), 11)
+        self.assertEqual(get_object.call_count, 11)
+        get_object.assert_any_call(
+            Bucket="somebucket",
+            Key="some/key",
+            Range="bytes=0-99",
+            RequestPayer="requester",
+        )
+        get_object.assert_any_call(
+            Bucket="somebucket",
+            Key="some/key",
+            Range="bytes=1000-1023",
+            RequestPayer="requester",
+        )
+        # the resource, not thread-safe, is not used to request ranges
+        s3_object.get.assert_not_called()
+        self.assertLessEqual(in_flight[1], 3)
+
+        # empty object
+        s3_object = mock.Mock(size=0)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(list(S3ObjectRanges(s3_object, executor)), [])
+        s3_object.meta.client.get_object.assert_not_called()
+
+    def test_plugins_download_aws_resume_object(self):
+        """AwsDownload must resume the download of an unchanged S3 object"""
+        plugin = self.get_download_plugin(self.product)
+        data = b"0123456789"
+        s3_object = mock.Mock(
+            size=len(data), e_tag='"etag"', bucket_name="somebucket", key="some/key"
+        )
+        get_object = s3_object.meta.client.get_object
+        get_object.side_effect = lambda Bucket, Key, Range, **kwargs: {
+            "Body": io.BytesIO(
+                data[int(Range[len("bytes=") :].split("-")[0]) :][: plugin.range_size]
+            )
+        }
+        path = os.path.join(self.output_dir, "some_object")
+        with open(f"{path}~", "wb") as fh:
+            fh.write(data[:4])
+        with open(f"{path}~.json", "w") as fh:
+            json.dump(
+                {"url": "s3://somebucket/some/key", "validator": '"etag"', "size": 10},
+                fh,
+            )
+        progress_callback = mock.Mock()
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            plugin._download_object(
+                s3_object, path, executor, progress_callback, {"RequestPayer": "foo"}
+            )
+
+        get_object.assert_called_once_with(
+            Bucket="somebucket",
+            Key="some/key",
+            Range="bytes=4-9",
+            RequestPayer="foo",
+            IfMatch='"etag"',
+        )
+        with open(path, "rb") as fh:
+            self.assertEqual(fh.read(), data)
+        self.assertFalse(os.path.exists(f"{path}~.json"))
+        self.assertEqual(sum(c.args[0] for c in progress_callback.call_args_list), 10)
+
+        # changed object is downloaded again
+        os.rename(path, f"{path}~")
+        with open(f"{path}~.json", "w") as fh:
+            json.dump(
+                {"url": "s3://somebucket/some/key", "validator": '"old"', "size": 10},
+                fh,
+            )
+        get_object.reset_mock()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            plugin._download_object(s3_object, path, executor, mock.Mock(), {})
+        get_object.assert_called_once_with(
+            Bucket="somebucket", Key="some/key", Range="bytes=0-9"
+        )
+        with open(path, "rb") as fh:
+            self.assertEqual(fh.read(), data)
+
+    @mock.patch(
+        "eodag.plugins.download.aws.AwsDownload.get_chunk_dest_path", autospec=True
+    )
+    def test_plugins_download_aws_stream_download(self, mock_get_chunk_dest_path):
+        """AwsDownload._stream_download() must stream objects parts in order"""
+
+        plugin = self.get_download_plugin(self.product)
+        plugin.config.flatten_top_dirs = False
+        plugin.range_size = 10
+        plugin.ranges_in_flight = 2
+        plugin.objects_in_flight = 2
+        mock_get_chunk_dest_path.side_effect = lambda *x, **y: x[2].key
+
+        objects_data = {"a": b"a" * 25, "b": b"b" * 5, "c": b"c" * 31}
+
+        def mock_object(key):
+            data = objects_data[key]
+
+            def get_range(Bucket, Key, Range, **kwargs):
+                start, end = (int(x) for x in Range[len("bytes=") :].split("-"))
+                return {"Body": io.BytesIO(data[start : end + 1])}
+
+            s3_object = mock.Mock(key=key, size=len(data))
+            s3_object.meta.client.get_object.side_effect = get_range
+            return s3_object
+
+        s3_objects = [mock_object(k) for k in objects_data]
+        progress_callback = mock.Mock()
+
+        # multiple assets: zip entries
+        chunks_tuples = plugin._stream_download(
+            s3_objects, self.product, False, progress_callback, [{}, {}, {}]
+        )
+        entries = {entry[0]: b"".join(entry[4]) for entry in chunks_tuples}
+        self.assertDictEqual(entries, objects_data)
+        self.assertEqual(
+            sum(c.args[0] for c in progress_callback.call_args_list),
+            sum(len(d) for d in objects_data.values()),
+        )
+
+        # single asset: raw parts
+        chunks = plugin._stream_download(
+            s3_objects[:1], self.product, False, progress_callback, [{}]
+        )
+        self.assertEqual(b"".join(chunks), objects_data["a"])
+
+        # stopped consumer: running ranged GETs are waited for, pending ones cancelled
+        get_object = s3_objects[0].meta.client.get_object
+        get_object.reset_mock()
+        chunks = plugin._stream_download(
+            s3_objects[:1], self.product, False, progress_callback, [{}]
+        )
+        self.assertEqual(next(chunks), objects_data["a"][:10])
+        chunks.close()
+        calls_count = get_object.call_count
+        time.sleep(0.05)
+        self.assertEqual(get_object.call_count, calls_count)
+
 
 class TestDownloadPluginS3Rest(BaseDownloadPluginTest):
     def setUp(self):
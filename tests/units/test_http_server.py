@@ -36,6 +36,7 @@ from shapely.geometry import box
 from eodag.config import PluginConfig
 from eodag.plugins.authentication.base import Authentication
 from eodag.plugins.download.base import Download
+from eodag.rest.cache import get_products_cache
 from eodag.rest.config import Settings
 from eodag.rest.types.queryables import StacQueryables
 from eodag.utils import USER_AGENT, MockResponse
@@ -103,6 +104,7 @@ class RequestTestCase(unittest.TestCase):
 
     def setUp(self):
         self.app = TestClient(self.eodag_http_server.app)
+        get_products_cache.cache_clear()
 
     def test_route(self):
         result = self._request_valid("/", check_links=False)
@@ -316,7 +318,7 @@ class RequestTestCase(unittest.TestCase):
         search_result.number_matched = len(search_result)
         return search_result
 
-    @mock.patch("eodag.rest.core.eodag_api.search", autospec=True)
+    @mock.patch("eodag.rest.core.eodag_api.async_search", autospec=True)
     def _request_valid_raw(
         self,
         url: str,
@@ -550,7 +552,7 @@ class RequestTestCase(unittest.TestCase):
         self._request_not_found("search?collections=ZZZ&bbox=0,43,1,44")
 
     @mock.patch(
-        "eodag.rest.core.eodag_api.search",
+        "eodag.rest.core.eodag_api.async_search",
         autospec=True,
         side_effect=AuthenticationError("you are not authorized"),
     )
@@ -570,7 +572,7 @@ class RequestTestCase(unittest.TestCase):
         self.assertEqual(500, response.status_code)
 
     @mock.patch(
-        "eodag.rest.core.eodag_api.search",
+        "eodag.rest.core.eodag_api.async_search",
         autospec=True,
         side_effect=TimeOutError("too long"),
     )
@@ -707,6 +709,54 @@ class RequestTestCase(unittest.TestCase):
             },
         )
 
+    def test_search_item_id_from_products_cache(self):
+        """Products returned by a search must be found by id without searching them again"""
+        product_id = "578f1768-e66e-5b86-9363-b19f8931cc7b"
+        self._request_valid("search?collections=S1_SAR_OCN", search_call_count=1)
+
+        result = self._request_valid(
+            f"collections/S1_SAR_OCN/items/{product_id}", search_call_count=0
+        )
+        self.assertEqual(result["id"], product_id)
+        # not found in cache for another product type or provider
+        self._request_valid(
+            f"collections/{self.tested_product_type}/items/{product_id}",
+            search_call_count=1,
+        )
+        self._request_valid(
+            f"collections/S1_SAR_OCN/items/{product_id}?provider=creodias",
+            search_call_count=1,
+        )
+
+        # only missing products are searched, concurrently
+        result = self._request_valid(
+            "search",
+            method="POST",
+            post_data={
+                "collections": ["S1_SAR_OCN"],
+                "ids": ["foo", product_id, "bar"],
+            },
+            search_call_count=2,
+            expected_search_kwargs=[
+                {"id": "foo", "productType": "S1_SAR_OCN", "provider": None},
+                {"id": "bar", "productType": "S1_SAR_OCN", "provider": None},
+            ],
+        )
+        self.assertEqual(result["features"][2]["id"], product_id)
+
+        # disabled products cache
+        get_products_cache.cache_clear()
+        try:
+            Settings.from_environment.cache_clear()
+            with temporary_environment(EODAG_PRODUCTS_CACHE_TTL="0"):
+                self._request_valid("search?collections=S1_SAR_OCN")
+                self._request_valid(
+                    f"collections/S1_SAR_OCN/items/{product_id}", search_call_count=1
+                )
+        finally:
+            Settings.from_environment.cache_clear()
+            get_products_cache.cache_clear()
+
     def test_collection(self):
         """Requesting a collection through eodag server should return a valid response"""
         result = self._request_valid(f"collections/{self.tested_product_type}")
@@ -850,7 +900,7 @@ class RequestTestCase(unittest.TestCase):
             ],
         )
 
-    @mock.patch("eodag.rest.core.eodag_api.search", autospec=True)
+    @mock.patch("eodag.rest.core.eodag_api.async_search", autospec=True)
     def test_provider_prefix_post_search(self, mock_search):
         """provider prefixes should be removed from query parameters"""
         post_data = {
@@ -954,7 +1004,7 @@ class RequestTestCase(unittest.TestCase):
         )
 
     @mock.patch(
-        "eodag.rest.core.eodag_api.search",
+        "eodag.rest.core.eodag_api.async_search",
         autospec=True,
     )
     def test_search_no_results_with_errors(self, mock_search):
@@ -25,6 +25,7 @@ from shapely import wkt
 from eodag.api.product.metadata_mapping import get_provider_queryable_key
 from tests.context import (
     NOT_AVAILABLE,
+    CompiledJsonMapping,
     format_metadata,
     get_geometry_from_various,
     properties_from_json,
@@ -361,6 +362,71 @@ class TestMetadataFormatter(unittest.TestCase):
             },
         )
 
+    def test_compiled_json_mapping(self):
+        """CompiledJsonMapping must extract properties from many json results"""
+        mapping = {
+            "id": (None, parse("$.id")),
+            "title": (None, "{id}_{suffix}"),
+            "suffix": (None, "{platform}-x"),
+            "label": (None, "{title}/{suffix}"),
+            "platform": (None, "S2"),
+            "keywords": (None, "['a', 'b']"),
+            "cloudCover": (None, parse("$.cloud")),
+            "startTime": (
+                ["to_iso_utc_datetime_from_milliseconds"],
+                parse("$.start"),
+            ),
+            "dateOnly": (["to_iso_date", "1,0,0,0,0,0,0"], parse("$.date")),
+            "missingDate": (["to_iso_date"], parse("$.missing")),
+            "orbit": (["replace_str", "r'^R',''"], parse("$.orbit")),
+            "eo:snow": (["to_upper"], parse("$.snow")),
+            "dynamic": (["replace_str", "'{platform}','S1'"], parse("$.name")),
+            "nothing": (None, parse("$.none")),
+        }
+        results = [
+            {
+                "id": "foo",
+                "cloud": "12",
+                "start": 1619029639123,
+                "date": "2021-04-21T18:27:19.123Z",
+                "orbit": "R051",
+                "snow": "no",
+                "name": "S2A",
+                "none": None,
+            },
+            {"id": "bar", "cloud": 3.5, "start": 0, "orbit": "R1", "name": "S2B"},
+        ]
+        compiled_mapping = CompiledJsonMapping(mapping)
+        properties = compiled_mapping(results[0])
+        self.assertDictEqual(properties, properties_from_json(results[0], mapping))
+        self.assertDictEqual(
+            properties,
+            {
+                "id": "foo",
+                # templates are resolved in mapping order, templates defined after
+                # them being empty
+                "title": "foo_",
+                "suffix": "S2-x",
+                "label": "foo_/S2-x",
+                "platform": "S2",
+                "keywords": ["a", "b"],
+                "cloudCover": 12,
+                "startTime": "2021-04-21T18:27:19.123Z",
+                "dateOnly": "2021-04-22",
+                "orbit": "051",
+                "eo:snow": "NO",
+                "dynamic": "S1A",
+                "nothing": None,
+            },
+        )
+        # unavailable value that cannot be converted is skipped
+        other_properties = compiled_mapping(results[1])
+        self.assertNotIn("dateOnly", other_properties)
+        self.assertEqual(other_properties["startTime"], "1970-01-01T00:00:00.000Z")
+        # mutable constants are not shared between results
+        properties["keywords"].append("c")
+        self.assertListEqual(other_properties["keywords"], ["a", "b"])
+
     def test_convert_split_id_into_s1_params(self):
         to_format = "{id#split_id_into_s1_params}"
         expected = {
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024, CS GROUP - France, https://www.csgroup.eu/
+#
+# This file is part of EODAG project
+#     https://www.github.com/CS-SI/EODAG
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import stat
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from tests.context import (
+    EOProduct,
+    PluginManager,
+    ProductStore,
+    load_default_config,
+    set_product_store,
+)
+
+
+class TestProductStore(unittest.TestCase):
+    def setUp(self):
+        super(TestProductStore, self).setUp()
+        self.tmp_dir = TemporaryDirectory()
+        self.store = ProductStore(os.path.join(self.tmp_dir.name, "store"))
+        self.output_dir = os.path.join(self.tmp_dir.name, "output")
+        os.makedirs(self.output_dir)
+
+    def tearDown(self):
+        super(TestProductStore, self).tearDown()
+        set_product_store(None)
+        self.tmp_dir.cleanup()
+
+    def make_product(self, name, files):
+        product_path = os.path.join(self.output_dir, name)
+        for rel_path, content in files.items():
+            file_path = os.path.join(product_path, rel_path)
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            Path(file_path).write_bytes(content)
+        return product_path
+
+    def test_product_store_add_and_get(self):
+        """Stored products must be materialized elsewhere, sharing identical files"""
+        foo_path = self.make_product("foo", {"a": b"a" * 10, "sub/b": b"b" * 20})
+        os.makedirs(os.path.join(foo_path, "empty"))
+        self.store.add("foo", foo_path)
+        # identical files of other products are stored once
+        bar_path = self.make_product("bar", {"c": b"a" * 10})
+        self.store.add("bar", bar_path)
+        self.assertEqual(self.store.size(), 30)
+        # downloaded files are copied to the store, which only holds read-only files
+        Path(foo_path, "a").write_bytes(b"modified")
+        for dirpath, _, filenames in os.walk(self.store.objects_dir):
+            for filename in filenames:
+                mode = os.stat(os.path.join(dirpath, filename)).st_mode
+                self.assertEqual(stat.S_IMODE(mode) & 0o222, 0)
+
+        other_dir = os.path.join(self.tmp_dir.name, "other")
+        path = self.store.get("foo", other_dir)
+        self.assertEqual(path, os.path.join(other_dir, "foo"))
+        self.assertEqual(Path(path, "sub", "b").read_bytes(), b"b" * 20)
+        self.assertTrue(os.path.isdir(os.path.join(path, "empty")))
+        self.assertEqual(Path(path, "a").read_bytes(), b"a" * 10)
+        self.assertListEqual(os.listdir(other_dir), ["foo"])
+        self.assertIsNone(self.store.get("baz", other_dir))
+
+        # lone files
+        zip_path = os.path.join(self.output_dir, "baz.zip")
+        Path(zip_path).write_bytes(b"zip")
+        self.store.add("baz", zip_path)
+        self.assertEqual(Path(self.store.get("baz", other_dir)).read_bytes(), b"zip")
+
+        # corrupted stored files are not used
+        with TemporaryDirectory() as tmp_dir:
+            path = self.store.get("bar", tmp_dir)
+            os.chmod(os.path.join(path, "c"), 0o644)
+            Path(path, "c").write_bytes(b"corrupted!")
+        self.assertIsNone(self.store.get("bar", os.path.join(self.tmp_dir.name, "new")))
+        self.assertIsNone(self.store.get("foo", os.path.join(self.tmp_dir.name, "new")))
+
+    def test_product_store_eviction(self):
+        """Least recently used products must be evicted above the maximum size"""
+        store = ProductStore(os.path.join(self.tmp_dir.name, "small"), max_size=25)
+        store.add("foo", self.make_product("foo", {"a": b"a" * 10}))
+        store.add("bar", self.make_product("bar", {"b": b"b" * 10}))
+        # foo is used again
+        self.assertIsNotNone(store.get("foo", self.output_dir))
+        store.add("baz", self.make_product("baz", {"c": b"c" * 10}))
+
+        self.assertEqual(store.size(), 20)
+        other_dir = os.path.join(self.tmp_dir.name, "other")
+        self.assertIsNone(store.get("bar", other_dir))
+        self.assertIsNotNone(store.get("foo", other_dir))
+        self.assertIsNotNone(store.get("baz", other_dir))
+        # files of evicted products are removed
+        self.assertEqual(
+            sum(len(files) for _, _, files in os.walk(store.objects_dir)), 2
+        )
+        # too large products are not stored
+        store.add("qux", self.make_product("qux", {"d": b"d" * 30}))
+        self.assertIsNone(store.get("qux", other_dir))
+
+    def test_product_store_download(self):
+        """Download plugins must materialize stored products instead of downloading them"""
+        set_product_store(self.store)
+        product = EOProduct(
+            "peps",
+            {"id": "foo", "title": "foo", "geometry": "POINT (0 0)"},
+            productType="S2_MSI_L1C",
+        )
+        product.location = product.remote_location = "http://somewhere/foo"
+        plugin = PluginManager(load_default_config()).get_download_plugin(product)
+        self.store.add(
+            plugin._get_product_store_key(product),
+            self.make_product("foo", {"a": b"a"}),
+        )
+
+        other_dir = os.path.join(self.tmp_dir.name, "other")
+        fs_path, record_filename = plugin._prepare_download(
+            product, output_dir=other_dir
+        )
+        self.assertEqual(fs_path, os.path.join(other_dir, "foo"))
+        self.assertIsNone(record_filename)
+        self.assertEqual(Path(fs_path, "a").read_bytes(), b"a")
+        self.assertEqual(len(os.listdir(os.path.join(other_dir, ".downloaded"))), 1)
+
+        # products are stored per on-disk layout, whatever their provider
+        self.assertEqual(
+            plugin._get_product_store_key(product),
+            self.store.make_key(
+                "S2_MSI_L1C", "foo", True, "HTTPDownload,depth=2,flatten=True"
+            ),
+        )
+        creodias_product = EOProduct(
+            "creodias",
+            {"id": "foo", "title": "foo", "geometry": "POINT (0 0)"},
+            productType="S2_MSI_L1C",
+        )
+        creodias_product.location = (
+            creodias_product.remote_location
+        ) = "http://elsewhere/foo"
+        creodias_plugin = PluginManager(load_default_config()).get_download_plugin(
+            creodias_product
+        )
+        fs_path, record_filename = creodias_plugin._prepare_download(
+            creodias_product, output_dir=os.path.join(self.tmp_dir.name, "creodias")
+        )
+        self.assertIsNone(record_filename)
+        self.assertEqual(Path(fs_path, "a").read_bytes(), b"a")
+        # products downloaded as assets are packaged differently
+        creodias_product.assets.update({"a": {"href": "http://somewhere/foo/a"}})
+        self.assertNotEqual(
+            creodias_plugin._get_product_store_key(creodias_product),
+            plugin._get_product_store_key(product),
+        )
+        plugin.config.archive_depth = 1
+        try:
+            fs_path, record_filename = plugin._prepare_download(
+                product, output_dir=os.path.join(self.tmp_dir.name, "depth")
+            )
+            self.assertIsNotNone(record_filename)
+        finally:
+            plugin.config.archive_depth = 2
+
+        # archives are stored separately
+        fs_path, record_filename = plugin._prepare_download(
+            product, output_dir=self.tmp_dir.name, extract=False
+        )
+        self.assertEqual(fs_path, os.path.join(self.tmp_dir.name, "foo.zip"))
+        self.assertIsNotNone(record_filename)
+
+        # downloaded products are stored
+        def download(product, **kwargs):
+            Path(fs_path).write_bytes(b"zip")
+            return fs_path
+
+        product.register_downloader(plugin, None)
+        with mock.patch.object(plugin, "download", side_effect=download):
+            product.download(extract=False)
+        self.assertEqual(
+            Path(
+                self.store.get(
+                    plugin._get_product_store_key(product, extract=False), other_dir
+                )
+            ).read_bytes(),
+            b"zip",
+        )
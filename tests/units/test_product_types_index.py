@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024, CS GROUP - France, https://www.csgroup.eu/
+#
+# This file is part of EODAG project
+#     https://www.github.com/CS-SI/EODAG
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pickle
+import unittest
+
+from tests.context import ProductTypesIndex
+
+FIELDS = [
+    "instrument",
+    "platform",
+    "platformSerialIdentifier",
+    "processingLevel",
+    "sensorType",
+    "keywords",
+    "abstract",
+    "title",
+]
+
+
+class TestProductTypesIndex(unittest.TestCase):
+    def setUp(self):
+        super(TestProductTypesIndex, self).setUp()
+        self.index = ProductTypesIndex(
+            [
+                {
+                    "ID": "S1_SAR_GRD",
+                    "abstract": "Level-1 Ground Range Detected SAR data",
+                    "instrument": "SAR",
+                    "platform": "SENTINEL1",
+                    "platformSerialIdentifier": "S1A,S1B",
+                    "sensorType": "RADAR",
+                    "keywords": "SAR,SENTINEL,SENTINEL1,S1,S1A,S1B,L1,GRD",
+                    "title": "SENTINEL1 Level-1 Ground Range Detected",
+                    "missionStartDate": "2014-04-03T00:00:00Z",
+                },
+                {
+                    "ID": "S2_MSI_L1C",
+                    "abstract": "The Level-1C product is composed of 100x100 km2 tiles",
+                    "instrument": "MSI",
+                    "platform": "SENTINEL2",
+                    "platformSerialIdentifier": "S2A,S2B",
+                    "sensorType": "OPTICAL",
+                    "keywords": "MSI,SENTINEL,SENTINEL2,S2,S2A,S2B,L1,L1C",
+                    "title": "SENTINEL2 Level-1C",
+                },
+                {
+                    "ID": "S2_MSI_L2A",
+                    "abstract": "The Level-2A product provides surface reflectance images",
+                    "instrument": "MSI",
+                    "platform": "SENTINEL2",
+                    "platformSerialIdentifier": "S2A,S2B",
+                    "sensorType": "OPTICAL",
+                    "keywords": "MSI,SENTINEL,SENTINEL2,S2,S2A,S2B,L2,L2A",
+                    "title": "SENTINEL2 Level-2A",
+                },
+            ]
+        )
+
+    def search(self, text):
+        return [pt["ID"] for pt in self.index.search(text, FIELDS)]
+
+    def test_product_types_index_fields(self):
+        """Product types fields must be searched according to their type"""
+        # identifiers fields: exact and case sensitive match of the whole value
+        self.assertListEqual(
+            self.search("platform:SENTINEL2"), ["S2_MSI_L1C", "S2_MSI_L2A"]
+        )
+        self.assertListEqual(self.search("platform:sentinel2"), [])
+        # identifiers lists fields
+        self.assertListEqual(
+            self.search("platformSerialIdentifier:S1B"), ["S1_SAR_GRD"]
+        )
+        # keywords: case insensitive, without dashes and underscores
+        self.assertListEqual(self.search("keywords:l_1c"), ["S2_MSI_L1C"])
+        # text fields: case insensitive words, without stop words
+        self.assertListEqual(self.search("abstract:REFLECTANCE"), ["S2_MSI_L2A"])
+        self.assertListEqual(self.search("abstract:the"), [])
+        # not indexed field
+        self.assertListEqual(self.search("missionStartDate:2014"), [])
+        # stored fields
+        self.assertDictEqual(
+            self.index.search("ID:S1_SAR_GRD", FIELDS)[0],
+            {
+                "ID": "S1_SAR_GRD",
+                "missionStartDate": "2014-04-03T00:00:00Z",
+                "missionEndDate": None,
+            },
+        )
+
+    def test_product_types_index_syntax(self):
+        """Product types index queries must support terms combinations and patterns"""
+        self.assertListEqual(
+            self.search("SAR OR MSI"), ["S1_SAR_GRD", "S2_MSI_L1C", "S2_MSI_L2A"]
+        )
+        self.assertListEqual(self.search("MSI AND L2A"), ["S2_MSI_L2A"])
+        self.assertListEqual(self.search("MSI AND NOT L2A"), ["S2_MSI_L1C"])
+        self.assertListEqual(self.search("MSI ANDNOT L2A"), ["S2_MSI_L1C"])
+        self.assertListEqual(self.search("+sentinel -MSI"), ["S1_SAR_GRD"])
+        self.assertListEqual(self.search("(SAR OR L2A) AND OPTICAL"), ["S2_MSI_L2A"])
+        self.assertListEqual(self.search("MSI REQUIRE L1C"), ["S2_MSI_L1C"])
+        self.assertListEqual(self.search("S2*"), ["S2_MSI_L1C", "S2_MSI_L2A"])
+        self.assertListEqual(self.search("ID:S?_MSI_L2?"), ["S2_MSI_L2A"])
+        self.assertListEqual(
+            self.search("platform:[SENTINEL1 TO SENTINEL2}"), ["S1_SAR_GRD"]
+        )
+        self.assertListEqual(
+            self.search("*:*"), ["S1_SAR_GRD", "S2_MSI_L1C", "S2_MSI_L2A"]
+        )
+        self.assertListEqual(self.search(""), [])
+        # phrases
+        self.assertListEqual(self.search('"ground range"'), ["S1_SAR_GRD"])
+        self.assertListEqual(self.search('"range ground"'), [])
+        self.assertListEqual(self.search('"level-1 range"~2'), ["S1_SAR_GRD"])
+        # best matches first
+        self.assertListEqual(self.search("L1C OR L2A^3"), ["S2_MSI_L2A", "S2_MSI_L1C"])
+        self.assertListEqual(self.search("L1C^3 OR L2A"), ["S2_MSI_L1C", "S2_MSI_L2A"])
+
+    def test_product_types_index_add(self):
+        """Product types must be added to the index, or replaced if they already exist"""
+        self.assertEqual(len(self.index), 3)
+        self.index.add({"ID": "foo", "title": "Foo collection"})
+        self.assertIn("foo", self.index)
+        self.assertListEqual(self.search("collection"), ["foo"])
+
+        self.index.add({"ID": "foo", "title": "Bar collection", "sensorType": "RADAR"})
+        self.assertEqual(len(self.index), 4)
+        self.assertListEqual(self.search("foo"), [])
+        self.assertListEqual(self.search("bar"), ["foo"])
+        self.assertListEqual(self.search("sensorType:RADAR"), ["S1_SAR_GRD", "foo"])
+
+    def test_product_types_index_pickle(self):
+        """Product types index must be picklable"""
+        index = pickle.loads(pickle.dumps(self.index))
+        self.assertListEqual(
+            [pt["ID"] for pt in index.search("sentinel", FIELDS)],
+            self.search("sentinel"),
+        )
+        index.add({"ID": "foo", "title": "Foo"})
+        self.assertIn("foo", index)
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024, CS GROUP - France, https://www.csgroup.eu/
+#
+# This file is part of EODAG project
+#     https://www.github.com/CS-SI/EODAG
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+import requests
+from requests.auth import HTTPBasicAuth
+
+from tests.context import (
+    DiskResponseCache,
+    PluginConfig,
+    cached_request,
+    set_response_cache,
+)
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        super(TestResponseCache, self).setUp()
+        self.tmp_dir = TemporaryDirectory()
+        self.cache = DiskResponseCache(self.tmp_dir.name)
+        set_response_cache(self.cache)
+        self.config = PluginConfig.from_mapping({"response_cache_ttl": 60})
+        self.sent_headers = []
+
+    def tearDown(self):
+        super(TestResponseCache, self).tearDown()
+        set_response_cache(None)
+        self.tmp_dir.cleanup()
+
+    def send(self, status_code=200, content=b'{"features": []}', headers=None):
+        def send(headers_to_send):
+            self.sent_headers.append(headers_to_send)
+            response = requests.Response()
+            response.status_code = status_code
+            response._content = content
+            response.headers.update(headers or {})
+            return response
+
+        return send
+
+    def test_response_cache_hit_and_miss(self):
+        """cached_request must serve identical requests from the cache until they expire"""
+        url = "https://foo.bar/search?b=2&a=1"
+        response = cached_request("foo", self.config, "GET", url, self.send())
+        self.assertEqual(response.json(), {"features": []})
+        # same request, with differently ordered parameters
+        response = cached_request(
+            "foo", self.config, "GET", "https://foo.bar/search?a=1&b=2", self.send()
+        )
+        self.assertEqual(response.json(), {"features": []})
+        self.assertEqual(len(self.sent_headers), 1)
+
+        # POST bodies are part of the key
+        for body in ({"a": 1, "b": 2}, {"b": 2, "a": 1}, {"a": 2}):
+            cached_request("foo", self.config, "POST", url, self.send(), body=body)
+        self.assertEqual(len(self.sent_headers), 3)
+        self.assertDictEqual(
+            self.cache.stats(),
+            {"foo": {"hits": 2, "misses": 3, "revalidations": 0}},
+        )
+
+        # disabled cache
+        cached_request(
+            "foo",
+            PluginConfig.from_mapping({"response_cache_ttl": 0}),
+            "GET",
+            url,
+            self.send(),
+        )
+        self.assertEqual(len(self.sent_headers), 4)
+
+    def test_response_cache_revalidation(self):
+        """cached_request must revalidate stale responses using their validators"""
+        url = "https://foo.bar/search"
+        validators = {"ETag": '"abc"', "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}
+        cached_request("foo", self.config, "GET", url, self.send(headers=validators))
+        self.assertDictEqual(self.sent_headers[-1], {})
+
+        with mock.patch("eodag.utils.response_cache.time.time", return_value=1e12):
+            response = cached_request(
+                "foo", self.config, "GET", url, self.send(status_code=304, content=b"")
+            )
+        self.assertDictEqual(
+            self.sent_headers[-1],
+            {
+                "If-None-Match": '"abc"',
+                "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT",
+            },
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"features": []})
+        self.assertEqual(self.cache.stats("foo")["foo"]["revalidations"], 1)
+
+        # not stored if asked by the provider
+        cached_request(
+            "foo",
+            self.config,
+            "GET",
+            url + "?no-store",
+            self.send(headers={"Cache-Control": "no-store"}),
+        )
+        cached_request("foo", self.config, "GET", url + "?no-store", self.send())
+        self.assertEqual(self.cache.stats("foo")["foo"]["misses"], 3)
+
+    def test_response_cache_lru_eviction(self):
+        """DiskResponseCache must evict least recently used responses above its size limit"""
+        self.cache.max_size = 25
+        for i in range(3):
+            cached_request(
+                "foo",
+                self.config,
+                "GET",
+                f"https://foo.bar/{i}",
+                self.send(content=b"0123456789"),
+            )
+            # keep the first response recently used
+            cached_request("foo", self.config, "GET", "https://foo.bar/0", self.send())
+        self.assertEqual(len(self.sent_headers), 3)
+        # second response was evicted
+        cached_request(
+            "foo",
+            self.config,
+            "GET",
+            "https://foo.bar/1",
+            self.send(content=b"0123456789"),
+        )
+        self.assertEqual(len(self.sent_headers), 4)
+        # storing it again evicted the third one
+        cached_request("foo", self.config, "GET", "https://foo.bar/0", self.send())
+        self.assertEqual(len(self.sent_headers), 4)
+        cached_request("foo", self.config, "GET", "https://foo.bar/2", self.send())
+        self.assertEqual(len(self.sent_headers), 5)
+
+    def test_response_cache_credentials(self):
+        """cached_request must only serve responses to requests having the same credentials"""
+        url = "https://foo.bar/search"
+        for auth in (
+            None,
+            HTTPBasicAuth("alice", "secret"),
+            HTTPBasicAuth("bob", "secret"),
+            HTTPBasicAuth("alice", "secret"),
+            ("bob", "secret"),
+        ):
+            cached_request("foo", self.config, "GET", url, self.send(), auth=auth)
+        self.assertDictEqual(
+            self.cache.stats("foo"),
+            {"foo": {"hits": 2, "misses": 3, "revalidations": 0}},
+        )
+
+        # requests are sent without the cache if their credentials cannot be known
+        def failing_auth(request):
+            raise RuntimeError("boom")
+
+        for _ in range(2):
+            cached_request(
+                "foo", self.config, "GET", url, self.send(), auth=failing_auth
+            )
+        self.assertEqual(len(self.sent_headers), 5)
+        self.assertEqual(self.cache.stats("foo")["foo"]["misses"], 3)
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024, CS GROUP - France, https://www.csgroup.eu/
+#
+# This file is part of EODAG project
+#     https://www.github.com/CS-SI/EODAG
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+import os
+import unittest
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+from unittest import mock
+
+from cachetools import TTLCache
+
+from eodag.api.product import EOProduct
+from eodag.rest.cache import (
+    MemoryCacheBackend,
+    ProductsCache,
+    SqliteCacheBackend,
+    cached,
+    init_cache,
+)
+from eodag.rest.config import Settings
+
+
+class TestRestCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        super(TestRestCache, self).setUp()
+        self.tmp_dir = TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "cache.sqlite")
+        self.calls = 0
+
+    def tearDown(self):
+        super(TestRestCache, self).tearDown()
+        self.tmp_dir.cleanup()
+        Settings.from_environment.cache_clear()
+
+    def request(self, cache):
+        return SimpleNamespace(
+            app=SimpleNamespace(state=SimpleNamespace(cache=cache)),
+            state=SimpleNamespace(url_root="http://foo"),
+        )
+
+    async def fetch(self):
+        self.calls += 1
+        await asyncio.sleep(0.1)
+        return {"collections": [self.calls]}
+
+    def test_rest_cache_init(self):
+        """init_cache must create the configured backend, honoring the configured ttl"""
+        app = SimpleNamespace(state=SimpleNamespace())
+        with mock.patch.dict(os.environ, {"EODAG_CACHE_TTL": "10"}):
+            Settings.from_environment.cache_clear()
+            init_cache(app)
+        self.assertIsInstance(app.state.cache, MemoryCacheBackend)
+        self.assertIsInstance(app.state.cache._cache, TTLCache)
+        self.assertEqual(app.state.cache._cache.ttl, 10)
+
+        with mock.patch.dict(
+            os.environ,
+            {"EODAG_CACHE_BACKEND": "sqlite", "EODAG_CACHE_PATH": self.db_path},
+        ):
+            Settings.from_environment.cache_clear()
+            init_cache(app)
+        self.assertIsInstance(app.state.cache, SqliteCacheBackend)
+        self.assertTrue(os.path.isfile(self.db_path))
+
+    async def test_rest_cache_collapse_requests(self):
+        """Concurrent identical requests must be computed once"""
+        request = self.request(MemoryCacheBackend(maxsize=10))
+        results = await asyncio.gather(
+            *(cached(self.fetch, "collections", request) for _ in range(5))
+        )
+        self.assertEqual(self.calls, 1)
+        self.assertTrue(all(r == {"collections": [1]} for r in results))
+        # each request got its own result
+        self.assertEqual(len({id(r) for r in results}), 5)
+
+        # next requests are served from cache
+        self.assertEqual(
+            await cached(self.fetch, "collections", request), {"collections": [1]}
+        )
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(request.app.state.cache.pending, {})
+
+        # errors are raised in all collapsed requests
+        async def fail():
+            await asyncio.sleep(0.1)
+            raise ValueError("foo")
+
+        results = await asyncio.gather(
+            *(cached(fail, "error", request) for _ in range(3)),
+            return_exceptions=True,
+        )
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+
+    async def test_rest_cache_sqlite_shared(self):
+        """SqliteCacheBackend must be shared by workers, with expiring and bounded entries"""
+        worker_1 = SqliteCacheBackend(self.db_path, maxsize=2, ttl=60)
+        worker_2 = SqliteCacheBackend(self.db_path, maxsize=2, ttl=60)
+
+        worker_1.set("foo", b"1")
+        self.assertEqual(worker_2.get("foo"), b"1")
+        with mock.patch("eodag.rest.cache.time.time", return_value=1e12):
+            self.assertIsNone(worker_2.get("foo"))
+
+        worker_1.set("bar", b"2")
+        worker_1.set("baz", b"3")
+        self.assertIsNone(worker_2.get("foo"))
+        self.assertEqual(worker_2.get("baz"), b"3")
+
+        # worker_2 waits for the result computed by worker_1
+        self.assertTrue(worker_1.acquire("collections:foo", 10))
+        self.assertFalse(worker_2.acquire("collections:foo", 10))
+
+        async def compute_in_worker_1():
+            await asyncio.sleep(0.2)
+            worker_1.set("collections:foo", b'{"collections": [0]}')
+            worker_1.release("collections:foo")
+
+        task = asyncio.create_task(compute_in_worker_1())
+        result = await cached(self.fetch, "collections", self.request(worker_2))
+        await task
+        self.assertEqual(result, {"collections": [0]})
+        self.assertEqual(self.calls, 0)
+
+    async def test_rest_cache_cancelled_request(self):
+        """Cancelling the request computing a result must not cancel the waiting ones"""
+        request = self.request(MemoryCacheBackend(maxsize=10))
+        first = asyncio.create_task(cached(self.fetch, "collections", request))
+        await asyncio.sleep(0)
+        others = [
+            asyncio.create_task(cached(self.fetch, "collections", request))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        first.cancel()
+
+        results = await asyncio.gather(*others)
+        self.assertTrue(first.cancelled())
+        self.assertEqual(results, [{"collections": [1]}] * 2)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(request.app.state.cache.pending, {})
+
+    async def test_rest_cache_sqlite_lock_released_without_result(self):
+        """A worker must compute the result if the one holding the lock released it without result"""
+        worker_1 = SqliteCacheBackend(self.db_path, maxsize=2, ttl=60)
+        worker_2 = SqliteCacheBackend(self.db_path, maxsize=2, ttl=60)
+
+        self.assertTrue(worker_1.acquire("collections:foo", 60))
+
+        async def fail_in_worker_1():
+            await asyncio.sleep(0.2)
+            worker_1.release("collections:foo")
+
+        task = asyncio.create_task(fail_in_worker_1())
+        result = await asyncio.wait_for(
+            cached(self.fetch, "collections", self.request(worker_2)), timeout=5
+        )
+        await task
+        self.assertEqual(result, {"collections": [1]})
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(worker_1.get("collections:foo"), b'{"collections":[1]}')
+
+    def test_rest_cache_products_copies(self):
+        """ProductsCache must store and return independent copies of online products"""
+        products_cache = ProductsCache(maxsize=10, ttl=60)
+        product = EOProduct(
+            "peps",
+            {
+                "id": "foo",
+                "geometry": "POINT (0 0)",
+                "storageStatus": "ONLINE",
+                "keywords": ["bar"],
+            },
+            productType="S2_MSI_L1C",
+        )
+        product.assets.update({"data": {"href": "http://foo/data", "roles": ["data"]}})
+        offline_product = EOProduct(
+            "peps",
+            {"id": "baz", "geometry": "POINT (0 0)", "storageStatus": "OFFLINE"},
+        )
+        products_cache.add([product, offline_product])
+
+        cached_product = products_cache.get("foo", provider="peps")
+        cached_product.properties["keywords"].append("baz")
+        cached_product.assets["data"]["roles"].append("metadata")
+        self.assertListEqual(product.properties["keywords"], ["bar"])
+        self.assertListEqual(product.assets["data"]["roles"], ["data"])
+        self.assertIs(cached_product.assets.product, cached_product)
+        self.assertIs(cached_product.assets["data"].product, cached_product)
+        self.assertListEqual(
+            products_cache.get("foo", provider="peps").properties["keywords"], ["bar"]
+        )
+
+        # products which are not online are searched again to refresh their status
+        self.assertIsNone(products_cache.get("baz", provider="peps"))
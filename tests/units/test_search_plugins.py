@@ -20,11 +20,13 @@ import json
 import os
 import re
 import ssl
+import tempfile
 import unittest
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest import mock
 from unittest.mock import call
+from urllib.error import URLError
 
 import boto3
 import botocore
@@ -513,6 +515,94 @@ class TestSearchPluginQueryStringSearch(BaseSearchPluginTest):
         # restore configuration
         search_plugin.config.discover_product_types = discover_product_types_conf
 
+    def test_plugins_search_querystringsearch_discover_product_types_short_page(self):
+        """QueryStringSearch.discover_product_types must stop at the first short page"""
+        provider = "earth_search"
+        search_plugin = self.get_search_plugin(self.product_type, provider)
+
+        discover_product_types_conf = search_plugin.config.discover_product_types
+        search_plugin.config.discover_product_types = dict(
+            discover_product_types_conf,
+            fetch_url="https://foo.bar/collections",
+            next_page_url_tpl="{url}?page={page}",
+            start_page=0,
+            max_connections=2,
+        )
+
+        def collections(*ids):
+            return {"collections": [{"id": id, "title": id.upper()} for id in ids]}
+
+        with responses.RequestsMock(
+            assert_all_requests_are_fired=True
+        ) as mock_requests, mock.patch(
+            "eodag.plugins.search.qssearch.logger", autospec=True
+        ) as mock_logger:
+            mock_requests.add(
+                responses.GET,
+                "https://foo.bar/collections?page=0",
+                json=collections("foo", "bar"),
+            )
+            # short page, the last one
+            mock_requests.add(
+                responses.GET,
+                "https://foo.bar/collections?page=1",
+                json=collections("baz"),
+            )
+            conf_update_dict = search_plugin.discover_product_types()
+
+            # the page of the window past the last one fails, without logged error
+            self.assertEqual(len(mock_requests.calls), 3)
+            mock_logger.exception.assert_not_called()
+
+        self.assertCountEqual(
+            conf_update_dict["providers_config"].keys(), ["foo", "bar", "baz"]
+        )
+
+        # restore configuration
+        search_plugin.config.discover_product_types = discover_product_types_conf
+
+    @mock.patch(
+        "eodag.plugins.search.qssearch.QueryStringSearch._request", autospec=True
+    )
+    def test_plugins_search_querystringsearch_discover_product_types_etag(
+        self, mock__request
+    ):
+        """QueryStringSearch.discover_product_types must reuse product types parsed from an unchanged listing"""
+        provider = "earth_search"
+        search_plugin = self.get_search_plugin(self.product_type, provider)
+
+        mock__request.return_value = mock.Mock()
+        mock__request.return_value.headers = {"ETag": '"v1"'}
+        mock__request.return_value.json.return_value = {
+            "collections": [{"id": "foo_collection", "title": "The FOO collection"}]
+        }
+        with tempfile.TemporaryDirectory() as snapshot_dir, mock.patch.dict(
+            os.environ, {"EODAG_CFG_SNAPSHOT_DIR": snapshot_dir}
+        ), mock.patch.object(
+            type(search_plugin),
+            "_parse_discovered_product_types",
+            autospec=True,
+            side_effect=type(search_plugin)._parse_discovered_product_types,
+        ) as mock_parse:
+            conf_update_dict = search_plugin.discover_product_types()
+            self.assertEqual(mock_parse.call_count, 1)
+            self.assertIn("foo_collection", conf_update_dict["providers_config"])
+
+            # same ETag: the listing is requested, but not parsed again
+            self.assertEqual(search_plugin.discover_product_types(), conf_update_dict)
+            self.assertEqual(mock__request.call_count, 2)
+            self.assertEqual(mock_parse.call_count, 1)
+
+            # new ETag: the listing is parsed again
+            mock__request.return_value.headers = {"ETag": '"v2"'}
+            mock__request.return_value.json.return_value = {
+                "collections": [{"id": "bar_collection", "title": "The BAR collection"}]
+            }
+            conf_update_dict = search_plugin.discover_product_types()
+            self.assertEqual(mock_parse.call_count, 2)
+            self.assertIn("bar_collection", conf_update_dict["providers_config"])
+            self.assertNotIn("foo_collection", conf_update_dict["providers_config"])
+
     @mock.patch("eodag.plugins.search.qssearch.PostJsonSearch._request", autospec=True)
     def test_plugins_search_querystringsearch_discover_product_types_post(
         self, mock__request
@@ -821,6 +911,20 @@ class TestSearchPluginPostJsonSearch(BaseSearchPluginTest):
                     )
                 self.assertIn("test error message", str(cm.output))
 
+            # errors without response
+            responses.replace(
+                responses.POST, self.awseos_url, body=URLError("no route to host")
+            )
+            with self.assertRaisesRegex(RequestError, "no route to host"):
+                self.awseos_search_plugin.query(
+                    prep=PreparedSearch(
+                        page=1,
+                        items_per_page=2,
+                        auth_plugin=self.awseos_auth_plugin,
+                    ),
+                    **self.search_criteria_s2_msi_l1c,
+                )
+
         run()
 
     def test_plugins_search_postjsonsearch_request_auth_error(self):
@@ -948,7 +1052,7 @@ class TestSearchPluginPostJsonSearch(BaseSearchPluginTest):
         "eodag.plugins.search.qssearch.QueryStringSearch.normalize_results",
         autospec=True,
     )
-    @mock.patch("eodag.plugins.search.qssearch.requests.post", autospec=True)
+    @mock.patch("eodag.plugins.search.qssearch.requests.Session.post", autospec=True)
     def test_plugins_search_postjsonsearch_search_cloudcover_awseos(
         self, mock_requests_post, mock_normalize_results
     ):
@@ -1016,7 +1120,7 @@ class TestSearchPluginPostJsonSearch(BaseSearchPluginTest):
         )
         self.assertNotIn("bar", products[0].properties)
 
-    @mock.patch("eodag.plugins.search.qssearch.requests.post", autospec=True)
+    @mock.patch("eodag.plugins.search.qssearch.requests.Session.post", autospec=True)
     @mock.patch(
         "eodag.plugins.search.qssearch.PostJsonSearch.normalize_results", autospec=True
     )
@@ -1037,6 +1141,7 @@ class TestSearchPluginPostJsonSearch(BaseSearchPluginTest):
             time=["01:00"],
         )
         mock_request.assert_called_with(
+            mock.ANY,
             "https://gateway.prod.wekeo2.eu/hda-broker/api/v1/dataaccess/search",
             json={
                 "dataset_id": "EO:ECMWF:DAT:REANALYSIS_ERA5_SINGLE_LEVELS",
@@ -1062,6 +1167,7 @@ class TestSearchPluginPostJsonSearch(BaseSearchPluginTest):
             startTimeFromAscendingNode="2021-02-01T03:00:00Z",
         )
         mock_request.assert_called_with(
+            mock.ANY,
             "https://gateway.prod.wekeo2.eu/hda-broker/api/v1/dataaccess/search",
             json={
                 "dataset_id": "EO:ECMWF:DAT:REANALYSIS_ERA5_SINGLE_LEVELS",
@@ -1101,6 +1207,7 @@ class TestSearchPluginPostJsonSearch(BaseSearchPluginTest):
         )
         search_plugin.query(productType="ERA5_SL", prep=PreparedSearch())
         mock_request.assert_called_with(
+            mock.ANY,
             "https://gateway.prod.wekeo2.eu/hda-broker/api/v1/dataaccess/search",
             json={
                 "dataset_id": "EO:ECMWF:DAT:REANALYSIS_ERA5_SINGLE_LEVELS",
@@ -1140,6 +1247,7 @@ class TestSearchPluginPostJsonSearch(BaseSearchPluginTest):
         )
         search_plugin.query(productType="CAMS_EAC4", prep=PreparedSearch())
         mock_request.assert_called_with(
+            mock.ANY,
             "https://gateway.prod.wekeo2.eu/hda-broker/api/v1/dataaccess/search",
             json={
                 "dataset_id": "EO:ECMWF:DAT:CAMS_GLOBAL_REANALYSIS_EAC4",
@@ -1298,7 +1406,7 @@ class TestSearchPluginODataV4Search(BaseSearchPluginTest):
 
         self.assertEqual(products[0].properties["foo"], "bar")
 
-    @mock.patch("eodag.plugins.search.qssearch.requests.get", autospec=True)
+    @mock.patch("eodag.plugins.search.qssearch.requests.Session.get", autospec=True)
     @mock.patch(
         "eodag.plugins.search.qssearch.QueryStringSearch._request", autospec=True
     )
@@ -1410,7 +1518,7 @@ class TestSearchPluginODataV4Search(BaseSearchPluginTest):
 
         del self.onda_search_plugin.config.ssl_verify
 
-    @mock.patch("eodag.plugins.search.qssearch.requests.get", autospec=True)
+    @mock.patch("eodag.plugins.search.qssearch.requests.Session.get", autospec=True)
     @mock.patch(
         "eodag.plugins.search.qssearch.QueryStringSearch._request", autospec=True
     )
@@ -1464,7 +1572,11 @@ class TestSearchPluginODataV4Search(BaseSearchPluginTest):
             products[1].properties["uid"],
         )
         mock_requests_get.assert_called_with(
-            metadata_url, headers=USER_AGENT, timeout=HTTP_REQ_TIMEOUT, verify=True
+            mock.ANY,
+            metadata_url,
+            headers=USER_AGENT,
+            timeout=HTTP_REQ_TIMEOUT,
+            verify=True,
         )
         # we check that two requests have been called, one per product
         self.assertEqual(mock_requests_get.call_count, 2)
@@ -1490,7 +1602,7 @@ class TestSearchPluginODataV4Search(BaseSearchPluginTest):
         # products count non extracted from search results as count endpoint is specified
         self.assertFalse(hasattr(self.onda_search_plugin, "total_items_nb"))
 
-    @mock.patch("eodag.plugins.search.qssearch.requests.get", autospec=True)
+    @mock.patch("eodag.plugins.search.qssearch.requests.Session.get", autospec=True)
     @mock.patch(
         "eodag.plugins.search.qssearch.QueryStringSearch._request", autospec=True
     )
@@ -1721,7 +1833,7 @@ class TestSearchPluginStacSearch(BaseSearchPluginTest):
         )
         self.assertEqual(products[1].geometry.bounds, (-180.0, -90.0, 180.0, 90.0))
 
-    @mock.patch("eodag.plugins.search.qssearch.requests.post", autospec=True)
+    @mock.patch("eodag.plugins.search.qssearch.requests.Session.post", autospec=True)
     def test_plugins_search_stacsearch_opened_time_intervals(self, mock_requests_post):
         """Opened time intervals must be handled by StacSearch plugin"""
         mock_requests_post.return_value = mock.Mock()
@@ -1847,7 +1959,7 @@ class TestSearchPluginMeteoblueSearch(BaseSearchPluginTest):
         self.auth_plugin.config.credentials = {"cred": "entials"}
         self.auth = self.auth_plugin.authenticate()
 
-    @mock.patch("eodag.plugins.search.qssearch.requests.post", autospec=True)
+    @mock.patch("eodag.plugins.search.qssearch.requests.Session.post", autospec=True)
     def test_plugins_search_buildpostsearchresult_count_and_search(
         self, mock_requests_post
     ):
@@ -1861,6 +1973,7 @@ class TestSearchPluginMeteoblueSearch(BaseSearchPluginTest):
         )
 
         mock_requests_post.assert_called_with(
+            mock.ANY,
             self.search_plugin.config.api_endpoint,
             json=mock.ANY,
             headers=USER_AGENT,
@@ -16,14 +16,31 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
+import logging
+import os
+import time
 import unittest
 from collections import UserList
+from importlib.util import find_spec
+from tempfile import TemporaryDirectory
 
 import geojson
+import numpy as np
 from lxml import html
+from shapely.geometry import Polygon, box
 from shapely.geometry.collection import GeometryCollection
 
-from tests.context import EOProduct, SearchResult
+from tests.context import (
+    EOProduct,
+    FilterDate,
+    FilterLatestIntersect,
+    FilterOverlap,
+    FilterProperty,
+    SearchResult,
+)
+
+logger = logging.getLogger("eodag.tests.search_result")
 
 
 class TestSearchResult(unittest.TestCase):
@@ -88,3 +105,320 @@ class TestSearchResult(unittest.TestCase):
         """SearchResult html repr must be correctly formatted"""
         sr_repr = html.fromstring(self.search_result._repr_html_())
         self.assertIn("SearchResult", sr_repr.xpath("//thead/tr/td")[0].text)
+
+
+class TestSearchResultCrunch(unittest.TestCase):
+    """Vectorized geometry crunchers must filter like product by product ones"""
+
+    @staticmethod
+    def make_products(count, searched=None, invalid=True):
+        """Products on a grid of overlapping boxes, some of them invalid or without
+        search intersection"""
+        products = []
+        for i in range(count):
+            x, y = i % 100 * 0.5, i // 100 * 0.5
+            if invalid and i % 10 == 5:
+                # invalid bowtie geometry
+                geom = Polygon([(x, y), (x + 1, y + 1), (x + 1, y), (x, y + 1)])
+            else:
+                geom = box(x, y, x + 1 + i % 3 * 0.2, y + 1)
+            product = EOProduct(
+                provider=None,
+                properties={
+                    "id": str(i),
+                    "geometry": geom,
+                    "startTimeFromAscendingNode": f"2024-01-{i % 28 + 1:02d}T00:00:00Z",
+                    "completionTimeFromAscendingNode": (
+                        f"2024-01-{i % 28 + 1:02d}T{i % 24:02d}:00:00Z"
+                    ),
+                    "cloudCover": i % 100,
+                    "storageStatus": "ONLINE" if i % 3 else "OFFLINE",
+                },
+            )
+            if i % 5 == 0:
+                product.search_intersection = None
+            elif searched is not None and i % 2:
+                product.search_intersection = geom.buffer(0).intersection(searched)
+            products.append(product)
+        return SearchResult(products)
+
+    @staticmethod
+    def reference_overlap(products, search_geom, minimum_overlap, mode=None):
+        filtered = []
+        for product in products:
+            if product.search_intersection:
+                intersection = product.search_intersection
+                product_geometry = product.geometry
+            else:
+                product_geometry = product.geometry.buffer(0)
+                intersection = search_geom.intersection(product_geometry)
+            if mode is not None:
+                if getattr(product_geometry, mode)(search_geom):
+                    filtered.append(product)
+                continue
+            ipos = intersection.area / search_geom.area * 100
+            ipop = intersection.area / product_geometry.area * 100
+            if (
+                search_geom.contains(product.geometry)
+                or ipos >= minimum_overlap
+                or ipop >= minimum_overlap
+            ):
+                filtered.append(product)
+        return filtered
+
+    @staticmethod
+    def reference_latest_intersect(products, search_extent):
+        filtered = []
+        for product in products:
+            if product.search_intersection:
+                filtered.append(product)
+            search_extent = search_extent.difference(product.geometry)
+            if search_extent.is_empty:
+                break
+        return filtered
+
+    def test_search_result_geometries(self):
+        """SearchResult must cache its products geometries and their spatial index"""
+        search_result = self.make_products(10)
+        self.assertEqual(
+            list(search_result.geometries), [p.geometry for p in search_result]
+        )
+        self.assertIs(search_result.geometries, search_result.geometries)
+        self.assertIs(search_result.strtree, search_result.strtree)
+        self.assertEqual(list(search_result.strtree.query(box(0, 0, 0.1, 0.1))), [0])
+        # cache is rebuilt when products change
+        search_result.reverse()
+        self.assertEqual(
+            list(search_result.strtree.query(box(0, 0, 0.1, 0.1))),
+            [len(search_result) - 1],
+        )
+        search_result.append(search_result[0])
+        self.assertEqual(len(search_result.geometries), 11)
+
+    def test_search_result_crunch_filter_overlap(self):
+        """FilterOverlap must keep the products overlapping the search extent"""
+        search_result = self.make_products(1000, box(2, 2, 10, 10))
+        for config, mode, search_geom in (
+            ({"minimum_overlap": 0}, None, box(3, 3, 20, 6.2)),
+            ({"minimum_overlap": 10}, None, box(3, 3, 20, 6.2)),
+            ({"minimum_overlap": 60}, None, box(3, 3, 20, 6.2)),
+            ({"contains": True}, "contains", box(3.1, 3.1, 3.3, 3.3)),
+            ({"within": True}, "within", box(3, 3, 20, 6.2)),
+            ({"intersects": True}, "intersects", box(3, 3, 20, 6.2)),
+        ):
+            with self.subTest(config=config):
+                expected = self.reference_overlap(
+                    search_result, search_geom, config.get("minimum_overlap", 0), mode
+                )
+                filtered = search_result.crunch(
+                    FilterOverlap(config), geometry=search_geom
+                )
+                self.assertListEqual(
+                    [p.properties["id"] for p in filtered],
+                    [p.properties["id"] for p in expected],
+                )
+                self.assertGreater(len(filtered), 0)
+
+    def test_search_result_crunch_filter_latest_intersect(self):
+        """FilterLatestIntersect must keep the latest products covering the search
+        extent"""
+        for search_extent in (box(3, 3, 8, 4.5), box(-5, 3, 8, 4.5)):
+            with self.subTest(search_extent=search_extent):
+                search_result = self.make_products(1000, invalid=False)
+                expected = self.reference_latest_intersect(
+                    sorted(
+                        search_result,
+                        key=FilterLatestIntersect.sort_product_by_start_date,
+                        reverse=True,
+                    ),
+                    search_extent,
+                )
+                filtered = search_result.crunch(
+                    FilterLatestIntersect({}), geometry=search_extent
+                )
+                self.assertListEqual(
+                    [p.properties["id"] for p in filtered],
+                    [p.properties["id"] for p in expected],
+                )
+
+    def test_search_result_columns(self):
+        """SearchResult columns must hold the products properties as arrays"""
+        search_result = SearchResult(
+            [
+                EOProduct(
+                    provider=None,
+                    properties={
+                        "id": str(i),
+                        "geometry": "POINT (0 0)",
+                        "startTimeFromAscendingNode": start,
+                        "cloudCover": cloud_cover,
+                    },
+                )
+                for i, (start, cloud_cover) in enumerate(
+                    (
+                        ("2024-01-02T03:04:05.123Z", 10),
+                        ("2024-01-02T04:04:05+01:00", None),
+                        ("2024-01-01", 20.5),
+                        (None, 0),
+                    )
+                )
+            ]
+        )
+        columns = search_result.columns
+        self.assertIs(columns, search_result.columns)
+        self.assertListEqual(list(columns.ids), ["0", "1", "2", "3"])
+        np.testing.assert_array_equal(
+            columns.start_dates,
+            np.array(
+                [
+                    "2024-01-02T03:04:05.123",
+                    "2024-01-02T03:04:05",
+                    "2024-01-01T00:00:00",
+                    "NaT",
+                ],
+                dtype="datetime64[us]",
+            ),
+        )
+        np.testing.assert_array_equal(columns.cloud_cover, [10, np.nan, 20.5, 0])
+        self.assertListEqual(list(columns.column("foo")), [None] * 4)
+        self.assertFalse(columns.has_property("foo"))
+        self.assertListEqual(
+            list(columns.argsort_dates("startTimeFromAscendingNode", reverse=True)),
+            [0, 1, 2, 3],
+        )
+        # columns are built again when products change
+        search_result.reverse()
+        self.assertIsNot(columns, search_result.columns)
+        self.assertListEqual(list(search_result.columns.ids), ["3", "2", "1", "0"])
+
+    def test_search_result_crunch_filter_date_and_property(self):
+        """FilterDate and FilterProperty must filter on the products columns"""
+        search_result = self.make_products(1000)
+        filtered = search_result.crunch(
+            FilterDate({"start": "2024-01-10", "end": "2024-01-20T12:00:00+01:00"})
+        )
+        self.assertListEqual(
+            [p.properties["id"] for p in filtered],
+            [
+                p.properties["id"]
+                for p in search_result
+                if "2024-01-10" <= p.properties["startTimeFromAscendingNode"]
+                and p.properties["completionTimeFromAscendingNode"]
+                <= "2024-01-20T11:00:00Z"
+            ],
+        )
+        filtered = search_result.crunch(
+            FilterProperty({"cloudCover": 10, "operator": "lt"})
+        )
+        self.assertListEqual(
+            [p.properties["id"] for p in filtered],
+            [
+                p.properties["id"]
+                for p in search_result
+                if p.properties["cloudCover"] < 10
+            ],
+        )
+        self.assertListEqual(
+            list(search_result.filter_online()),
+            [p for p in search_result if p.properties["storageStatus"] == "ONLINE"],
+        )
+        filtered = search_result.crunch(FilterProperty({"cloudCover": [1, 2]}))
+        self.assertEqual(len(filtered), 0)
+        # other operators are applied to the property of each product
+        filtered = search_result.crunch(
+            FilterProperty(
+                {"startTimeFromAscendingNode": "2024-01-05", "operator": "contains"}
+            )
+        )
+        self.assertListEqual(
+            [p.properties["id"] for p in filtered],
+            [
+                p.properties["id"]
+                for p in search_result
+                if "2024-01-05" in p.properties["startTimeFromAscendingNode"]
+            ],
+        )
+        self.assertEqual(len(filtered), 36)
+        # filtering is disabled on a property missing from some products
+        search_result[0].properties.pop("cloudCover")
+        filtered = SearchResult(search_result).crunch(
+            FilterProperty({"cloudCover": 10})
+        )
+        self.assertEqual(len(filtered), len(search_result))
+
+    def test_search_result_as_geojson_object_intersections(self):
+        """SearchResult GeoJSON representation must hold the products search intersections"""
+        search_result = self.make_products(200, box(2, 2, 10, 10))
+        search_result[1].search_intersection = Polygon()
+        self.assertEqual(
+            json.loads(geojson.dumps(search_result.as_geojson_object())),
+            json.loads(
+                geojson.dumps(
+                    {
+                        "type": "FeatureCollection",
+                        "features": [p.as_dict() for p in search_result],
+                    }
+                )
+            ),
+        )
+
+    @unittest.skipUnless(find_spec("pyarrow"), "pyarrow is not installed")
+    def test_search_result_to_parquet(self):
+        """SearchResult must be exported to GeoParquet"""
+        import pyarrow.parquet as pq
+        import shapely
+
+        search_result = self.make_products(100)
+        with TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "products.parquet")
+            search_result.to_parquet(path)
+            table = pq.read_table(path)
+        self.assertEqual(table.num_rows, 100)
+        geo_metadata = json.loads(table.schema.metadata[b"geo"])
+        self.assertEqual(geo_metadata["primary_column"], "geometry")
+        self.assertListEqual(
+            geo_metadata["columns"]["geometry"]["geometry_types"],
+            ["Polygon"],
+        )
+        self.assertListEqual(
+            table.column("id").to_pylist(), [p.properties["id"] for p in search_result]
+        )
+        self.assertEqual(
+            str(table.schema.field("startTimeFromAscendingNode").type),
+            "timestamp[us, tz=UTC]",
+        )
+        self.assertTrue(
+            shapely.from_wkb(table.column("geometry").to_pylist()[1]).equals(
+                search_result[1].geometry
+            )
+        )
+
+    def test_search_result_crunch_benchmark(self):
+        """Crunchers must scale to large search results"""
+        search_result = self.make_products(50000, invalid=False)
+        search_geom = box(10, 10, 30, 60)
+        for cruncher, search_params in (
+            (FilterOverlap({"minimum_overlap": 50}), {"geometry": search_geom}),
+            (FilterLatestIntersect({}), {"geometry": search_geom}),
+            (FilterDate({"start": "2024-01-10", "end": "2024-01-20"}), {}),
+            (FilterProperty({"cloudCover": 10, "operator": "lt"}), {}),
+        ):
+            start = time.perf_counter()
+            filtered = search_result.crunch(cruncher, **search_params)
+            elapsed = time.perf_counter() - start
+            logger.info(
+                "%s on %s products: %.3fs",
+                type(cruncher).__name__,
+                len(search_result),
+                elapsed,
+            )
+            self.assertGreater(len(filtered), 0)
+            self.assertLess(elapsed, 30)
+
+        start = time.perf_counter()
+        search_result.as_geojson_object()
+        elapsed = time.perf_counter() - start
+        logger.info(
+            "GeoJSON representation of %s products: %.3fs", len(search_result), elapsed
+        )
+        self.assertLess(elapsed, 30)
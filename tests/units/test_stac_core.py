@@ -16,6 +16,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import copy
 import importlib
 import json
 import os
@@ -28,7 +30,14 @@ import pytest
 from eodag.rest.types.stac_search import SearchPostRequest
 from eodag.utils.exceptions import ValidationError
 from tests import TEST_RESOURCES_PATH, mock
-from tests.context import SearchResult
+from tests.context import (
+    CompiledStacItem,
+    SearchResult,
+    deepcopy,
+    format_dict_items,
+    jsonpath_parse_dict_items,
+    string_to_jsonpath,
+)
 from tests.utils import mock_request
 
 
@@ -365,11 +374,13 @@ class TestStacCore(unittest.TestCase):
         res["features"][1]["properties"]["productIdentifier"] = "star*in*id"
         mock__request.return_value.json.return_value = res
 
-        response = self.rest_core.search_stac_items(
-            request=mock_request("http://foo/search"),
-            search_request=SearchPostRequest.model_validate(
-                {"provider": "peps", "collections": "S2_MSI_L1C"}
-            ),
+        response = asyncio.run(
+            self.rest_core.search_stac_items(
+                request=mock_request("http://foo/search"),
+                search_request=SearchPostRequest.model_validate(
+                    {"provider": "peps", "collections": "S2_MSI_L1C"}
+                ),
+            )
         )
 
         mock__request.assert_called()
@@ -388,6 +399,56 @@ class TestStacCore(unittest.TestCase):
         # check that no other asset have also been added to the response
         self.assertEqual(len(response["features"][0]["assets"]), 2)
 
+    def test_compiled_stac_item(self):
+        """CompiledStacItem must render items as parsing and formatting the whole model would do"""
+        product = copy.deepcopy(self.products[0])
+        product.properties["storageStatus"] = "OFFLINE"
+        product.properties["numbers"] = ["1", "2.5", {"foo": "True"}]
+        item_model = {
+            "stac_version": "{stac_version}",
+            "id": string_to_jsonpath("$.product.properties.id"),
+            "bbox": ["{item[geometry].bounds[0]}", "{item[geometry].bounds[3]}"],
+            "geometry": string_to_jsonpath("$.product.geometry"),
+            "properties": {
+                "providers": string_to_jsonpath("$.providers"),
+                "license": "{catalog[license]}",
+                "numbers": string_to_jsonpath("$.product.properties.numbers"),
+                "missing": string_to_jsonpath("$.product.properties.missing"),
+                "order:status": string_to_jsonpath(
+                    "$.product.properties.storageStatus"
+                ),
+            },
+            "links": [{"title": "{item[id]}", "href": "{catalog[url]}/{item[id]}"}],
+        }
+        need_conversion = {
+            "order:status": ("get_group_name", "(?P<orderable>OFFLINE)"),
+        }
+        format_args = {
+            "stac_version": "1.0.0",
+            "catalog": {"license": "proprietary", "url": "http://foo"},
+        }
+        providers = [{"name": "peps", "priority": "1"}]
+
+        item = CompiledStacItem(item_model, need_conversion, format_args).render(
+            product, providers, {"peps:foo": "2"}, {"foo": {"href": "http://bar"}}
+        )
+
+        expected = jsonpath_parse_dict_items(
+            item_model,
+            {"product": deepcopy(product.__dict__), "providers": providers},
+        )
+        expected["properties"]["order:status"] = "orderable"
+        expected["properties"]["peps:foo"] = "2"
+        expected["assets"] = {"foo": {"href": "http://bar"}}
+        expected = format_dict_items(expected, **dict(format_args, item=expected))
+        self.assertDictEqual(item, expected)
+        self.assertEqual(item["properties"]["numbers"], [1, 2.5, {"foo": True}])
+        self.assertEqual(item["properties"]["peps:foo"], 2)
+        self.assertEqual(item["bbox"][0], product.geometry.bounds[0])
+        self.assertEqual(
+            item["links"][0]["href"], f"http://foo/{product.properties['id']}"
+        )
+
     def test_get_templates_path(self):
         """get_templates_path returns an existing dir path"""
         with pytest.warns(
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024, CS GROUP - France, https://www.csgroup.eu/
+#
+# This file is part of EODAG project
+#     https://www.github.com/CS-SI/EODAG
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import io
+import os
+import shutil
+import unittest
+from email.message import Message
+from tempfile import TemporaryDirectory
+from unittest import mock
+from urllib.error import HTTPError
+
+from shapely.geometry import box
+
+from tests import TEST_RESOURCES_PATH
+from tests.context import StacItemsIndex, _TextOpener
+
+
+class TestStacItemsIndex(unittest.TestCase):
+    def setUp(self):
+        super(TestStacItemsIndex, self).setUp()
+        self.tmp_dir = TemporaryDirectory()
+        self.cat_dir_path = os.path.join(self.tmp_dir.name, "stac")
+        shutil.copytree(os.path.join(TEST_RESOURCES_PATH, "stac"), self.cat_dir_path)
+        self.root_cat = os.path.join(self.cat_dir_path, "catalog.json")
+        self.root_cat_len = 5
+        self.index_dir = os.path.join(self.tmp_dir.name, "index")
+        self.item = os.path.join(
+            self.cat_dir_path,
+            "country",
+            "FRA",
+            "year",
+            "2018",
+            "items",
+            "S2A_MSIL1C_20181231T141041_N0207_R110_T21NYF_20181231T155050",
+            "S2A_MSIL1C_20181231T141041_N0207_R110_T21NYF_20181231T155050.json",
+        )
+
+    def tearDown(self):
+        super(TestStacItemsIndex, self).tearDown()
+        self.tmp_dir.cleanup()
+
+    def test_stac_index_search(self):
+        """StacItemsIndex.search must return items matching time and space extents"""
+        index = StacItemsIndex(self.root_cat, index_dir=self.index_dir)
+        self.assertEqual(len(index), 0)
+        index.refresh()
+        self.assertEqual(len(index), self.root_cat_len)
+        self.assertEqual(len(index.search()), self.root_cat_len)
+
+        items = index.search(start="2019-01-01")
+        self.assertEqual(len(items), 2)
+        for item in items:
+            self.assertTrue(item["properties"]["datetime"].startswith("2019"))
+
+        items = index.search(start="2018-01-01", end="2018-12-31T23:59:59Z")
+        self.assertEqual(len(items), 2)
+        for item in items:
+            self.assertTrue(item["properties"]["datetime"].startswith("2018"))
+
+        items = index.search(geometry=box(-55, 2, -53, 5))
+        self.assertEqual(len(items), 3)
+        self.assertListEqual(
+            index.search(geometry=box(-55, 2, -53, 5), end="2018-01-01"),
+            [i for i in items if i["properties"]["datetime"] < "2018-01-01"],
+        )
+        self.assertListEqual(index.search(geometry=box(0, 0, 1, 1)), [])
+
+    def test_stac_index_persistence(self):
+        """StacItemsIndex must be loaded from disk and refreshed incrementally"""
+        index = StacItemsIndex(self.root_cat, index_dir=self.index_dir)
+        index.refresh()
+        self.assertTrue(os.path.isfile(index.path))
+
+        with mock.patch.object(
+            _TextOpener, "read_local_json", wraps=_TextOpener.read_local_json
+        ) as mock_read_local_json:
+            # loaded from disk, not refreshed before ttl
+            index = StacItemsIndex(self.root_cat, index_dir=self.index_dir)
+            self.assertEqual(len(index), self.root_cat_len)
+            index.refresh()
+            mock_read_local_json.assert_not_called()
+
+            # unchanged items are not read again
+            index.refresh(force=True)
+            read_items = [
+                c.args[0]
+                for c in mock_read_local_json.call_args_list
+                if c.args[0] == self.item
+            ]
+            self.assertListEqual(read_items, [])
+
+            # updated item is read again
+            stat = os.stat(self.item)
+            os.utime(self.item, (stat.st_atime, stat.st_mtime + 10))
+            mock_read_local_json.reset_mock()
+            index.refresh(force=True)
+            mock_read_local_json.assert_called_once_with(self.item, as_json=True)
+            self.assertEqual(len(index), self.root_cat_len)
+
+        # removed item
+        shutil.rmtree(os.path.dirname(self.item))
+        index.refresh(force=True)
+        self.assertEqual(len(index), self.root_cat_len - 1)
+        self.assertNotIn(self.item, index.entries)
+        self.assertEqual(
+            len(StacItemsIndex(self.root_cat, index_dir=self.index_dir)),
+            self.root_cat_len - 1,
+        )
+
+    @mock.patch("eodag.utils.stac_index.urlopen", autospec=True)
+    def test_stac_index_http_conditional_fetch(self, mock_urlopen):
+        """StacItemsIndex must only index again remote items that changed"""
+        href = "https://example.com/item.json"
+        index = StacItemsIndex(href)
+
+        mock_urlopen.return_value.read.return_value = (
+            b'{"type": "Feature", "id": "foo", "bbox": [0, 0, 1, 1],'
+            b' "properties": {"datetime": "2020-01-01T00:00:00Z"}}'
+        )
+        mock_urlopen.return_value.getheader.side_effect = lambda k: {
+            "ETag": '"abc"'
+        }.get(k)
+        entry = index._fetch_entry(href)
+        self.assertEqual(entry["etag"], '"abc"')
+        self.assertListEqual(entry["bbox"], [0, 0, 1, 1])
+        self.assertEqual(entry["start"], entry["end"])
+
+        # not modified
+        mock_urlopen.side_effect = HTTPError(
+            href, 304, "Not Modified", Message(), io.BytesIO()
+        )
+        self.assertIs(index._fetch_entry(href, entry), entry)
+        request = mock_urlopen.call_args[0][0]
+        self.assertEqual(request.get_header("If-none-match"), '"abc"')
+
+        # temporarily unavailable items are kept
+        for code in (429, 500, 503):
+            mock_urlopen.side_effect = HTTPError(
+                href, code, "Error", Message(), io.BytesIO()
+            )
+            self.assertIs(index._fetch_entry(href, entry), entry)
+
+        # removed items are dropped
+        for code in (404, 410):
+            mock_urlopen.side_effect = HTTPError(
+                href, code, "Gone", Message(), io.BytesIO()
+            )
+            self.assertIsNone(index._fetch_entry(href, entry))
+
+    @mock.patch("eodag.utils.stac_index.urlopen", autospec=True)
+    def test_stac_index_http_not_modified_catalog(self, mock_urlopen):
+        """StacItemsIndex must not browse again remote catalogs that did not change"""
+        root = "https://example.com/catalog.json"
+        child = "https://example.com/child/catalog.json"
+        item = "https://example.com/child/item.json"
+        contents = {
+            root: b'{"type": "Catalog", "id": "root",'
+            b' "links": [{"rel": "child", "href": "./child/catalog.json"}]}',
+            child: b'{"type": "Catalog", "id": "child",'
+            b' "links": [{"rel": "item", "href": "item.json"}]}',
+            item: b'{"type": "Feature", "id": "foo", "bbox": [0, 0, 1, 1],'
+            b' "properties": {"datetime": "2020-01-01T00:00:00Z"}}',
+        }
+
+        def urlopen(request, **kwargs):
+            res = mock.MagicMock()
+            res.read.return_value = contents[request.full_url]
+            res.getheader.side_effect = lambda k: {"ETag": '"abc"'}.get(k)
+            return res
+
+        mock_urlopen.side_effect = urlopen
+        index = StacItemsIndex(root, index_dir=self.index_dir)
+        index.refresh()
+        self.assertEqual(mock_urlopen.call_count, 3)
+        self.assertListEqual(list(index.entries), [item])
+
+        # unchanged root catalog: children are not requested
+        mock_urlopen.reset_mock()
+        mock_urlopen.side_effect = HTTPError(
+            root, 304, "Not Modified", Message(), io.BytesIO()
+        )
+        index = StacItemsIndex(root, index_dir=self.index_dir)
+        index.refresh(force=True)
+        mock_urlopen.assert_called_once()
+        self.assertListEqual(list(index.entries), [item])
+
+        # temporarily unavailable root catalog: indexed items are kept
+        mock_urlopen.side_effect = HTTPError(
+            root, 503, "Service Unavailable", Message(), io.BytesIO()
+        )
+        index.refresh(force=True)
+        self.assertListEqual(list(index.entries), [item])
@@ -16,36 +16,57 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import copy
+import gzip
 import logging
 import os
 import ssl
 import sys
+import tarfile
+import threading
+import time
 import unittest
+import zipfile
 from contextlib import closing
 from datetime import datetime
-from io import StringIO
+from email.utils import formatdate
+from io import BytesIO, StringIO
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest import mock
 
+import responses
+import shapefile
 from requests.exceptions import RequestException
 
 from tests.context import (
     HTTP_REQ_TIMEOUT,
     USER_AGENT,
     DownloadedCallback,
+    DownloadError,
+    PluginConfig,
+    PooledHTTPAdapter,
     ProgressCallback,
     RequestError,
+    SessionsRegistry,
+    UnsupportedArchiveError,
+    check_stream_extractable,
     deepcopy,
     fetch_json,
     flatten_top_directories,
+    get_async_executor,
     get_bucket_name_and_prefix,
+    get_location_index,
     get_ssl_context,
     get_timestamp,
     merge_mappings,
+    parse_retry_after,
     path_to_uri,
+    prefetch_iter,
+    run_with_async_requests,
     setup_logging,
+    stream_extract,
     uri_to_path,
 )
 
@@ -350,3 +371,323 @@ class TestUtils(unittest.TestCase):
             side_effect=RequestException,
         ) as mock_get:
             self.assertRaises(RequestError, fetch_json, file_url)
+
+    def test_sessions_registry(self):
+        """SessionsRegistry must share connection pools per provider and connection settings"""
+        registry = SessionsRegistry()
+        config = PluginConfig.from_mapping({"pool_maxsize": 2})
+
+        session = registry.get_session("foo", config)
+        adapter = session.get_adapter("https://foo.bar")
+
+        def get_adapter(*args, **kwargs):
+            return registry.get_session(*args, **kwargs).get_adapter("https://foo.bar")
+
+        self.assertIs(adapter, get_adapter("foo", config))
+        self.assertIsNot(adapter, get_adapter("bar", config))
+        self.assertIsNot(adapter, get_adapter("foo"))
+        self.assertIsNot(adapter, get_adapter("foo", config, retries=False))
+        # sessions, and their cookies, are not shared
+        other_session = registry.get_session("foo", config)
+        self.assertIsNot(session, other_session)
+        session.cookies.set("token", "secret")
+        self.assertNotIn("token", other_session.cookies)
+        self.assertEqual(adapter._pool_maxsize, 2)
+        self.assertEqual(adapter.max_retries.total, 3)
+        self.assertEqual(
+            registry.get_session("foo", config, retries=False)
+            .get_adapter("https://foo.bar")
+            .max_retries.total,
+            0,
+        )
+
+        # keep-alive disabled
+        config.keep_alive = False
+        self.assertEqual(
+            registry.get_session("foo", config).headers["Connection"], "close"
+        )
+
+        with responses.RequestsMock() as rsps:
+            rsps.add(responses.GET, "https://foo.bar/baz", json={})
+            session.get("https://foo.bar/baz")
+            session.get("https://foo.bar/baz")
+        stats = registry.stats("foo")
+        self.assertListEqual(list(stats.keys()), ["foo"])
+        self.assertEqual(stats["foo"]["requests"], 2)
+        for stat_name in (
+            "new_connections",
+            "reused_connections",
+            "open_connections",
+            "pools",
+        ):
+            self.assertIn(stat_name, stats["foo"])
+
+        registry.close("foo")
+        self.assertDictEqual(registry.stats("foo"), {})
+        self.assertIn("bar", registry.stats())
+
+    def test_run_with_async_requests(self):
+        """run_with_async_requests must send the requests of a function asynchronously"""
+        import httpx
+
+        sent = []
+
+        def handler(request):
+            sent.append(str(request.url))
+            if request.url.path == "/retry" and sent.count(str(request.url)) == 1:
+                return httpx.Response(503)
+            return httpx.Response(200, json={"path": request.url.path})
+
+        session = SessionsRegistry().get_session(
+            "foo", PluginConfig.from_mapping({"pool_maxsize": 2})
+        )
+
+        threads = []
+
+        def get_paths(*paths):
+            threads.append(threading.current_thread())
+            return [session.get(f"https://foo.bar/{p}").json()["path"] for p in paths]
+
+        async def run():
+            return await asyncio.gather(
+                run_with_async_requests(get_paths, "a", "retry"),
+                run_with_async_requests(get_paths, "b"),
+            )
+
+        with mock.patch.object(
+            PooledHTTPAdapter,
+            "_get_async_client",
+            return_value=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        ):
+            self.assertListEqual(asyncio.run(run()), [["/a", "/retry"], ["/b"]])
+
+        # each request is sent once, failed ones are retried
+        self.assertEqual(sent.count("https://foo.bar/retry"), 2)
+        self.assertEqual(len(sent), 4)
+        # functions are run once, in worker threads of the dedicated executor
+        self.assertEqual(len(threads), 2)
+        self.assertTrue(all(t.name.startswith("eodag-async") for t in threads))
+
+        # requests are sent synchronously outside of run_with_async_requests
+        with responses.RequestsMock() as rsps:
+            rsps.add(responses.GET, "https://foo.bar/c", json={"path": "/c"})
+            self.assertListEqual(get_paths("c"), ["/c"])
+
+    def test_utils_get_async_executor(self):
+        """get_async_executor must return a shared executor sized by $EODAG_ASYNC_WORKERS"""
+        with mock.patch("eodag.utils.requests._async_executor", None), mock.patch.dict(
+            os.environ, {"EODAG_ASYNC_WORKERS": "3"}
+        ):
+            executor = get_async_executor()
+            self.assertEqual(executor._max_workers, 3)
+            self.assertIs(get_async_executor(), executor)
+        executor.shutdown()
+
+    def test_utils_get_location_index(self):
+        """get_location_index must load a shapefile once, until it is modified"""
+        with TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "locations.shp")
+
+            def write_shapefile(codes):
+                with shapefile.Writer(path, shapeType=shapefile.POLYGON) as shp:
+                    shp.field("code", "C")
+                    for i, code in enumerate(codes):
+                        shp.poly([[[i, 0], [i, 1], [i + 1, 1], [i + 1, 0], [i, 0]]])
+                        shp.record(code)
+
+            write_shapefile(["PAK", "PAN", "FRA"])
+            index = get_location_index(path)
+            self.assertIs(get_location_index(path), index)
+            self.assertEqual(len(index), 3)
+            self.assertEqual(index.lookup("code")["PAN"], [1])
+
+            # single match, multiple matches union, and no match
+            self.assertEqual(index.get_geometry("code", "FRA").bounds, (2, 0, 3, 1))
+            geometry = index.get_geometry("code", "PA[A-Z]")
+            self.assertEqual(geometry.bounds, (0, 0, 2, 1))
+            self.assertAlmostEqual(geometry.area, 2)
+            self.assertIs(index.get_geometry("code", "PA[A-Z]"), geometry)
+            self.assertIsNone(index.get_geometry("code", "ITA"))
+            with self.assertRaises(KeyError):
+                index.get_geometry("name", "FRA")
+
+            # modified shapefile is loaded again
+            write_shapefile(["ITA"])
+            st = os.stat(path)
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+            reloaded_index = get_location_index(path)
+            self.assertIsNot(reloaded_index, index)
+            self.assertIsNone(reloaded_index.get_geometry("code", "FRA"))
+            self.assertIsNotNone(reloaded_index.get_geometry("code", "ITA"))
+
+    def test_utils_parse_retry_after(self):
+        """parse_retry_after must parse delays in seconds and HTTP dates"""
+        self.assertEqual(parse_retry_after("120"), 120)
+        self.assertEqual(parse_retry_after("-1"), 0)
+        self.assertEqual(parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0)
+        in_a_minute = formatdate(time.time() + 60, usegmt=True)
+        self.assertAlmostEqual(parse_retry_after(in_a_minute), 60, delta=2)
+        self.assertIsNone(parse_retry_after(""))
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after("soon"))
+
+    def test_utils_prefetch_iter(self):
+        """prefetch_iter must consume elements in background and yield them in order"""
+        consumed = []
+
+        def gen():
+            for i in range(10):
+                consumed.append(i)
+                yield i
+
+        self.assertListEqual(list(prefetch_iter(gen(), depth=3)), list(range(10)))
+
+        # stops consuming when closed
+        consumed.clear()
+        iterator = prefetch_iter(gen(), depth=2)
+        self.assertEqual(next(iterator), 0)
+        iterator.close()
+        self.assertLessEqual(len(consumed), 4)
+
+        # closing does not wait for the element being consumed
+        release = threading.Event()
+
+        def slow_gen():
+            yield 0
+            release.wait(5)
+            yield 1
+
+        iterator = prefetch_iter(slow_gen())
+        self.assertEqual(next(iterator), 0)
+        start = time.monotonic()
+        iterator.close()
+        self.assertLess(time.monotonic() - start, 1)
+        release.set()
+
+        # unless asked to
+        release.clear()
+        consumed.clear()
+
+        def slow_consumed_gen():
+            yield 0
+            release.wait(5)
+            consumed.append(1)
+            yield 1
+
+        iterator = prefetch_iter(slow_consumed_gen(), wait_on_close=True)
+        self.assertEqual(next(iterator), 0)
+        threading.Timer(0.2, release.set).start()
+        iterator.close()
+        self.assertListEqual(consumed, [1])
+
+        # errors are raised after previous elements
+        def failing_gen():
+            yield 1
+            raise RequestError("boom")
+
+        iterator = prefetch_iter(failing_gen())
+        self.assertEqual(next(iterator), 1)
+        self.assertRaises(RequestError, next, iterator)
+
+    def test_utils_stream_extract(self):
+        """stream_extract must extract zip and tar archives from their chunks"""
+        members = {"top/a.txt": os.urandom(100000), "top/sub/b": b"b" * 100000}
+
+        def chunks(data):
+            return (data[i : i + 1000] for i in range(0, len(data), 1000))
+
+        class UnseekableBytesIO(BytesIO):
+            def seek(self, *args):
+                raise OSError("unseekable")
+
+        # members of zip archives written to unseekable streams have data descriptors
+        for fileobj_class in (BytesIO, UnseekableBytesIO):
+            for compression in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+                if compression == zipfile.ZIP_STORED and fileobj_class != BytesIO:
+                    continue
+                fileobj = fileobj_class()
+                with zipfile.ZipFile(fileobj, "w", compression=compression) as zfile:
+                    for name, data in members.items():
+                        zfile.writestr(name, data)
+                with TemporaryDirectory() as tmp_dir:
+                    self.assertEqual(
+                        stream_extract(chunks(fileobj.getvalue()), tmp_dir), 2
+                    )
+                    for name, data in members.items():
+                        self.assertEqual(
+                            Path(tmp_dir, name).read_bytes(), data, msg=name
+                        )
+
+        fileobj = BytesIO()
+        with tarfile.open(fileobj=fileobj, mode="w:gz") as tfile:
+            for name, data in members.items():
+                tarinfo = tarfile.TarInfo(name)
+                tarinfo.size = len(data)
+                tfile.addfile(tarinfo, BytesIO(data))
+        with TemporaryDirectory() as tmp_dir:
+            self.assertEqual(stream_extract(chunks(fileobj.getvalue()), tmp_dir), 2)
+            self.assertEqual(Path(tmp_dir, "top/sub/b").read_bytes(), b"b" * 100000)
+
+        # members outside of the extraction directory, truncated or invalid archives
+        fileobj = BytesIO()
+        with zipfile.ZipFile(fileobj, "w") as zfile:
+            zfile.writestr("../evil", b"evil")
+        with TemporaryDirectory() as tmp_dir:
+            extraction_dir = os.path.join(tmp_dir, "extracted")
+            for data in (
+                fileobj.getvalue(),
+                fileobj.getvalue()[:40],
+                b"not an archive",
+            ):
+                self.assertRaises(
+                    DownloadError, stream_extract, chunks(data), extraction_dir
+                )
+            self.assertFalse(os.path.exists(os.path.join(tmp_dir, "evil")))
+
+    def test_utils_check_stream_extractable(self):
+        """check_stream_extractable must only accept archives which can be extracted while received"""
+
+        class UnseekableBytesIO(BytesIO):
+            def seek(self, *args):
+                raise OSError("unseekable")
+
+        def chunks(data):
+            return (data[i : i + 100] for i in range(0, len(data), 100))
+
+        payloads = {}
+        for name, fileobj_class, compression in (
+            ("zip", BytesIO, zipfile.ZIP_STORED),
+            ("deflated_descriptor_zip", UnseekableBytesIO, zipfile.ZIP_DEFLATED),
+            ("stored_descriptor_zip", UnseekableBytesIO, zipfile.ZIP_STORED),
+        ):
+            fileobj = fileobj_class()
+            with zipfile.ZipFile(fileobj, "w", compression=compression) as zfile:
+                zfile.writestr("a.txt", b"a" * 1000)
+            payloads[name] = fileobj.getvalue()
+        for name, mode in (("tar", "w"), ("tar_gz", "w:gz")):
+            fileobj = BytesIO()
+            with tarfile.open(fileobj=fileobj, mode=mode) as tfile:
+                tarinfo = tarfile.TarInfo("a.txt")
+                tarinfo.size = 1000
+                tfile.addfile(tarinfo, BytesIO(b"a" * 1000))
+            payloads[name] = fileobj.getvalue()
+        payloads["netcdf"] = b"CDF\x01" + b"\x00" * 1000
+
+        for name, data in payloads.items():
+            extractable, payload_chunks = check_stream_extractable(chunks(data))
+            self.assertEqual(
+                extractable,
+                name not in ("stored_descriptor_zip", "netcdf"),
+                msg=name,
+            )
+            # checked chunks are not lost
+            self.assertEqual(b"".join(payload_chunks), data, msg=name)
+
+        # compressed files which are not tar archives are detected once extracting
+        with TemporaryDirectory() as tmp_dir:
+            self.assertRaises(
+                UnsupportedArchiveError,
+                stream_extract,
+                chunks(gzip.compress(b"a" * 1000)),
+                tmp_dir,
+            )
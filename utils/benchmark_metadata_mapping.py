@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024, CS GROUP - France, https://www.csgroup.eu/
+#
+# This file is part of EODAG project
+#     https://www.github.com/CS-SI/EODAG
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark the normalization of a large page of provider results into EOProduct properties"""
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import logging
+import os
+import timeit
+from typing import Any, Dict, List
+
+from eodag.api.core import EODataAccessGateway
+from eodag.api.product.metadata_mapping import CompiledJsonMapping, properties_from_json
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.StreamHandler())
+logger.setLevel(logging.INFO)
+
+DEFAULT_RESPONSE_PATH = os.path.join(
+    os.path.dirname(os.path.realpath(__file__)),
+    "../tests/resources/provider_responses/earth_search_search.json",
+)
+
+
+def load_page(response_path: str, items: int) -> List[Dict[str, Any]]:
+    """Build a page of ``items`` results from a recorded provider response
+
+    :param response_path: Path to a recorded json search response (``features`` entry)
+    :param items: Number of results of the page
+    :returns: The page results
+    """
+    with open(response_path) as fh:
+        features = json.load(fh)["features"]
+    page = []
+    for i in range(items):
+        feature = copy.deepcopy(features[i % len(features)])
+        feature["id"] = "%s_%s" % (feature["id"], i)
+        page.append(feature)
+    return page
+
+
+def benchmark_metadata_mapping(
+    provider: str = "earth_search",
+    response_path: str = DEFAULT_RESPONSE_PATH,
+    items: int = 1000,
+    repeat: int = 5,
+) -> None:
+    """Compare the per-item cost of :func:`properties_from_json` with a
+    :class:`~eodag.api.product.metadata_mapping.CompiledJsonMapping` compiled once per page
+
+    :param provider: (optional) Provider whose search metadata mapping is used
+    :param response_path: (optional) Path to a recorded json search response
+    :param items: (optional) Number of results of the page
+    :param repeat: (optional) Number of timed runs, the best one is kept
+    """
+    dag = EODataAccessGateway()
+    search_plugin = next(dag._plugins_manager.get_search_plugins(provider=provider))
+    mapping = search_plugin.get_metadata_mapping()
+    discovery_config = getattr(search_plugin.config, "discover_metadata", {})
+    page = load_page(response_path, items)
+
+    def per_item() -> None:
+        for result in page:
+            properties_from_json(result, mapping, discovery_config=discovery_config)
+
+    def compiled() -> None:
+        compiled_mapping = CompiledJsonMapping(mapping, discovery_config)
+        for result in page:
+            compiled_mapping(result)
+
+    per_item_time = min(timeit.repeat(per_item, number=1, repeat=repeat))
+    compiled_time = min(timeit.repeat(compiled, number=1, repeat=repeat))
+    logger.info(
+        f"{provider}: {len(mapping)} mapped properties, {items} results per page"
+    )
+    logger.info(
+        f"properties_from_json per item: {1e6 * per_item_time / items:.1f} us/item"
+    )
+    logger.info(
+        f"compiled once per page:        {1e6 * compiled_time / items:.1f} us/item "
+        f"(x{per_item_time / compiled_time:.1f})"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--provider", default="earth_search")
+    parser.add_argument("--response", default=DEFAULT_RESPONSE_PATH)
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    benchmark_metadata_mapping(args.provider, args.response, args.items, args.repeat)
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024, CS GROUP - France, https://www.csgroup.eu/
+#
+# This file is part of EODAG project
+#     https://www.github.com/CS-SI/EODAG
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark the rendering of pages of search results as STAC items by the server mode"""
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import timeit
+from typing import Any, Dict, List, Tuple
+
+from benchmark_metadata_mapping import load_page
+
+from eodag.api.core import EODataAccessGateway
+from eodag.api.search_result import SearchResult
+from eodag.config import load_stac_config
+from eodag.rest.stac import StacCatalog, StacItem
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.StreamHandler())
+logger.setLevel(logging.INFO)
+
+DEFAULT_RESPONSE_PATH = os.path.join(
+    os.path.dirname(os.path.realpath(__file__)),
+    "../tests/resources/provider_responses/earth_search_search.json",
+)
+DEFAULT_PAGE_SIZES = [10, 100, 1000]
+SERVER_URL = "http://127.0.0.1:5000"
+
+
+def build_search_result(
+    dag: EODataAccessGateway,
+    provider: str,
+    product_type: str,
+    response_path: str,
+    items: int,
+) -> SearchResult:
+    """Build a page of ``items`` products from a recorded provider response
+
+    :param dag: EODAG python API instance
+    :param provider: Provider whose search plugin normalizes the results
+    :param product_type: Product type of the results
+    :param response_path: Path to a recorded json search response (``features`` entry)
+    :param items: Number of results of the page
+    :returns: The page of products
+    """
+    search_plugin = next(dag._plugins_manager.get_search_plugins(provider=provider))
+    products = search_plugin.normalize_results(
+        load_page(response_path, items), productType=product_type
+    )
+    return SearchResult(products, number_matched=len(products))
+
+
+def render_stac_items(
+    dag: EODataAccessGateway,
+    stac_config: Dict[str, Any],
+    search_result: SearchResult,
+    provider: str,
+    product_type: str,
+) -> Dict[str, Any]:
+    """Render a page of products as a STAC items collection, as the server search endpoint does
+
+    :param dag: EODAG python API instance
+    :param stac_config: STAC configuration
+    :param search_result: Page of products
+    :param provider: Provider of the products
+    :param product_type: Product type of the products
+    :returns: STAC items collection
+    """
+    url = f"{SERVER_URL}/collections/{product_type}/items"
+    catalog = StacCatalog(
+        url=f"{SERVER_URL}/collections/{product_type}",
+        stac_config=stac_config,
+        root=SERVER_URL,
+        provider=provider,
+        eodag_api=dag,
+        collection=product_type,
+    )
+    return StacItem(
+        url=url,
+        stac_config=stac_config,
+        provider=provider,
+        eodag_api=dag,
+        root=SERVER_URL,
+    ).get_stac_items(
+        search_results=search_result,
+        total=len(search_result),
+        next_link=None,
+        catalog={**catalog.data, **{"url": catalog.url, "root": catalog.root}},
+    )
+
+
+def benchmark_stac_items(
+    provider: str = "earth_search",
+    product_type: str = "S2_MSI_L1C",
+    response_path: str = DEFAULT_RESPONSE_PATH,
+    page_sizes: List[int] = DEFAULT_PAGE_SIZES,
+    repeat: int = 3,
+) -> List[Tuple[int, float]]:
+    """Measure the per-item cost of :meth:`~eodag.rest.stac.StacItem.get_stac_items`
+    for several page sizes
+
+    :param provider: (optional) Provider whose search plugin normalizes the results
+    :param product_type: (optional) Product type of the results
+    :param response_path: (optional) Path to a recorded json search response
+    :param page_sizes: (optional) Numbers of results per page
+    :param repeat: (optional) Number of timed runs, the best one is kept
+    :returns: Page sizes and their best rendering time, in seconds
+    """
+    dag = EODataAccessGateway()
+    stac_config = load_stac_config()
+    timings = []
+    for page_size in page_sizes:
+        search_result = build_search_result(
+            dag, provider, product_type, response_path, page_size
+        )
+        elapsed = min(
+            timeit.repeat(
+                lambda: render_stac_items(
+                    dag, stac_config, search_result, provider, product_type
+                ),
+                number=1,
+                repeat=repeat,
+            )
+        )
+        logger.info(
+            f"{page_size:>5} items per page: {1e3 * elapsed:8.1f} ms "
+            f"({1e6 * elapsed / page_size:.1f} us/item)"
+        )
+        timings.append((page_size, elapsed))
+    return timings
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--provider", default="earth_search")
+    parser.add_argument("--product-type", default="S2_MSI_L1C")
+    parser.add_argument("--response", default=DEFAULT_RESPONSE_PATH)
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=DEFAULT_PAGE_SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    benchmark_stac_items(
+        args.provider, args.product_type, args.response, args.page_sizes, args.repeat
+    )
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024, CS GROUP - France, https://www.csgroup.eu/
+#
+# This file is part of EODAG project
+#     https://www.github.com/CS-SI/EODAG
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark the cold start of eodag: package import and gateway instantiation, each
+measured in a new python process"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.StreamHandler())
+logger.setLevel(logging.INFO)
+
+STARTUP_SCRIPT = """
+import json, time
+start = time.perf_counter()
+from eodag import EODataAccessGateway
+imported = time.perf_counter()
+EODataAccessGateway()
+print(json.dumps({"import": imported - start, "init": time.perf_counter() - imported}))
+"""
+
+
+def measure_startup(env: Dict[str, str]) -> Dict[str, float]:
+    """Import eodag and instantiate a gateway in a new python process
+
+    :param env: Environment variables of the process
+    :returns: The import and instantiation times, in seconds
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", STARTUP_SCRIPT],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def benchmark_startup(repeat: int = 5, snapshot: bool = True) -> None:
+    """Measure the first start of eodag, with an empty configuration directory, and the
+    following ones
+
+    :param repeat: (optional) Number of timed following starts, the median is kept
+    :param snapshot: (optional) Whether configuration snapshots are enabled or not
+    """
+    with tempfile.TemporaryDirectory() as conf_dir:
+        env = dict(os.environ, EODAG_CFG_DIR=conf_dir)
+        if not snapshot:
+            env["EODAG_CFG_SNAPSHOT_DIR"] = ""
+        first = measure_startup(env)
+        following: List[Dict[str, float]] = [
+            measure_startup(env) for _ in range(repeat)
+        ]
+
+    logger.info(f"configuration snapshots {'enabled' if snapshot else 'disabled'}")
+    logger.info(
+        f"first start:      import {first['import']:.3f}s, init {first['init']:.3f}s"
+    )
+    logger.info(
+        "following starts: import %.3fs, init %.3fs (median of %s)",
+        statistics.median(times["import"] for times in following),
+        statistics.median(times["init"] for times in following),
+        repeat,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--no-snapshot", action="store_true")
+    args = parser.parse_args()
+    benchmark_startup(args.repeat, not args.no_snapshot)